@@ -13,6 +13,7 @@ from synalinks.api import DataModel
 from synalinks.api import Decision
 from synalinks.api import EmbeddedEntity
 from synalinks.api import Embedding
+from synalinks.api import EmbeddingCache
 from synalinks.api import EmbeddingModel
 from synalinks.api import Embeddings
 from synalinks.api import Entities
@@ -28,6 +29,7 @@ from synalinks.api import GenericOutputs
 from synalinks.api import GenericResult
 from synalinks.api import Identity
 from synalinks.api import Initializer
+from synalinks.api import InMemoryCache
 from synalinks.api import Input
 from synalinks.api import Instructions
 from synalinks.api import JsonDataModel
@@ -45,12 +47,14 @@ from synalinks.api import Or
 from synalinks.api import Prediction
 from synalinks.api import Program
 from synalinks.api import ProgramAsJudge
+from synalinks.api import RateLimiter
 from synalinks.api import Relation
 from synalinks.api import Relations
 from synalinks.api import Reward
 from synalinks.api import SelfCritique
 from synalinks.api import Sequential
 from synalinks.api import SimilaritySearch
+from synalinks.api import SQLiteCache
 from synalinks.api import StatelessScope
 from synalinks.api import SymbolicDataModel
 from synalinks.api import SymbolicScope
@@ -61,6 +65,7 @@ from synalinks.api import UpdateKnowledge
 from synalinks.api import Xor
 from synalinks.api import __version__
 from synalinks.api import backend
+from synalinks.api import caches
 from synalinks.api import callbacks
 from synalinks.api import chat_prompt_template
 from synalinks.api import clear_session
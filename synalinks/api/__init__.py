@@ -5,6 +5,7 @@ since your modifications would be overwritten.
 """
 
 from synalinks.api import backend as backend
+from synalinks.api import caches as caches
 from synalinks.api import callbacks as callbacks
 from synalinks.api import config as config
 from synalinks.api import datasets as datasets
@@ -68,6 +69,9 @@ from synalinks.src.backend.pydantic.base import (
 )
 from synalinks.src.backend.pydantic.base import is_tool_call as is_tool_call
 from synalinks.src.backend.pydantic.base import is_triplet_search as is_triplet_search
+from synalinks.src.caches.embedding_cache import EmbeddingCache as EmbeddingCache
+from synalinks.src.caches.in_memory_cache import InMemoryCache as InMemoryCache
+from synalinks.src.caches.sqlite_cache import SQLiteCache as SQLiteCache
 from synalinks.src.embedding_models.embedding_model import (
     EmbeddingModel as EmbeddingModel,
 )
@@ -119,6 +123,7 @@ from synalinks.src.rewards.lm_as_judge import LMAsJudge as LMAsJudge
 from synalinks.src.rewards.reward import Reward as Reward
 from synalinks.src.rewards.reward_wrappers import ProgramAsJudge as ProgramAsJudge
 from synalinks.src.utils.mcp.client import MultiServerMCPClient as MultiServerMCPClient
+from synalinks.src.utils.rate_limiter import RateLimiter as RateLimiter
 from synalinks.src.utils.tool_utils import Tool as Tool
 from synalinks.src.version import __version__
 from synalinks.src.version import version as version
@@ -0,0 +1,14 @@
+"""DO NOT EDIT.
+
+This file was autogenerated. Do not edit it by hand,
+since your modifications would be overwritten.
+"""
+
+from synalinks.src.caches import deserialize as deserialize
+from synalinks.src.caches import get as get
+from synalinks.src.caches import serialize as serialize
+from synalinks.src.caches.cache import Cache as Cache
+from synalinks.src.caches.cache import content_hash as content_hash
+from synalinks.src.caches.embedding_cache import EmbeddingCache as EmbeddingCache
+from synalinks.src.caches.in_memory_cache import InMemoryCache as InMemoryCache
+from synalinks.src.caches.sqlite_cache import SQLiteCache as SQLiteCache
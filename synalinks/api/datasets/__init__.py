@@ -7,3 +7,5 @@ since your modifications would be overwritten.
 from synalinks.api.datasets import arcagi as arcagi
 from synalinks.api.datasets import gsm8k as gsm8k
 from synalinks.api.datasets import hotpotqa as hotpotqa
+from synalinks.src.datasets.columnar_dataset import ColumnarDataset as ColumnarDataset
+from synalinks.src.datasets.streaming_dataset import StreamingDataset as StreamingDataset
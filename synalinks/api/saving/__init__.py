@@ -28,3 +28,4 @@ from synalinks.src.saving.serialization_lib import (
 from synalinks.src.saving.serialization_lib import (
     serialize_synalinks_object as serialize_synalinks_object,
 )
+from synalinks.src.saving.state_snapshot import StateSnapshot as StateSnapshot
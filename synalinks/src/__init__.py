@@ -1,4 +1,5 @@
 from synalinks.src import backend
+from synalinks.src import caches
 from synalinks.src import datasets
 from synalinks.src import embedding_models
 from synalinks.src import initializers
@@ -17,6 +17,13 @@ class JsonDataModel:
     This structure is the one flowing in the pipelines as
     the backend data models are only used for the variable/data model declaration.
 
+    To avoid copying large JSON objects (like retrieved contexts) at each step of
+    a program, the JSON objects and schemas are shared between the data models
+    (e.g. when concatenated or cloned) and handled as copy-on-write: `update()`
+    creates a new JSON object and `get()` returns a copy of the nested
+    objects, so they can be safely modified. The dicts returned by `get_json()`
+    and `get_schema()` should therefore not be modified in place.
+
     Args:
         schema (dict): The JSON object's schema. If not provided,
             uses the data model to infer it.
@@ -403,20 +410,29 @@ class JsonDataModel:
         Args:
             name (str): The attribute name to access.
         """
-        return copy.deepcopy(self._json.get(name, default_value))
+        value = self._json.get(name, default_value)
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
 
     def update(self, kv_dict):
         """Update wrapper to make it easier to modify JSON fields.
 
+        The JSON object is copied (without its nested objects) before being
+        updated, so the data models sharing it are left untouched.
+
         Args:
             kv_dict (dict): The key/json dict to update.
         """
-        self._json.update(kv_dict)
+        self._json = {**self._json, **kv_dict}
 
     def clone(self, name=None):
-        """Clone a data model and give it a different name."""
+        """Clone a data model and give it a different name.
 
-        clone = copy.deepcopy(self)
+        The clone shares the JSON object and schema with the original data model
+        until one of them is updated.
+        """
+        clone = copy.copy(self)
         if name:
             clone.name = name
         else:
@@ -425,20 +441,20 @@ class JsonDataModel:
 
     def get_nested_entity(self, key):
         """Retrieve a nested Entity and convert it to a JsonDataModel"""
-        json = copy.deepcopy(self.get(key))
+        json = self.get(key)
         if "label" in json:
             schema_key = json.get("label")
         else:
             return None
-        schema = copy.deepcopy(self.get_schema().get("$defs").get(schema_key))
+        schema = self.get_schema().get("$defs").get(schema_key)
 
         defs = {}
-        for obj_key, obj_schema in copy.deepcopy(self.get_schema().get("$defs")).items():
+        for obj_key, obj_schema in self.get_schema().get("$defs").items():
             if str(schema).find(f"#/$defs/{obj_key}") > 0:
                 defs[obj_key] = obj_schema
 
         if defs:
-            schema.update({"$defs": defs})
+            schema = {**schema, "$defs": defs}
 
         if schema:
             return JsonDataModel(json=json, schema=schema, name=self.name + "_" + key)
@@ -458,7 +474,7 @@ class JsonDataModel:
                     if str(schema).find(f"#/$defs/{obj_key}") > 0:
                         defs[obj_key] = obj_schema
                 if defs:
-                    schema.update({"$defs": defs})
+                    schema = {**schema, "$defs": defs}
 
                 outputs.append(
                     JsonDataModel(
@@ -304,3 +304,24 @@ class JsonDataModelTest(testing.TestCase):
 
         self.assertTrue(foo_json in foobar_json)
         self.assertFalse(bar_json in foo_json)
+
+    def test_copy_on_write(self):
+        class Document(DataModel):
+            title: str
+            chunks: List[str]
+
+        data_model = JsonDataModel(
+            data_model=Document(title="Document", chunks=["a", "b"]),
+        )
+        clone = data_model.clone()
+        # The clone shares the JSON object until it is updated
+        self.assertIs(clone.get_json(), data_model.get_json())
+        clone.update({"title": "Other document"})
+        self.assertEqual(data_model.get("title"), "Document")
+        self.assertEqual(clone.get("title"), "Other document")
+        self.assertIs(clone.get_json()["chunks"], data_model.get_json()["chunks"])
+
+        # The nested objects returned by `get()` can be safely modified
+        chunks = data_model.get("chunks")
+        chunks.append("c")
+        self.assertEqual(data_model.get("chunks"), ["a", "b"])
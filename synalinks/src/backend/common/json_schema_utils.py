@@ -2,12 +2,214 @@
 
 import collections
 import copy
+import functools
+import hashlib
+import json
+import threading
 
 from synalinks.src.utils.nlp_utils import add_suffix
 from synalinks.src.utils.nlp_utils import is_plural
 from synalinks.src.utils.nlp_utils import to_plural_without_numerical_suffix
 from synalinks.src.utils.nlp_utils import to_singular_without_numerical_suffix
 
+SCHEMA_OPERATIONS_CACHE_SIZE = 1024
+INTERNED_SCHEMAS_CACHE_SIZE = 4096
+
+_interned_schemas = collections.OrderedDict()
+_interned_schemas_lock = threading.Lock()
+
+
+def _raise_frozen(self, *args, **kwargs):
+    raise TypeError(
+        "The schema is shared and cannot be modified in place, "
+        "use `copy.deepcopy()` to get a modifiable copy of it."
+    )
+
+
+class _FrozenDict(dict):
+    """A read-only dict used for the shared schemas.
+
+    The copies (`copy.copy()`, `copy.deepcopy()`) and the pickled schemas are
+    regular (modifiable) dicts.
+    """
+
+    __slots__ = ("__weakref__", "_fingerprint")
+
+    __setitem__ = _raise_frozen
+    __delitem__ = _raise_frozen
+    __ior__ = _raise_frozen
+    clear = _raise_frozen
+    pop = _raise_frozen
+    popitem = _raise_frozen
+    setdefault = _raise_frozen
+    update = _raise_frozen
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """A read-only list used for the shared schemas."""
+
+    __slots__ = ()
+
+    __setitem__ = _raise_frozen
+    __delitem__ = _raise_frozen
+    __iadd__ = _raise_frozen
+    __imul__ = _raise_frozen
+    append = _raise_frozen
+    clear = _raise_frozen
+    extend = _raise_frozen
+    insert = _raise_frozen
+    pop = _raise_frozen
+    remove = _raise_frozen
+    reverse = _raise_frozen
+    sort = _raise_frozen
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze_schema(schema):
+    """Returns a read-only version of a JSON schema.
+
+    The dicts and lists of the schema are recursively converted into read-only
+    ones (the already frozen parts are reused as is). Modifying the frozen
+    schema in place raises a `TypeError`, while its copies are modifiable.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        (dict): The frozen JSON schema.
+    """
+    if isinstance(schema, (_FrozenDict, _FrozenList)):
+        return schema
+    if isinstance(schema, dict):
+        return _FrozenDict((k, freeze_schema(v)) for k, v in schema.items())
+    if isinstance(schema, list):
+        return _FrozenList(freeze_schema(v) for v in schema)
+    return schema
+
+
+def is_frozen_schema(schema):
+    """Returns True if the schema was frozen with `freeze_schema()`."""
+    return isinstance(schema, _FrozenDict)
+
+
+def schema_fingerprint(schema):
+    """Returns a stable fingerprint of a JSON schema.
+
+    The fingerprint is computed from the JSON serialization of the schema
+    (keeping the properties order). As the frozen schemas (see
+    `freeze_schema()`) cannot change, their fingerprint is computed once and
+    remembered, so looking it up again is O(1).
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        (str): The schema fingerprint.
+    """
+    if isinstance(schema, _FrozenDict):
+        try:
+            return schema._fingerprint
+        except AttributeError:
+            pass
+    fingerprint = hashlib.blake2b(
+        json.dumps(schema, default=str).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    if isinstance(schema, _FrozenDict):
+        schema._fingerprint = fingerprint
+    return fingerprint
+
+
+def intern_schema(schema):
+    """Returns the canonical object of a JSON schema.
+
+    Identical schemas (with the same fingerprint) are interned into the same
+    object, so they can be compared by identity and their fingerprint and the
+    schema operations results are looked up in O(1).
+
+    The interned schemas are shared, so they are frozen (see `freeze_schema()`).
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        (dict): The interned (read-only) JSON schema.
+    """
+    fingerprint = schema_fingerprint(schema)
+    with _interned_schemas_lock:
+        interned = _interned_schemas.get(fingerprint)
+        if interned is None:
+            interned = freeze_schema(schema)
+            _interned_schemas[fingerprint] = interned
+            if len(_interned_schemas) > INTERNED_SCHEMAS_CACHE_SIZE:
+                _interned_schemas.popitem(last=False)
+        else:
+            _interned_schemas.move_to_end(fingerprint)
+    return interned
+
+
+def _freeze_argument(value):
+    if isinstance(value, dict):
+        return ("schema", schema_fingerprint(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_argument(v) for v in value)
+    return value
+
+
+def memoize_schema_operation(function):
+    """Memoize a schema operation using the fingerprint of its schemas.
+
+    The results are kept in a bounded LRU table and shared between the
+    callers, so the schemas returned are frozen (see `freeze_schema()`). As
+    the schemas of a program don't change once traced, the schema operations
+    performed at runtime are then just a lookup.
+
+    Args:
+        function (callable): The schema operation to memoize.
+
+    Returns:
+        (callable): The memoized schema operation.
+    """
+    cache = collections.OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        key = (
+            _freeze_argument(args),
+            tuple((k, _freeze_argument(v)) for k, v in sorted(kwargs.items())),
+        )
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        result = freeze_schema(function(*args, **kwargs))
+        with lock:
+            cache[key] = result
+            if len(cache) > SCHEMA_OPERATIONS_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
 
 def standardize_schema(schema):
     """Standardize the JSON schema for consistency"""
@@ -19,6 +221,7 @@ def contains_schema(schema1, schema2):
     return schema2.get("properties").items() <= schema1.get("properties").items()
 
 
+@memoize_schema_operation
 def prefix_schema(schema, prefix):
     """Add a prefix to the schema properties"""
     schema = copy.deepcopy(schema)
@@ -31,6 +234,7 @@ def prefix_schema(schema, prefix):
     return schema
 
 
+@memoize_schema_operation
 def suffix_schema(schema, suffix):
     """Add a suffix to the schema properties"""
     schema = copy.deepcopy(schema)
@@ -81,6 +285,7 @@ def is_array(schema):
     return False
 
 
+@memoize_schema_operation
 def concatenate_schema(schema1, schema2):
     """Concatenate two JSON schemas into a single schema.
 
@@ -92,10 +297,9 @@ def concatenate_schema(schema1, schema2):
         schema2 (dict): The second JSON schema to be concatenated.
 
     Returns:
-        (dict): A new JSON schema that combines the properties of the input schemas.
+        (dict): A new (frozen) JSON schema that combines the properties of the
+            input schemas.
     """
-    schema1 = copy.deepcopy(schema1)
-    schema2 = copy.deepcopy(schema2)
     # Initialize the resulting schema
     result_schema = {
         "additionalProperties": False,
@@ -107,9 +311,9 @@ def concatenate_schema(schema1, schema2):
     }
 
     if schema1.get("$defs") and not schema2.get("$defs"):
-        result_schema["$defs"] = schema1.get("$defs")
+        result_schema["$defs"] = dict(schema1.get("$defs"))
     if not schema1.get("$defs") and schema2.get("$defs"):
-        result_schema["$defs"] = schema2.get("$defs")
+        result_schema["$defs"] = dict(schema2.get("$defs"))
     if schema1.get("$defs") and schema2.get("$defs"):
         result_schema["$defs"] = {**schema1.get("$defs"), **schema2.get("$defs")}
 
@@ -122,7 +326,10 @@ def concatenate_schema(schema1, schema2):
         while new_prop_key in result_schema["properties"]:
             suffix += 1
             new_prop_key = add_suffix(prop_key, suffix)
-            prop_value["title"] = new_prop_key.title().replace("_", " ")
+            prop_value = {
+                **prop_value,
+                "title": new_prop_key.title().replace("_", " "),
+            }
         result_schema["properties"][new_prop_key] = prop_value
 
         required1 = schema1.get("required")
@@ -153,6 +360,7 @@ def concatenate_schema(schema1, schema2):
     return result_schema
 
 
+@memoize_schema_operation
 def factorize_schema(schema):
     """Factorize a JSON schema by grouping similar properties into lists.
 
@@ -239,6 +447,7 @@ def factorize_schema(schema):
     return result_schema
 
 
+@memoize_schema_operation
 def out_mask_schema(schema, mask=None, recursive=True):
     """Mask specific fields of a JSON schema.
 
@@ -309,6 +518,7 @@ def out_mask_schema(schema, mask=None, recursive=True):
     return schema
 
 
+@memoize_schema_operation
 def in_mask_schema(schema, mask=None, recursive=True):
     """Keep specific fields of a JSON schema.
 
@@ -1,5 +1,8 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import copy
+import json
+import pickle
 from typing import List
 from typing import Literal
 from typing import Union
@@ -10,9 +13,11 @@ from synalinks.src.backend import standardize_schema
 from synalinks.src.backend.common.json_schema_utils import concatenate_schema
 from synalinks.src.backend.common.json_schema_utils import contains_schema
 from synalinks.src.backend.common.json_schema_utils import factorize_schema
+from synalinks.src.backend.common.json_schema_utils import freeze_schema
 from synalinks.src.backend.common.json_schema_utils import in_mask_schema
 from synalinks.src.backend.common.json_schema_utils import is_schema_equal
 from synalinks.src.backend.common.json_schema_utils import out_mask_schema
+from synalinks.src.backend.common.json_schema_utils import schema_fingerprint
 
 
 class JsonSchemaConcatenateTest(testing.TestCase):
@@ -608,3 +613,95 @@ class JsonSchemaContainsTest(testing.TestCase):
         schema2 = standardize_schema(Input2.get_schema())
 
         self.assertFalse(contains_schema(schema1, schema2))
+
+
+class JsonSchemaMemoizationTest(testing.TestCase):
+    def test_freeze_schema(self):
+        schema = {
+            "properties": {"foo": {"title": "Foo", "type": "string"}},
+            "required": ["foo"],
+            "title": "Input",
+            "type": "object",
+        }
+        frozen = freeze_schema(schema)
+        self.assertEqual(frozen, schema)
+        self.assertIs(freeze_schema(frozen), frozen)
+        self.assertEqual(json.dumps(frozen), json.dumps(schema))
+        with self.assertRaises(TypeError):
+            frozen["properties"]["foo"]["title"] = "Bar"
+        with self.assertRaises(TypeError):
+            frozen["required"] += ["bar"]
+
+        for unfrozen in [copy.deepcopy(frozen), pickle.loads(pickle.dumps(frozen))]:
+            self.assertEqual(unfrozen, schema)
+            unfrozen["properties"]["foo"]["title"] = "Bar"
+            unfrozen["required"].append("bar")
+        self.assertEqual(frozen, schema)
+
+    def test_schema_fingerprint(self):
+        class Input1(DataModel):
+            foo: str
+            bar: str
+
+        class Input2(DataModel):
+            bar: str
+            foo: str
+
+        schema = Input1.get_schema()
+        self.assertEqual(schema_fingerprint(schema), schema_fingerprint(schema))
+        self.assertEqual(
+            schema_fingerprint(schema),
+            schema_fingerprint(Input1.get_schema()),
+        )
+        # The properties order matters
+        self.assertNotEqual(
+            schema_fingerprint(Input1.get_schema()),
+            schema_fingerprint(Input2.get_schema()),
+        )
+
+    def test_memoized_operations(self):
+        class Input1(DataModel):
+            foo: str
+
+        class Input2(DataModel):
+            bar: str
+
+        schema = concatenate_schema(Input1.get_schema(), Input2.get_schema())
+        # Equal schemas (even if different objects) give the same result
+        self.assertIs(
+            concatenate_schema(Input1.get_schema(), Input2.get_schema()),
+            schema,
+        )
+        self.assertIsNot(
+            concatenate_schema(Input2.get_schema(), Input1.get_schema()),
+            schema,
+        )
+        self.assertIs(
+            out_mask_schema(schema, mask=["foo"]),
+            out_mask_schema(schema, mask=["foo"]),
+        )
+        self.assertIsNot(
+            out_mask_schema(schema, mask=["foo"]),
+            out_mask_schema(schema, mask=["bar"]),
+        )
+        self.assertEqual(list(schema["properties"].keys()), ["foo", "bar"])
+
+    def test_memoized_operations_with_modified_schema(self):
+        class Input1(DataModel):
+            a: str
+
+        class Input2(DataModel):
+            b: str
+
+        schema = copy.deepcopy(Input1.get_schema())
+        result = concatenate_schema(schema, Input2.get_schema())
+        self.assertEqual(list(result["properties"].keys()), ["a", "b"])
+        # The results are frozen and don't share the inputs dicts
+        with self.assertRaises(TypeError):
+            result["properties"]["a"]["title"] = "A"
+        self.assertIsNot(result["properties"]["a"], schema["properties"]["a"])
+
+        # A (non-frozen) schema modified in place is not looked up by identity
+        schema["properties"]["extra"] = {"title": "Extra", "type": "string"}
+        result = concatenate_schema(schema, Input2.get_schema())
+        self.assertEqual(list(result["properties"].keys()), ["a", "extra", "b"])
@@ -1,7 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import collections
-import copy
 
 from synalinks.src.utils.nlp_utils import add_suffix
 from synalinks.src.utils.nlp_utils import is_plural
@@ -9,9 +8,23 @@ from synalinks.src.utils.nlp_utils import to_plural_without_numerical_suffix
 from synalinks.src.utils.nlp_utils import to_singular_without_numerical_suffix
 
 
+def _copy_objects(json, recursive=True):
+    """Copy the (nested) objects of a Json object that the masks can modify.
+
+    Only the dicts and the lists containing dicts are copied,
+    the other values are shared with the input object.
+    """
+    if isinstance(json, dict):
+        if not recursive:
+            return dict(json)
+        return {k: _copy_objects(v) for k, v in json.items()}
+    if isinstance(json, list) and any(isinstance(item, dict) for item in json):
+        return [_copy_objects(item) for item in json]
+    return json
+
+
 def prefix_json(json, prefix):
     """Add a prefix to the json object keys"""
-    json = copy.deepcopy(json)
     prefixed_json = {}
     for prop_key, prop_value in json.items():
         prefixed_json[f"{prefix}_{prop_key}"] = prop_value
@@ -20,7 +33,6 @@ def prefix_json(json, prefix):
 
 def suffix_json(json, suffix):
     """Add a suffix to the json object keys"""
-    json = copy.deepcopy(json)
     suffixed_json = {}
     for prop_key, prop_value in json.items():
         suffixed_json[f"{prop_key}_{suffix}"] = prop_value
@@ -39,10 +51,8 @@ def concatenate_json(json1, json2):
 
     Returns:
         (dict): A new Json object that combines the properties of the input objects.
+            The values are shared with the input objects (not copied).
     """
-    json1 = copy.deepcopy(json1)
-    json2 = copy.deepcopy(json2)
-
     result_json = {}
 
     def add_property(prop_key, prop_value, suffix=0):
@@ -75,7 +85,6 @@ def factorize_json(json):
     Returns:
         (dict): A factorized Json object with grouped properties.
     """
-    json = copy.deepcopy(json)
     # Initialize the resulting Json object
     result_json = {}
 
@@ -103,8 +112,11 @@ def factorize_json(json):
         else:
             if not is_plural(prop_key):
                 result_json[base_key] = prop_value
-            else:
+            elif isinstance(prop_value, list):
                 # If the property is a plural (a list) ensure it is added to the result
+                # (copied, as the values of the similar properties are added to it)
+                result_json[prop_key] = list(prop_value)
+            else:
                 result_json[prop_key] = prop_value
 
     return result_json
@@ -125,7 +137,7 @@ def out_mask_json(json, mask=None, recursive=True):
     Returns:
         - (dict): A masked Json object with removed properties.
     """
-    json = copy.deepcopy(json)
+    json = _copy_objects(json, recursive=recursive)
 
     if not mask:
         return json
@@ -174,7 +186,7 @@ def in_mask_json(json, mask=None, recursive=True):
     Returns:
         (dict): A masked Json object with only the specified properties.
     """
-    json = copy.deepcopy(json)
+    json = _copy_objects(json, recursive=recursive)
 
     if not mask:
         return {}
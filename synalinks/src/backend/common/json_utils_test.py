@@ -27,6 +27,16 @@ class JsonConcatenateTest(testing.TestCase):
         result = concatenate_json(json, json)
         self.assertEqual(result, expected)
 
+    def test_concatenate_jsons_share_values(self):
+        class Input(DataModel):
+            foo: List[str]
+
+        json = Input(foo=["test"]).get_json()
+
+        result = concatenate_json(json, json)
+        self.assertIs(result["foo"], json["foo"])
+        self.assertIs(result["foo_1"], json["foo"])
+
     def test_concatenate_jsons_with_different_properties(self):
         class Input1(DataModel):
             foo: str
@@ -232,6 +242,13 @@ class JsonFactorizeTest(testing.TestCase):
         result = factorize_json(json)
         self.assertEqual(result, expected)
 
+    def test_factorize_json_doesnt_modify_inputs(self):
+        json = {"answers": ["a"], "answer": "b", "answer_1": "c"}
+
+        result = factorize_json(json)
+        self.assertEqual(result, {"answers": ["a", "b", "c"]})
+        self.assertEqual(json, {"answers": ["a"], "answer": "b", "answer_1": "c"})
+
     def test_factorize_json_with_existing_array_property_and_additional_properties(
         self,
     ):
@@ -544,6 +561,8 @@ class JsonOutMaskTest(testing.TestCase):
 
         result = out_mask_json(json, mask=["foo"])
         self.assertEqual(result, expected)
+        # The input object is left untouched
+        self.assertEqual(json["boos"][0], {"foo": "test", "boo": "test"})
 
     def test_mask_empty_json(self):
         class Input(DataModel):
@@ -127,6 +127,9 @@ class Variable:
         self._initializer = None
         self._data_model = data_model
         self._trainable = bool(trainable)
+        self._version = 0
+        self._assigned_version = 0
+        self._field_versions = {}
 
         if in_stateless_scope():
             if callable(initializer):
@@ -256,6 +259,8 @@ class Variable:
             json (dict): The new json value to be assigned.
         """
         self._json = json
+        self._version += 1
+        self._assigned_version = self._version
 
     def get_schema(self):
         """The schema of the variable.
@@ -287,6 +292,25 @@ class Variable:
     def trainable(self, value):
         self._trainable = bool(value)
 
+    def get_version(self, key=None):
+        """Returns a counter incremented each time the value is modified.
+
+        It can be used to invalidate the values computed from the variable.
+        Note that the in-place modifications of the nested values are not
+        tracked, only the `assign()` and `update()` calls.
+
+        Args:
+            key (str): Optional. If provided, returns the version of this field,
+                only incremented when the field is updated or the whole value
+                assigned (Default to None, the version of the whole value).
+
+        Returns:
+            (int): The version.
+        """
+        if key is None:
+            return self._version
+        return max(self._assigned_version, self._field_versions.get(key, 0))
+
     @property
     def name(self):
         """The name of the variable."""
@@ -321,6 +345,8 @@ class Variable:
             json (dict): The initial value (JSON object dict).
         """
         self._json = json
+        self._version += 1
+        self._assigned_version = self._version
 
     def to_json_data_model(self):
         """Convert the variable into a `JsonDataModel`.
@@ -353,6 +379,9 @@ class Variable:
             kv_dict (dict): The key/value dict to update.
         """
         self._json.update(kv_dict)
+        self._version += 1
+        for key in kv_dict:
+            self._field_versions[key] = self._version
 
 
 def register_uninitialized_variable(variable):
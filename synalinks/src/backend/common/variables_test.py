@@ -69,6 +69,29 @@ class VariablesTest(testing.TestCase):
             standardize_schema(Instructions.get_schema()),
         )
 
+    def test_variable_version(self):
+        class Instructions(DataModel):
+            instructions: List[str] = []
+            seen: int = 0
+
+        variable = Variable(
+            initializer={"instructions": [], "seen": 0},
+            data_model=Instructions,
+        )
+        version = variable.get_version()
+        instructions_version = variable.get_version("instructions")
+        variable.get("instructions").append("Answer in one word")
+        self.assertEqual(variable.get_version(), version)
+        variable.update({"seen": 1})
+        self.assertEqual(variable.get_version(), version + 1)
+        self.assertEqual(variable.get_version("instructions"), instructions_version)
+        variable.update({"instructions": ["Answer in one word"]})
+        self.assertGreater(variable.get_version("instructions"), instructions_version)
+        instructions_version = variable.get_version("instructions")
+        variable.assign({"instructions": [], "seen": 0})
+        self.assertEqual(variable.get_version(), version + 3)
+        self.assertGreater(variable.get_version("instructions"), instructions_version)
+
     def test_assign_variable_from_dataype(self):
         class Instructions(DataModel):
             instructions: List[str] = []
@@ -1,6 +1,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import inspect
+import weakref
 
 import pydantic
 from typing_extensions import ClassVar
@@ -8,12 +9,15 @@ from typing_extensions import ClassVar
 from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common.json_data_model import JsonDataModel
+from synalinks.src.backend.common.json_schema_utils import intern_schema
 from synalinks.src.backend.common.symbolic_data_model import SymbolicDataModel
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
 from synalinks.src.utils.async_utils import run_maybe_nested
 
 IS_THREAD_SAFE = True
 
+_schemas_cache = weakref.WeakKeyDictionary()
+
 
 class MetaDataModel(type(pydantic.BaseModel)):
     """The metaclass data model.
@@ -277,10 +281,20 @@ class DataModel(pydantic.BaseModel, SynalinksSaveable, metaclass=MetaDataModel):
     def get_schema(cls):
         """Gets the JSON schema of the data model.
 
+        The schema is generated once per class and interned. The returned dict
+        is shared, so it is read-only: use `copy.deepcopy()` to get a modifiable
+        copy of it.
+
         Returns:
-            (dict): The JSON schema.
+            (dict): The (read-only) JSON schema.
         """
-        return cls.model_json_schema()
+        schema = _schemas_cache.get(cls)
+        if schema is None:
+            schema = intern_schema(cls.model_json_schema())
+            # Don't cache the schema of the classes with unresolved references
+            if cls.__pydantic_complete__:
+                _schemas_cache[cls] = schema
+        return schema
 
     @classmethod
     def prettify_schema(cls):
@@ -296,7 +310,7 @@ class DataModel(pydantic.BaseModel, SynalinksSaveable, metaclass=MetaDataModel):
     @classmethod
     def to_symbolic_data_model(cls, name=None):
         """Converts the data model to a symbolic data model.
-        
+
         Args:
             name (str): Optional. The name of the symbolic data model.
                 If None, a name will be given automatically.
@@ -329,7 +343,7 @@ class DataModel(pydantic.BaseModel, SynalinksSaveable, metaclass=MetaDataModel):
 
     def to_json_data_model(self, name=None):
         """Converts the data model to a backend-independent data model.
-        
+
         Args:
             name (str): Optional. The name of the json data model.
                 If None, a name will be given automatically.
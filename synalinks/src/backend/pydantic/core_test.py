@@ -1,5 +1,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import copy
+
 from synalinks.src import testing
 from synalinks.src.backend.common.json_schema_utils import is_schema_equal
 from synalinks.src.backend.common.json_schema_utils import standardize_schema
@@ -137,3 +139,45 @@ class CoreTest(testing.TestCase):
 
         self.assertTrue(Foo in FooBar)
         self.assertFalse(Bar in Foo)
+
+    def test_cached_and_interned_schema(self):
+        class Foo(DataModel):
+            foo: str
+
+        class OtherFoo(DataModel):
+            foo: str
+
+        class Bar(DataModel):
+            bar: str
+
+        schema = Foo.get_schema()
+        self.assertIs(Foo.get_schema(), schema)
+        self.assertIs(Foo(foo="foo").get_schema(), schema)
+        self.assertIsNot(Bar.get_schema(), schema)
+        # The title differs
+        self.assertIsNot(OtherFoo.get_schema(), schema)
+
+        class Foo(DataModel):
+            foo: str
+
+        # Identical schemas are interned into the same object
+        self.assertIs(Foo.get_schema(), schema)
+
+    def test_schema_is_read_only(self):
+        class Foo(DataModel):
+            foo: str
+
+        schema = Foo.get_schema()
+        with self.assertRaisesRegex(TypeError, "cannot be modified"):
+            schema["properties"]["bar"] = {"title": "Bar", "type": "string"}
+        with self.assertRaisesRegex(TypeError, "cannot be modified"):
+            schema["required"].append("bar")
+        with self.assertRaisesRegex(TypeError, "cannot be modified"):
+            schema.pop("title")
+
+        # The copies are modifiable and don't change the schema of the class
+        schema_copy = copy.deepcopy(schema)
+        schema_copy["properties"]["bar"] = {"title": "Bar", "type": "string"}
+        schema_copy["required"].append("bar")
+        self.assertEqual(list(Foo.get_schema()["properties"].keys()), ["foo"])
+        self.assertEqual(Foo.get_schema()["required"], ["foo"])
@@ -0,0 +1,84 @@
+import inspect
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.caches.cache import Cache
+from synalinks.src.caches.cache import content_hash
+from synalinks.src.caches.embedding_cache import EmbeddingCache
+from synalinks.src.caches.in_memory_cache import InMemoryCache
+from synalinks.src.caches.sqlite_cache import SQLiteCache
+from synalinks.src.saving import serialization_lib
+
+ALL_OBJECTS = {
+    Cache,
+    EmbeddingCache,
+    InMemoryCache,
+    SQLiteCache,
+}
+
+ALL_OBJECTS_DICT = {cls.__name__: cls for cls in ALL_OBJECTS}
+
+
+@synalinks_export("synalinks.caches.serialize")
+def serialize(cache):
+    """Returns the cache configuration as a Python dict.
+
+    Args:
+        cache: A `Cache` instance to serialize.
+
+    Returns:
+        Python dict which contains the configuration of the cache.
+    """
+    return serialization_lib.serialize_synalinks_object(cache)
+
+
+@synalinks_export("synalinks.caches.deserialize")
+def deserialize(config, custom_objects=None):
+    """Returns a Synalinks cache object via its configuration.
+
+    Args:
+        config: Cache configuration dictionary.
+        custom_objects: Optional dictionary mapping names (strings) to custom
+            objects (classes and functions) to be considered during
+            deserialization.
+
+    Returns:
+        A Synalinks `Cache` instance.
+    """
+    return serialization_lib.deserialize_synalinks_object(
+        config,
+        module_objects=ALL_OBJECTS_DICT,
+        custom_objects=custom_objects,
+    )
+
+
+@synalinks_export("synalinks.caches.get")
+def get(identifier):
+    """Retrieves a Synalinks cache instance.
+
+    The `identifier` may be the string name of a `Cache` class.
+
+    >>> cache = caches.get("InMemoryCache")
+    >>> type(cache)
+    <class '...InMemoryCache'>
+
+    Args:
+        identifier: A cache identifier. One of None or string name of a cache
+            class or cache configuration dictionary or a cache instance.
+
+    Returns:
+        A Synalinks `Cache` instance.
+    """
+    if identifier is None:
+        return None
+    if isinstance(identifier, dict):
+        obj = deserialize(identifier)
+    elif isinstance(identifier, str):
+        obj = ALL_OBJECTS_DICT.get(identifier, None)
+    else:
+        obj = identifier
+
+    if inspect.isclass(obj):
+        obj = obj()
+    if isinstance(obj, Cache):
+        return obj
+    raise ValueError(f"Could not interpret cache identifier: {identifier}")
@@ -0,0 +1,186 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import hashlib
+import json
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
+
+
+@synalinks_export("synalinks.caches.content_hash")
+def content_hash(obj):
+    """Computes a stable content hash of a JSON-like object.
+
+    The object is serialized with sorted keys, so two dicts with the same
+    content always produce the same hash regardless of their insertion order.
+
+    Args:
+        obj (any): The JSON-like object to hash.
+
+    Returns:
+        (str): The SHA-256 hexadecimal digest of the object.
+    """
+    serialized = json.dumps(
+        obj,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@synalinks_export("synalinks.caches.Cache")
+class Cache(SynalinksSaveable):
+    """Base cache class used to store the responses of the language models.
+
+    A cache maps a content hash (see `synalinks.caches.content_hash`) to a JSON
+    response. It is used by the `LanguageModel` (and the `EmbeddingModel`) to avoid
+    calling the provider twice for the same input, which is common when re-running
+    evaluations or training over the same dataset.
+
+    The cache keeps track of the number of hits and misses, entries can be evicted
+    in a LRU fashion using `max_size` and can expire after `ttl` seconds.
+
+    When `read_only` is `True`, the cache is never written and the language models
+    raise an error on a cache miss. This "replay" mode allow to run your programs
+    deterministically (e.g. in a CI) using the responses previously recorded.
+
+    To be implemented by subclasses:
+
+    * `lookup(key)`: Returns the stored value or `None` if missing or expired.
+    * `store(key, value)`: Stores the value and evict entries if needed.
+    * `delete(key)`: Removes an entry.
+    * `clear()`: Removes all the entries.
+    * `size()`: Returns the number of entries.
+
+    Args:
+        max_size (int): Optional. The maximum number of entries, the least
+            recently used entries are evicted first (Default to None, unbounded).
+        ttl (float): Optional. The time to live of the entries in seconds
+            (Default to None, never expire).
+        read_only (bool): Optional. If True, the cache is never written and a
+            cache miss raise an error (Default to False).
+    """
+
+    def __init__(
+        self,
+        max_size=None,
+        ttl=None,
+        read_only=False,
+    ):
+        if max_size is not None and max_size <= 0:
+            raise ValueError(
+                f"The `max_size` argument should be positive, received: {max_size}"
+            )
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"The `ttl` argument should be positive, received: {ttl}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Get a value from the cache and update the hit/miss counters.
+
+        Args:
+            key (str): The entry key.
+
+        Returns:
+            (dict): The cached value or `None` if missing.
+        """
+        value = self.lookup(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Put a value into the cache, does nothing in read-only mode.
+
+        Args:
+            key (str): The entry key.
+            value (dict): The JSON value to store.
+        """
+        if self.read_only:
+            return
+        self.store(key, value)
+
+    def lookup(self, key):
+        raise NotImplementedError(
+            f"Cache {self.__class__.__name__} does not have a `lookup()` "
+            "method implemented."
+        )
+
+    def store(self, key, value):
+        raise NotImplementedError(
+            f"Cache {self.__class__.__name__} does not have a `store()` "
+            "method implemented."
+        )
+
+    def delete(self, key):
+        raise NotImplementedError(
+            f"Cache {self.__class__.__name__} does not have a `delete()` "
+            "method implemented."
+        )
+
+    def clear(self):
+        raise NotImplementedError(
+            f"Cache {self.__class__.__name__} does not have a `clear()` "
+            "method implemented."
+        )
+
+    def size(self):
+        raise NotImplementedError(
+            f"Cache {self.__class__.__name__} does not have a `size()` "
+            "method implemented."
+        )
+
+    @property
+    def hit_rate(self):
+        """The ratio of hits over the total number of lookups."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Returns the cache statistics.
+
+        Returns:
+            (dict): The number of hits, misses, entries and the hit rate.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": self.size(),
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self):
+        return self.size()
+
+    def _obj_type(self):
+        return "Cache"
+
+    def get_config(self):
+        return {
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "read_only": self.read_only,
+        }
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} size={self.size()} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
@@ -0,0 +1,219 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+import threading
+
+import numpy as np
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.caches.cache import Cache
+
+VECTORS_FILENAME = "vectors.f32"
+INDEX_FILENAME = "index.txt"
+
+
+@synalinks_export(
+    [
+        "synalinks.caches.EmbeddingCache",
+        "synalinks.EmbeddingCache",
+    ]
+)
+class EmbeddingCache(Cache):
+    """A cache for the embedding vectors backed by a memory-mapped file.
+
+    The vectors are stored in a compact float32 array file that is memory-mapped
+    on load, alongside an index file with one key per row. Both files are
+    append-only, so the cache can be safely shared in read-only mode
+    across worker processes without copying the vectors in memory.
+
+    If no `path` is provided, the vectors are kept in memory only.
+
+    As the files are append-only, the entries cannot be evicted (there is no
+    `max_size` nor `ttl`) nor deleted one by one: use `clear()` to remove all
+    of them.
+
+    Example:
+
+    ```python
+    import synalinks
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="ollama/mxbai-embed-large",
+        cache=synalinks.caches.EmbeddingCache(path="embeddings_cache"),
+    )
+    ```
+
+    Args:
+        path (str): Optional. The directory where the vectors and the index
+            are stored (Default to None, in-memory only).
+        read_only (bool): Optional. If True, the cache is never written and a
+            cache miss raise an error (Default to False).
+        max_size (int): Not supported, should be None.
+        ttl (float): Not supported, should be None.
+    """
+
+    def __init__(
+        self,
+        path=None,
+        read_only=False,
+        max_size=None,
+        ttl=None,
+    ):
+        if max_size is not None or ttl is not None:
+            raise ValueError(
+                "The EmbeddingCache is append-only and doesn't evict its entries, "
+                "the `max_size` and `ttl` arguments are not supported. "
+                f"Received: max_size={max_size} and ttl={ttl}"
+            )
+        super().__init__(read_only=read_only)
+        self.path = path
+        self.dimension = None
+        self._index = {}
+        self._vectors = []
+        self._mapped = None
+        self._mapped_rows = 0
+        self._lock = threading.Lock()
+        if self.path:
+            self._load()
+
+    def _vectors_path(self):
+        return os.path.join(self.path, VECTORS_FILENAME)
+
+    def _index_path(self):
+        return os.path.join(self.path, INDEX_FILENAME)
+
+    def _load(self):
+        if not os.path.exists(self._index_path()):
+            if self.read_only:
+                raise ValueError(
+                    f"Cannot open the embedding cache '{self.path}' in read-only "
+                    "mode because it does not exist."
+                )
+            os.makedirs(self.path, exist_ok=True)
+            return
+        with open(self._index_path(), "r") as f:
+            content = f.read()
+        lines = content.splitlines()
+        if not lines:
+            return
+        self.dimension = int(lines[0])
+        keys = lines[1:]
+        if keys and not content.endswith("\n"):
+            # The last key was partially written
+            keys = keys[:-1]
+        rows = 0
+        if os.path.exists(self._vectors_path()):
+            rows = os.path.getsize(self._vectors_path()) // (4 * self.dimension)
+        # Ignore the partially written rows (e.g. after a crash)
+        rows = min(rows, len(keys))
+        if not self.read_only:
+            self._truncate(rows, keys)
+        for row, key in enumerate(keys[:rows]):
+            self._index[key] = row
+        self._remap(rows)
+
+    def _truncate(self, rows, keys):
+        # Remove the partially written rows, so the new rows are appended
+        # right after the recovered ones
+
+        vectors_size = rows * 4 * self.dimension
+        if not os.path.exists(self._vectors_path()):
+            open(self._vectors_path(), "wb").close()
+        if os.path.getsize(self._vectors_path()) != vectors_size:
+            os.truncate(self._vectors_path(), vectors_size)
+        index_content = "".join(f"{line}\n" for line in [self.dimension] + keys[:rows])
+        if os.path.getsize(self._index_path()) != len(index_content.encode("utf-8")):
+            with open(self._index_path(), "w") as f:
+                f.write(index_content)
+
+    def _remap(self, rows):
+        if rows == 0:
+            self._mapped = None
+        else:
+            self._mapped = np.memmap(
+                self._vectors_path(),
+                dtype=np.float32,
+                mode="r",
+                shape=(rows, self.dimension),
+            )
+        self._mapped_rows = rows
+
+    def lookup(self, key):
+        with self._lock:
+            row = self._index.get(key, None)
+            if row is None:
+                return None
+            if not self.path:
+                return self._vectors[row].tolist()
+            if row >= self._mapped_rows:
+                self._remap(len(self._index))
+            return self._mapped[row].tolist()
+
+    def store(self, key, value):
+        with self._lock:
+            if key in self._index:
+                return
+            vector = np.asarray(value, dtype=np.float32).reshape(-1)
+            if self.dimension is None:
+                self.dimension = int(vector.shape[0])
+                if self.path:
+                    with open(self._index_path(), "w") as f:
+                        f.write(f"{self.dimension}\n")
+            elif vector.shape[0] != self.dimension:
+                raise ValueError(
+                    f"Expected embedding vectors of dimension {self.dimension}, "
+                    f"received a vector of dimension {vector.shape[0]}."
+                )
+            row = len(self._index)
+            if self.path:
+                with open(self._vectors_path(), "ab") as f:
+                    f.write(vector.tobytes())
+                with open(self._index_path(), "a") as f:
+                    f.write(f"{key}\n")
+            else:
+                self._vectors.append(vector)
+            self._index[key] = row
+
+    def delete(self, key):
+        """Not supported, the cache is append-only.
+
+        Raises:
+            ValueError: Always, use `clear()` to remove all the entries.
+        """
+        raise ValueError(
+            "The EmbeddingCache is append-only and its entries cannot be deleted "
+            f"one by one (received key: {key}), use `clear()` to remove all "
+            "the entries."
+        )
+
+    def clear(self):
+        with self._lock:
+            self._index = {}
+            self._vectors = []
+            self._mapped = None
+            self._mapped_rows = 0
+            self.dimension = None
+            if self.path and not self.read_only:
+                for filepath in (self._vectors_path(), self._index_path()):
+                    if os.path.exists(filepath):
+                        os.remove(filepath)
+
+    def size(self):
+        return len(self._index)
+
+    def get_config(self):
+        return {
+            "path": self.path,
+            "read_only": self.read_only,
+        }
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_mapped"] = None
+        state["_mapped_rows"] = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,110 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+
+import numpy as np
+
+from synalinks.src import testing
+from synalinks.src.caches.embedding_cache import EmbeddingCache
+
+
+class EmbeddingCacheTest(testing.TestCase):
+    def test_in_memory(self):
+        cache = EmbeddingCache()
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", [0.0, 0.5, 1.0])
+        self.assertEqual(cache.get("key"), [0.0, 0.5, 1.0])
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_persistence_across_instances(self):
+        path = os.path.join(self.get_temp_dir(), "embeddings")
+        cache = EmbeddingCache(path=path)
+        cache.put("a", [0.0, 0.5, 1.0])
+        cache.put("b", [1.0, 0.5, 0.0])
+        self.assertEqual(cache.get("b"), [1.0, 0.5, 0.0])
+        cache.put("c", [0.25, 0.25, 0.25])
+        self.assertEqual(cache.get("c"), [0.25, 0.25, 0.25])
+
+        cache = EmbeddingCache(path=path, read_only=True)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get("a"), [0.0, 0.5, 1.0])
+        self.assertIsInstance(cache._mapped, np.memmap)
+        cache.put("d", [0.0, 0.0, 0.0])
+        self.assertEqual(len(cache), 3)
+
+    def test_partially_written_rows_are_ignored(self):
+        path = os.path.join(self.get_temp_dir(), "embeddings")
+        cache = EmbeddingCache(path=path)
+        cache.put("a", [0.0, 0.5, 1.0])
+        with open(os.path.join(path, "index.txt"), "a") as f:
+            f.write("b\n")
+        cache = EmbeddingCache(path=path)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("b"))
+
+    def test_store_after_partially_written_rows(self):
+        path = os.path.join(self.get_temp_dir(), "embeddings")
+        # Orphan key (the vector was not written)
+        cache = EmbeddingCache(path=path)
+        cache.put("a", [0.0, 1.0])
+        with open(os.path.join(path, "index.txt"), "a") as f:
+            f.write("orphan\n")
+        cache = EmbeddingCache(path=path)
+        cache.put("b", [1.0, 2.0])
+        cache.put("c", [2.0, 3.0])
+        cache = EmbeddingCache(path=path)
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get("orphan"))
+        self.assertEqual(cache.get("b"), [1.0, 2.0])
+        self.assertEqual(cache.get("c"), [2.0, 3.0])
+
+        # Orphan vector (the key was not written) and a partial vector
+        cache.clear()
+        cache = EmbeddingCache(path=path)
+        cache.put("a", [0.0, 1.0])
+        with open(os.path.join(path, "vectors.f32"), "ab") as f:
+            f.write(np.asarray([9.0, 9.0], dtype=np.float32).tobytes())
+            f.write(b"\x00\x00")
+        cache = EmbeddingCache(path=path)
+        cache.put("b", [1.0, 2.0])
+        cache.put("c", [2.0, 3.0])
+        cache = EmbeddingCache(path=path)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get("a"), [0.0, 1.0])
+        self.assertEqual(cache.get("b"), [1.0, 2.0])
+        self.assertEqual(cache.get("c"), [2.0, 3.0])
+
+    def test_dimension_mismatch(self):
+        cache = EmbeddingCache()
+        cache.put("a", [0.0, 0.5, 1.0])
+        with self.assertRaises(ValueError):
+            cache.put("b", [0.0, 0.5])
+
+    def test_append_only(self):
+        cache = EmbeddingCache()
+        cache.put("a", [0.0, 0.5, 1.0])
+        with self.assertRaisesRegex(ValueError, "append-only"):
+            cache.delete("a")
+        self.assertEqual(cache.get("a"), [0.0, 0.5, 1.0])
+
+        with self.assertRaisesRegex(ValueError, "max_size"):
+            EmbeddingCache(max_size=10)
+        with self.assertRaisesRegex(ValueError, "ttl"):
+            EmbeddingCache(ttl=60)
+
+    def test_read_only_missing_path(self):
+        path = os.path.join(self.get_temp_dir(), "missing")
+        with self.assertRaises(ValueError):
+            EmbeddingCache(path=path, read_only=True)
+
+    def test_clear(self):
+        path = os.path.join(self.get_temp_dir(), "embeddings")
+        cache = EmbeddingCache(path=path)
+        cache.put("a", [0.0, 0.5, 1.0])
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.put("b", [0.0, 0.5])
+        cache = EmbeddingCache(path=path)
+        self.assertEqual(cache.get("b"), [0.0, 0.5])
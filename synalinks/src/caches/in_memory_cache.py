@@ -0,0 +1,81 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import copy
+import time
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.caches.cache import Cache
+
+
+@synalinks_export(
+    [
+        "synalinks.caches.InMemoryCache",
+        "synalinks.InMemoryCache",
+    ]
+)
+class InMemoryCache(Cache):
+    """An in-memory LRU cache for the language models responses.
+
+    The entries live in the process memory and are lost when the program exits.
+    Use `SQLiteCache` to persist them across runs.
+
+    Example:
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="ollama/mistral",
+        cache=synalinks.caches.InMemoryCache(max_size=1000),
+    )
+    ```
+
+    Args:
+        max_size (int): Optional. The maximum number of entries, the least
+            recently used entries are evicted first (Default to None, unbounded).
+        ttl (float): Optional. The time to live of the entries in seconds
+            (Default to None, never expire).
+        read_only (bool): Optional. If True, the cache is never written and a
+            cache miss raise an error (Default to False).
+    """
+
+    def __init__(
+        self,
+        max_size=None,
+        ttl=None,
+        read_only=False,
+    ):
+        super().__init__(
+            max_size=max_size,
+            ttl=ttl,
+            read_only=read_only,
+        )
+        self._entries = collections.OrderedDict()
+
+    def lookup(self, key):
+        entry = self._entries.get(key, None)
+        if entry is None:
+            return None
+        value, created_at = entry
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def store(self, key, value):
+        self._entries[key] = (copy.deepcopy(value), time.time())
+        self._entries.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def size(self):
+        return len(self._entries)
@@ -0,0 +1,64 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from unittest.mock import patch
+
+from synalinks.src import testing
+from synalinks.src.caches.cache import content_hash
+from synalinks.src.caches.in_memory_cache import InMemoryCache
+
+
+class InMemoryCacheTest(testing.TestCase):
+    def test_content_hash_is_order_independent(self):
+        self.assertEqual(
+            content_hash({"a": 1, "b": [1, 2]}),
+            content_hash({"b": [1, 2], "a": 1}),
+        )
+        self.assertNotEqual(content_hash({"a": 1}), content_hash({"a": 2}))
+
+    def test_hits_and_misses(self):
+        cache = InMemoryCache()
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", {"answer": "Paris"})
+        self.assertEqual(cache.get("key"), {"answer": "Paris"})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_returned_value_is_a_copy(self):
+        cache = InMemoryCache()
+        cache.put("key", {"answers": ["Paris"]})
+        cache.get("key")["answers"].append("Lyon")
+        self.assertEqual(cache.get("key"), {"answers": ["Paris"]})
+
+    def test_lru_eviction(self):
+        cache = InMemoryCache(max_size=2)
+        cache.put("a", {"value": 1})
+        cache.put("b", {"value": 2})
+        cache.get("a")
+        cache.put("c", {"value": 3})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"value": 1})
+        self.assertEqual(cache.get("c"), {"value": 3})
+
+    def test_ttl_expiration(self):
+        cache = InMemoryCache(ttl=10)
+        with patch("time.time", return_value=100.0):
+            cache.put("key", {"value": 1})
+        with patch("time.time", return_value=105.0):
+            self.assertEqual(cache.get("key"), {"value": 1})
+        with patch("time.time", return_value=111.0):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+    def test_read_only(self):
+        cache = InMemoryCache(read_only=True)
+        cache.put("key", {"value": 1})
+        self.assertEqual(len(cache), 0)
+
+    def test_in_memory_cache_from_config(self):
+        cache = InMemoryCache(max_size=10, ttl=60)
+        config = cache.get_config()
+        cache = InMemoryCache.from_config(config)
+        self.assertEqual(cache.max_size, 10)
+        self.assertEqual(cache.ttl, 60)
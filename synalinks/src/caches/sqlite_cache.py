@@ -0,0 +1,200 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.backend.config import synalinks_home
+from synalinks.src.caches.cache import Cache
+
+
+@synalinks_export(
+    [
+        "synalinks.caches.SQLiteCache",
+        "synalinks.SQLiteCache",
+    ]
+)
+class SQLiteCache(Cache):
+    """An on-disk LRU cache for the language models responses backed by SQLite.
+
+    The entries are persisted in a single SQLite file, so they survive across runs
+    and can be shared between processes. Commit the file with your project and
+    use `read_only=True` to replay the recorded responses in your CI.
+
+    A cache hit doesn't write to the file: the access times used to evict the
+    least recently used entries are only tracked when `max_size` is set, and
+    they are kept in memory and written with the next stored entry (or when the
+    cache is closed).
+
+    Example:
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="ollama/mistral",
+        cache=synalinks.caches.SQLiteCache(
+            path="responses.db",
+            ttl=7 * 24 * 60 * 60,
+        ),
+    )
+    ```
+
+    Args:
+        path (str): Optional. The path of the SQLite file
+            (Default to `~/.synalinks/cache.db`).
+        max_size (int): Optional. The maximum number of entries, the least
+            recently used entries are evicted first (Default to None, unbounded).
+        ttl (float): Optional. The time to live of the entries in seconds
+            (Default to None, never expire).
+        read_only (bool): Optional. If True, the cache is never written and a
+            cache miss raise an error (Default to False).
+    """
+
+    def __init__(
+        self,
+        path=None,
+        max_size=None,
+        ttl=None,
+        read_only=False,
+    ):
+        super().__init__(
+            max_size=max_size,
+            ttl=ttl,
+            read_only=read_only,
+        )
+        if not path:
+            path = os.path.join(synalinks_home(), "cache.db")
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+        # The access times of the hits not yet written to the file
+        self._accessed_at = {}
+
+    def _connect(self):
+        if self._connection is None:
+            if self.read_only:
+                if not os.path.exists(self.path):
+                    raise ValueError(
+                        f"Cannot open the cache file '{self.path}' in read-only mode "
+                        "because it does not exist."
+                    )
+                self._connection = sqlite3.connect(
+                    f"file:{self.path}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                )
+            else:
+                dirname = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(dirname, exist_ok=True)
+                self._connection = sqlite3.connect(
+                    self.path,
+                    check_same_thread=False,
+                )
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT PRIMARY KEY, "
+                    "value TEXT NOT NULL, "
+                    "created_at REAL NOT NULL, "
+                    "accessed_at REAL NOT NULL)"
+                )
+                self._connection.execute(
+                    "CREATE INDEX IF NOT EXISTS entries_accessed_at "
+                    "ON entries (accessed_at)"
+                )
+                self._connection.commit()
+        return self._connection
+
+    def lookup(self, key):
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            now = time.time()
+            if self.ttl is not None and now - created_at > self.ttl:
+                if not self.read_only:
+                    connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    connection.commit()
+                return None
+            if not self.read_only and self.max_size is not None:
+                self._accessed_at[key] = now
+            return json.loads(value)
+
+    def _write_accessed_at(self, connection):
+        if self._accessed_at:
+            connection.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                [(now, key) for key, now in self._accessed_at.items()],
+            )
+            self._accessed_at = {}
+
+    def store(self, key, value):
+        with self._lock:
+            connection = self._connect()
+            now = time.time()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+            if self.max_size is not None:
+                self._write_accessed_at(connection)
+                connection.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    "SELECT key FROM entries ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+            connection.commit()
+
+    def delete(self, key):
+        with self._lock:
+            connection = self._connect()
+            self._accessed_at.pop(key, None)
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            connection.commit()
+
+    def clear(self):
+        with self._lock:
+            connection = self._connect()
+            self._accessed_at = {}
+            connection.execute("DELETE FROM entries")
+            connection.commit()
+
+    def size(self):
+        with self._lock:
+            connection = self._connect()
+            (count,) = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+            return count
+
+    def close(self):
+        """Write the pending access times and close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._write_accessed_at(self._connection)
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+
+    def get_config(self):
+        config = super().get_config()
+        return {"path": self.path, **config}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_connection"] = None
+        state["_accessed_at"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
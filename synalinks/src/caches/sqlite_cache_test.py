@@ -0,0 +1,100 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+import sqlite3
+from unittest.mock import patch
+
+from synalinks.src import testing
+from synalinks.src.caches.sqlite_cache import SQLiteCache
+
+
+class SQLiteCacheTest(testing.TestCase):
+    def test_persistence_across_instances(self):
+        path = os.path.join(self.get_temp_dir(), "cache.db")
+        cache = SQLiteCache(path=path)
+        cache.put("key", {"answer": "Paris"})
+        cache.close()
+
+        cache = SQLiteCache(path=path)
+        self.assertEqual(cache.get("key"), {"answer": "Paris"})
+        self.assertEqual(cache.get_stats()["hits"], 1)
+        cache.close()
+
+    def test_lru_eviction(self):
+        path = os.path.join(self.get_temp_dir(), "cache.db")
+        cache = SQLiteCache(path=path, max_size=2)
+        with patch("time.time", return_value=1.0):
+            cache.put("a", {"value": 1})
+        with patch("time.time", return_value=2.0):
+            cache.put("b", {"value": 2})
+        with patch("time.time", return_value=3.0):
+            cache.get("a")
+        with patch("time.time", return_value=4.0):
+            cache.put("c", {"value": 3})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"value": 1})
+        cache.close()
+
+    def test_hits_dont_write(self):
+        path = os.path.join(self.get_temp_dir(), "cache.db")
+        cache = SQLiteCache(path=path, max_size=2)
+        with patch("time.time", return_value=1.0):
+            cache.put("key", {"value": 1})
+        connection = cache._connect()
+        total_changes = connection.total_changes
+        with patch("time.time", return_value=2.0):
+            self.assertEqual(cache.get("key"), {"value": 1})
+        self.assertEqual(connection.total_changes, total_changes)
+
+        # The access times are written when the cache is closed
+        cache.close()
+        connection = sqlite3.connect(path)
+        (accessed_at,) = connection.execute(
+            "SELECT accessed_at FROM entries WHERE key = ?", ("key",)
+        ).fetchone()
+        connection.close()
+        self.assertEqual(accessed_at, 2.0)
+
+        # Without max size, the access times are not tracked
+        cache = SQLiteCache(path=path)
+        with patch("time.time", return_value=3.0):
+            self.assertEqual(cache.get("key"), {"value": 1})
+        self.assertEqual(cache._accessed_at, {})
+        cache.close()
+
+    def test_ttl_expiration(self):
+        path = os.path.join(self.get_temp_dir(), "cache.db")
+        cache = SQLiteCache(path=path, ttl=10)
+        with patch("time.time", return_value=100.0):
+            cache.put("key", {"value": 1})
+        with patch("time.time", return_value=111.0):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+    def test_read_only(self):
+        path = os.path.join(self.get_temp_dir(), "cache.db")
+        cache = SQLiteCache(path=path)
+        cache.put("key", {"value": 1})
+        cache.close()
+
+        cache = SQLiteCache(path=path, read_only=True)
+        cache.put("other_key", {"value": 2})
+        self.assertEqual(cache.get("key"), {"value": 1})
+        self.assertIsNone(cache.get("other_key"))
+        cache.close()
+
+    def test_read_only_missing_file(self):
+        path = os.path.join(self.get_temp_dir(), "missing.db")
+        cache = SQLiteCache(path=path, read_only=True)
+        with self.assertRaises(ValueError):
+            cache.get("key")
+
+    def test_sqlite_cache_from_config(self):
+        path = os.path.join(self.get_temp_dir(), "cache.db")
+        cache = SQLiteCache(path=path, max_size=10)
+        config = cache.get_config()
+        cache = SQLiteCache.from_config(config)
+        self.assertEqual(cache.path, path)
+        self.assertEqual(cache.max_size, 10)
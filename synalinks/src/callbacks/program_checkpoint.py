@@ -10,6 +10,7 @@ import numpy as np
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.callbacks.callback import Callback
+from synalinks.src.saving.state_snapshot import StateSnapshot
 from synalinks.src.utils import file_utils
 from synalinks.src.utils import io_utils
 
@@ -89,6 +90,18 @@ class ProgramCheckpoint(Callback):
 
     # The program variables (that are considered the best) can be loaded as -
     program.load_variables(checkpoint_filepath)
+
+    # For frequent checkpointing, the variables can be saved as an incremental
+    # snapshot written in the background -
+    checkpoint_dirpath = '/tmp/synalinks/checkpoint_snapshot'
+    program_checkpoint_callback = synalinks.callbacks.ProgramCheckpoint(
+        filepath=checkpoint_dirpath,
+        save_format='snapshot',
+        save_freq=1,
+    )
+
+    # The program variables can be restored as -
+    synalinks.saving.StateSnapshot(checkpoint_dirpath).restore(program)
     ```
 
     Args:
@@ -142,6 +155,12 @@ class ProgramCheckpoint(Callback):
             metric to be monitored. Only applies if `save_best_value=True`. Only
             overwrites the program variables already saved if the performance of
             current program is better than this value.
+        save_format (str): `"json"` or `"snapshot"`. When using `"snapshot"`,
+            the program variables are saved as a `synalinks.saving.StateSnapshot`
+            in the `filepath` directory: only the variables that changed since
+            the last save are written, and the files are written by a
+            background thread so the training doesn't wait for the I/O.
+            Defaults to `"json"`.
     """
 
     def __init__(
@@ -154,6 +173,7 @@ class ProgramCheckpoint(Callback):
         mode="auto",
         save_freq="epoch",
         initial_value_threshold=None,
+        save_format="json",
     ):
         super().__init__()
         self.monitor = monitor
@@ -162,6 +182,8 @@ class ProgramCheckpoint(Callback):
         self.save_best_only = save_best_only
         self.save_variables_only = save_variables_only
         self.save_freq = save_freq
+        self.save_format = save_format
+        self._snapshot = None
         self._batches_seen_since_last_saving = 0
         self._last_batch_seen = 0
         self.best = initial_value_threshold
@@ -192,7 +214,20 @@ class ProgramCheckpoint(Callback):
                 "Expected save_freq are 'epoch' or integer values"
             )
 
-        if save_variables_only:
+        if save_format not in ["json", "snapshot"]:
+            raise ValueError(
+                f"Unrecognized save_format: {save_format}. "
+                "Expected save_format are 'json' or 'snapshot'"
+            )
+
+        if save_format == "snapshot":
+            if self.filepath.endswith(".json"):
+                raise ValueError(
+                    "When using `save_format='snapshot'` in `ProgramCheckpoint`, "
+                    "the filepath provided must be a directory, not a `.json` "
+                    f"file. Received: filepath={self.filepath}"
+                )
+        elif save_variables_only:
             if not self.filepath.endswith(".variables.json"):
                 raise ValueError(
                     "When using `save_variables_only=True` in `ProgramCheckpoint`"
@@ -219,6 +254,23 @@ class ProgramCheckpoint(Callback):
         if self.save_freq == "epoch":
             self._save_program(epoch=epoch, batch=None, logs=logs)
 
+    def on_train_end(self, logs=None):
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def _save(self, filepath):
+        if self.save_format == "snapshot":
+            if self._snapshot is None or self._snapshot.directory != filepath:
+                if self._snapshot is not None:
+                    self._snapshot.close()
+                self._snapshot = StateSnapshot(filepath)
+            self._snapshot.save(self.program, blocking=False)
+        elif self.save_variables_only:
+            self.program.save_variables(filepath, overwrite=True)
+        else:
+            self.program.save(filepath, overwrite=True)
+
     def _should_save_on_batch(self, batch):
         """Handles batch-level saving logic, supports steps_per_execution."""
         if self.save_freq == "epoch":
@@ -267,7 +319,7 @@ class ProgramCheckpoint(Callback):
                         f"a scalar value. Received: {current}. "
                         "Falling back to `save_best_only=False`."
                     )
-                    self.program.save(filepath, overwrite=True)
+                    self._save(filepath)
                 else:
                     if self.monitor_op(current, self.best):
                         if self.verbose > 0:
@@ -278,10 +330,7 @@ class ProgramCheckpoint(Callback):
                                 f"saving program to {filepath}"
                             )
                         self.best = current
-                        if self.save_variables_only:
-                            self.program.save_variables(filepath, overwrite=True)
-                        else:
-                            self.program.save(filepath, overwrite=True)
+                        self._save(filepath)
                     else:
                         if self.verbose > 0:
                             io_utils.print_msg(
@@ -292,10 +341,7 @@ class ProgramCheckpoint(Callback):
             else:
                 if self.verbose > 0:
                     io_utils.print_msg(f"\nEpoch {epoch + 1}: saving model to {filepath}")
-                if self.save_variables_only:
-                    self.program.save_variables(filepath, overwrite=True)
-                else:
-                    self.program.save(filepath, overwrite=True)
+                self._save(filepath)
         except IsADirectoryError:  # h5py 3.x
             raise IOError(
                 "Please specify a non-directory filepath for "
@@ -0,0 +1,185 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import numpy as np
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.backend import JsonDataModel
+
+StringDType = getattr(np.dtypes, "StringDType", None)
+
+
+def _to_column(values):
+    """Convert a list of field values into a compact numpy array.
+
+    Booleans, integers and floats are stored in typed arrays, strings in
+    variable-length string arrays (if supported by numpy), and the other
+    values (nested objects, lists or fields with missing values) in object arrays.
+    """
+    types = set(type(value) for value in values)
+    if types == {bool}:
+        return np.array(values, dtype=np.bool_)
+    if types == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    if types == {float}:
+        return np.array(values, dtype=np.float64)
+    if types == {str} and StringDType is not None:
+        return np.array(values, dtype=StringDType())
+    column = np.empty(len(values), dtype="object")
+    column[:] = values
+    return column
+
+
+class _Columns:
+    """The columns of data models sharing the same schema."""
+
+    def __init__(self, schema, keys, columns, size):
+        self.schema = schema
+        self.keys = keys
+        self.columns = columns
+        self.size = size
+
+    @classmethod
+    def from_data_models(cls, data_models):
+        schema = None
+        keys = None
+        rows = []
+        for data_model in data_models:
+            if data_model is None:
+                raise ValueError(
+                    "The ColumnarDataset doesn't support missing data models, "
+                    f"received: {data_model}"
+                )
+            if schema is None:
+                schema = data_model.get_schema()
+            json = data_model.get_json()
+            if keys is None:
+                keys = list(json.keys())
+            elif list(json.keys()) != keys:
+                raise ValueError(
+                    "All the data models of a ColumnarDataset should have the same "
+                    f"fields. Expected fields {keys}, received {list(json.keys())}."
+                )
+            rows.append(json)
+        if schema is None:
+            raise ValueError("Cannot create a ColumnarDataset without data models.")
+        columns = {key: _to_column([row[key] for row in rows]) for key in keys}
+        return cls(schema, keys, columns, len(rows))
+
+    def take(self, indices):
+        columns = {key: column[indices] for key, column in self.columns.items()}
+        size = len(next(iter(columns.values()))) if columns else 0
+        return _Columns(self.schema, self.keys, columns, size)
+
+    def materialize(self, indices):
+        values = [self.columns[key][indices].tolist() for key in self.keys]
+        outputs = np.empty(len(values[0]) if values else 0, dtype="object")
+        outputs[:] = [
+            JsonDataModel(json=dict(zip(self.keys, row)), schema=self.schema)
+            for row in zip(*values)
+        ]
+        return outputs
+
+
+@synalinks_export("synalinks.datasets.ColumnarDataset")
+class ColumnarDataset:
+    """An in-memory dataset storing the data models field by field.
+
+    Instead of keeping one Python object per example, each field of the data
+    models is stored in its own numpy array (typed arrays for the numbers and
+    booleans and compact string arrays for the strings). The data models are
+    only materialized into `JsonDataModel`s when a batch is requested, which
+    makes large datasets cheap in memory and fast to shuffle (the examples
+    are shuffled using an index permutation).
+
+    All the data models of `x` (and `y`) should have the same schema.
+
+    Example:
+
+    ```python
+    (x_train, y_train), (x_test, y_test) = synalinks.datasets.gsm8k.load_data()
+
+    train_dataset = synalinks.datasets.ColumnarDataset(x_train, y_train)
+    test_dataset = synalinks.datasets.ColumnarDataset(x_test, y_test)
+
+    history = await program.fit(
+        x=train_dataset,
+        validation_data=test_dataset,
+        batch_size=32,
+        epochs=4,
+    )
+    ```
+
+    Args:
+        x (list | np.ndarray): The input data models (`DataModel`s or
+            `JsonDataModel`s).
+        y (list | np.ndarray): Optional. The target data models.
+    """
+
+    def __init__(self, x, y=None):
+        if isinstance(x, _Columns):
+            self._x = x
+            self._y = y
+        else:
+            self._x = _Columns.from_data_models(x)
+            self._y = _Columns.from_data_models(y) if y is not None else None
+        if self._y is not None and self._y.size != self._x.size:
+            raise ValueError(
+                "The inputs and targets should have the same number of examples, "
+                f"received {self._x.size} inputs and {self._y.size} targets."
+            )
+
+    def __len__(self):
+        return self._x.size
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+    @property
+    def has_targets(self):
+        """Whether or not the dataset contains targets."""
+        return self._y is not None
+
+    def get_x_schema(self):
+        """Returns the JSON schema of the inputs."""
+        return self._x.schema
+
+    def get_y_schema(self):
+        """Returns the JSON schema of the targets (or None)."""
+        return self._y.schema if self._y is not None else None
+
+    def __getitem__(self, key):
+        """Returns a subset of the dataset.
+
+        Args:
+            key (slice | list | np.ndarray): The indices of the examples to keep.
+
+        Returns:
+            (ColumnarDataset): The subset of the dataset.
+        """
+        if isinstance(key, (int, np.integer)):
+            raise TypeError(
+                "Use `get_batch()` to retrieve data models from a ColumnarDataset, "
+                f"indexing only supports slices and index arrays, received: {key}"
+            )
+        return ColumnarDataset(
+            self._x.take(key),
+            self._y.take(key) if self._y is not None else None,
+        )
+
+    def get_batch(self, indices):
+        """Materialize a batch of examples into `JsonDataModel`s.
+
+        Args:
+            indices (slice | list | np.ndarray): The indices of the examples.
+
+        Returns:
+            (tuple): The `(x, y)` object arrays of `JsonDataModel`s,
+                `y` is None if the dataset doesn't have targets.
+        """
+        x = self._x.materialize(indices)
+        y = self._y.materialize(indices) if self._y is not None else None
+        return x, y
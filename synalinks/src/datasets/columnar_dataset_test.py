@@ -0,0 +1,74 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from typing import List
+from typing import Optional
+
+import numpy as np
+
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.datasets.columnar_dataset import ColumnarDataset
+
+
+class Document(DataModel):
+    title: str
+    views: int
+    score: float
+    published: bool
+    tags: List[str]
+    summary: Optional[str] = None
+
+
+def make_documents(n):
+    return [
+        Document(
+            title=f"Document {i}",
+            views=i,
+            score=i / 2,
+            published=i % 2 == 0,
+            tags=[f"tag {i}"],
+            summary="summary" if i % 2 else None,
+        )
+        for i in range(n)
+    ]
+
+
+class ColumnarDatasetTest(testing.TestCase):
+    def test_columns(self):
+        documents = make_documents(4)
+        dataset = ColumnarDataset(documents)
+        self.assertEqual(len(dataset), 4)
+        self.assertFalse(dataset.has_targets)
+
+        columns = dataset._x.columns
+        self.assertEqual(columns["views"].dtype, np.int64)
+        self.assertEqual(columns["score"].dtype, np.float64)
+        self.assertEqual(columns["published"].dtype, np.bool_)
+        self.assertEqual(columns["tags"].dtype, object)
+        self.assertEqual(columns["summary"].dtype, object)
+
+        x, y = dataset.get_batch(np.array([2, 1]))
+        self.assertIsNone(y)
+        self.assertEqual(x[0].get_json(), documents[2].get_json())
+        self.assertEqual(x[1].get_json(), documents[1].get_json())
+        self.assertIsInstance(x[0].get("views"), int)
+        self.assertIs(x[0].get_schema(), Document.get_schema())
+
+    def test_slicing(self):
+        documents = make_documents(6)
+        dataset = ColumnarDataset(documents, documents)
+        subset = dataset[2:4]
+        self.assertEqual(len(subset), 2)
+        x, y = subset.get_batch(slice(0, 2))
+        self.assertEqual(x[0].get("title"), "Document 2")
+        self.assertEqual(y[1].get("title"), "Document 3")
+
+        with self.assertRaises(TypeError):
+            dataset[0]
+
+    def test_invalid_datasets(self):
+        documents = make_documents(2)
+        with self.assertRaisesRegex(ValueError, "same number of examples"):
+            ColumnarDataset(documents, documents[:1])
+        with self.assertRaisesRegex(ValueError, "without data models"):
+            ColumnarDataset([])
@@ -0,0 +1,290 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+
+import numpy as np
+
+from synalinks.src.api_export import synalinks_export
+
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+
+def build_line_index(path):
+    """Build the offsets of the non-empty lines of a file.
+
+    The file is scanned once in binary mode without being loaded in memory.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        (np.ndarray): The int64 array of the lines offsets.
+    """
+    offsets = []
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                offsets.append(offset)
+            offset += len(line)
+    return np.array(offsets, dtype=np.int64)
+
+
+class _JsonlReader:
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.offsets = self._load_index(index_path)
+        self._file = None
+
+    def _load_index(self, index_path):
+        stat = os.stat(self.path)
+        # The index header contains the file size and modification time,
+        # so an outdated index is rebuilt
+        header = [stat.st_size, stat.st_mtime_ns]
+        if index_path and os.path.exists(index_path):
+            index = np.load(index_path)
+            if index[:2].tolist() == header:
+                return index[2:]
+        offsets = build_line_index(self.path)
+        if index_path:
+            with open(index_path, "wb") as f:
+                np.save(f, np.concatenate([np.array(header, dtype=np.int64), offsets]))
+        return offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def read(self, indices):
+        if self._file is None:
+            self._file = open(self.path, "rb")
+        records = []
+        for index in indices:
+            self._file.seek(self.offsets[index])
+            records.append(json.loads(self._file.readline()))
+        return records
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _ParquetReader:
+    def __init__(self, path):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Reading Parquet files requires `pyarrow`, "
+                "install it with `pip install pyarrow`."
+            ) from e
+
+        self.path = path
+        self._file = pq.ParquetFile(path)
+        metadata = self._file.metadata
+        rows = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        self.row_group_starts = np.cumsum([0] + rows)
+        self._row_group = None
+        self._table = None
+
+    def __len__(self):
+        return int(self.row_group_starts[-1])
+
+    def read(self, indices):
+        indices = np.asarray(indices)
+        row_groups = np.searchsorted(self.row_group_starts, indices, side="right") - 1
+        records = [None] * len(indices)
+        # Read each row group once (the last one is kept for the next batch)
+        for row_group in np.unique(row_groups):
+            if self._row_group != row_group:
+                self._table = self._file.read_row_group(int(row_group))
+                self._row_group = row_group
+            positions = np.nonzero(row_groups == row_group)[0]
+            local_indices = indices[positions] - self.row_group_starts[row_group]
+            rows = self._table.take(local_indices).to_pylist()
+            for position, row in zip(positions, rows):
+                records[position] = row
+        return records
+
+    def close(self):
+        self._row_group = None
+        self._table = None
+
+
+@synalinks_export("synalinks.datasets.StreamingDataset")
+class StreamingDataset:
+    """A file-backed dataset streaming JSONL or Parquet files.
+
+    The records are never loaded all at once: a line-offset index is built by
+    scanning the JSONL file once (or read from the Parquet metadata), allowing
+    random access to shuffle the examples, and the records are read and
+    validated against the data models only when their batch is requested.
+    This allows to `fit()`, `evaluate()` or `predict()` on large corpora
+    with a flat memory usage.
+
+    Each record is a JSON object. If `input_key` (resp. `output_key`) is
+    provided, the inputs (resp. targets) are read from this key of the records,
+    otherwise the record fields of the data model are used.
+
+    The dataset keeps track of its position in `fit()` (the epoch and the
+    number of examples already trained on), which can be saved with
+    `get_state()` and restored with `set_state()` to resume an interrupted run.
+    The evaluation and the predictions always iterate over the whole dataset,
+    without changing its position.
+
+    Example:
+
+    ```python
+    dataset = synalinks.datasets.StreamingDataset(
+        "train.jsonl",
+        input_data_model=Query,
+        output_data_model=Answer,
+    )
+
+    history = await program.fit(
+        x=dataset,
+        batch_size=32,
+        epochs=2,
+    )
+    ```
+
+    Args:
+        path (str): The path of the JSONL (`.jsonl`, `.ndjson`) or Parquet
+            (`.parquet`, `.pq`) file.
+        input_data_model (DataModel): The data model of the inputs.
+        output_data_model (DataModel): Optional. The data model of the targets.
+        input_key (str): Optional. The key of the inputs in the records.
+        output_key (str): Optional. The key of the targets in the records.
+        index_path (str): Optional. Where to save the line-offset index of a
+            JSONL file, to reuse it the next time the file is opened.
+        seed (int): Optional. The seed used to shuffle the examples,
+            making the order of the epochs reproducible.
+    """
+
+    def __init__(
+        self,
+        path,
+        input_data_model=None,
+        output_data_model=None,
+        input_key=None,
+        output_key=None,
+        index_path=None,
+        seed=None,
+    ):
+        if not input_data_model:
+            raise ValueError("You should provide the `input_data_model` argument.")
+        self.path = path
+        self.input_data_model = input_data_model
+        self.output_data_model = output_data_model
+        self.input_key = input_key
+        self.output_key = output_key
+        self.index_path = index_path
+        self.seed = seed if seed is not None else int(np.random.randint(2**31))
+        self.epoch = 0
+        self.position = 0
+        if path.endswith(PARQUET_EXTENSIONS):
+            self._reader = _ParquetReader(path)
+        elif path.endswith(JSONL_EXTENSIONS):
+            self._reader = _JsonlReader(path, index_path=index_path)
+        else:
+            raise ValueError(
+                f"Unsupported file format for '{path}', expected one of "
+                f"{JSONL_EXTENSIONS + PARQUET_EXTENSIONS}."
+            )
+
+    def __len__(self):
+        return len(self._reader)
+
+    @property
+    def has_targets(self):
+        """Whether or not the dataset contains targets."""
+        return self.output_data_model is not None
+
+    def get_state(self):
+        """Returns the position of the dataset to resume from it later.
+
+        Returns:
+            (dict): The `epoch`, `position` and `seed` of the dataset.
+        """
+        return {"epoch": self.epoch, "position": self.position, "seed": self.seed}
+
+    def set_state(self, state):
+        """Restore the position of the dataset.
+
+        Args:
+            state (dict): A state returned by `get_state()`.
+        """
+        self.epoch = state.get("epoch", 0)
+        self.position = state.get("position", 0)
+        self.seed = state.get("seed", self.seed)
+
+    def get_permutation(self, shuffle=False):
+        """Returns the order of the examples for the current epoch.
+
+        Args:
+            shuffle (bool | str): Whether to shuffle the examples, `"batch"`
+                is handled by the data adapter.
+
+        Returns:
+            (np.ndarray | None): The permutation of the examples or None.
+        """
+        if not shuffle or shuffle == "batch":
+            return None
+        rng = np.random.default_rng([self.seed, self.epoch])
+        return rng.permutation(len(self))
+
+    def _validate(self, data_model, record, key, index):
+        if key is not None:
+            record = record.get(key)
+        else:
+            record = {k: v for k, v in record.items() if k in data_model.model_fields}
+        try:
+            return data_model(**record)
+        except Exception as e:
+            raise ValueError(
+                f"Invalid record {index} in '{self.path}' for the data model "
+                f"{data_model.__name__}: {e}"
+            ) from e
+
+    def get_batch(self, indices):
+        """Read and validate a batch of examples.
+
+        Args:
+            indices (list | np.ndarray): The indices of the examples.
+
+        Returns:
+            (tuple): The `(x, y)` object arrays of `DataModel`s,
+                `y` is None if the dataset doesn't have targets.
+        """
+        records = self._reader.read(indices)
+        x = np.empty(len(records), dtype="object")
+        x[:] = [
+            self._validate(self.input_data_model, record, self.input_key, index)
+            for index, record in zip(indices, records)
+        ]
+        y = None
+        if self.output_data_model is not None:
+            y = np.empty(len(records), dtype="object")
+            y[:] = [
+                self._validate(self.output_data_model, record, self.output_key, index)
+                for index, record in zip(indices, records)
+            ]
+        return x, y
+
+    def close(self):
+        """Close the underlying file."""
+        self._reader.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_reader"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.path.endswith(PARQUET_EXTENSIONS):
+            self._reader = _ParquetReader(self.path)
+        else:
+            self._reader = _JsonlReader(self.path, index_path=self.index_path)
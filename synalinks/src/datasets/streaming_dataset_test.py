@@ -0,0 +1,153 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+import pickle
+
+import numpy as np
+
+from synalinks.src import testing
+from synalinks.src.datasets.streaming_dataset import StreamingDataset
+from synalinks.src.datasets.streaming_dataset import build_line_index
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+
+
+def write_jsonl(path, records):
+    with open(path, "w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+            # Blank lines are ignored
+            f.write("\n")
+    return path
+
+
+def make_records(n):
+    return [
+        {"query": f"query {i}", "rationale": "rationale", "answer": str(i)}
+        for i in range(n)
+    ]
+
+
+class StreamingDatasetTest(testing.TestCase):
+    def test_build_line_index(self):
+        path = write_jsonl(os.path.join(self.get_temp_dir(), "data.jsonl"), [{}, {}])
+        self.assertEqual(build_line_index(path).tolist(), [0, 4])
+
+    def test_get_batch(self):
+        path = write_jsonl(
+            os.path.join(self.get_temp_dir(), "data.jsonl"), make_records(5)
+        )
+        dataset = StreamingDataset(
+            path,
+            input_data_model=Query,
+            output_data_model=AnswerWithRationale,
+        )
+        self.assertEqual(len(dataset), 5)
+        self.assertTrue(dataset.has_targets)
+
+        x, y = dataset.get_batch([3, 1])
+        self.assertIsInstance(x[0], Query)
+        self.assertEqual([inputs.query for inputs in x], ["query 3", "query 1"])
+        self.assertEqual([targets.answer for targets in y], ["3", "1"])
+
+        dataset = StreamingDataset(path, input_data_model=Query)
+        self.assertFalse(dataset.has_targets)
+        x, y = dataset.get_batch([0])
+        self.assertEqual(x[0].query, "query 0")
+        self.assertIsNone(y)
+
+    def test_keys(self):
+        path = write_jsonl(
+            os.path.join(self.get_temp_dir(), "data.jsonl"),
+            [
+                {
+                    "inputs": {"query": "query"},
+                    "outputs": {"answer": "a", "rationale": "r"},
+                }
+            ],
+        )
+        dataset = StreamingDataset(
+            path,
+            input_data_model=Query,
+            output_data_model=AnswerWithRationale,
+            input_key="inputs",
+            output_key="outputs",
+        )
+        x, y = dataset.get_batch([0])
+        self.assertEqual(x[0].query, "query")
+        self.assertEqual(y[0].answer, "a")
+
+    def test_invalid_record(self):
+        path = write_jsonl(
+            os.path.join(self.get_temp_dir(), "data.jsonl"),
+            make_records(2) + [{"answer": "2"}],
+        )
+        dataset = StreamingDataset(path, input_data_model=Query)
+        # The records are validated lazily
+        dataset.get_batch([0, 1])
+        with self.assertRaisesRegex(ValueError, "Invalid record 2"):
+            dataset.get_batch([2])
+
+    def test_unsupported_format(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported file format"):
+            StreamingDataset("data.csv", input_data_model=Query)
+
+    def test_index_path(self):
+        path = write_jsonl(
+            os.path.join(self.get_temp_dir(), "data.jsonl"), make_records(3)
+        )
+        index_path = path + ".idx"
+        dataset = StreamingDataset(path, input_data_model=Query, index_path=index_path)
+        self.assertTrue(os.path.exists(index_path))
+
+        with open(index_path, "rb") as f:
+            self.assertEqual(len(np.load(f)), 2 + 3)
+        dataset = StreamingDataset(path, input_data_model=Query, index_path=index_path)
+        self.assertEqual(len(dataset), 3)
+
+        # An outdated index is rebuilt
+        write_jsonl(path, make_records(4))
+        dataset = StreamingDataset(path, input_data_model=Query, index_path=index_path)
+        self.assertEqual(len(dataset), 4)
+
+    def test_parquet(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.get_temp_dir(), "data.parquet")
+        pq.write_table(pa.Table.from_pylist(make_records(5)), path, row_group_size=2)
+        dataset = StreamingDataset(
+            path,
+            input_data_model=Query,
+            output_data_model=AnswerWithRationale,
+        )
+        self.assertEqual(len(dataset), 5)
+        x, y = dataset.get_batch([4, 0, 3])
+        queries = [inputs.query for inputs in x]
+        self.assertEqual(queries, ["query 4", "query 0", "query 3"])
+        self.assertEqual([targets.answer for targets in y], ["4", "0", "3"])
+
+    def test_state(self):
+        path = write_jsonl(
+            os.path.join(self.get_temp_dir(), "data.jsonl"), make_records(5)
+        )
+        dataset = StreamingDataset(path, input_data_model=Query, seed=42)
+        permutation = dataset.get_permutation(shuffle=True)
+        self.assertEqual(sorted(permutation.tolist()), list(range(5)))
+        self.assertIsNone(dataset.get_permutation(shuffle=False))
+
+        dataset.position = 2
+        state = dataset.get_state()
+        self.assertEqual(state, {"epoch": 0, "position": 2, "seed": 42})
+
+        restored = StreamingDataset(path, input_data_model=Query)
+        restored.set_state(state)
+        self.assertEqual(restored.get_state(), state)
+        self.assertEqual(
+            restored.get_permutation(shuffle=True).tolist(), permutation.tolist()
+        )
+
+        restored = pickle.loads(pickle.dumps(dataset))
+        self.assertEqual(restored.get_state(), state)
+        self.assertEqual(restored.get_batch([1])[0][0].query, "query 1")
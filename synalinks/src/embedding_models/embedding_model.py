@@ -1,12 +1,18 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import contextlib
 import warnings
 
 import litellm
 
 from synalinks.src.api_export import synalinks_export
+from synalinks.src.caches.cache import content_hash
 from synalinks.src.saving import serialization_lib
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
+from synalinks.src.utils.rate_limiter import estimate_tokens
+from synalinks.src.utils.rate_limiter import get_rate_limiter
+from synalinks.src.utils.rate_limiter import is_retryable_error
 
 
 @synalinks_export(
@@ -79,6 +85,40 @@ class EmbeddingModel(SynalinksSaveable):
     )
     ```
 
+    **Coalescing concurrent requests**
+
+    Most of the callers (like the knowledge bases similarity search) embed
+    a single text at a time. When many of them run concurrently, use the
+    `coalescing_window` argument to gather their texts during a few milliseconds
+    (or until `max_batch_size` texts are pending) and send them in a single
+    request to the provider. The vectors are then dispatched back to each caller.
+
+    ```python
+    import synalinks
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="ollama/mxbai-embed-large",
+        coalescing_window=0.005,
+        max_batch_size=128,
+    )
+    ```
+
+    **Caching the embedding vectors**
+
+    To never re-embed a known text (e.g. the ground truth of the
+    `CosineSimilarity` reward or the entities of a knowledge base), use the
+    `cache` argument with an `EmbeddingCache`. The vectors are stored on disk in a
+    memory-mapped file that can be shared in read-only mode across processes.
+
+    ```python
+    import synalinks
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="ollama/mxbai-embed-large",
+        cache=synalinks.caches.EmbeddingCache(path="embeddings_cache"),
+    )
+    ```
+
     **Note**: Obviously, use an `.env` file and `.gitignore` to avoid
     putting your API keys in the code or a config file that can lead to
     leackage when pushing it into repositories.
@@ -89,6 +129,17 @@ class EmbeddingModel(SynalinksSaveable):
         retry (int): Optional. The number of retry.
         fallback (EmbeddingModel): Optional. The embedding model to fallback
             if anything is wrong.
+        rate_limiter (RateLimiter): Optional. The rate limiter to use
+            (Default to None, use the one registered for the provider
+            with `synalinks.utils.set_rate_limiter()` if any).
+        coalescing_window (float): Optional. The time in seconds to wait for other
+            concurrent calls before sending a request to the provider
+            (Default to None, no coalescing).
+        max_batch_size (int): Optional. The maximum number of pending texts before
+            sending a coalesced request without waiting for the end of the
+            window (Default to 256).
+        cache (EmbeddingCache): Optional. The cache used to store the vectors
+            (Default to None, no caching).
     """
 
     def __init__(
@@ -98,6 +149,10 @@ class EmbeddingModel(SynalinksSaveable):
         retry=5,
         fallback=None,
         caching=True,
+        rate_limiter=None,
+        coalescing_window=None,
+        max_batch_size=256,
+        cache=None,
     ):
         if model is None:
             raise ValueError(
@@ -111,6 +166,11 @@ class EmbeddingModel(SynalinksSaveable):
         self.retry = retry
         self.fallback = fallback
         self.caching = caching
+        self.rate_limiter = rate_limiter
+        self.coalescing_window = coalescing_window
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self._batcher = None
 
     async def __call__(self, texts, **kwargs):
         """
@@ -122,38 +182,85 @@ class EmbeddingModel(SynalinksSaveable):
         Returns:
             (list): The list of corresponding vectors.
         """
+        if self.cache is None:
+            return await self._dispatch(texts, **kwargs)
+        keys = [
+            content_hash({"model": self.model, "text": text, "kwargs": kwargs})
+            for text in texts
+        ]
+        vectors = [self.cache.get(key) for key in keys]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            if self.cache.read_only:
+                raise ValueError(
+                    f"Cache miss for {self} while the cache is in read-only mode. "
+                    "Re-run your program with a writable cache to record "
+                    "the missing embeddings."
+                )
+            result = await self._dispatch([texts[i] for i in missing], **kwargs)
+            if result is None:
+                return None
+            for i, vector in zip(missing, result["embeddings"]):
+                self.cache.put(keys[i], vector)
+                vectors[i] = vector
+        return {"embeddings": vectors}
+
+    async def _dispatch(self, texts, **kwargs):
+        if self.coalescing_window and not kwargs:
+            if self._batcher is None:
+                self._batcher = EmbeddingBatcher(
+                    self._embed,
+                    window=self.coalescing_window,
+                    max_batch_size=self.max_batch_size,
+                )
+            return await self._batcher.submit(texts)
+        return await self._embed(texts, **kwargs)
 
+    async def _embed(self, texts, **kwargs):
+        rate_limiter = self._get_rate_limiter()
         for i in range(self.retry):
             try:
-                if self.api_base:
-                    response = await litellm.aembedding(
-                        model=self.model,
-                        input=texts,
-                        api_base=self.api_base,
-                        caching=self.caching,
-                        **kwargs,
-                    )
+                if rate_limiter:
+                    limit = rate_limiter.limit(tokens=estimate_tokens(texts))
                 else:
-                    response = await litellm.aembedding(
-                        model=self.model,
-                        input=texts,
-                        caching=self.caching,
-                        **kwargs,
-                    )
+                    limit = contextlib.nullcontext()
+                async with limit:
+                    if self.api_base:
+                        response = await litellm.aembedding(
+                            model=self.model,
+                            input=texts,
+                            api_base=self.api_base,
+                            caching=self.caching,
+                            **kwargs,
+                        )
+                    else:
+                        response = await litellm.aembedding(
+                            model=self.model,
+                            input=texts,
+                            caching=self.caching,
+                            **kwargs,
+                        )
                 vectors = []
                 for data in response["data"]:
                     vectors.append(data["embedding"])
                 return {"embeddings": vectors}
             except Exception as e:
                 warnings.warn(f"Error occured while trying to call {self}: " + str(e))
+                if rate_limiter and i < self.retry - 1 and is_retryable_error(e):
+                    await rate_limiter.backoff(i)
         if self.fallback:
-            return self.fallback(
+            return await self.fallback(
                 texts,
                 **kwargs,
             )
         else:
             return None
 
+    def _get_rate_limiter(self):
+        if self.rate_limiter is not None:
+            return self.rate_limiter
+        return get_rate_limiter(self.model.split("/")[0])
+
     def _obj_type(self):
         return "EmbeddingModel"
 
@@ -163,6 +270,29 @@ class EmbeddingModel(SynalinksSaveable):
             "api_base": self.api_base,
             "retry": self.retry,
         }
+        if self.cache is not None:
+            config.update(
+                {
+                    "cache": serialization_lib.serialize_synalinks_object(
+                        self.cache,
+                    )
+                }
+            )
+        if self.coalescing_window:
+            config.update(
+                {
+                    "coalescing_window": self.coalescing_window,
+                    "max_batch_size": self.max_batch_size,
+                }
+            )
+        if self.rate_limiter is not None:
+            config.update(
+                {
+                    "rate_limiter": serialization_lib.serialize_synalinks_object(
+                        self.rate_limiter,
+                    )
+                }
+            )
         if self.fallback:
             fallback_config = {
                 "fallback": serialization_lib.serialize_synalinks_object(
@@ -175,6 +305,14 @@ class EmbeddingModel(SynalinksSaveable):
 
     @classmethod
     def from_config(cls, config):
+        if "cache" in config:
+            config["cache"] = serialization_lib.deserialize_synalinks_object(
+                config.pop("cache")
+            )
+        if "rate_limiter" in config:
+            config["rate_limiter"] = serialization_lib.deserialize_synalinks_object(
+                config.pop("rate_limiter")
+            )
         if "fallback" in config:
             fallback = serialization_lib.deserialize_synalinks_object(
                 config.pop("fallback")
@@ -183,6 +321,103 @@ class EmbeddingModel(SynalinksSaveable):
         else:
             return cls(**config)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_batcher"] = None
+        return state
+
     def __repr__(self):
         api_base = f" api_base={self.api_base}" if self.api_base else ""
         return f"<EmbeddingModel model={self.model}{api_base}>"
+
+
+class _PendingBatch:
+    def __init__(self, loop):
+        self.loop = loop
+        self.requests = []
+        self.size = 0
+        self.handle = None
+        self.flushed = False
+
+
+class EmbeddingBatcher:
+    """Coalesce the concurrent embedding requests into a single provider call.
+
+    The texts submitted during the `window` (or until `max_batch_size` texts are
+    pending) are embedded together, then the vectors are dispatched back to
+    each caller in order.
+
+    Args:
+        embed_fn (callable): The coroutine function embedding a list of texts and
+            returning a dict with the `embeddings` key (or `None` on failure).
+        window (float): The time in seconds to wait for other requests.
+        max_batch_size (int): The maximum number of pending texts before flushing.
+    """
+
+    def __init__(self, embed_fn, window=0.005, max_batch_size=256):
+        self.embed_fn = embed_fn
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._batch = None
+        self._tasks = set()
+
+    async def submit(self, texts):
+        """Submit texts to embed and wait for their vectors.
+
+        Args:
+            texts (list): A list of texts to embed.
+
+        Returns:
+            (dict): The `embeddings` of the given texts or `None` on failure.
+        """
+        texts = list(texts)
+        if not texts:
+            return {"embeddings": []}
+        loop = asyncio.get_running_loop()
+        batch = self._batch
+        if batch is None or batch.loop is not loop:
+            batch = _PendingBatch(loop)
+            batch.handle = loop.call_later(self.window, self._flush, batch)
+            self._batch = batch
+        future = loop.create_future()
+        batch.requests.append((texts, future))
+        batch.size += len(texts)
+        if batch.size >= self.max_batch_size:
+            self._flush(batch)
+        return await future
+
+    def _flush(self, batch):
+        if self._batch is batch:
+            self._batch = None
+        if batch.flushed:
+            return
+        batch.flushed = True
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = batch.loop.create_task(self._run(batch.requests))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, requests):
+        texts = [text for request_texts, _ in requests for text in request_texts]
+        try:
+            result = await self.embed_fn(texts)
+            if result is not None and len(result["embeddings"]) != len(texts):
+                raise ValueError(
+                    f"Expected {len(texts)} embeddings vectors, "
+                    f"received {len(result['embeddings'])}."
+                )
+        except Exception as e:
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        start = 0
+        for request_texts, future in requests:
+            end = start + len(request_texts)
+            if not future.done():
+                if result is None:
+                    future.set_result(None)
+                else:
+                    future.set_result({"embeddings": result["embeddings"][start:end]})
+            start = end
@@ -1,9 +1,11 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 from unittest.mock import patch
 
 from synalinks.src import testing
 from synalinks.src.backend import Embeddings
+from synalinks.src.caches import EmbeddingCache
 from synalinks.src.embedding_models.embedding_model import EmbeddingModel
 
 
@@ -18,3 +20,85 @@ class EmbeddingModelTest(testing.TestCase):
         result = await embedding_model(["What is the capital of France?"])
         self.assertEqual(result, Embeddings(**result).get_json())
         self.assertEqual(result, {"embeddings": [expected_value]})
+
+    @patch("litellm.aembedding")
+    async def test_coalescing_concurrent_calls(self, mock_embedding):
+        embedding_model = EmbeddingModel(
+            model="ollama/all-minilm",
+            coalescing_window=0.01,
+        )
+
+        async def embed(model=None, input=None, **kwargs):
+            return {
+                "data": [{"embedding": [float(len(text))]} for text in input],
+            }
+
+        mock_embedding.side_effect = embed
+
+        results = await asyncio.gather(
+            embedding_model(["a"]),
+            embedding_model(["bb", "ccc"]),
+            embedding_model(["dddd"]),
+        )
+        self.assertEqual(mock_embedding.call_count, 1)
+        self.assertEqual(results[0], {"embeddings": [[1.0]]})
+        self.assertEqual(results[1], {"embeddings": [[2.0], [3.0]]})
+        self.assertEqual(results[2], {"embeddings": [[4.0]]})
+
+    @patch("litellm.aembedding")
+    async def test_coalescing_max_batch_size(self, mock_embedding):
+        embedding_model = EmbeddingModel(
+            model="ollama/all-minilm",
+            coalescing_window=10.0,
+            max_batch_size=2,
+        )
+
+        async def embed(model=None, input=None, **kwargs):
+            return {
+                "data": [{"embedding": [float(len(text))]} for text in input],
+            }
+
+        mock_embedding.side_effect = embed
+
+        results = await asyncio.gather(
+            embedding_model(["a"]),
+            embedding_model(["bb"]),
+        )
+        self.assertEqual(mock_embedding.call_count, 1)
+        self.assertEqual(results, [{"embeddings": [[1.0]]}, {"embeddings": [[2.0]]}])
+
+    @patch("litellm.aembedding")
+    async def test_coalescing_failure(self, mock_embedding):
+        embedding_model = EmbeddingModel(
+            model="ollama/all-minilm",
+            retry=1,
+            coalescing_window=0.01,
+        )
+        mock_embedding.side_effect = ValueError("Provider error")
+
+        results = await asyncio.gather(
+            embedding_model(["a"]),
+            embedding_model(["b"]),
+        )
+        self.assertEqual(results, [None, None])
+
+    @patch("litellm.aembedding")
+    async def test_call_api_with_cache(self, mock_embedding):
+        cache = EmbeddingCache()
+        embedding_model = EmbeddingModel(model="ollama/all-minilm", cache=cache)
+
+        async def embed(model=None, input=None, **kwargs):
+            return {
+                "data": [{"embedding": [float(len(text))]} for text in input],
+            }
+
+        mock_embedding.side_effect = embed
+
+        result = await embedding_model(["a", "bb"])
+        self.assertEqual(result, {"embeddings": [[1.0], [2.0]]})
+        result = await embedding_model(["bb", "ccc", "a"])
+        self.assertEqual(result, {"embeddings": [[2.0], [3.0], [1.0]]})
+        self.assertEqual(mock_embedding.call_count, 2)
+        self.assertEqual(mock_embedding.call_args.kwargs["input"], ["ccc"])
+        await embedding_model(["ccc", "a"])
+        self.assertEqual(mock_embedding.call_count, 2)
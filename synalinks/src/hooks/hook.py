@@ -35,6 +35,18 @@ class Hook:
     def module(self):
         return self._module
 
+    @property
+    def enabled(self):
+        """Whether the hook needs to be called.
+
+        Modules skip the calls to their hooks (and the work needed to prepare
+        them) when none of their hooks is enabled. By default, a hook is
+        enabled if it overrides `on_call_begin()` or `on_call_end()`.
+        """
+        return not (
+            utils.is_default(self.on_call_begin) and utils.is_default(self.on_call_end)
+        )
+
     @utils.default
     def on_call_begin(
         self,
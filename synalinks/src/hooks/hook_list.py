@@ -64,6 +64,13 @@ class HookList(Hook):
         for hook in self.hooks:
             hook.set_module(module)
 
+    @property
+    def enabled(self):
+        return any(hook.enabled for hook in self.hooks)
+
+    def __bool__(self):
+        return self.enabled
+
     def on_call_begin(
         self,
         call_id,
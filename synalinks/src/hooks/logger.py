@@ -54,13 +54,28 @@ class Logger(Hook):
             self.logger = logging.getLogger(self.module.name)
             self.logger.setLevel(_DEFAULT_LOG_LEVEL)
 
+    def _is_enabled_for(self, level):
+        """Returns whether a record of the given level would be emitted."""
+        self._maybe_setup_logger()
+        if not self.logger.isEnabledFor(level):
+            return False
+        if self.logger.hasHandlers():
+            return True
+        # Without handlers, the records go to the last resort handler (if any)
+        return logging.lastResort is not None and level >= logging.lastResort.level
+
+    @property
+    def enabled(self):
+        # The calls are only logged at the INFO level, the exceptions are
+        # always reported to the hooks by the modules.
+        return self._is_enabled_for(logging.INFO)
+
     def on_call_begin(
         self,
         call_id,
         inputs=None,
     ):
-        self._maybe_setup_logger()
-        if not inputs:
+        if not inputs or not self._is_enabled_for(logging.INFO):
             return
         module_name = self.module.name
         module_description = self.module.description
@@ -104,20 +119,19 @@ class Logger(Hook):
         outputs=None,
         exception=None,
     ):
-        self._maybe_setup_logger()
-        module_name = self.module.name
-        module_description = self.module.description
-        if exception:
+        if exception and self._is_enabled_for(logging.ERROR):
             self.logger.error(
                 _EXCEPTION_TEMPLATE.format(
                     call_id=call_id,
                     exception=exception,
-                    module_name=module_name,
-                    module_description=module_description,
+                    module_name=self.module.name,
+                    module_description=self.module.description,
                 )
             )
-        if not outputs:
+        if not outputs or not self._is_enabled_for(logging.INFO):
             return
+        module_name = self.module.name
+        module_description = self.module.description
         flatten_outputs = tree.flatten(outputs)
         if any_symbolic_data_models(outputs):
             for data_model in flatten_outputs:
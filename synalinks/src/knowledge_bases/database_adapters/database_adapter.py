@@ -5,6 +5,8 @@ import re
 from typing import Any
 from typing import Dict
 
+import numpy as np
+
 from synalinks.src.embedding_models import EmbeddingModel
 from synalinks.src.utils.async_utils import run_maybe_nested
 from synalinks.src.utils.naming import to_snake_case
@@ -124,6 +126,55 @@ class DatabaseAdapter:
             f"{self.__class__} should implement the `update()` method"
         )
 
+    async def update_batch(self, data_models, threshold=0.8, chunk_size=500):
+        raise NotImplementedError(
+            f"{self.__class__} should implement the `update_batch()` method"
+        )
+
+    def pairwise_similarity(self, vectors):
+        """Compute the similarity scores between the given vectors.
+
+        Args:
+            vectors (np.ndarray): The vectors of shape (n, embedding_dim).
+
+        Returns:
+            (np.ndarray): The similarity scores of shape (n, n).
+        """
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+            normalized = vectors / np.maximum(norms, 1e-12)
+            return normalized @ normalized.T
+        squared_norms = np.sum(vectors**2, axis=-1)
+        distances = (
+            squared_norms[:, None] + squared_norms[None, :] - 2 * vectors @ vectors.T
+        )
+        return 1.0 / (1.0 + np.maximum(distances, 0.0))
+
+    def align_vectors(self, vectors, threshold=0.8):
+        """Find the vectors similar to a previous vector of the same batch.
+
+        The vector index of the database only see the rows once committed,
+        so the duplicates inside a single batch are aligned here.
+
+        Args:
+            vectors (list): The list of vectors.
+            threshold (float): The similarity threshold (Default to 0.8).
+
+        Returns:
+            (list): The positions of the vectors to align with a previous one.
+        """
+        if len(vectors) < 2:
+            return []
+        scores = self.pairwise_similarity(np.asarray(vectors, dtype="float32"))
+        kept = []
+        duplicates = []
+        for i in range(len(vectors)):
+            if kept and np.max(scores[i, kept]) >= threshold:
+                duplicates.append(i)
+            else:
+                kept.append(i)
+        return duplicates
+
     async def query(self, query: str, params: Dict[str, Any] = None, **kwargs):
         raise NotImplementedError(
             f"{self.__class__} should implement the `query()` method"
@@ -139,5 +190,15 @@ class DatabaseAdapter:
             f"{self.__class__} should implement the `triplet_search()` method"
         )
 
+    async def close(self):
+        """Release the resources (e.g. the connections) held by the adapter."""
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
     async def __repr__(self):
         return f"<DatabaseAdapter index={self.uri}>"
@@ -0,0 +1,737 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import atexit
+import copy
+import glob
+import json
+import os
+import re
+import shutil
+import threading
+import warnings
+import weakref
+from typing import Any
+from typing import Dict
+
+import numpy as np
+
+from synalinks.src.backend import is_entity
+from synalinks.src.backend import is_relation
+from synalinks.src.backend import is_similarity_search
+from synalinks.src.backend import is_triplet_search
+from synalinks.src.knowledge_bases.database_adapters.database_adapter import (
+    DatabaseAdapter,
+)
+
+METADATA_FILENAME = "metadata.json"
+NODES_DIRNAME = "nodes"
+RELATIONS_DIRNAME = "relations"
+
+NODE_PATTERN = r"\((?P<{0}>\w+)?(?:\s*:\s*(?P<{0}_label>\w+))?\)"
+
+MATCH_PATTERN = re.compile(
+    r"^\s*MATCH\s+"
+    + NODE_PATTERN.format("a")
+    + r"(?P<path>\s*-\[(?P<r>\w+)?(?:\s*:\s*(?P<r_label>\w+))?\]->\s*"
+    + NODE_PATTERN.format("b")
+    + r")?"
+    r"(?:\s+WHERE\s+(?P<where>.+?))?"
+    r"\s+(?:DETACH\s+DELETE\s+(?P<delete>\w+)|RETURN\s+(?P<items>.+?))"
+    r"(?:\s+LIMIT\s+(?P<limit>\$?\w+))?"
+    r"\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+RETURN_PATTERN = re.compile(
+    r"^\s*RETURN\s+(?P<items>.+?)\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+CONDITION_PATTERN = re.compile(r"^\s*(?P<var>\w+)\.(?P<key>\w+)\s*=\s*(?P<value>.+?)\s*$")
+
+ITEM_PATTERN = re.compile(
+    r"^\s*(?P<expr>.+?)(?:\s+AS\s+(?P<alias>\w+))?\s*$",
+    re.IGNORECASE,
+)
+
+FUNCTION_PATTERN = re.compile(r"^(?P<function>\w+)\(\s*(?P<var>\w+|\*)\s*\)$")
+
+PROPERTY_PATTERN = re.compile(r"^(?P<var>\w+)\.(?P<key>\w+)$")
+
+
+class _GrowableArray:
+    """A numpy array with an amortized constant time append."""
+
+    def __init__(self, shape=(), dtype=np.float32, data=None):
+        self.size = 0
+        self._data = np.zeros((16, *shape), dtype=dtype)
+        if data is not None:
+            self.extend(data)
+
+    @property
+    def data(self):
+        return self._data[: self.size]
+
+    def extend(self, rows):
+        rows = np.asarray(rows, dtype=self._data.dtype)
+        size = self.size + len(rows)
+        if size > len(self._data):
+            capacity = max(size, 2 * len(self._data))
+            data = np.zeros((capacity, *self._data.shape[1:]), dtype=self._data.dtype)
+            data[: self.size] = self.data
+            self._data = data
+        self._data[self.size : size] = rows
+        self.size = size
+
+    def keep(self, mask):
+        data = self.data[mask]
+        self.size = 0
+        self.extend(data)
+
+
+class _NodeTable:
+    """The nodes of a label, with their vectors in a contiguous matrix."""
+
+    def __init__(self, dim, vectors=None, ids=None):
+        self.dim = dim
+        self.vectors = _GrowableArray(shape=(dim,), dtype=np.float32, data=vectors)
+        self.ids = _GrowableArray(dtype=np.int64, data=ids)
+
+    def __len__(self):
+        return self.ids.size
+
+    def append(self, node_id, vector):
+        self.vectors.extend([vector])
+        self.ids.extend([node_id])
+
+    def keep(self, mask):
+        self.vectors.keep(mask)
+        self.ids.keep(mask)
+
+
+class _RelationTable:
+    """The relations of a label, stored as adjacency arrays."""
+
+    def __init__(self, edges=None, properties=None):
+        self.subj = _GrowableArray(dtype=np.int64)
+        self.obj = _GrowableArray(dtype=np.int64)
+        self.properties = []
+        self.index = {}
+        if edges is not None:
+            for (subj_id, obj_id), edge_properties in zip(edges, properties):
+                self.merge(int(subj_id), int(obj_id), edge_properties)
+
+    def __len__(self):
+        return self.subj.size
+
+    def merge(self, subj_id, obj_id, properties):
+        edge = self.index.get((subj_id, obj_id), None)
+        if edge is None:
+            self.index[(subj_id, obj_id)] = len(self.properties)
+            self.subj.extend([subj_id])
+            self.obj.extend([obj_id])
+            self.properties.append(dict(properties))
+        else:
+            self.properties[edge].update(properties)
+
+    def keep(self, mask):
+        self.subj.keep(mask)
+        self.obj.keep(mask)
+        self.properties = [p for p, keep in zip(self.properties, mask) if keep]
+        self.index = {
+            (int(s), int(o)): i
+            for i, (s, o) in enumerate(zip(self.subj.data, self.obj.data))
+        }
+
+
+def _save_at_exit(adapter_ref):
+    adapter = adapter_ref()
+    if adapter is not None:
+        adapter.save()
+
+
+class LocalAdapter(DatabaseAdapter):
+    """An embedded, in-process graph and vector database.
+
+    The entities vectors are kept in a contiguous NumPy matrix per label and
+    searched using a brute-force top-k, the relations are kept in adjacency
+    arrays. Everything is persisted in the directory given by the URI
+    (`local://path/to/directory`), or kept in memory only if no path is
+    given (`local://`).
+
+    The `query()` method only supports a subset of Cypher:
+
+    - `MATCH (n:Label) [WHERE n.key = value [AND ...]] RETURN n [LIMIT k]`
+    - `MATCH (s:Label)-[r:Label]->(o:Label) [WHERE ...] RETURN s, r, o [LIMIT k]`
+    - `MATCH ... DETACH DELETE n`
+    - `RETURN value`
+
+    Where the returned items can be a variable, a property (`n.key`),
+    `count(n)` or `properties(r)`, optionally aliased using `AS`.
+
+    Only the modified labels are persisted, once per `update_batch()`. The
+    changes made by `update()` and by the `DETACH DELETE` queries are kept in
+    memory and persisted by `save()`, `close()`, the next `update_batch()` or
+    at exit, so ingesting the entities one by one doesn't rewrite the files
+    on each update.
+    """
+
+    def __init__(
+        self,
+        uri=None,
+        entity_models=None,
+        relation_models=None,
+        embedding_model=None,
+        metric="cosine",
+        wipe_on_start=False,
+        **kwargs,
+    ):
+        self.path = uri.replace("local://", "", 1) if uri else None
+        self._lock = threading.RLock()
+        self._next_id = 0
+        self._nodes = {}
+        self._node_tables = {}
+        self._relation_tables = {}
+        self._dirty_labels = set()
+        self._dirty_relation_labels = set()
+        if self.path:
+            self._load()
+            atexit.register(_save_at_exit, weakref.ref(self))
+        super().__init__(
+            uri=uri,
+            entity_models=entity_models,
+            relation_models=relation_models,
+            embedding_model=embedding_model,
+            metric=metric,
+            wipe_on_start=wipe_on_start,
+        )
+
+    def _load(self):
+        metadata_path = os.path.join(self.path, METADATA_FILENAME)
+        if not os.path.exists(metadata_path):
+            return
+        with open(metadata_path, "r") as f:
+            metadata = json.load(f)
+        self._next_id = metadata.get("next_id", 0)
+        for filepath in glob.glob(os.path.join(self.path, NODES_DIRNAME, "*.npy")):
+            label = os.path.splitext(os.path.basename(filepath))[0]
+            with open(filepath[: -len(".npy")] + ".json", "r") as f:
+                nodes = json.load(f)
+            vectors = np.load(filepath)
+            table = _NodeTable(vectors.shape[1], vectors=vectors, ids=nodes["ids"])
+            self._node_tables[label] = table
+            for node_id, properties in zip(nodes["ids"], nodes["properties"]):
+                self._nodes[node_id] = properties
+        for filepath in glob.glob(os.path.join(self.path, RELATIONS_DIRNAME, "*.npy")):
+            label = os.path.splitext(os.path.basename(filepath))[0]
+            with open(filepath[: -len(".npy")] + ".json", "r") as f:
+                relations = json.load(f)
+            self._relation_tables[label] = _RelationTable(
+                edges=np.load(filepath),
+                properties=relations["properties"],
+            )
+
+    def _write(self, filepath, content):
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        tmp_filepath = filepath + ".tmp"
+        if isinstance(content, np.ndarray):
+            with open(tmp_filepath, "wb") as f:
+                np.save(f, content)
+        else:
+            with open(tmp_filepath, "w") as f:
+                json.dump(content, f)
+        os.replace(tmp_filepath, filepath)
+
+    def save(self):
+        """Persist the modified labels to disk (no-op if kept in memory)."""
+        with self._lock:
+            if not self.path:
+                return
+            if not self._dirty_labels and not self._dirty_relation_labels:
+                return
+            nodes_dir = os.path.join(self.path, NODES_DIRNAME)
+            for label in self._dirty_labels:
+                table = self._node_tables[label]
+                ids = table.ids.data.tolist()
+                self._write(
+                    os.path.join(nodes_dir, label + ".json"),
+                    {"ids": ids, "properties": [self._nodes[i] for i in ids]},
+                )
+                self._write(os.path.join(nodes_dir, label + ".npy"), table.vectors.data)
+            relations_dir = os.path.join(self.path, RELATIONS_DIRNAME)
+            for label in self._dirty_relation_labels:
+                table = self._relation_tables[label]
+                self._write(
+                    os.path.join(relations_dir, label + ".json"),
+                    {"properties": table.properties},
+                )
+                self._write(
+                    os.path.join(relations_dir, label + ".npy"),
+                    np.stack([table.subj.data, table.obj.data], axis=-1),
+                )
+            self._write(
+                os.path.join(self.path, METADATA_FILENAME),
+                {"next_id": self._next_id},
+            )
+            self._dirty_labels = set()
+            self._dirty_relation_labels = set()
+
+    async def close(self):
+        self.save()
+
+    def wipe_database(self):
+        """Wipe all data from the database"""
+        with self._lock:
+            self._next_id = 0
+            self._nodes = {}
+            self._node_tables = {}
+            self._relation_tables = {}
+            self._dirty_labels = set()
+            self._dirty_relation_labels = set()
+            if self.path:
+                for dirname in (NODES_DIRNAME, RELATIONS_DIRNAME):
+                    shutil.rmtree(os.path.join(self.path, dirname), ignore_errors=True)
+                metadata_path = os.path.join(self.path, METADATA_FILENAME)
+                if os.path.exists(metadata_path):
+                    os.remove(metadata_path)
+
+    def create_vector_index(self):
+        """Create vector indexes"""
+        with self._lock:
+            for entity_model in self.entity_models:
+                node_label = self.sanitize_label(entity_model.get_schema().get("title"))
+                self._get_node_table(node_label, self.embedding_dim)
+
+    def _get_node_table(self, label, dim):
+        table = self._node_tables.get(label, None)
+        if table is None:
+            table = _NodeTable(dim)
+            self._node_tables[label] = table
+        elif table.dim != dim:
+            raise ValueError(
+                f"Expected embedding vectors of dimension {table.dim} for '{label}', "
+                f"received a vector of dimension {dim}."
+            )
+        return table
+
+    def _scores(self, vectors, vector):
+        # Scores normalized between 0 and 1, like Neo4j's vector indexes
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=-1) * np.linalg.norm(vector)
+            return (1.0 + (vectors @ vector) / np.maximum(norms, 1e-12)) / 2.0
+        distances = np.sum((vectors - vector) ** 2, axis=-1)
+        return 1.0 / (1.0 + distances)
+
+    def _search(self, label, vector, k=10, threshold=0.8):
+        table = self._node_tables.get(label, None)
+        if table is None or not len(table):
+            return []
+        vector = np.asarray(vector, dtype=np.float32)
+        if vector.shape[0] != table.dim:
+            raise ValueError(
+                f"Expected embedding vectors of dimension {table.dim} for '{label}', "
+                f"received a vector of dimension {vector.shape[0]}."
+            )
+        scores = self._scores(table.vectors.data, vector)
+        if k < len(scores):
+            indices = np.argpartition(-scores, k - 1)[:k]
+        else:
+            indices = np.arange(len(scores))
+        indices = indices[np.argsort(-scores[indices], kind="stable")]
+        ids = table.ids.data
+        return [
+            (int(ids[i]), float(scores[i])) for i in indices if scores[i] >= threshold
+        ]
+
+    def _update(self, data_model, threshold=0.8):
+        if is_relation(data_model):
+            subj = data_model.get_nested_entity("subj")
+            obj = data_model.get_nested_entity("obj")
+            subj_vector = subj.get("embedding") if subj else None
+            obj_vector = obj.get("embedding") if obj else None
+            if not subj_vector or not obj_vector:
+                return "skipped"
+            subj_match = self._search(
+                self.sanitize_label(subj.get("label")),
+                subj_vector,
+                k=1,
+                threshold=threshold,
+            )
+            obj_match = self._search(
+                self.sanitize_label(obj.get("label")),
+                obj_vector,
+                k=1,
+                threshold=threshold,
+            )
+            if not subj_match or not obj_match:
+                return "unaligned"
+            relation_label = self.sanitize_label(data_model.get("label"))
+            properties = self.sanitize_properties(data_model.get_json())
+            properties.pop("subj", None)
+            properties.pop("obj", None)
+            table = self._relation_tables.get(relation_label, None)
+            if table is None:
+                table = _RelationTable()
+                self._relation_tables[relation_label] = table
+            table.merge(subj_match[0][0], obj_match[0][0], properties)
+            self._dirty_relation_labels.add(relation_label)
+            return "merged"
+        elif is_entity(data_model):
+            vector = data_model.get("embedding")
+            if not vector:
+                return "skipped"
+            node_label = self.sanitize_label(data_model.get("label"))
+            if self._search(node_label, vector, k=1, threshold=threshold):
+                return "aligned"
+            properties = self.sanitize_properties(data_model.get_json())
+            properties.pop("embedding", None)
+            table = self._get_node_table(node_label, len(vector))
+            node_id = self._next_id
+            self._next_id += 1
+            table.append(node_id, vector)
+            self._nodes[node_id] = properties
+            self._dirty_labels.add(node_label)
+            return "created"
+        else:
+            raise ValueError(
+                "The parameter `data_model` must be an `Entity` or `Relation` instance"
+            )
+
+    async def update(
+        self,
+        data_model,
+        threshold=0.8,
+    ):
+        with self._lock:
+            outcome = self._update(data_model, threshold=threshold)
+        if outcome == "skipped":
+            warnings.warn(
+                "No embedding found for the entities: "
+                "Entities and relations needs to be embedded. "
+                "Use `Embedding` module before `UpdateKnowledge`. "
+                "Skipping update."
+            )
+
+    async def update_batch(
+        self,
+        data_models,
+        threshold=0.8,
+        chunk_size=500,
+    ):
+        """Update the database with many entities and relations at once.
+
+        The entities are inserted before the relations, and the modified labels
+        are persisted only once at the end.
+
+        Args:
+            data_models (list): The list of `Entity` or `Relation` data models.
+            threshold (float): Similarity threshold for entity alignment
+                (Default to 0.8).
+            chunk_size (int): Unused, kept for compatibility with the other
+                adapters (Default to 500).
+
+        Returns:
+            (list): The outcome of each data model, in the same order. One of
+                `"created"` or `"aligned"` for the entities, `"merged"` or
+                `"unaligned"` for the relations or `"skipped"` if the data
+                model is not embedded.
+        """
+        outcomes = [None] * len(data_models)
+        with self._lock:
+            order = sorted(
+                range(len(data_models)),
+                key=lambda i: is_relation(data_models[i]),
+            )
+            for i in order:
+                outcomes[i] = self._update(data_models[i], threshold=threshold)
+            self.save()
+        if outcomes.count("skipped"):
+            warnings.warn(
+                f"{outcomes.count('skipped')} data models are not embedded: "
+                "Entities and relations needs to be embedded. "
+                "Use `Embedding` module before `UpdateKnowledge`. "
+                "Skipping them."
+            )
+        return outcomes
+
+    async def similarity_search(
+        self,
+        similarity_search,
+        k=10,
+        threshold=0.7,
+    ):
+        if not is_similarity_search(similarity_search):
+            raise ValueError(
+                "The `similarity_search` argument "
+                "should be a `SimilaritySearch` data model"
+            )
+        text = similarity_search.get("similarity_search")
+        entity_label = self.sanitize_label(similarity_search.get("entity_label"))
+        vector = (await self.embedding_model(texts=[text]))["embeddings"][0]
+        with self._lock:
+            matches = self._search(entity_label, vector, k=k, threshold=threshold)
+            result = [
+                {"node": copy.deepcopy(self._nodes[node_id]), "score": score}
+                for node_id, score in matches
+            ]
+        return list(reversed(result))
+
+    async def triplet_search(
+        self,
+        triplet_search,
+        k=10,
+        threshold=0.7,
+    ):
+        if not is_triplet_search(triplet_search):
+            raise ValueError(
+                "The `triplet_search` argument should be a `TripletSearch` data model"
+            )
+        subject_label = self.sanitize_label(triplet_search.get("subject_label"))
+        subject_similarity_search = triplet_search.get("subject_similarity_search")
+        relation_label = self.sanitize_label(triplet_search.get("relation_label"))
+        object_label = self.sanitize_label(triplet_search.get("object_label"))
+        object_similarity_search = triplet_search.get("object_similarity_search")
+
+        has_subject_similarity = (
+            subject_similarity_search and subject_similarity_search != "?"
+        )
+        has_object_similarity = (
+            object_similarity_search and object_similarity_search != "?"
+        )
+        texts = []
+        if has_subject_similarity:
+            texts.append(subject_similarity_search)
+        if has_object_similarity:
+            texts.append(object_similarity_search)
+        vectors = (await self.embedding_model(texts=texts))["embeddings"] if texts else []
+
+        with self._lock:
+            table = self._relation_tables.get(relation_label, None)
+            if table is None or not len(table):
+                return []
+            subj_ids = table.subj.data
+            obj_ids = table.obj.data
+            mask = np.ones((len(table),), dtype=bool)
+            subj_scores = {}
+            obj_scores = {}
+            if has_subject_similarity:
+                subj_scores = dict(
+                    self._search(subject_label, vectors[0], k=k, threshold=threshold)
+                )
+                mask &= np.isin(subj_ids, list(subj_scores.keys()))
+            elif not has_object_similarity:
+                mask &= np.isin(subj_ids, self._get_ids(subject_label))
+            if has_object_similarity:
+                obj_scores = dict(
+                    self._search(object_label, vectors[-1], k=k, threshold=threshold)
+                )
+                mask &= np.isin(obj_ids, list(obj_scores.keys()))
+            elif not has_subject_similarity:
+                mask &= np.isin(obj_ids, self._get_ids(object_label))
+
+            result = []
+            for edge in np.flatnonzero(mask):
+                subj_id = int(subj_ids[edge])
+                obj_id = int(obj_ids[edge])
+                score = float(
+                    np.sqrt(subj_scores.get(subj_id, 1.0) * obj_scores.get(obj_id, 1.0))
+                )
+                result.append(
+                    {
+                        "subj": copy.deepcopy(self._nodes[subj_id]),
+                        "relation": copy.deepcopy(table.properties[edge]),
+                        "obj": copy.deepcopy(self._nodes[obj_id]),
+                        "score": score,
+                    }
+                )
+        result = sorted(result, key=lambda x: x["score"], reverse=True)[:k]
+        return list(reversed(result))
+
+    def _get_ids(self, label):
+        table = self._node_tables.get(label, None)
+        if table is None:
+            return np.zeros((0,), dtype=np.int64)
+        return table.ids.data
+
+    async def query(self, query: str, params: Dict[str, Any] = None, **kwargs):
+        """Execute a query, only a subset of Cypher is supported.
+
+        Args:
+            query (str): The query to execute.
+            params (dict): Optional. The query parameters.
+
+        Returns:
+            (list): The list of records.
+        """
+        params = params or {}
+        with self._lock:
+            match = RETURN_PATTERN.match(query)
+            if match:
+                return [self._evaluate_items(match.group("items"), [{}], params)[0]]
+            match = MATCH_PATTERN.match(query)
+            if not match:
+                raise ValueError(
+                    f"Unsupported query for the local knowledge base: {query}"
+                )
+            bindings = self._match(match)
+            if match.group("where"):
+                bindings = self._where(match.group("where"), bindings, params)
+            if match.group("delete"):
+                self._delete(match.group("delete"), bindings)
+                return []
+            limit = match.group("limit")
+            if limit:
+                limit = params[limit[1:]] if limit.startswith("$") else int(limit)
+            records = self._evaluate_items(match.group("items"), bindings, params)
+            return records[:limit] if limit else records
+
+    def _match(self, match):
+        a, a_label = match.group("a") or "_a", match.group("a_label")
+        a_label = self.sanitize_label(a_label) if a_label else None
+        if not match.group("path"):
+            if a_label:
+                ids = self._get_ids(a_label).tolist()
+            else:
+                ids = sorted(self._nodes.keys())
+            return [{a: ("node", node_id)} for node_id in ids]
+        r, r_label = match.group("r") or "_r", match.group("r_label")
+        b, b_label = match.group("b") or "_b", match.group("b_label")
+        b_label = self.sanitize_label(b_label) if b_label else None
+        if r_label:
+            relation_labels = [self.sanitize_label(r_label)]
+        else:
+            relation_labels = list(self._relation_tables.keys())
+        bindings = []
+        for relation_label in relation_labels:
+            table = self._relation_tables.get(relation_label, None)
+            if table is None:
+                continue
+            mask = np.ones((len(table),), dtype=bool)
+            if a_label:
+                mask &= np.isin(table.subj.data, self._get_ids(a_label))
+            if b_label:
+                mask &= np.isin(table.obj.data, self._get_ids(b_label))
+            for edge in np.flatnonzero(mask):
+                bindings.append(
+                    {
+                        a: ("node", int(table.subj.data[edge])),
+                        r: ("relation", (relation_label, int(edge))),
+                        b: ("node", int(table.obj.data[edge])),
+                    }
+                )
+        return bindings
+
+    def _get_properties(self, value):
+        kind, key = value
+        if kind == "node":
+            return self._nodes[key]
+        relation_label, edge = key
+        return self._relation_tables[relation_label].properties[edge]
+
+    def _evaluate_literal(self, literal, params):
+        literal = literal.strip()
+        if literal.startswith("$"):
+            return params[literal[1:]]
+        if len(literal) >= 2 and literal[0] == literal[-1] and literal[0] in "'\"":
+            return literal[1:-1]
+        try:
+            return json.loads(literal.lower() if literal.isalpha() else literal)
+        except json.JSONDecodeError:
+            raise ValueError(f"Unsupported value for the local knowledge base: {literal}")
+
+    def _where(self, where, bindings, params):
+        conditions = []
+        for condition in re.split(r"\s+AND\s+", where, flags=re.IGNORECASE):
+            match = CONDITION_PATTERN.match(condition)
+            if not match:
+                raise ValueError(
+                    f"Unsupported condition for the local knowledge base: {condition}"
+                )
+            conditions.append(
+                (
+                    match.group("var"),
+                    match.group("key"),
+                    self._evaluate_literal(match.group("value"), params),
+                )
+            )
+        return [
+            binding
+            for binding in bindings
+            if all(
+                var in binding and self._get_properties(binding[var]).get(key) == value
+                for var, key, value in conditions
+            )
+        ]
+
+    def _evaluate_items(self, items, bindings, params):
+        parsed = []
+        for item in items.split(","):
+            match = ITEM_PATTERN.match(item)
+            parsed.append((match.group("expr").strip(), match.group("alias")))
+        aggregates = [self._is_count(expr) for expr, _ in parsed]
+        if any(aggregates):
+            if not all(aggregates):
+                raise ValueError(
+                    "Mixing aggregations and other values is not supported "
+                    "by the local knowledge base."
+                )
+            return [{alias or expr: len(bindings) for expr, alias in parsed}]
+        records = []
+        for binding in bindings:
+            record = {}
+            for expr, alias in parsed:
+                record[alias or expr] = self._evaluate_expression(expr, binding, params)
+            records.append(record)
+        return records
+
+    def _is_count(self, expr):
+        match = FUNCTION_PATTERN.match(expr)
+        return bool(match) and match.group("function").lower() == "count"
+
+    def _evaluate_expression(self, expr, binding, params):
+        if expr in binding:
+            return copy.deepcopy(self._get_properties(binding[expr]))
+        match = FUNCTION_PATTERN.match(expr)
+        if match and match.group("function").lower() == "properties":
+            return copy.deepcopy(self._get_properties(binding[match.group("var")]))
+        match = PROPERTY_PATTERN.match(expr)
+        if match and match.group("var") in binding:
+            value = self._get_properties(binding[match.group("var")])
+            return copy.deepcopy(value.get(match.group("key"), None))
+        return self._evaluate_literal(expr, params)
+
+    def _delete(self, var, bindings):
+        node_ids = set()
+        for binding in bindings:
+            if var not in binding:
+                raise ValueError(f"Unknown variable '{var}' in the query")
+            kind, key = binding[var]
+            if kind != "node":
+                raise ValueError(
+                    "Only the nodes can be deleted in the local knowledge base."
+                )
+            node_ids.add(key)
+        if not node_ids:
+            return
+        deleted = np.array(sorted(node_ids), dtype=np.int64)
+        for label, table in list(self._node_tables.items()):
+            mask = ~np.isin(table.ids.data, deleted)
+            if not mask.all():
+                table.keep(mask)
+                self._dirty_labels.add(label)
+        for label, table in self._relation_tables.items():
+            mask = ~(np.isin(table.subj.data, deleted) | np.isin(table.obj.data, deleted))
+            if not mask.all():
+                table.keep(mask)
+                self._dirty_relation_labels.add(label)
+        for node_id in node_ids:
+            self._nodes.pop(node_id, None)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
@@ -0,0 +1,212 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+from typing import Literal
+from unittest.mock import patch
+
+from synalinks.src import testing
+from synalinks.src.backend import EmbeddedEntity
+from synalinks.src.backend import Relation
+from synalinks.src.backend import SimilaritySearch
+from synalinks.src.backend import TripletSearch
+from synalinks.src.embedding_models import EmbeddingModel
+from synalinks.src.knowledge_bases.database_adapters.local_adapter import LocalAdapter
+from synalinks.src.knowledge_bases.knowledge_base import KnowledgeBase
+
+VECTORS = {
+    "paris": [1.0, 0.0, 0.0],
+    "france": [0.0, 1.0, 0.0],
+}
+
+
+def mock_embed(model=None, input=None, **kwargs):
+    return {"data": [{"embedding": VECTORS.get(text, [0.0, 0.0, 1.0])} for text in input]}
+
+
+class City(EmbeddedEntity):
+    label: Literal["City"]
+    name: str
+
+
+class Country(EmbeddedEntity):
+    label: Literal["Country"]
+    name: str
+
+
+class IsCapitalOf(Relation):
+    subj: City
+    label: Literal["IsCapitalOf"]
+    obj: Country
+
+
+paris = City(label="City", name="Paris", embedding=VECTORS["paris"])
+france = Country(label="Country", name="France", embedding=VECTORS["france"])
+is_capital_of = IsCapitalOf(subj=paris, label="IsCapitalOf", obj=france)
+
+
+class LocalAdapterTest(testing.TestCase):
+    def build_adapter(self, uri="local://", wipe_on_start=False):
+        return LocalAdapter(
+            uri=uri,
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+            entity_models=[City, Country],
+            relation_models=[IsCapitalOf],
+            wipe_on_start=wipe_on_start,
+        )
+
+    @patch("litellm.aembedding", side_effect=mock_embed)
+    async def test_update_and_similarity_search(self, mock_embedding):
+        adapter = self.build_adapter()
+
+        await adapter.update(paris.to_json_data_model())
+        await adapter.update(france.to_json_data_model())
+        # Aligned with the existing node
+        await adapter.update(paris.to_json_data_model())
+
+        result = await adapter.query("MATCH (n) RETURN count(n) AS count")
+        self.assertEqual(result, [{"count": 2}])
+
+        result = await adapter.similarity_search(
+            SimilaritySearch(
+                entity_label="City",
+                similarity_search="paris",
+            ).to_json_data_model(),
+            k=10,
+            threshold=0.8,
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["node"]["name"], "Paris")
+        self.assertNotIn("embedding", result[0]["node"])
+        self.assertAlmostEqual(result[0]["score"], 1.0, places=5)
+
+    @patch("litellm.aembedding", side_effect=mock_embed)
+    async def test_triplet_search(self, mock_embedding):
+        adapter = self.build_adapter()
+
+        outcomes = await adapter.update_batch(
+            [
+                is_capital_of.to_json_data_model(),
+                paris.to_json_data_model(),
+                france.to_json_data_model(),
+            ]
+        )
+        self.assertEqual(outcomes, ["merged", "created", "created"])
+
+        result = await adapter.triplet_search(
+            TripletSearch(
+                subject_label="City",
+                subject_similarity_search="?",
+                relation_label="IsCapitalOf",
+                object_label="Country",
+                object_similarity_search="?",
+            ).to_json_data_model(),
+        )
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["subj"]["name"], "Paris")
+        self.assertEqual(result[0]["obj"]["name"], "France")
+        self.assertEqual(result[0]["relation"]["label"], "IsCapitalOf")
+
+        result = await adapter.triplet_search(
+            TripletSearch(
+                subject_label="City",
+                subject_similarity_search="?",
+                relation_label="IsCapitalOf",
+                object_label="Country",
+                object_similarity_search="unrelated",
+            ).to_json_data_model(),
+            threshold=0.8,
+        )
+        self.assertEqual(result, [])
+
+    @patch("litellm.aembedding", side_effect=mock_embed)
+    async def test_query(self, mock_embedding):
+        adapter = self.build_adapter()
+        await adapter.update_batch(
+            [
+                paris.to_json_data_model(),
+                france.to_json_data_model(),
+                is_capital_of.to_json_data_model(),
+            ]
+        )
+
+        self.assertEqual(await adapter.query("RETURN 1"), [{"1": 1}])
+
+        result = await adapter.query(
+            "MATCH (n:City) WHERE n.name = $name RETURN n.name AS name",
+            params={"name": "Paris"},
+        )
+        self.assertEqual(result, [{"name": "Paris"}])
+
+        result = await adapter.query(
+            "MATCH (s:City)-[r:IsCapitalOf]->(o) RETURN s.name, o.name LIMIT 1"
+        )
+        self.assertEqual(result, [{"s.name": "Paris", "o.name": "France"}])
+
+        await adapter.query("MATCH (n:City) DETACH DELETE n")
+        result = await adapter.query("MATCH (s)-[r]->(o) RETURN count(r) AS count")
+        self.assertEqual(result, [{"count": 0}])
+        result = await adapter.query("MATCH (n) RETURN n")
+        self.assertEqual(len(result), 1)
+
+        with self.assertRaisesRegex(ValueError, "Unsupported query"):
+            await adapter.query("CREATE (n:City)")
+
+    @patch("litellm.aembedding", side_effect=mock_embed)
+    async def test_persistence(self, mock_embedding):
+        path = os.path.join(self.get_temp_dir(), "knowledge_base")
+        adapter = self.build_adapter(uri=f"local://{path}")
+        await adapter.update_batch(
+            [
+                paris.to_json_data_model(),
+                france.to_json_data_model(),
+                is_capital_of.to_json_data_model(),
+            ]
+        )
+        await adapter.close()
+
+        adapter = self.build_adapter(uri=f"local://{path}")
+        result = await adapter.query("MATCH (s)-[r]->(o) RETURN s.name, o.name")
+        self.assertEqual(result, [{"s.name": "Paris", "o.name": "France"}])
+
+        # The new nodes get new ids
+        await adapter.update(
+            City(
+                label="City", name="Lyon", embedding=[0.0, 0.0, 1.0]
+            ).to_json_data_model()
+        )
+        result = await adapter.query("MATCH (n) RETURN count(n) AS count")
+        self.assertEqual(result, [{"count": 3}])
+
+        # The single updates are persisted on close (not on each update)
+        with patch.object(adapter, "_write", wraps=adapter._write) as mock_write:
+            await adapter.update(
+                City(
+                    label="City", name="Nice", embedding=[0.0, 1.0, 0.0]
+                ).to_json_data_model()
+            )
+            await adapter.query("MATCH (n:Country) DETACH DELETE n")
+            mock_write.assert_not_called()
+            await adapter.close()
+            self.assertGreater(mock_write.call_count, 0)
+        adapter = self.build_adapter(uri=f"local://{path}")
+        result = await adapter.query("MATCH (n) RETURN n.name")
+        self.assertEqual(sorted(r["n.name"] for r in result), ["Lyon", "Nice", "Paris"])
+
+        adapter = self.build_adapter(uri=f"local://{path}", wipe_on_start=True)
+        result = await adapter.query("MATCH (n) RETURN count(n) AS count")
+        self.assertEqual(result, [{"count": 0}])
+
+    @patch("litellm.aembedding", side_effect=mock_embed)
+    async def test_knowledge_base(self, mock_embedding):
+        knowledge_base = KnowledgeBase(
+            uri="local://",
+            entity_models=[City, Country],
+            relation_models=[IsCapitalOf],
+            embedding_model=EmbeddingModel(model="ollama/mxbai-embed-large"),
+        )
+        self.assertIsInstance(knowledge_base.adapter, LocalAdapter)
+
+        async with knowledge_base:
+            await knowledge_base.update(paris.to_json_data_model())
+            result = await knowledge_base.query("MATCH (n:City) RETURN n.name")
+        self.assertEqual(result, [{"n.name": "Paris"}])
@@ -2,6 +2,7 @@
 
 import os
 import warnings
+import weakref
 
 from synalinks.src.backend import is_entity
 from synalinks.src.backend import is_relation
@@ -9,7 +10,6 @@ from synalinks.src.backend import is_similarity_search
 from synalinks.src.backend import is_triplet_search
 from synalinks.src.knowledge_bases.database_adapters import DatabaseAdapter
 from synalinks.src.knowledge_bases.database_adapters.neo4j_adapter import Neo4JAdapter
-from synalinks.src.utils.async_utils import run_maybe_nested
 from synalinks.src.utils.naming import to_snake_case
 
 
@@ -22,10 +22,13 @@ class MemGraphAdapter(Neo4JAdapter):
         embedding_model=None,
         metric="cosine",
         wipe_on_start=False,
+        max_connection_pool_size=100,
     ):
         self.db_name = os.getenv("MEMGRAPH_DATABASE", "memgraph")
         self.username = os.getenv("MEMGRAPH_USERNAME", "memgraph")
         self.password = os.getenv("MEMGRAPH_PASSWORD", "memgraph")
+        self.max_connection_pool_size = max_connection_pool_size
+        self._drivers = weakref.WeakKeyDictionary()
 
         DatabaseAdapter.__init__(
             self,
@@ -37,10 +40,10 @@ class MemGraphAdapter(Neo4JAdapter):
             wipe_on_start=wipe_on_start,
         )
 
-    def wipe_database(self):
-        run_maybe_nested(self.query("MATCH (n) DETACH DELETE n;"))
+    async def _wipe_database(self):
+        await self.query("MATCH (n) DETACH DELETE n;", read_only=False)
 
-    def create_vector_index(self):
+    async def _create_vector_index(self):
         metric_mapping = {"cosine": "cos", "euclidean": "l2sq"}
         metric = metric_mapping[self.metric]
 
@@ -58,9 +61,7 @@ class MemGraphAdapter(Neo4JAdapter):
                     "};",
                 ]
             )
-            run_maybe_nested(
-                self.query(query),
-            )
+            await self.query(query, read_only=False)
 
     async def update(
         self,
@@ -118,7 +119,7 @@ class MemGraphAdapter(Neo4JAdapter):
                 "objVector": obj_vector,
                 **relation_properties,
             }
-            await self.query(query, params=params)
+            await self.query(query, params=params, read_only=False)
         elif is_entity(data_model):
             node_label = self.sanitize_label(data_model.get("label"))
             vector = data_model.get("embedding")
@@ -159,12 +160,59 @@ class MemGraphAdapter(Neo4JAdapter):
                 "vector": vector,
                 **node_properties,
             }
-            await self.query(query, params=params)
+            await self.query(query, params=params, read_only=False)
         else:
             raise ValueError(
                 "The parameter `data_model` must be an `Entity` or `Relation` instance"
             )
 
+    def entity_batch_query(self, node_label):
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL {",
+                "  WITH row",
+                "  CALL vector_search.search($indexName, 1, row.vector)",
+                "  YIELD node, similarity AS score",
+                "  WITH node, score",
+                "  WHERE score >= $threshold",
+                "  RETURN count(node) AS existing_count",
+                "}",
+                "FOREACH (_ IN CASE WHEN existing_count = 0 THEN [1] ELSE [] END |",
+                f"  CREATE (n:{node_label})",
+                "  SET n = row.properties",
+                ")",
+                "RETURN row.row_id AS row_id, CASE WHEN existing_count = 0",
+                "  THEN 'created' ELSE 'aligned' END AS outcome",
+            ]
+        )
+
+    def relation_batch_query(self, relation_label):
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL {",
+                "  WITH row",
+                "  CALL vector_search.search($subjIndexName, 1, row.subjVector)",
+                "  YIELD node AS s, similarity AS subj_score",
+                "  WITH row, s, subj_score",
+                "  WHERE subj_score >= $threshold",
+                "  CALL vector_search.search($objIndexName, 1, row.objVector)",
+                "  YIELD node AS o, similarity AS obj_score",
+                "  WITH row, s, o, obj_score",
+                "  WHERE obj_score >= $threshold",
+                f"  MERGE (s)-[r:{relation_label}]->(o)",
+                "  SET r += row.properties",
+                "  RETURN count(r) AS merged_count",
+                "}",
+                "RETURN row.row_id AS row_id, CASE WHEN merged_count > 0",
+                "  THEN 'merged' ELSE 'unaligned' END AS outcome",
+            ]
+        )
+
+    def pairwise_similarity(self, vectors):
+        return DatabaseAdapter.pairwise_similarity(self, vectors)
+
     async def similarity_search(
         self,
         similarity_search,
@@ -200,7 +248,7 @@ class MemGraphAdapter(Neo4JAdapter):
             "threshold": threshold,
             "vector": vector,
         }
-        result = await self.query(query, params=params)
+        result = await self.query(query, params=params, read_only=True)
         return result
 
     async def triplet_search(
@@ -237,12 +285,11 @@ class MemGraphAdapter(Neo4JAdapter):
         )
 
         if has_subject_similarity and has_object_similarity:
-            subject_vector = (
-                await self.embedding_model(texts=[subject_similarity_search])
-            )["embeddings"][0]
-            object_vector = (
-                await self.embedding_model(texts=[object_similarity_search])
-            )["embeddings"][0]
+            subject_vector, object_vector = (
+                await self.embedding_model(
+                    texts=[subject_similarity_search, object_similarity_search]
+                )
+            )["embeddings"]
             params["subjVector"] = subject_vector
             params["objVector"] = object_vector
 
@@ -341,4 +388,4 @@ class MemGraphAdapter(Neo4JAdapter):
         )
         query_lines.append("LIMIT $numberOfNearestNeighbours")
         query = "\n".join(query_lines)
-        return await self.query(query, params)
+        return await self.query(query, params, read_only=True)
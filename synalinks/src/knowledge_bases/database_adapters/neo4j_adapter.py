@@ -1,7 +1,9 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import os
 import warnings
+import weakref
 from typing import Any
 from typing import Dict
 
@@ -26,10 +28,13 @@ class Neo4JAdapter(DatabaseAdapter):
         embedding_model=None,
         metric="cosine",
         wipe_on_start=False,
+        max_connection_pool_size=100,
     ):
         self.db_name = os.getenv("NEO4J_DATABASE", "neo4j")
         self.username = os.getenv("NEO4J_USERNAME", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "neo4j")
+        self.max_connection_pool_size = max_connection_pool_size
+        self._drivers = weakref.WeakKeyDictionary()
 
         super().__init__(
             uri=uri,
@@ -40,32 +45,96 @@ class Neo4JAdapter(DatabaseAdapter):
             wipe_on_start=wipe_on_start,
         )
 
+    def get_driver(self):
+        """Returns the async driver of the running event loop.
+
+        The async drivers (and their connection pool) are bound to the event loop
+        they were created in, so one long-lived driver is lazily created per loop
+        and reused by all the subsequent queries.
+
+        Returns:
+            (neo4j.AsyncDriver): The async driver.
+        """
+        loop = asyncio.get_running_loop()
+        driver = self._drivers.get(loop, None)
+        if driver is None:
+            for other_loop in list(self._drivers.keys()):
+                if other_loop.is_closed():
+                    del self._drivers[other_loop]
+            driver = neo4j.AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+            )
+            self._drivers[loop] = driver
+        return driver
+
+    def run_sync(self, coro):
+        """Run a coroutine from a synchronous method.
+
+        If a new driver had to be created for the (temporary) loop used to
+        run the coroutine, it is closed before returning.
+
+        Args:
+            coro (coroutine): The coroutine to run.
+
+        Returns:
+            (any): The result of the coroutine.
+        """
+
+        async def run_and_release():
+            loop = asyncio.get_running_loop()
+            owned = loop not in self._drivers
+            try:
+                return await coro
+            finally:
+                if owned:
+                    driver = self._drivers.pop(loop, None)
+                    if driver is not None:
+                        await driver.close()
+
+        return run_maybe_nested(run_and_release())
+
+    async def close(self):
+        """Close the drivers and their connection pools."""
+        loop = asyncio.get_running_loop()
+        for driver_loop, driver in list(self._drivers.items()):
+            del self._drivers[driver_loop]
+            if driver_loop is loop:
+                await driver.close()
+            elif driver_loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(driver.close(), driver_loop)
+                )
+
     def wipe_database(self):
         """Wipe all data from the database"""
-        run_maybe_nested(
-            self.query(
-                """
-                MATCH (n)
-                CALL (n) {
-                    DETACH DELETE n
-                } IN TRANSACTIONS OF 10000 ROWS
-                """,
-                read_only=False,
-            )
+        self.run_sync(self._wipe_database())
+
+    async def _wipe_database(self):
+        await self.query(
+            """
+            MATCH (n)
+            CALL (n) {
+                DETACH DELETE n
+            } IN TRANSACTIONS OF 10000 ROWS
+            """,
+            read_only=False,
         )
-        result = run_maybe_nested(self.query("SHOW VECTOR INDEXES"))
+        result = await self.query("SHOW VECTOR INDEXES", read_only=True)
         for indexes in result:
             index_name = indexes["name"]
             query = "DROP INDEX $index"
             params = {
                 "index": index_name,
             }
-            run_maybe_nested(
-                self.query(query, params)
-            )
+            await self.query(query, params, read_only=False)
 
     def create_vector_index(self):
         """Create vector indexes"""
+        self.run_sync(self._create_vector_index())
+
+    async def _create_vector_index(self):
         for entity_model in self.entity_models:
             node_label = self.sanitize_label(entity_model.get_schema().get("title"))
             index_name = to_snake_case(node_label)
@@ -84,39 +153,51 @@ class Neo4JAdapter(DatabaseAdapter):
                 "dimension": self.embedding_dim,
                 "similarityFunction": self.metric,
             }
-            run_maybe_nested(
-                self.query(query, params=params),
-            )
+            await self.query(query, params=params, read_only=False)
         if self.entity_models:
-            run_maybe_nested(
-                self.query("CALL db.awaitIndexes(300)"),
-            )
+            await self.query("CALL db.awaitIndexes(300)", read_only=True)
 
     async def query(
-        self, query: str, params: Dict[str, Any] = None, read_only=True, **kwargs
+        self, query: str, params: Dict[str, Any] = None, read_only=False, **kwargs
     ):
-        driver = neo4j.GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        """Execute a Cypher query.
+
+        Args:
+            query (str): The Cypher query to execute.
+            params (dict): Optional. The parameters of the query.
+            read_only (bool): Optional. Whether the query only reads data, so it
+                can be routed to a read replica (Default to False).
+            **kwargs (keyword arguments): Additional arguments forwarded to the
+                session `run()` method.
+
+        Returns:
+            (list): The records of the query.
+        """
+        driver = self.get_driver()
         result_list = []
-        if read_only:
-            if not params:
-                params = {}
-            params["routing_"] = neo4j.RoutingControl.READ
-        try:
-            with driver.session(database=self.db_name) as session:
-                if params:
-                    result = session.run(query, **params, **kwargs)
-                else:
-                    result = session.run(query, **kwargs)
-                for record in reversed(list(result)):
-                    data = record.data()
-                    if isinstance(data, dict):
-                        data = out_mask_json(data, mask=["embedding"])
-                    result_list.append(data)
-                session.close()
-        finally:
-            driver.close()
+        access_mode = neo4j.READ_ACCESS if read_only else neo4j.WRITE_ACCESS
+        async with driver.session(
+            database=self.db_name,
+            default_access_mode=access_mode,
+        ) as session:
+            result = await session.run(query, parameters=params, **kwargs)
+            records = [record async for record in result]
+            for record in reversed(records):
+                data = record.data()
+                if isinstance(data, dict):
+                    data = out_mask_json(data, mask=["embedding"])
+                result_list.append(data)
         return result_list
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_drivers"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._drivers = weakref.WeakKeyDictionary()
+
     async def update(
         self,
         data_model,
@@ -217,6 +298,194 @@ class Neo4JAdapter(DatabaseAdapter):
                 "The parameter `data_model` must be an `Entity` or `Relation` instance"
             )
 
+    async def update_batch(
+        self,
+        data_models,
+        threshold=0.8,
+        chunk_size=500,
+    ):
+        """Update the database with many entities and relations at once.
+
+        The entities are grouped by label (and the relations by label and
+        subject/object labels), each group is then sent in chunks, using
+        a single parameterized `UNWIND` query per chunk. The entities are
+        inserted before the relations.
+
+        Args:
+            data_models (list): The list of `Entity` or `Relation` data models.
+            threshold (float): Similarity threshold for entity alignment
+                (Default to 0.8).
+            chunk_size (int): The maximum number of rows per query
+                (Default to 500).
+
+        Returns:
+            (list): The outcome of each data model, in the same order. One of
+                `"created"` or `"aligned"` for the entities, `"merged"` or
+                `"unaligned"` for the relations, `"skipped"` if the data model is
+                not embedded or `"failed"` if its query failed.
+        """
+        outcomes = [None] * len(data_models)
+        entity_groups = {}
+        relation_groups = {}
+        for i, data_model in enumerate(data_models):
+            if is_relation(data_model):
+                subj = data_model.get_nested_entity("subj")
+                obj = data_model.get_nested_entity("obj")
+                subj_vector = subj.get("embedding") if subj else None
+                obj_vector = obj.get("embedding") if obj else None
+                if not subj_vector or not obj_vector:
+                    outcomes[i] = "skipped"
+                    continue
+                properties = self.sanitize_properties(data_model.get_json())
+                properties.pop("subj", None)
+                properties.pop("obj", None)
+                group = (
+                    self.sanitize_label(data_model.get("label")),
+                    self.sanitize_label(subj.get("label")),
+                    self.sanitize_label(obj.get("label")),
+                )
+                relation_groups.setdefault(group, []).append(
+                    {
+                        "row_id": i,
+                        "subjVector": subj_vector,
+                        "objVector": obj_vector,
+                        "properties": properties,
+                    }
+                )
+            elif is_entity(data_model):
+                vector = data_model.get("embedding")
+                if not vector:
+                    outcomes[i] = "skipped"
+                    continue
+                node_label = self.sanitize_label(data_model.get("label"))
+                entity_groups.setdefault(node_label, []).append(
+                    {
+                        "row_id": i,
+                        "vector": vector,
+                        "properties": self.sanitize_properties(data_model.get_json()),
+                    }
+                )
+            else:
+                raise ValueError(
+                    "The parameter `data_models` must be a list of "
+                    "`Entity` or `Relation` instances"
+                )
+
+        if outcomes.count("skipped"):
+            warnings.warn(
+                f"{outcomes.count('skipped')} data models are not embedded: "
+                "Entities and relations needs to be embedded. "
+                "Use `Embedding` module before `UpdateKnowledge`. "
+                "Skipping them."
+            )
+
+        for node_label, rows in entity_groups.items():
+            query = self.entity_batch_query(node_label)
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                duplicates = self.align_vectors(
+                    [row["vector"] for row in chunk],
+                    threshold=threshold,
+                )
+                for position in duplicates:
+                    outcomes[chunk[position]["row_id"]] = "aligned"
+                duplicates = set(duplicates)
+                chunk = [row for j, row in enumerate(chunk) if j not in duplicates]
+                params = {
+                    "indexName": to_snake_case(node_label),
+                    "threshold": threshold,
+                    "rows": chunk,
+                }
+                await self._run_batch(query, params, chunk, outcomes)
+
+        for (relation_label, subj_label, obj_label), rows in relation_groups.items():
+            query = self.relation_batch_query(relation_label)
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                params = {
+                    "subjIndexName": to_snake_case(subj_label),
+                    "objIndexName": to_snake_case(obj_label),
+                    "threshold": threshold,
+                    "rows": chunk,
+                }
+                await self._run_batch(query, params, chunk, outcomes)
+        return outcomes
+
+    async def _run_batch(self, query, params, chunk, outcomes):
+        if not chunk:
+            return
+        try:
+            result = await self.query(query, params=params, read_only=False)
+        except Exception as e:
+            warnings.warn(f"Failed to update a batch of {len(chunk)} rows: {e}")
+            for row in chunk:
+                outcomes[row["row_id"]] = "failed"
+            return
+        for record in result:
+            outcomes[record["row_id"]] = record["outcome"]
+
+    def entity_batch_query(self, node_label):
+        """Returns the `UNWIND` query creating the non-aligned entities.
+
+        Args:
+            node_label (str): The sanitized label of the entities.
+
+        Returns:
+            (str): The query.
+        """
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL (row) {",
+                "  CALL db.index.vector.queryNodes($indexName, 1, row.vector)",
+                "  YIELD node, score",
+                "  WHERE score >= $threshold",
+                "  RETURN count(node) AS existing_count",
+                "}",
+                "FOREACH (_ IN CASE WHEN existing_count = 0 THEN [1] ELSE [] END |",
+                f"  CREATE (n:{node_label})",
+                "  SET n = row.properties",
+                ")",
+                "RETURN row.row_id AS row_id, CASE WHEN existing_count = 0",
+                "  THEN 'created' ELSE 'aligned' END AS outcome",
+            ]
+        )
+
+    def relation_batch_query(self, relation_label):
+        """Returns the `UNWIND` query merging the relations between aligned entities.
+
+        Args:
+            relation_label (str): The sanitized label of the relations.
+
+        Returns:
+            (str): The query.
+        """
+        return "\n".join(
+            [
+                "UNWIND $rows AS row",
+                "CALL (row) {",
+                "  CALL db.index.vector.queryNodes($subjIndexName, 1, row.subjVector)",
+                "  YIELD node AS s, score AS subj_score",
+                "  WHERE subj_score >= $threshold",
+                "  CALL db.index.vector.queryNodes($objIndexName, 1, row.objVector)",
+                "  YIELD node AS o, score AS obj_score",
+                "  WHERE obj_score >= $threshold",
+                f"  MERGE (s)-[r:{relation_label}]->(o)",
+                "  SET r += row.properties",
+                "  RETURN count(r) AS merged_count",
+                "}",
+                "RETURN row.row_id AS row_id, CASE WHEN merged_count > 0",
+                "  THEN 'merged' ELSE 'unaligned' END AS outcome",
+            ]
+        )
+
+    def pairwise_similarity(self, vectors):
+        scores = super().pairwise_similarity(vectors)
+        if self.metric == "cosine":
+            # Neo4j normalizes the cosine similarity between 0 and 1
+            scores = (1.0 + scores) / 2.0
+        return scores
+
     async def similarity_search(
         self,
         similarity_search,
@@ -250,7 +519,7 @@ class Neo4JAdapter(DatabaseAdapter):
             "threshold": threshold,
             "vector": vector,
         }
-        result = await self.query(query, params=params)
+        result = await self.query(query, params=params, read_only=True)
         return result
 
     async def triplet_search(
@@ -286,12 +555,11 @@ class Neo4JAdapter(DatabaseAdapter):
         )
 
         if has_subject_similarity and has_object_similarity:
-            subject_vector = (
-                await self.embedding_model(texts=[subject_similarity_search])
-            )["embeddings"][0]
-            object_vector = (
-                await self.embedding_model(texts=[object_similarity_search])
-            )["embeddings"][0]
+            subject_vector, object_vector = (
+                await self.embedding_model(
+                    texts=[subject_similarity_search, object_similarity_search]
+                )
+            )["embeddings"]
             params["subjVector"] = subject_vector
             params["objVector"] = object_vector
 
@@ -385,4 +653,4 @@ class Neo4JAdapter(DatabaseAdapter):
         )
         query_lines.append("LIMIT $numberOfNearestNeighbours")
         query = "\n".join(query_lines)
-        return await self.query(query, params)
+        return await self.query(query, params, read_only=True)
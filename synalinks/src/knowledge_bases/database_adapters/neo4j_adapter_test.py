@@ -1,12 +1,16 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import copy
 from typing import Literal
 from typing import Union
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import numpy as np
 
 from synalinks.src import testing
+from synalinks.src.backend import EmbeddedEntity
 from synalinks.src.backend import Entity
 from synalinks.src.backend import Relation
 from synalinks.src.backend import SimilaritySearch
@@ -33,7 +37,140 @@ class IsPartOf(Relation):
     subj: Document
 
 
+class EmbeddedDocument(EmbeddedEntity):
+    label: Literal["EmbeddedDocument"]
+    text: str
+
+
+class EmbeddedIsPartOf(Relation):
+    obj: EmbeddedDocument
+    label: Literal["IsPartOf"]
+    subj: EmbeddedDocument
+
+
+class FakeRecord:
+    def __init__(self, data):
+        self._data = data
+
+    def data(self):
+        return self._data
+
+
+class FakeResult:
+    def __init__(self, records):
+        self._records = records
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self._records:
+            yield record
+
+
+def fake_driver():
+    session = MagicMock()
+    session.run = AsyncMock(return_value=FakeResult([FakeRecord({"n": 1})]))
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    driver = MagicMock()
+    driver.session = MagicMock(return_value=session)
+    driver.close = AsyncMock()
+    return driver
+
+
 class Neo4JAdapterTest(testing.TestCase):
+    @patch("neo4j.AsyncGraphDatabase.driver")
+    @patch("litellm.aembedding")
+    async def test_adapter_reuses_driver(self, mock_embedding, mock_driver):
+        expected_value = np.random.rand(1024)
+        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+        mock_driver.side_effect = lambda *args, **kwargs: fake_driver()
+
+        embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
+
+        adapter = Neo4JAdapter(
+            uri="neo4j://localhost:7687",
+            embedding_model=embedding_model,
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            max_connection_pool_size=10,
+        )
+        # The driver used to create the indexes is closed with its loop
+        self.assertEqual(mock_driver.call_count, 1)
+        setup_driver = mock_driver.call_args
+        self.assertEqual(setup_driver.kwargs["max_connection_pool_size"], 10)
+
+        async with adapter:
+            result = await adapter.query("RETURN 1 AS n")
+            self.assertEqual(result, [{"n": 1}])
+            _ = await adapter.query("RETURN 1 AS n")
+            self.assertEqual(mock_driver.call_count, 2)
+            driver = adapter.get_driver()
+            self.assertEqual(driver.session.call_count, 2)
+        driver.close.assert_awaited_once()
+        self.assertEqual(len(adapter._drivers), 0)
+
+        cloned_adapter = copy.deepcopy(adapter)
+        self.assertEqual(len(cloned_adapter._drivers), 0)
+
+    @patch("neo4j.AsyncGraphDatabase.driver")
+    @patch("litellm.aembedding")
+    async def test_adapter_update_batch(self, mock_embedding, mock_driver):
+        mock_embedding.return_value = {"data": [{"embedding": np.random.rand(8)}]}
+        mock_driver.side_effect = lambda *args, **kwargs: fake_driver()
+
+        embedding_model = EmbeddingModel(model="ollama/mxbai-embed-large")
+
+        adapter = Neo4JAdapter(
+            uri="neo4j://localhost:7687",
+            embedding_model=embedding_model,
+            entity_models=[EmbeddedDocument],
+            relation_models=[EmbeddedIsPartOf],
+        )
+
+        def run(query, parameters=None, **kwargs):
+            outcome = "merged" if "MERGE" in query else "created"
+            records = [
+                FakeRecord({"row_id": row["row_id"], "outcome": outcome})
+                for row in parameters["rows"]
+            ]
+            return FakeResult(records)
+
+        doc1 = EmbeddedDocument(
+            label="EmbeddedDocument", text="doc 1", embedding=[1.0, 0.0]
+        )
+        doc2 = EmbeddedDocument(
+            label="EmbeddedDocument", text="doc 2", embedding=[0.0, 1.0]
+        )
+        doc3 = EmbeddedDocument(
+            label="EmbeddedDocument", text="doc 3", embedding=[1.0, 0.0]
+        )
+        doc4 = EmbeddedDocument(label="EmbeddedDocument", text="doc 4", embedding=[])
+        relation = EmbeddedIsPartOf(subj=doc1, label="IsPartOf", obj=doc2)
+        data_models = [
+            relation.to_json_data_model(),
+            doc1.to_json_data_model(),
+            doc2.to_json_data_model(),
+            doc3.to_json_data_model(),
+            doc4.to_json_data_model(),
+        ]
+
+        async with adapter:
+            session = adapter.get_driver().session()
+            session.run.side_effect = run
+            with self.assertWarns(UserWarning):
+                outcomes = await adapter.update_batch(data_models, chunk_size=3)
+
+        self.assertEqual(
+            outcomes,
+            ["merged", "created", "created", "aligned", "skipped"],
+        )
+        # One query for the entities (without the duplicate) and for the relations
+        self.assertEqual(session.run.call_count, 2)
+        first_chunk = session.run.call_args_list[0].kwargs["parameters"]["rows"]
+        self.assertEqual([row["row_id"] for row in first_chunk], [1, 2])
+
     @patch("litellm.aembedding")
     async def test_adapter(self, mock_embedding):
         expected_value = np.random.rand(1024)
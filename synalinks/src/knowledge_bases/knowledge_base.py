@@ -70,6 +70,42 @@ class KnowledgeBase(SynalinksSaveable):
 
     Learn more about MemGraph in their documentation **[here](https://memgraph.com/docs)**
 
+    ### Using the local embedded database
+
+    For unit tests, edge deployments or latency-sensitive services, you can use
+    the embedded in-process database: the vectors and the relations are kept in
+    NumPy arrays and persisted in the given directory (or only kept in memory
+    if no directory is given, using `"local://"`).
+
+    ```python
+    knowledge_base = synalinks.KnowledgeBase(
+        uri="local://knowledge_base",
+        entity_models=[Document, Chunk],
+        relation_models=[IsPartOf],
+        embedding_model=embedding_model,
+        metric="cosine",
+        wipe_on_start=False,
+    )
+    ```
+
+    Note that only a subset of Cypher is supported by `query()` in that case.
+
+    The adapters keep one long-lived async driver with a pool of connections,
+    so the queries don't block the event loop and run concurrently with the
+    language models calls. Use the knowledge base as an async context manager
+    (or call `close()`) to release the connections.
+
+    ```python
+    async with synalinks.KnowledgeBase(
+        uri="neo4j://localhost:7687",
+        entity_models=[Document, Chunk],
+        relation_models=[IsPartOf],
+        embedding_model=embedding_model,
+        max_connection_pool_size=50,
+    ) as knowledge_base:
+        ...
+    ```
+
     **Note**: Obviously, use an `.env` file and `.gitignore` to avoid putting
     your username and password in the code or a config file that can lead to
     leackage when pushing it into repositories.
@@ -82,6 +118,8 @@ class KnowledgeBase(SynalinksSaveable):
         metric (str): The metric to use for the vector index (`cosine` or `euclidean`).
         wipe_on_start (bool): Wether or not to wipe the graph database at start
             (Default to False).
+        max_connection_pool_size (int): Optional. The maximum number of
+            connections kept in the pool of the database driver (Default to 100).
     """
 
     def __init__(
@@ -92,6 +130,7 @@ class KnowledgeBase(SynalinksSaveable):
         embedding_model=None,
         metric="cosine",
         wipe_on_start=False,
+        max_connection_pool_size=100,
     ):
         self.adapter = database_adapters.get(uri)(
             uri=uri,
@@ -100,6 +139,7 @@ class KnowledgeBase(SynalinksSaveable):
             embedding_model=embedding_model,
             metric=metric,
             wipe_on_start=wipe_on_start,
+            max_connection_pool_size=max_connection_pool_size,
         )
         self.uri = uri
         self.entity_models = entity_models
@@ -107,6 +147,7 @@ class KnowledgeBase(SynalinksSaveable):
         self.embedding_model = embedding_model
         self.metric = metric
         self.wipe_on_start = wipe_on_start
+        self.max_connection_pool_size = max_connection_pool_size
 
     async def update(
         self,
@@ -128,18 +169,74 @@ class KnowledgeBase(SynalinksSaveable):
                 Entities with similarity above this threshold will be merged.
                 Should be between 0.0 and 1.0 (Defaults to 0.8).
         """
-        return await self.adapter.update(data_model)
+        return await self.adapter.update(data_model, threshold=threshold)
+
+    async def update_batch(
+        self,
+        data_models,
+        threshold=0.8,
+        chunk_size=500,
+    ):
+        """Update the knowledge base with many entities and relations at once.
+
+        Much faster than calling `update()` for each data model when loading
+        large knowledge graphs: the entities are grouped by label and each group
+        is sent in chunks, using a single query per chunk. The entities are
+        inserted before the relations.
+
+        Example:
+
+        ```python
+        outcomes = await knowledge_base.update_batch(
+            entities + relations,
+            chunk_size=1000,
+        )
+        ```
+
+        Args:
+            data_models (list): The list of `Entity` or `Relation` data models
+                (already embedded) to add or update in the knowledge base.
+            threshold (float): Similarity threshold for entity alignment.
+                Entities with similarity above this threshold will be merged.
+                Should be between 0.0 and 1.0 (Defaults to 0.8).
+            chunk_size (int): The maximum number of data models per query
+                (Defaults to 500).
+
+        Returns:
+            (list): The outcome of each data model, in the same order. One of
+                `"created"` or `"aligned"` for the entities, `"merged"` or
+                `"unaligned"` for the relations, `"skipped"` if the data model is
+                not embedded or `"failed"` if its query failed.
+        """
+        return await self.adapter.update_batch(
+            data_models,
+            threshold=threshold,
+            chunk_size=chunk_size,
+        )
 
-    async def query(self, query: str, params: Dict[str, Any] = None, **kwargs):
+    async def query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        read_only=False,
+        **kwargs,
+    ):
         """Execute a query against the knowledge base.
 
         Args:
             query (str): The Cypher query to execute. The format depends on the
                 underlying database adapter (e.g., Cypher for Neo4j).
+            params (dict): Optional. The parameters of the query.
+            read_only (bool): Optional. Whether the query only reads data. Read
+                only queries run in a read session, that can be routed to a read
+                replica, while the other queries (e.g. `CREATE`, `MERGE` or `SET`)
+                need a write session (Default to False).
 
         Returns:
             (GenericResult): the query results
         """
+        if read_only:
+            kwargs["read_only"] = read_only
         return await self.adapter.query(query, params=params, **kwargs)
 
     async def similarity_search(
@@ -192,11 +289,22 @@ class KnowledgeBase(SynalinksSaveable):
             threshold=threshold,
         )
 
+    async def close(self):
+        """Close the connections to the database."""
+        await self.adapter.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
     def get_config(self):
         config = {
             "uri": self.uri,
             "metric": self.metric,
             "wipe_on_start": self.wipe_on_start,
+            "max_connection_pool_size": self.max_connection_pool_size,
         }
         entity_models_config = {
             "entity_models": [
@@ -1,8 +1,11 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 from typing import Literal
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import neo4j
 import numpy as np
 
 from synalinks.src import testing
@@ -49,6 +52,48 @@ class KnowledgeBaseTest(testing.TestCase):
 
         _ = await knowledge_base.query("RETURN 1")
 
+    @patch("neo4j.AsyncGraphDatabase.driver")
+    @patch("litellm.aembedding")
+    async def test_knowledge_base_write_query(self, mock_embedding, mock_driver):
+        expected_value = np.random.rand(1024)
+        mock_embedding.return_value = {"data": [{"embedding": expected_value}]}
+
+        driver = MagicMock()
+        driver.close = AsyncMock()
+        session = driver.session.return_value.__aenter__.return_value
+        session.run = AsyncMock()
+        session.run.return_value.__aiter__.return_value = []
+        mock_driver.return_value = driver
+
+        embedding_model = EmbeddingModel(
+            model="ollama/mxbai-embed-large",
+        )
+
+        knowledge_base = KnowledgeBase(
+            uri="neo4j://localhost:7687",
+            entity_models=[Document, Chunk],
+            relation_models=[IsPartOf],
+            embedding_model=embedding_model,
+            metric="cosine",
+            wipe_on_start=False,
+        )
+
+        driver.session.reset_mock()
+        _ = await knowledge_base.query(
+            "CREATE (n:Document {text: $text})", params={"text": "Hello"}
+        )
+        self.assertEqual(
+            driver.session.call_args.kwargs["default_access_mode"],
+            neo4j.WRITE_ACCESS,
+        )
+
+        driver.session.reset_mock()
+        _ = await knowledge_base.query("MATCH (n) RETURN n", read_only=True)
+        self.assertEqual(
+            driver.session.call_args.kwargs["default_access_mode"],
+            neo4j.READ_ACCESS,
+        )
+
     @patch("litellm.aembedding")
     def test_knowledge_base_serialization(self, mock_embedding):
         expected_value = np.random.rand(1024)
@@ -1,5 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import contextlib
 import copy
 import json
 import warnings
@@ -8,8 +9,12 @@ import litellm
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import ChatRole
+from synalinks.src.caches.cache import content_hash
 from synalinks.src.saving import serialization_lib
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
+from synalinks.src.utils.rate_limiter import estimate_tokens
+from synalinks.src.utils.rate_limiter import get_rate_limiter
+from synalinks.src.utils.rate_limiter import is_retryable_error
 
 
 @synalinks_export(
@@ -129,6 +134,53 @@ class LanguageModel(SynalinksSaveable):
     )
     ```
 
+    To avoid paying twice for the same prompt (e.g. when re-running an evaluation
+    or training over the same dataset), use the `cache` argument. The responses
+    are keyed on a hash of the model, the messages, the JSON schema and the
+    additional keyword arguments (like the temperature).
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="ollama/mistral",
+        cache=synalinks.caches.SQLiteCache(path="responses.db"),
+    )
+    ```
+
+    To avoid being rate limited by the provider when running large batches,
+    use the `rate_limiter` argument. The rate limiter bounds the number of
+    requests in flight and per minute, and backs off between the retries.
+    You can share the same rate limiter between the models of a provider.
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="openai/gpt-4o-mini",
+        rate_limiter=synalinks.RateLimiter(
+            max_concurrency=32,
+            requests_per_minute=500,
+        ),
+    )
+    ```
+
+    To reduce the latency and cost of the prompts sharing the same prefix
+    (like the successive steps of an agent, that share the same system prompt,
+    tools and earlier turns), use the `prompt_caching` argument. For Anthropic
+    models, the stable prefix of the messages is marked with `cache_control`
+    breakpoints, so the provider reuses it across the calls. The other
+    providers (like OpenAI) cache the prompt prefixes automatically.
+
+    ```python
+    import synalinks
+
+    language_model = synalinks.LanguageModel(
+        model="anthropic/claude-3-5-sonnet-20241022",
+        prompt_caching=True,
+    )
+    ```
+
     **Note**: Obviously, use an `.env` file and `.gitignore` to avoid
     putting your API keys in the code or a config file that can lead to
     leackage when pushing it into repositories.
@@ -140,6 +192,14 @@ class LanguageModel(SynalinksSaveable):
         retry (int): Optional. The number of retry (default to 5).
         fallback (LanguageModel): Optional. The language model to fallback
             if anything is wrong.
+        cache (Cache): Optional. The cache to use to store the responses
+            (Default to None, no caching).
+        rate_limiter (RateLimiter): Optional. The rate limiter to use
+            (Default to None, use the one registered for the provider
+            with `synalinks.utils.set_rate_limiter()` if any).
+        prompt_caching (bool): Optional. Whether to emit the prompt caching
+            hints for the stable prefix of the messages, for the providers
+            that need them (Default to False).
     """
 
     def __init__(
@@ -149,6 +209,9 @@ class LanguageModel(SynalinksSaveable):
         timeout=600,
         retry=5,
         fallback=None,
+        cache=None,
+        rate_limiter=None,
+        prompt_caching=False,
     ):
         if model is None:
             raise ValueError("You need to set the `model` argument for any LanguageModel")
@@ -165,6 +228,9 @@ class LanguageModel(SynalinksSaveable):
             self.api_base = api_base
         self.timeout = timeout
         self.retry = retry
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.prompt_caching = prompt_caching
 
     async def __call__(self, messages, schema=None, streaming=False, **kwargs):
         """
@@ -185,6 +251,9 @@ class LanguageModel(SynalinksSaveable):
         json_instance = {}
         input_kwargs = copy.deepcopy(kwargs)
         if schema:
+            # The shared schemas are read-only, while litellm can modify the
+            # schema in place (e.g. to adapt it to the provider)
+            schema = copy.deepcopy(schema)
             if self.model.startswith("groq"):
                 # Use a tool created on the fly for groq
                 kwargs.update(
@@ -269,16 +338,44 @@ class LanguageModel(SynalinksSaveable):
             streaming = False
         if streaming:
             kwargs.update({"stream": True})
+        cache_key = None
+        if self.cache is not None and not streaming:
+            cache_key = content_hash(
+                {
+                    "model": self.model,
+                    "messages": formatted_messages,
+                    "schema": schema,
+                    "kwargs": input_kwargs,
+                }
+            )
+            cached_instance = self.cache.get(cache_key)
+            if cached_instance is not None:
+                return cached_instance
+            if self.cache.read_only:
+                raise ValueError(
+                    f"Cache miss for {self} while the cache is in read-only mode. "
+                    "Re-run your program with a writable cache to record "
+                    "the missing responses."
+                )
+        lm_messages = formatted_messages
+        if self.prompt_caching and self.model.startswith("anthropic"):
+            lm_messages = add_cache_control(formatted_messages)
+        rate_limiter = self._get_rate_limiter()
         for i in range(self.retry):
             try:
                 response_str = ""
-                response = await litellm.acompletion(
-                    model=self.model,
-                    messages=formatted_messages,
-                    timeout=self.timeout,
-                    caching=False,
-                    **kwargs,
-                )
+                if rate_limiter:
+                    limit = rate_limiter.limit(tokens=estimate_tokens(formatted_messages))
+                else:
+                    limit = contextlib.nullcontext()
+                async with limit:
+                    response = await litellm.acompletion(
+                        model=self.model,
+                        messages=lm_messages,
+                        timeout=self.timeout,
+                        caching=False,
+                        **kwargs,
+                    )
                 if streaming:
                     return StreamingIterator(response)
                 if (
@@ -298,9 +395,13 @@ class LanguageModel(SynalinksSaveable):
                         "tool_call_id": None,
                         "tool_calls": [],
                     }
+                if cache_key:
+                    self.cache.put(cache_key, json_instance)
                 return json_instance
             except Exception as e:
                 warnings.warn(f"Error occured while trying to call {self}: " + str(e))
+                if rate_limiter and i < self.retry - 1 and is_retryable_error(e):
+                    await rate_limiter.backoff(i)
         if self.fallback:
             return self.fallback(
                 messages,
@@ -311,6 +412,12 @@ class LanguageModel(SynalinksSaveable):
         else:
             return None
 
+    def _get_rate_limiter(self):
+        if self.rate_limiter is not None:
+            return self.rate_limiter
+        provider = self.model.split("/")[0].replace("ollama_chat", "ollama")
+        return get_rate_limiter(provider)
+
     def _obj_type(self):
         return "LanguageModel"
 
@@ -321,6 +428,24 @@ class LanguageModel(SynalinksSaveable):
             "timeout": self.timeout,
             "retry": self.retry,
         }
+        if self.prompt_caching:
+            config.update({"prompt_caching": self.prompt_caching})
+        if self.cache is not None:
+            config.update(
+                {
+                    "cache": serialization_lib.serialize_synalinks_object(
+                        self.cache,
+                    )
+                }
+            )
+        if self.rate_limiter is not None:
+            config.update(
+                {
+                    "rate_limiter": serialization_lib.serialize_synalinks_object(
+                        self.rate_limiter,
+                    )
+                }
+            )
         if self.fallback:
             fallback_config = {
                 "fallback": serialization_lib.serialize_synalinks_object(
@@ -333,6 +458,14 @@ class LanguageModel(SynalinksSaveable):
 
     @classmethod
     def from_config(cls, config):
+        if "cache" in config:
+            config["cache"] = serialization_lib.deserialize_synalinks_object(
+                config.pop("cache")
+            )
+        if "rate_limiter" in config:
+            config["rate_limiter"] = serialization_lib.deserialize_synalinks_object(
+                config.pop("rate_limiter")
+            )
         if "fallback" in config:
             fallback = serialization_lib.deserialize_synalinks_object(
                 config.pop("fallback")
@@ -346,6 +479,50 @@ class LanguageModel(SynalinksSaveable):
         return f"<LanguageModel model={self.model}{api_base}>"
 
 
+def add_cache_control(messages):
+    """Mark the stable prefix of the messages with `cache_control` breakpoints.
+
+    A breakpoint is added at the end of the leading system messages (system
+    prompt, schemas, examples and instructions) and, for multi-turn
+    conversations, at the end of the earlier turns (the message preceding the
+    last one). The provider caches the prompt up to each breakpoint, so the
+    following calls sharing the same prefix only pay for the new messages.
+
+    Args:
+        messages (list): The list of chat messages JSON.
+
+    Returns:
+        (list): The messages, with the breakpoints added to copies of the
+            marked messages.
+    """
+    indices = set()
+    num_system_messages = 0
+    for message in messages:
+        if message.get("role") != ChatRole.SYSTEM:
+            break
+        num_system_messages += 1
+    if num_system_messages > 0:
+        indices.add(num_system_messages - 1)
+    if len(messages) - num_system_messages > 1:
+        indices.add(len(messages) - 2)
+    cached_messages = list(messages)
+    for index in indices:
+        content = messages[index].get("content")
+        if not isinstance(content, str) or not content:
+            continue
+        cached_messages[index] = {
+            **messages[index],
+            "content": [
+                {
+                    "type": "text",
+                    "text": content,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+    return cached_messages
+
+
 class StreamingIterator:
     def __init__(self, iterator):
         self._iterator = iterator
@@ -7,6 +7,7 @@ from synalinks.src.backend import ChatMessage
 from synalinks.src.backend import ChatMessages
 from synalinks.src.backend import ChatRole
 from synalinks.src.backend import DataModel
+from synalinks.src.caches import InMemoryCache
 from synalinks.src.language_models import LanguageModel
 
 
@@ -105,3 +106,103 @@ class LanguageModelTest(testing.TestCase):
             result += msg.get("content")
 
         self.assertEqual(result, expected)
+
+    @patch("litellm.acompletion")
+    async def test_call_api_with_cache(self, mock_completion):
+        cache = InMemoryCache()
+        language_model = LanguageModel(model="ollama/mistral", cache=cache)
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="Hello")]
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Hello, how can I help you?"}}]
+        }
+
+        first = await language_model(messages)
+        second = await language_model(messages)
+        self.assertEqual(first, second)
+        self.assertEqual(mock_completion.call_count, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+        await language_model(messages, temperature=0.5)
+        self.assertEqual(mock_completion.call_count, 2)
+
+    @patch("litellm.acompletion")
+    async def test_call_api_with_read_only_cache(self, mock_completion):
+        language_model = LanguageModel(
+            model="ollama/mistral",
+            cache=InMemoryCache(read_only=True),
+        )
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="Hello")]
+        )
+
+        with self.assertRaises(ValueError):
+            await language_model(messages)
+        mock_completion.assert_not_called()
+
+    def test_language_model_with_cache_serialization(self):
+        language_model = LanguageModel(
+            model="ollama/mistral",
+            cache=InMemoryCache(max_size=10),
+        )
+        config = language_model.get_config()
+        language_model = LanguageModel.from_config(config)
+        self.assertIsInstance(language_model.cache, InMemoryCache)
+        self.assertEqual(language_model.cache.max_size, 10)
+
+    @patch("litellm.acompletion")
+    async def test_call_api_with_prompt_caching(self, mock_completion):
+        language_model = LanguageModel(
+            model="anthropic/claude-3-5-sonnet-20241022",
+            prompt_caching=True,
+        )
+
+        messages = ChatMessages(
+            messages=[
+                ChatMessage(role=ChatRole.SYSTEM, content="You are helpful"),
+                ChatMessage(role=ChatRole.USER, content="Hello"),
+                ChatMessage(role=ChatRole.ASSISTANT, content="Hi"),
+                ChatMessage(role=ChatRole.USER, content="How are you?"),
+            ]
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": "Fine, thanks"}}]
+        }
+
+        await language_model(messages)
+        lm_messages = mock_completion.call_args.kwargs["messages"]
+        cached = [i for i, m in enumerate(lm_messages) if isinstance(m["content"], list)]
+        # The system prompt and the earlier turns are marked as cacheable
+        self.assertEqual(cached, [0, 2])
+        self.assertEqual(
+            lm_messages[0]["content"],
+            [
+                {
+                    "type": "text",
+                    "text": "You are helpful",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        )
+        self.assertEqual(lm_messages[3]["content"], "How are you?")
+
+        # The hints are only emitted for the providers that need them
+        language_model = LanguageModel(model="ollama/mistral", prompt_caching=True)
+        await language_model(messages)
+        lm_messages = mock_completion.call_args.kwargs["messages"]
+        self.assertTrue(all(isinstance(m["content"], str) for m in lm_messages))
+
+    def test_language_model_with_prompt_caching_serialization(self):
+        language_model = LanguageModel(
+            model="anthropic/claude-3-5-sonnet-20241022",
+            prompt_caching=True,
+        )
+        config = language_model.get_config()
+        language_model = LanguageModel.from_config(config)
+        self.assertTrue(language_model.prompt_caching)
@@ -103,6 +103,15 @@ class FBetaScore(Metric):
             self.axis = 0
 
     async def update_state(self, y_true, y_pred):
+        self._accumulate(*self._compute_counts(y_true, y_pred))
+
+    async def update_state_batch(self, y_true, y_pred):
+        # The counts of the samples are summed to update the state only once
+        counts = [self._compute_counts(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+        if counts:
+            self._accumulate(*[np.sum(c, axis=0) for c in zip(*counts)])
+
+    def _compute_counts(self, y_true, y_pred):
         y_pred = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_pred)
         y_true = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_true)
 
@@ -135,6 +144,11 @@ class FBetaScore(Metric):
         false_negatives = np.convert_to_numpy(false_negatives)
         intermediate_weights = np.convert_to_numpy(intermediate_weights)
 
+        return true_positives, false_positives, false_negatives, intermediate_weights
+
+    def _accumulate(
+        self, true_positives, false_positives, false_negatives, intermediate_weights
+    ):
         current_true_positives = self.state.get("true_positives")
         if current_true_positives:
             true_positives = np.add(current_true_positives, true_positives)
@@ -366,7 +380,7 @@ class BinaryFBetaScore(FBetaScore):
             )
         self.threshold = threshold
 
-    async def update_state(self, y_true, y_pred):
+    def _compute_counts(self, y_true, y_pred):
         y_pred = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_pred)
         y_true = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_true)
 
@@ -402,32 +416,7 @@ class BinaryFBetaScore(FBetaScore):
         false_negatives = (1 - y_pred) * y_true
         intermediate_weights = y_true
 
-        current_true_positives = self.state.get("true_positives")
-        if current_true_positives:
-            true_positives = np.add(current_true_positives, true_positives)
-
-        current_false_positives = self.state.get("false_positives")
-        if current_false_positives:
-            false_positives = np.add(current_false_positives, false_positives)
-
-        current_false_negatives = self.state.get("false_negatives")
-        if current_false_negatives:
-            false_negatives = np.add(current_false_negatives, false_negatives)
-
-        current_intermediate_weights = self.state.get("intermediate_weights")
-        if current_intermediate_weights:
-            intermediate_weights = np.add(
-                current_intermediate_weights, intermediate_weights
-            )
-
-        self.state.update(
-            {
-                "true_positives": true_positives.tolist(),
-                "false_positives": false_positives.tolist(),
-                "false_negatives": false_negatives.tolist(),
-                "intermediate_weights": intermediate_weights.tolist(),
-            }
-        )
+        return true_positives, false_positives, false_negatives, intermediate_weights
 
     def get_config(self):
         """Return the serializable config of the metric.
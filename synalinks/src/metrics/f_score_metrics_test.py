@@ -58,6 +58,28 @@ class F1ScoreTest(testing.TestCase):
         score = await metric(y_true, y_pred)
         self.assertAlmostEqual(score, 0.0, delta=3 * backend.epsilon())
 
+    async def test_update_state_batch(self):
+        class Answer(DataModel):
+            answer: str
+
+        y_true = [
+            Answer(answer="Paris is the capital of France."),
+            Answer(answer="Toulouse is the French city of aeronautics and space."),
+        ]
+        y_pred = [
+            Answer(answer="Paris is a city of France."),
+            Answer(answer="Toulouse is the French city of space."),
+        ]
+
+        metric = F1Score(average="weighted")
+        for y_t, y_p in zip(y_true, y_pred):
+            await metric.update_state(y_t, y_p)
+
+        batch_metric = F1Score(average="weighted")
+        await batch_metric.update_state_batch(y_true, y_pred)
+        self.assertEqual(batch_metric.state.get_json(), metric.state.get_json())
+        self.assertAlmostEqual(batch_metric.result(), metric.result())
+
 
 class BinaryFBetaScoreTest(testing.TestCase):
     async def test_same_boolean_fields(self):
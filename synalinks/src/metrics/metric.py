@@ -50,6 +50,44 @@ class Metric(SynalinksSaveable):
         """Accumulate statistics for the metric."""
         raise NotImplementedError
 
+    async def update_state_batch(self, y_true, y_pred):
+        """Accumulate statistics for a batch of samples.
+
+        By default, `update_state()` is called for each sample. Subclasses can
+        override this method to update their state once for the whole batch.
+
+        Args:
+            y_true (list): The ground truth data models of the batch.
+            y_pred (list): The predicted data models of the batch.
+        """
+        for y_t, y_p in zip(y_true, y_pred):
+            await self.update_state(y_t, y_p)
+
+    def merge_state(self, metric_states):
+        """Merge the states of other instances of the metric into this one.
+
+        This is used to reduce the states of the metrics updated on different
+        shards of the data. By default, the numerical fields of the state
+        variables are summed (element-wise for the lists of numbers), which
+        is correct for the metrics accumulating totals and counts.
+
+        Args:
+            metric_states (list): The states to merge, each state being the
+                list of the variables JSON corresponding 1:1 to `self.variables`.
+        """
+        for state in metric_states:
+            if len(state) != len(self.variables):
+                raise ValueError(
+                    "Argument `metric_states` must be a list of states "
+                    f"corresponding 1:1 to {self.__class__.__name__}().variables. "
+                    f"Received a state with length {len(state)}, but "
+                    f"expected {len(self.variables)} variables."
+                )
+            for v, json in zip(self.variables, state):
+                v.update(
+                    {key: _merge_values(v.get(key), value) for key, value in json.items()}
+                )
+
     def stateless_update_state(self, metric_variables, *args, **kwargs):
         if len(metric_variables) != len(self.variables):
             raise ValueError(
@@ -172,3 +210,18 @@ class Metric(SynalinksSaveable):
 
     def __str__(self):
         return self.__repr__()
+
+
+def _merge_values(value, other):
+    if value is None:
+        return other
+    if other is None:
+        return value
+    if isinstance(value, bool) or isinstance(other, bool):
+        return other
+    if isinstance(value, (int, float)) and isinstance(other, (int, float)):
+        return value + other
+    if isinstance(value, list) and isinstance(other, list):
+        if len(value) == len(other):
+            return [_merge_values(a, b) for a, b in zip(value, other)]
+    return other
@@ -2,6 +2,8 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+
 from synalinks.src import ops
 from synalinks.src import rewards
 from synalinks.src import tree
@@ -162,6 +164,38 @@ class MeanMetricWrapper(Mean):
             self._direction = "up"
 
     async def update_state(self, y_true, y_pred):
+        y_true, y_pred = self._standardize(y_true, y_pred)
+        values = await self._fn(y_true, y_pred, **self._fn_kwargs)
+        return await super().update_state(values)
+
+    async def update_state_batch(self, y_true, y_pred):
+        samples = [self._standardize(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+        if isinstance(self._fn, rewards.Reward) and not self._fn_kwargs:
+            # Let the reward score the whole batch at once
+            batch_values = await self._fn.compute_batch(
+                [y_t for y_t, _ in samples],
+                [y_p for _, y_p in samples],
+            )
+        else:
+            batch_values = await asyncio.gather(
+                *[self._fn(y_t, y_p, **self._fn_kwargs) for y_t, y_p in samples]
+            )
+        # Accumulate the values of all the samples to update the state only once
+        total = 0.0
+        num_samples = 0
+        for values in batch_values:
+            values = reduce_to_samplewise_values(values, reduce_fn=numpy.mean)
+            total += numpy.sum(values)
+            num_samples += numpy.shape(values)[0] if len(values.shape) >= 1 else 1
+        if num_samples:
+            self.total_with_count.update(
+                {
+                    "total": float(self.total_with_count.get("total") + total),
+                    "count": int(self.total_with_count.get("count") + num_samples),
+                }
+            )
+
+    def _standardize(self, y_true, y_pred):
         y_pred = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_pred)
         y_true = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_true)
         if self.in_mask:
@@ -170,8 +204,7 @@ class MeanMetricWrapper(Mean):
         if self.out_mask:
             y_pred = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_pred)
             y_true = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_true)
-        values = await self._fn(y_true, y_pred, **self._fn_kwargs)
-        return await super().update_state(values)
+        return y_true, y_pred
 
     def get_config(self):
         """Returns the serializable config of the metric."""
@@ -1,6 +1,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import asyncio
+import json
 import uuid
 from typing import List
 
@@ -264,6 +265,20 @@ class FunctionCallingAgent(Module):
         asyncio.run(main())
     ```
 
+    In *autonomous* mode, the trajectory is by default re-rendered as a single
+    input message at every step, so each step pays again for all the previous
+    steps, even with the prompt caching of the language model enabled (only
+    the system prompt, holding the tools schema, the examples and the
+    instructions, is cached). Set `multi_turn=True` to keep instead the
+    rendered prompt of the first step as a stable prefix and append each
+    assistant tool calls turn and each tool results turn as its own chat
+    message: a step then only renders its new turns, and with
+    `synalinks.LanguageModel(model="anthropic/...", prompt_caching=True)`
+    the previous turns are read from the cache. As the tool calls generator
+    then only sees the initial inputs, the predictions recorded for the
+    optimizers do not contain the previous steps, which is why this mode is
+    opt-in.
+
     The FunctionCallingAgent is compatible with MCP tools,
     here is an example on how to use it:
 
@@ -347,6 +362,7 @@ class FunctionCallingAgent(Module):
         autonomous=True,
         return_inputs_with_trajectory=True,
         max_iterations=5,
+        multi_turn=False,
         name=None,
         description=None,
     ):
@@ -382,6 +398,7 @@ class FunctionCallingAgent(Module):
         self.autonomous = autonomous
         self.return_inputs_with_trajectory = return_inputs_with_trajectory
         self.max_iterations = max_iterations
+        self.multi_turn = multi_turn
 
         self.tool_calls_generator = ChainOfThought(
             schema=tool_calls_schema,
@@ -428,8 +445,23 @@ class FunctionCallingAgent(Module):
         agent_messages = trajectory.get("messages")
 
         if self.autonomous:
+            if self.multi_turn:
+                # Snapshot of the inputs, rendered identically at every step,
+                # the steps being sent as separate turns after it.
+                prompt_inputs = JsonDataModel(
+                    json=trajectory.get_json(),
+                    schema=trajectory.get_schema(),
+                    name=self.name + "_prompt_inputs",
+                )
+                turns = []
             for i in range(self.max_iterations):
-                tool_calls = await self.tool_calls_generator(trajectory)
+                if self.multi_turn:
+                    tool_calls = await self.tool_calls_generator(
+                        prompt_inputs,
+                        messages=turns,
+                    )
+                else:
+                    tool_calls = await self.tool_calls_generator(trajectory)
 
                 if not tool_calls:
                     assistant_message = ChatMessage(
@@ -468,24 +500,42 @@ class FunctionCallingAgent(Module):
                 agent_messages.append(assistant_message.get_json())
 
                 tool_results = await asyncio.gather(*tasks, return_exceptions=True)
+                step_results = []
                 for j, tool_result in enumerate(tool_results):
                     tool_call_id = tool_calls_ids[j]
                     if isinstance(tool_result, Exception):
-                        agent_messages.append(
-                            ChatMessage(
-                                role=ChatRole.TOOL,
-                                tool_call_id=tool_call_id,
-                                content="error: %s" % str(tool_result),
-                            ).get_json()
-                        )
-                    else:
-                        agent_messages.append(
-                            ChatMessage(
-                                role=ChatRole.TOOL,
+                        tool_result = "error: %s" % str(tool_result)
+                    agent_messages.append(
+                        ChatMessage(
+                            role=ChatRole.TOOL,
                             tool_call_id=tool_call_id,
                             content=tool_result,
                         ).get_json()
                     )
+                    step_results.append(
+                        {
+                            "tool_name": assistant_message.tool_calls[j].name,
+                            "result": tool_result,
+                        }
+                    )
+
+                if self.multi_turn:
+                    # The tool calls are structured outputs and not native
+                    # tool calls of the provider, so the step is sent back as
+                    # an assistant turn followed by a user turn with the results.
+                    turns.append(
+                        ChatMessage(
+                            role=ChatRole.ASSISTANT,
+                            content=json.dumps(tool_calls.get_json()),
+                        )
+                    )
+                    turns.append(
+                        ChatMessage(
+                            role=ChatRole.USER,
+                            content="Tool results:\n%s"
+                            % json.dumps(step_results, default=str),
+                        )
+                    )
 
                 trajectory.update({"messages": agent_messages})
             if self.schema:
@@ -606,6 +656,7 @@ class FunctionCallingAgent(Module):
             "use_outputs_schema": self.use_outputs_schema,
             "autonomous": self.autonomous,
             "max_iterations": self.max_iterations,
+            "multi_turn": self.multi_turn,
             "return_inputs_with_trajectory": self.return_inputs_with_trajectory,
             "name": self.name,
             "description": self.description,
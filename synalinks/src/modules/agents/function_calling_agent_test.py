@@ -234,6 +234,169 @@ class FunctionCallingAgentTest(testing.TestCase):
         print("Result:")
         print(result.prettify_json())
 
+    @patch("litellm.acompletion")
+    async def test_autonomous_mode_multi_turn_prompt_caching(self, mock_completion):
+        """Test that each step only appends its own turns to a cached prefix."""
+        language_model = LanguageModel(
+            model="anthropic/claude-3-5-sonnet-20241022",
+            prompt_caching=True,
+        )
+        tools = [
+            Tool(calculate),
+            Tool(thinking),
+        ]
+        inputs = Input(data_model=ChatMessages)
+        outputs = await FunctionCallingAgent(
+            language_model=language_model,
+            tools=tools,
+            autonomous=True,
+            max_iterations=5,
+            multi_turn=True,
+        )(inputs)
+        agent = Program(
+            inputs=inputs,
+            outputs=outputs,
+            name="multi_turn_test",
+        )
+
+        steps = [
+            {
+                "thinking": "First, I add the two numbers.",
+                "tool_calls": [
+                    {
+                        "tool_name": "calculate",
+                        "expression": "152648 + 485",
+                    }
+                ],
+            },
+            {
+                "thinking": "Then, I double the result.",
+                "tool_calls": [
+                    {
+                        "tool_name": "calculate",
+                        "expression": "153133 * 2",
+                    }
+                ],
+            },
+            {
+                "thinking": "The result is 306266.",
+                "tool_calls": [],
+            },
+        ]
+        mock_completion.side_effect = [
+            {
+                "choices": [
+                    {
+                        "message": {
+                            "content": None,
+                            "tool_calls": [{"function": {"arguments": json.dumps(step)}}],
+                        }
+                    }
+                ]
+            }
+            for step in steps
+        ]
+
+        input_messages = ChatMessages(
+            messages=[
+                ChatMessage(
+                    role="user",
+                    content="How much is (152648 + 485) * 2?",
+                ),
+            ]
+        )
+        result = await agent(input_messages)
+        self.assertTrue(is_chat_messages(result))
+        self.assertEqual(mock_completion.call_count, len(steps))
+
+        calls = [call.kwargs["messages"] for call in mock_completion.call_args_list]
+        for n, lm_messages in enumerate(calls):
+            # The system prompt and the rendered inputs, then one assistant
+            # turn and one tool results turn per previous step
+            self.assertEqual(len(lm_messages), 2 + 2 * n)
+            self.assertEqual(
+                [m["role"] for m in lm_messages[2:]],
+                ["assistant", "user"] * n,
+            )
+            # The prefix is rendered identically at every step
+            self.assertEqual(lm_messages[:2], calls[0][:2])
+            cached = [
+                i for i, m in enumerate(lm_messages) if isinstance(m["content"], list)
+            ]
+            if n == 0:
+                self.assertEqual(cached, [0])
+            else:
+                # The breakpoint is on the assistant turn of the previous step
+                self.assertEqual(cached, [0, 2 * n])
+        for n, step in enumerate(steps[:-1]):
+            assistant_turn = calls[-1][2 + 2 * n]["content"]
+            if isinstance(assistant_turn, list):
+                assistant_turn = assistant_turn[0]["text"]
+            self.assertEqual(json.loads(assistant_turn), step)
+            self.assertIn("calculate", calls[-1][3 + 2 * n]["content"])
+
+        # The trajectory returned is the same as in the default mode
+        roles = [m["role"] for m in result.get("messages")]
+        self.assertEqual(
+            roles, ["user", "assistant", "tool", "assistant", "tool", "assistant"]
+        )
+
+    @patch("litellm.acompletion")
+    async def test_autonomous_mode_default_renders_single_input(self, mock_completion):
+        """Test that by default the trajectory is rendered in the input turn."""
+        language_model = LanguageModel(model="ollama/mistral")
+        tools = [
+            Tool(calculate),
+        ]
+        inputs = Input(data_model=ChatMessages)
+        outputs = await FunctionCallingAgent(
+            language_model=language_model,
+            tools=tools,
+            autonomous=True,
+            max_iterations=3,
+        )(inputs)
+        agent = Program(
+            inputs=inputs,
+            outputs=outputs,
+            name="single_input_test",
+        )
+
+        tool_calls = {
+            "thinking": "I add the two numbers.",
+            "tool_calls": [
+                {
+                    "tool_name": "calculate",
+                    "expression": "152648 + 485",
+                }
+            ],
+        }
+        tool_calls_1 = {
+            "thinking": "The result is 153133.",
+            "tool_calls": [],
+        }
+        mock_completion.side_effect = [
+            {"choices": [{"message": {"content": json.dumps(tool_calls)}}]},
+            {"choices": [{"message": {"content": json.dumps(tool_calls_1)}}]},
+        ]
+
+        input_messages = ChatMessages(
+            messages=[
+                ChatMessage(
+                    role="user",
+                    content="How much is 152648 + 485?",
+                ),
+            ]
+        )
+        await agent(input_messages)
+
+        for call in mock_completion.call_args_list:
+            self.assertEqual(
+                [m["role"] for m in call.kwargs["messages"]],
+                ["system", "user"],
+            )
+        second_input = mock_completion.call_args_list[1].kwargs["messages"][1]
+        self.assertIn("153133", second_input["content"])
+
     # async def test_interactive_mode_single_step(self):
     #     """Test interactive mode with single step execution."""
     #     language_model = LanguageModel(model="ollama/mistral")
@@ -110,6 +110,12 @@ class Action(Module):
             the prompt (Default to False) (see `Generator`).
         use_outputs_schema (bool): Optional. Whether or not use the outputs schema in
             the prompt (Default to False) (see `Generator`).
+        execution (str): Optional. Where the function is run, one of `"inline"`,
+            `"thread"` or `"process"` (Default to `"inline"`) (see `Tool`).
+        timeout (float): Optional. The maximum duration in seconds of the function
+            call (Default to None, no timeout) (see `Tool`).
+        max_concurrency (int): Optional. The maximum number of concurrent calls
+            of the function (Default to None, no limit) (see `Tool`).
         name (str): Optional. The name of the module.
         description (str): Optional. The description of the module.
         trainable (bool): Whether the module's variables should be trainable.
@@ -125,6 +131,9 @@ class Action(Module):
         instructions=None,
         use_inputs_schema=False,
         use_outputs_schema=False,
+        execution="inline",
+        timeout=None,
+        max_concurrency=None,
         name=None,
         description=None,
         trainable=True,
@@ -135,7 +144,16 @@ class Action(Module):
             trainable=trainable,
         )
         self.fn = fn
-        schema = tool_utils.Tool(fn).get_tool_schema()
+        self.execution = execution
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.tool = tool_utils.Tool(
+            fn,
+            execution=execution,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+        )
+        schema = self.tool.get_tool_schema()
         self.language_model = language_model
         self.prompt_template = prompt_template
         self.static_system_prompt = static_system_prompt
@@ -160,7 +178,7 @@ class Action(Module):
             return None
         fn_inputs = await self.action(inputs, training=training)
         try:
-            fn_outputs = await self.fn(**fn_inputs.get_json())
+            fn_outputs = await self.tool.run(**fn_inputs.get_json())
         except Exception as e:
             fn_outputs = {"error": str(e)}
         generic_io = GenericIO(inputs=fn_inputs.get_json(), outputs=fn_outputs)
@@ -181,6 +199,9 @@ class Action(Module):
             "static_system_prompt": self.static_system_prompt,
             "examples": self.examples,
             "instructions": self.instructions,
+            "execution": self.execution,
+            "timeout": self.timeout,
+            "max_concurrency": self.max_concurrency,
             "name": self.name,
             "description": self.description,
             "trainable": self.trainable,
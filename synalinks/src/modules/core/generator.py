@@ -1,10 +1,13 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import re
+from functools import lru_cache
 from typing import List
 from typing import Optional
 
 import jinja2
+from jinja2 import meta
+from jinja2 import nodes
 
 from synalinks.src import ops
 from synalinks.src.api_export import synalinks_export
@@ -17,6 +20,7 @@ from synalinks.src.backend import Prediction
 from synalinks.src.backend import SymbolicDataModel
 from synalinks.src.modules.module import Module
 from synalinks.src.saving import serialization_lib
+from synalinks.src.utils.prediction_buffer import add_prediction
 
 XML_TAGS_REGEX = re.compile(
     r"<("
@@ -25,6 +29,75 @@ XML_TAGS_REGEX = re.compile(
     re.MULTILINE,
 )
 
+SYSTEM_CLOSING_TAG = f"</{ChatRole.SYSTEM.value}>"
+
+PROMPT_TEMPLATES_CACHE_SIZE = 256
+
+_JINJA_ENVIRONMENT = jinja2.Environment()
+
+
+@lru_cache(maxsize=PROMPT_TEMPLATES_CACHE_SIZE)
+def compile_prompt_template(prompt_template):
+    """Compile a jinja2 prompt template.
+
+    The compiled templates are cached (with a bounded LRU cache) using the
+    template string as key, so a template rewritten by an optimizer is
+    simply compiled again on its first use.
+
+    The template is split after the system message when possible, so that the
+    static part of the prompt (system prompt, schemas, examples and
+    instructions) can be rendered once and reused. The split is only performed
+    if the static part compiles on its own, doesn't use the `inputs` and
+    doesn't declare any variable or macro.
+
+    Args:
+        prompt_template (str): The jinja2 prompt template.
+
+    Returns:
+        (tuple): A tuple `(static_template, template)`, where `static_template`
+            is the compiled static part of the prompt (or `None` if the template
+            cannot be split) and `template` the compiled rest of the prompt
+            (or the whole template if it cannot be split).
+    """
+    index = prompt_template.find(SYSTEM_CLOSING_TAG)
+    if index >= 0:
+        index += len(SYSTEM_CLOSING_TAG)
+        static_source = prompt_template[:index]
+        source = prompt_template[index:]
+        try:
+            static_ast = _JINJA_ENVIRONMENT.parse(static_source)
+            _JINJA_ENVIRONMENT.parse(source)
+        except jinja2.TemplateSyntaxError:
+            static_ast = None
+        if (
+            static_ast is not None
+            and "inputs" not in meta.find_undeclared_variables(static_ast)
+            and not any(static_ast.find_all((nodes.Assign, nodes.Macro)))
+        ):
+            return (
+                _JINJA_ENVIRONMENT.from_string(static_source),
+                _JINJA_ENVIRONMENT.from_string(source),
+            )
+    return None, _JINJA_ENVIRONMENT.from_string(prompt_template)
+
+
+def extract_messages(rendered_prompt):
+    """Extract the chat messages from a rendered prompt.
+
+    Args:
+        rendered_prompt (str): The rendered prompt with the messages
+            delimited by XML tags.
+
+    Returns:
+        (list): The list of non-empty `ChatMessage`.
+    """
+    messages = []
+    for role, content in XML_TAGS_REGEX.findall(rendered_prompt):
+        content = content.strip()
+        if content:
+            messages.append(ChatMessage(role=role, content=content))
+    return messages
+
 
 @synalinks_export("synalinks.default_prompt_template")
 def default_prompt_template():
@@ -106,6 +179,7 @@ class GeneratorState(DataModel):
     static_system_prompt: Optional[str] = None
     examples: List[Prediction] = []
     predictions: List[Prediction] = []
+    predictions_seen: int = 0
     instructions: Optional[Instructions] = None
     instructions_candidates: List[Instructions] = []
 
@@ -183,6 +257,10 @@ class Generator(Module):
             the outputs (Default to False).
         streaming (str): Optional. If true stream the LM response, enabled only if
             `schema` is `None` and only during inference (not during training).
+        max_predictions (int): Optional. The max number of predictions buffered
+            during training between two optimization steps. Beyond it, the
+            predictions are reservoir sampled to keep the memory bounded
+            (Default to 1000).
         name (str): Optional. The name of the module.
         description (str): Optional. The description of the module.
         trainable (bool): Whether the module's variables should be trainable.
@@ -201,6 +279,7 @@ class Generator(Module):
         use_outputs_schema=False,
         return_inputs=False,
         streaming=False,
+        max_predictions=1000,
         name=None,
         description=None,
         trainable=True,
@@ -231,6 +310,7 @@ class Generator(Module):
         if schema and streaming:
             streaming = False
         self.streaming = streaming
+        self.max_predictions = max_predictions
 
         predictions = [
             Prediction(
@@ -246,17 +326,21 @@ class Generator(Module):
                 prompt_template=prompt_template,
                 examples=predictions,
                 predictions=predictions,
+                predictions_seen=len(predictions),
                 instructions=Instructions(instructions=instructions),
             ).get_json(),
             data_model=GeneratorState,
             name=self.name + "_state",
         )
+        self._static_messages = None
 
-    async def call(self, inputs, training=False):
+    async def call(self, inputs, messages=None, training=False):
         if not inputs:
             return None
         msgs = ChatMessages()
-        msgs.messages = self.format_messages(inputs)
+        # The optional `messages` are extra turns (e.g. the previous steps of an
+        # agent) appended after the prompt, each one as its own chat message.
+        msgs.messages = self.format_messages(inputs) + list(messages or [])
         if self.streaming and not training:
             streaming = True
         else:
@@ -272,11 +356,13 @@ class Generator(Module):
             return result
         if result:
             if training:
-                self.state.get("predictions").append(
+                add_prediction(
+                    self.state,
                     Prediction(
                         inputs=inputs.get_json(),
                         outputs=result.get_json(),
-                    ).get_json()
+                    ).get_json(),
+                    max_predictions=self.max_predictions,
                 )
             if self.return_inputs:
                 return await ops.concat(
@@ -288,7 +374,7 @@ class Generator(Module):
                 return result
         return None
 
-    async def compute_output_spec(self, inputs, training=False):
+    async def compute_output_spec(self, inputs, messages=None, training=False):
         if self.schema:
             if self.return_inputs:
                 return await ops.concat(
@@ -321,26 +407,40 @@ class Generator(Module):
                 )
 
     def format_messages(self, inputs=None):
-        template = jinja2.Template(self.state.get("prompt_template"))
-        rendered_prompt = template.render(
-            static_system_prompt=self.static_system_prompt,
-            inputs_schema=inputs.get_schema() if self.use_inputs_schema else None,
-            outputs_schema=self.schema if self.use_outputs_schema else None,
-            examples=[
-                (pred.get("inputs"), pred.get("outputs"))
-                for pred in self.state.get("examples")
-            ],
-            instructions=self.state.get("instructions").get("instructions"),
-            inputs=inputs.get_json() if inputs else None,
+        prompt_template = self.state.get("prompt_template")
+        examples = self.state.get("examples")
+        instructions = self.state.get("instructions")
+        static_template, template = compile_prompt_template(prompt_template)
+        variables = {
+            "static_system_prompt": self.static_system_prompt,
+            "inputs_schema": inputs.get_schema() if self.use_inputs_schema else None,
+            "outputs_schema": self.schema if self.use_outputs_schema else None,
+            "examples": [(pred.get("inputs"), pred.get("outputs")) for pred in examples],
+            "instructions": instructions.get("instructions"),
+        }
+        inputs = inputs.get_json() if inputs else None
+        if static_template is None:
+            return extract_messages(template.render(inputs=inputs, **variables))
+        # The static messages are rendered again only if the fields of the state
+        # used by the prompt (e.g. the examples or instructions updated by an
+        # optimizer) or the schemas changed. The other fields (e.g. the
+        # predictions recorded during training) don't invalidate them.
+        key = (
+            self.state.get_version("prompt_template"),
+            self.state.get_version("examples"),
+            self.state.get_version("instructions"),
+            variables["static_system_prompt"],
+            variables["inputs_schema"],
+            variables["outputs_schema"],
+        )
+        if self._static_messages is None or self._static_messages[0] != key:
+            self._static_messages = (
+                key,
+                tuple(extract_messages(static_template.render(**variables))),
+            )
+        return list(self._static_messages[1]) + extract_messages(
+            template.render(inputs=inputs, **variables)
         )
-        matches = XML_TAGS_REGEX.findall(rendered_prompt)
-        extracted_tags = [(match[0], match[1].strip()) for match in matches]
-        messages = []
-        for message in extracted_tags:
-            role, content = message
-            if content:
-                messages.append(ChatMessage(role=role, content=content))
-        return messages
 
     def get_config(self):
         config = {
@@ -352,6 +452,7 @@ class Generator(Module):
             "use_inputs_schema": self.use_inputs_schema,
             "use_outputs_schema": self.use_outputs_schema,
             "return_inputs": self.return_inputs,
+            "max_predictions": self.max_predictions,
             "name": self.name,
             "description": self.description,
             "trainable": self.trainable,
@@ -9,6 +9,8 @@ from synalinks.src.backend import DataModel
 from synalinks.src.language_models import LanguageModel
 from synalinks.src.modules import Generator
 from synalinks.src.modules import Input
+from synalinks.src.modules.core.generator import chat_prompt_template
+from synalinks.src.modules.core.generator import compile_prompt_template
 from synalinks.src.programs import Program
 
 
@@ -109,6 +111,95 @@ class GeneratorModuleTest(testing.TestCase):
         )
         self.assertTrue(len(msgs) == 2)
 
+    def test_format_message_reuse_static_messages(self):
+        class Query(DataModel):
+            query: str
+
+        class Answer(DataModel):
+            answer: str
+
+        generator = Generator(
+            data_model=Answer,
+            language_model=LanguageModel(model="ollama/mistral"),
+            instructions=["You are an helpfull assistant"],
+            use_inputs_schema=True,
+            use_outputs_schema=True,
+        )
+        msgs = generator.format_messages(Query(query="What is the capital of France?"))
+        self.assertEqual(len(msgs), 2)
+        static_messages = generator._static_messages
+        msgs = generator.format_messages(Query(query="What is the capital of Italy?"))
+        self.assertIs(generator._static_messages, static_messages)
+        self.assertIn("Italy", msgs[1].content)
+
+        # Updating the variables (like an optimizer would) invalidates the cache
+        instructions = generator.state.get("instructions")
+        instructions["instructions"] = ["Answer in one word"]
+        generator.state.update({"instructions": instructions})
+        msgs = generator.format_messages(Query(query="What is the capital of Italy?"))
+        self.assertIsNot(generator._static_messages, static_messages)
+        self.assertIn("Answer in one word", msgs[0].content)
+
+        static_messages = generator._static_messages
+        state = generator.state.get_json()
+        state["instructions"] = {"instructions": ["Answer in French"]}
+        generator.state.assign(state)
+        msgs = generator.format_messages(Query(query="What is the capital of Italy?"))
+        self.assertIsNot(generator._static_messages, static_messages)
+        self.assertIn("Answer in French", msgs[0].content)
+
+        generator.state.update({"prompt_template": "<user>{{ inputs.query }}</user>"})
+        msgs = generator.format_messages(Query(query="What is the capital of Italy?"))
+        self.assertEqual(len(msgs), 1)
+        self.assertEqual(msgs[0].content, "What is the capital of Italy?")
+
+    @patch("litellm.acompletion")
+    async def test_training_calls_reuse_static_messages(self, mock_completion):
+        class Query(DataModel):
+            query: str
+
+        class Answer(DataModel):
+            answer: str
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps({"answer": "Paris"})}}]
+        }
+
+        generator = Generator(
+            data_model=Answer,
+            language_model=LanguageModel(model="ollama/mistral"),
+            instructions=["You are an helpfull assistant"],
+        )
+        await generator(Query(query="What is the capital of France?"), training=True)
+        static_messages = generator._static_messages
+        self.assertIsNotNone(static_messages)
+
+        # Recording the predictions doesn't re-render the static messages
+        await generator(Query(query="What is the capital of Italy?"), training=True)
+        self.assertEqual(len(generator.state.get("predictions")), 2)
+        self.assertIs(generator._static_messages, static_messages)
+
+    def test_compile_prompt_template(self):
+        template = "<system>{{ instructions }}</system><user>{{ inputs }}</user>"
+        static_template, _ = compile_prompt_template(template)
+        self.assertIsNotNone(static_template)
+        self.assertIs(compile_prompt_template(template)[1], _)
+
+        # The static part uses the inputs
+        static_template, _ = compile_prompt_template(
+            "<system>{{ inputs }}</system><user>{{ inputs }}</user>"
+        )
+        self.assertIsNone(static_template)
+
+        # The static part doesn't compile on its own
+        static_template, _ = compile_prompt_template(
+            "{% if x %}<system>{{ x }}</system>{% endif %}<user>{{ inputs }}</user>"
+        )
+        self.assertIsNone(static_template)
+
+        static_template, _ = compile_prompt_template(chat_prompt_template())
+        self.assertIsNotNone(static_template)
+
     @patch("litellm.acompletion")
     async def test_basic_functional_setup(self, mock_completion):
         class Query(DataModel):
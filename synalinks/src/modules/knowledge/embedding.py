@@ -289,8 +289,11 @@ class Embedding(Module):
                                     outputs_schema["$defs"][def_key] = def_value
 
             # Update output JSON
-            outputs_json = inputs.get_json()
-            outputs_json.update({"entities": entities_json, "relations": relations_json})
+            outputs_json = {
+                **inputs.get_json(),
+                "entities": entities_json,
+                "relations": relations_json,
+            }
             return JsonDataModel(
                 json=outputs_json,
                 schema=outputs_schema,
@@ -318,8 +321,7 @@ class Embedding(Module):
                                 ].update(embedded_schema["properties"])
 
             # Update output JSON with embedded entities
-            outputs_json = inputs.get_json()
-            outputs_json.update({"entities": entities_json})
+            outputs_json = {**inputs.get_json(), "entities": entities_json}
 
             return JsonDataModel(
                 json=outputs_json,
@@ -353,8 +355,7 @@ class Embedding(Module):
                                     outputs_schema["$defs"][def_key] = def_value
 
             # Update output JSON
-            outputs_json = inputs.get_json()
-            outputs_json.update({"relations": relations_json})
+            outputs_json = {**inputs.get_json(), "relations": relations_json}
 
             return JsonDataModel(
                 json=outputs_json,
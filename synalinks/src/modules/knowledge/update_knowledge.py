@@ -32,11 +32,20 @@ class UpdateKnowledge(Module):
     It however needs to have the entities embeded using the `Embedding` module before
     updating the knwoledge base.
 
+    When updating the knowledge base with many entities and relations at once
+    (e.g. `Entities`, `Relations` or `KnowledgeGraph` data models), use
+    `batched=True` to send them in a few bulk queries instead of one query
+    per entity or relation.
+
     Args:
         knowledge_base (KnowledgeBase): The knowledge base to update.
         threshold (float): Similarity threshold for entity alignment.
             Entities with similarity above this threshold may be merged.
             Should be between 0.0 and 1.0 (Defaults to 0.8).
+        batched (bool): Optional. Whether to update the knowledge base using
+            bulk queries (Defaults to False).
+        chunk_size (int): Optional. The maximum number of entities or relations
+            per bulk query when `batched` is True (Defaults to 500).
         name (str): Optional. The name of the module.
         description (str): Optional. The description of the module.
         trainable (bool): Whether the module's variables should be trainable.
@@ -46,6 +55,8 @@ class UpdateKnowledge(Module):
         self,
         knowledge_base=None,
         threshold=0.8,
+        batched=False,
+        chunk_size=500,
         name=None,
         description=None,
         trainable=False,
@@ -57,10 +68,54 @@ class UpdateKnowledge(Module):
         )
         self.knowledge_base = knowledge_base
         self.threshold = threshold
+        self.batched = batched
+        self.chunk_size = chunk_size
+
+    def _get_data_models(self, inputs):
+        entities = []
+        relations = []
+        if is_knowledge_graph(inputs):
+            entities = inputs.get_nested_entity_list("entities")
+            relations = inputs.get_nested_entity_list("relations")
+        elif is_entities(inputs):
+            entities = inputs.get_nested_entity_list("entities")
+        elif is_relations(inputs):
+            relations = inputs.get_nested_entity_list("relations")
+        elif is_relation(inputs):
+            entities = [
+                inputs.get_nested_entity("subj"),
+                inputs.get_nested_entity("obj"),
+            ]
+        elif is_entity(inputs):
+            entities = [inputs]
+        else:
+            return None
+        data_models = list(entities)
+        for relation in relations:
+            subj = relation.get_nested_entity("subj")
+            if not subj:
+                continue
+            data_models.append(subj)
+            obj = relation.get_nested_entity("obj")
+            if not obj:
+                continue
+            data_models.extend([obj, relation])
+        return data_models
 
     async def call(self, inputs):
         if not inputs:
             return None
+        if self.batched:
+            data_models = self._get_data_models(inputs)
+            if data_models is None:
+                return None
+            if data_models:
+                _ = await self.knowledge_base.update_batch(
+                    data_models,
+                    threshold=self.threshold,
+                    chunk_size=self.chunk_size,
+                )
+            return inputs.clone(name=inputs.name + "_updated")
         if is_knowledge_graph(inputs):
             for entity in inputs.get_nested_entity_list("entities"):
                 _ = await ops.update_knowledge(
@@ -164,6 +219,8 @@ class UpdateKnowledge(Module):
     def get_config(self):
         config = {
             "threshold": self.threshold,
+            "batched": self.batched,
+            "chunk_size": self.chunk_size,
             "name": self.name,
             "description": self.description,
             "trainable": self.trainable,
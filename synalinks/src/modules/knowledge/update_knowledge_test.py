@@ -3,6 +3,8 @@
 from typing import List
 from typing import Literal
 from typing import Union
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import numpy as np
@@ -240,3 +242,29 @@ class UpdateKnowledgeTest(testing.TestCase):
 
         result = await program(inputs)
         self.assertNotEqual(result, None)
+
+    async def test_update_knowledge_batched(self):
+        knowledge_base = MagicMock()
+        knowledge_base.update_batch = AsyncMock(return_value=["created", "created"])
+
+        doc1 = Document(label="Document", text="test document 1")
+        doc2 = Document(label="Document", text="test document 2")
+        relations = DocumentRelations(
+            relations=[IsPartOf(subj=doc1, label="IsPartOf", obj=doc2)],
+        )
+
+        module = UpdateKnowledge(
+            knowledge_base=knowledge_base,
+            batched=True,
+            chunk_size=100,
+        )
+        result = await module(relations.to_json_data_model())
+        self.assertEqual(result.get_json(), relations.get_json())
+
+        knowledge_base.update_batch.assert_awaited_once()
+        data_models = knowledge_base.update_batch.call_args.args[0]
+        self.assertEqual(
+            [data_model.get("label") for data_model in data_models],
+            ["Document", "Document", "IsPartOf"],
+        )
+        self.assertEqual(knowledge_base.update_batch.call_args.kwargs["chunk_size"], 100)
@@ -4,6 +4,7 @@
 
 import collections
 import inspect
+import itertools
 import uuid
 import warnings
 from functools import wraps
@@ -24,6 +25,17 @@ from synalinks.src.utils import tracking
 from synalinks.src.utils.async_utils import run_maybe_nested
 from synalinks.src.utils.naming import auto_name
 
+# The call ids are unique within a process thanks to the counter, and across
+# processes thanks to the prefix, without generating a UUID for each call.
+_CALL_ID_PREFIX = uuid.uuid4().hex[:12]
+_call_counter = itertools.count()
+
+
+def new_call_id():
+    """Returns a new unique id for a module call."""
+    return f"{_CALL_ID_PREFIX}-{next(_call_counter)}"
+
+
 if backend.backend() == "pydantic":
     from synalinks.src.backend.pydantic.module import PydanticModule as BackendModule
 else:
@@ -132,10 +144,9 @@ class Module(BackendModule, Operation, SynalinksSaveable):
         self._rewards_override = []
 
         self._call_signature = inspect.signature(self.call)
-        call_signature_parameters = [
-            p.name for p in self._call_signature.parameters.values()
-        ]
-        self._call_has_training_arg = "training" in call_signature_parameters
+        # Caches the binding of the arguments to the `call()` signature.
+        self._call_signature_binder = CallSignatureBinder(self._call_signature)
+        self._call_has_training_arg = "training" in self._call_signature.parameters
         # Whether to automatically convert inputs to `call()`.
         self._convert_input_args = True
         # Whether to allow non-json object as positional arguments in `call()`.
@@ -502,8 +513,10 @@ class Module(BackendModule, Operation, SynalinksSaveable):
         )
 
     async def __call__(self, *args, **kwargs):
-        call_id = str(uuid.uuid4())
+        # The hooks (and the call id) are skipped when none of them is enabled.
+        call_id = None
         if self._hooks:
+            call_id = new_call_id()
             self._hooks.on_call_begin(
                 call_id=call_id,
                 inputs=args,
@@ -530,7 +543,10 @@ class Module(BackendModule, Operation, SynalinksSaveable):
         ##########################################################
         # 2. Enforce that only JsonDataModels or SymbolicDataModel
         # can be passed positionally.
-        if not self._allow_non_json_data_model_positional_args:
+        # Used to avoid expensive `tree` operations in the most common case.
+        if not self._allow_non_json_data_model_positional_args and not (
+            len(args) == 1 and is_json_data_model_or_symbolic_data_model(args[0])
+        ):
             for arg in tree.flatten(args):
                 if not is_json_data_model_or_symbolic_data_model(arg) and arg is not None:
                     raise ValueError(
@@ -541,7 +557,7 @@ class Module(BackendModule, Operation, SynalinksSaveable):
                     )
 
         # Caches info about `call()` signature, args, kwargs.
-        call_spec = CallSpec(self._call_signature, args, kwargs)
+        call_spec = CallSpec(self._call_signature_binder, args, kwargs)
 
         ############################################
         # 3. Check input spec for 1st positional arg.
@@ -550,8 +566,9 @@ class Module(BackendModule, Operation, SynalinksSaveable):
 
         ################
         # 4. Call build
-        with self._open_name_scope():
-            await self._maybe_build(call_spec)
+        if not self.built:
+            with self._open_name_scope():
+                await self._maybe_build(call_spec)
 
         ##########################
         # 5. Infer training value
@@ -587,16 +604,17 @@ class Module(BackendModule, Operation, SynalinksSaveable):
             if not self.built:
                 self.built = True
         except Exception as e:
-            if self._hooks:
+            # Always report the exceptions, even if no hook is enabled.
+            if self._hooks.hooks:
                 self._hooks.on_call_end(
-                    call_id=call_id,
+                    call_id=call_id or new_call_id(),
                     exception=str(e),
                 )
             raise e
         finally:
             # Destroy call context if we created it
             self._maybe_reset_call_context()
-        if self._hooks:
+        if call_id is not None:
             self._hooks.on_call_end(
                 call_id=call_id,
                 outputs=outputs,
@@ -651,13 +669,12 @@ class Module(BackendModule, Operation, SynalinksSaveable):
         pass
 
     def _maybe_convert_inputs(self, inputs):
-        counter = {'i': 0}
+        counter = {"i": 0}
+
         def convert_fn(x):
             if backend.is_data_model(x):
-                result = x.to_json_data_model(
-                    name=f"{self.name}_inputs_{counter['i']}"
-                )
-                counter['i'] += 1
+                result = x.to_json_data_model(name=f"{self.name}_inputs_{counter['i']}")
+                counter["i"] += 1
                 return result
             return x
 
@@ -801,26 +818,107 @@ def is_json_data_model_or_symbolic_data_model(x, allow_none=False):
     return backend.is_json_data_model(x) or backend.is_symbolic_data_model(x)
 
 
+class CallSignatureBinder:
+    """Binds the arguments of a call to a `call()` signature.
+
+    The parameters of the signature are analyzed once, so the common calls
+    (without variadic parameters) are bound without `inspect.Signature.bind()`.
+    For the other calls, or when the arguments don't match the signature,
+    `inspect.Signature.bind()` is used (and raises the usual `TypeError`).
+
+    Args:
+        signature (inspect.Signature): The signature of the `call()` method.
+    """
+
+    def __init__(self, signature):
+        self.signature = signature
+        kinds = [p.kind for p in self.parameters.values()]
+        self.has_variadic = (
+            inspect.Parameter.VAR_POSITIONAL in kinds
+            or inspect.Parameter.VAR_KEYWORD in kinds
+        )
+        self.positional_names = [
+            p.name
+            for p in self.parameters.values()
+            if p.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+        ]
+        self.keyword_names = set(
+            p.name
+            for p in self.parameters.values()
+            if p.kind != inspect.Parameter.POSITIONAL_ONLY
+        )
+        self.defaults = {
+            p.name: p.default
+            for p in self.parameters.values()
+            if p.default is not inspect.Parameter.empty
+        }
+
+    @property
+    def parameters(self):
+        return self.signature.parameters
+
+    def bind(self, args, kwargs):
+        """Bind the arguments to the signature.
+
+        Args:
+            args (list | tuple): The positional arguments.
+            kwargs (dict): The keyword arguments.
+
+        Returns:
+            (tuple): The dict of the arguments passed by the user and the dict
+                of all the arguments (including the default values), both in
+                the order of the signature.
+        """
+        if self.has_variadic or len(args) > len(self.positional_names):
+            return self._slow_bind(args, kwargs)
+        passed = dict(zip(self.positional_names, args))
+        for name, value in kwargs.items():
+            if name in passed or name not in self.keyword_names:
+                return self._slow_bind(args, kwargs)
+            passed[name] = value
+        user_arguments = {}
+        arguments = {}
+        for name in self.parameters:
+            if name in passed:
+                user_arguments[name] = passed[name]
+                arguments[name] = passed[name]
+            elif name in self.defaults:
+                arguments[name] = self.defaults[name]
+            else:
+                # Missing argument
+                return self._slow_bind(args, kwargs)
+        return user_arguments, arguments
+
+    def _slow_bind(self, args, kwargs):
+        bound_args = self.signature.bind(*args, **kwargs)
+        user_arguments = dict(bound_args.arguments)
+        bound_args.apply_defaults()
+        return user_arguments, dict(bound_args.arguments)
+
+
 class CallSpec:
     def __init__(self, signature, args, kwargs):
+        if not isinstance(signature, CallSignatureBinder):
+            signature = CallSignatureBinder(signature)
         # `training` is a special kwargs that is always available in
         # a module, if user specifies them in their call without adding to spec,
         # we remove them to be able to bind variables. If User is not using
         # `training` anyway so we can ignore.
         if "training" in kwargs and "training" not in signature.parameters:
             kwargs.pop("training")
-            bound_args = signature.bind(*args, **kwargs)
-        else:
-            bound_args = signature.bind(*args, **kwargs)
-        self.user_arguments_dict = {k: v for k, v in bound_args.arguments.items()}
-        bound_args.apply_defaults()
+        user_arguments_dict, arguments_dict = signature.bind(args, kwargs)
+        self.user_arguments_dict = user_arguments_dict
         arg_dict = {}
         arg_names = []
         data_arg_dict = {}
         data_args = []
         data_arg_names = []
         nested_data_arg_names = []
-        for name, value in bound_args.arguments.items():
+        for name, value in arguments_dict.items():
             arg_dict[name] = value
             arg_names.append(name)
             if is_json_data_model_or_symbolic_data_model(value):
@@ -2,9 +2,14 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import inspect
+
 from synalinks.src import backend
 from synalinks.src import modules
 from synalinks.src import testing
+from synalinks.src.hooks.hook import Hook
+from synalinks.src.hooks.hook_list import HookList
+from synalinks.src.modules.module import CallSignatureBinder
 
 
 class ModuleTest(testing.TestCase):
@@ -93,3 +98,66 @@ class ModuleTest(testing.TestCase):
         self.assertEqual(
             out["2"].get_schema(), backend.standardize_schema(Query.get_schema())
         )
+
+    def test_call_signature_binder(self):
+        def call(inputs, other=None, *, training=False):
+            pass
+
+        signature = inspect.signature(call)
+        binder = CallSignatureBinder(signature)
+        for args, kwargs in [
+            ([1], {}),
+            ([1, 2], {}),
+            ([1], {"training": True}),
+            ([], {"inputs": 1, "other": 2}),
+        ]:
+            bound_args = signature.bind(*args, **kwargs)
+            user_arguments = dict(bound_args.arguments)
+            bound_args.apply_defaults()
+            self.assertEqual(
+                binder.bind(args, kwargs),
+                (user_arguments, dict(bound_args.arguments)),
+            )
+            self.assertEqual(
+                list(binder.bind(args, kwargs)[1].keys()),
+                ["inputs", "other", "training"],
+            )
+
+        # Invalid calls raise the same errors as `inspect.Signature.bind()`
+        for args, kwargs in [
+            ([], {}),
+            ([1, 2, 3], {}),
+            ([1], {"inputs": 1}),
+            ([1], {"unknown": 1}),
+        ]:
+            with self.assertRaises(TypeError):
+                binder.bind(args, kwargs)
+
+    async def test_hooks_only_called_when_enabled(self):
+        class Query(backend.DataModel):
+            query: str
+
+        class RecordingHook(Hook):
+            def __init__(self):
+                super().__init__()
+                self.call_ids = []
+
+            def on_call_begin(self, call_id, inputs=None):
+                self.call_ids.append(call_id)
+
+        class TestModule(modules.Module):
+            async def call(self, inputs, training=False):
+                return inputs
+
+        self.assertFalse(Hook().enabled)
+        hook = RecordingHook()
+        self.assertTrue(hook.enabled)
+
+        module = TestModule(hooks=[hook])
+        await module(Query(query="a"))
+        await module(Query(query="b"))
+        self.assertEqual(len(hook.call_ids), 2)
+        self.assertEqual(len(set(hook.call_ids)), 2)
+
+        self.assertFalse(HookList(hooks=[Hook()], add_logger=False))
+        self.assertTrue(HookList(hooks=[Hook(), hook], add_logger=False))
@@ -153,8 +153,8 @@ class ChainOfThought(Module):
             name=self.name + "_generator",
         )
 
-    async def call(self, inputs, training=False):
-        return await self.generator(inputs, training=training)
+    async def call(self, inputs, messages=None, training=False):
+        return await self.generator(inputs, messages=messages, training=training)
 
     def get_config(self):
         config = {
@@ -8,6 +8,13 @@ from synalinks.src.backend import SymbolicDataModel
 from synalinks.src.backend import any_symbolic_data_models
 from synalinks.src.ops.operation import Operation
 from synalinks.src.saving import serialization_lib
+from synalinks.src.utils.naming import auto_name
+
+
+async def _embedding(x, embedding_model=None, name=None, **kwargs):
+    texts = tree.flatten(tree.map_structure(lambda field: str(field), x.get_json()))
+    embeddings = await embedding_model(texts, **kwargs)
+    return JsonDataModel(data_model=Embeddings(**embeddings), name=name)
 
 
 class Embedding(Operation):
@@ -36,9 +43,12 @@ class Embedding(Operation):
         self.em_kwargs = kwargs
 
     async def call(self, x):
-        texts = tree.flatten(tree.map_structure(lambda field: str(field), x.get_json()))
-        embeddings = await self.embedding_model(texts, **self.em_kwargs)
-        return JsonDataModel(data_model=Embeddings(**embeddings), name=self.name)
+        return await _embedding(
+            x,
+            embedding_model=self.embedding_model,
+            name=self.name,
+            **self.em_kwargs,
+        )
 
     async def compute_output_spec(self, x):
         return SymbolicDataModel(schema=Embeddings.get_schema(), name=self.name)
@@ -91,9 +101,10 @@ async def embedding(x, embedding_model=None, name=None, description=None, **kwar
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await Embedding(
+    # Eager calls don't need to build an `Operation`
+    return await _embedding(
+        x,
         embedding_model=embedding_model,
-        name=name,
-        description=description,
+        name=name or auto_name("embedding"),
         **kwargs,
-    )(x)
+    )
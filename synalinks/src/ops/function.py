@@ -4,6 +4,7 @@
 
 import asyncio
 import collections
+import time
 
 from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
@@ -55,10 +56,26 @@ class Function(Operation):
             They should be computable given only the values of `inputs`.
         name (str): Optional. The name of the function operation.
         description (str): Optional. The description of the function operation.
+        max_concurrency (int): Optional. The maximum number of operations
+            running concurrently when executing the graph
+            (Default to None, unbounded).
     """
 
-    def __init__(self, inputs, outputs, name=None, description=None):
+    def __init__(
+        self,
+        inputs,
+        outputs,
+        name=None,
+        description=None,
+        max_concurrency=None,
+    ):
         super().__init__(name=name, description=description)
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "The `max_concurrency` argument should be at least 1, "
+                f"received: {max_concurrency}"
+            )
+        self.max_concurrency = max_concurrency
 
         self._inputs_struct = tree.map_structure(lambda x: x, inputs)
         self._outputs_struct = tree.map_structure(lambda x: x, outputs)
@@ -84,6 +101,8 @@ class Function(Operation):
         self._nodes_by_depth = nodes_by_depth
         self._operations = operations
         self._operations_by_depth = operations_by_depth
+        self._execution_plan = None
+        self._node_timings = {}
 
     @property
     def operations(self):
@@ -133,11 +152,73 @@ class Function(Operation):
     async def call(self, inputs):
         """Computes output data_models for new inputs."""
         self._assert_input_compatibility(inputs)
-        return await self._run_through_graph(inputs, operation_fn=lambda op: op)
+        return await self._run_through_graph(
+            inputs,
+            operation_fn=lambda op: op,
+            record_timings=True,
+        )
+
+    def get_node_timings(self):
+        """Returns the wall-clock time spent in each operation of the graph.
+
+        The timings are accumulated over all the calls since the creation
+        of the function (or the last call to `reset_node_timings()`).
+
+        Returns:
+            (dict): A dict mapping each operation name to its number of `calls`,
+                its `total_time`, `mean_time` and `max_time` in seconds.
+        """
+        timings = {}
+        for name, (calls, total_time, max_time) in self._node_timings.items():
+            timings[name] = {
+                "calls": calls,
+                "total_time": total_time,
+                "mean_time": total_time / calls,
+                "max_time": max_time,
+            }
+        return timings
+
+    def reset_node_timings(self):
+        """Reset the timings returned by `get_node_timings()`."""
+        self._node_timings = {}
+
+    def _record_node_timing(self, name, duration):
+        calls, total_time, max_time = self._node_timings.get(name, (0, 0.0, 0.0))
+        self._node_timings[name] = (
+            calls + 1,
+            total_time + duration,
+            max(max_time, duration),
+        )
 
-    async def _run_through_graph(self, inputs, operation_fn, call_fn=None):
+    def _get_execution_plan(self):
+        """Returns the nodes to execute and the consumers of each data model."""
+        if self._execution_plan is None:
+            depth_keys = sorted(self._nodes_by_depth.keys(), reverse=True)
+            nodes = []
+            consumers = collections.defaultdict(list)
+            for depth in depth_keys:
+                for node in self._nodes_by_depth[depth]:
+                    if not node.operation or node.is_input:
+                        continue  # Input data_models already exist.
+                    dependencies = {id(x) for x in node.input_data_models}
+                    nodes.append((node, dependencies))
+                    for dependency in dependencies:
+                        consumers[dependency].append(node)
+            self._execution_plan = (nodes, dict(consumers))
+        return self._execution_plan
+
+    async def _run_through_graph(
+        self,
+        inputs,
+        operation_fn,
+        call_fn=None,
+        record_timings=False,
+    ):
         """Execute the graph.
 
+        Each node is scheduled as soon as all its input data models are
+        computed, so that a slow node only delays the nodes depending on it.
+
         At each node we compute outputs via
         `operation_fn(node.operation)(*args, **kwargs)`.
         """
@@ -148,44 +229,59 @@ class Function(Operation):
         for x, y in zip(self.inputs, inputs):
             data_model_dict[id(x)] = y
 
-        nodes_by_depth = self._nodes_by_depth
-        depth_keys = list(nodes_by_depth.keys())
-        depth_keys.sort(reverse=True)
+        nodes, consumers = self._get_execution_plan()
 
-        async def compute_node(node, operation_fn, call_fn):
+        async def compute_node(node):
             args, kwargs = node.arguments.fill_in(data_model_dict)
             op = operation_fn(node.operation)
+            start = time.perf_counter()
             if call_fn is not None:
                 outputs = await call_fn(op, *args, **kwargs)
             else:
                 outputs = await op(*args, **kwargs)
+            if record_timings:
+                self._record_node_timing(
+                    node.operation.name,
+                    time.perf_counter() - start,
+                )
             return outputs
 
-        for depth in depth_keys:
-            nodes = nodes_by_depth[depth]
-            tasks = []
-
-            for node in nodes:
-                if not node.operation or node.is_input:
-                    continue  # Input data_models already exist.
-
-                if any(id(x) not in data_model_dict for x in node.input_data_models):
-                    continue  # Node is not computable, try skipping.
-
-                tasks.append(compute_node(node, operation_fn, call_fn))
+        # Number of input data models not yet computed for each node.
+        missing = {}
+        ready = collections.deque()
+        for node, dependencies in nodes:
+            missing[node] = len([x for x in dependencies if x not in data_model_dict])
+            if not missing[node]:
+                ready.append(node)
 
-            results = await asyncio.gather(*tasks)
-
-            for i, node in enumerate(nodes):
-                if not node.operation or node.is_input:
-                    continue  # Input data_models already exist.
-
-                if any(id(x) not in data_model_dict for x in node.input_data_models):
-                    continue  # Node is not computable, try skipping.
-
-                # Update data_model_dict.
-                for x, y in zip(node.outputs, tree.flatten(results[i])):
-                    data_model_dict[id(x)] = y
+        # Nodes whose inputs are never computed are skipped.
+        running = {}
+        try:
+            while ready or running:
+                while ready and (
+                    self.max_concurrency is None or len(running) < self.max_concurrency
+                ):
+                    node = ready.popleft()
+                    running[asyncio.ensure_future(compute_node(node))] = node
+                done, _ = await asyncio.wait(
+                    running.keys(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    node = running.pop(task)
+                    outputs = task.result()
+                    # Update data_model_dict.
+                    for x, y in zip(node.outputs, tree.flatten(outputs)):
+                        data_model_dict[id(x)] = y
+                        for consumer in consumers.get(id(x), []):
+                            missing[consumer] -= 1
+                            if not missing[consumer]:
+                                ready.append(consumer)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
 
         output_data_models = []
         for x in self.outputs:
@@ -2,12 +2,31 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+
 from synalinks.src import testing
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import JsonDataModel
 from synalinks.src.backend import SymbolicDataModel
 from synalinks.src.ops import function
 from synalinks.src.ops.json import concat
+from synalinks.src.ops.operation import Operation
+
+
+class Delay(Operation):
+    def __init__(self, delay=0.0, events=None, name=None):
+        super().__init__(name=name)
+        self.delay = delay
+        self.events = events
+
+    async def call(self, x):
+        self.events.append(("start", self.name))
+        await asyncio.sleep(self.delay)
+        self.events.append(("end", self.name))
+        return JsonDataModel(json=x.get_json(), schema=x.get_schema(), name=self.name)
+
+    async def compute_output_spec(self, x):
+        return SymbolicDataModel(schema=x.get_schema(), name=self.name)
 
 
 class FunctionTest(testing.TestCase):
@@ -123,3 +142,52 @@ class FunctionTest(testing.TestCase):
         x = SymbolicDataModel(data_model=Query)
         with self.assertRaisesRegex(ValueError, "`inputs` argument cannot be empty"):
             _ = function.Function(inputs=[], outputs=x)
+
+    async def test_nodes_run_as_soon_as_inputs_are_ready(self):
+        class Query(DataModel):
+            query: str
+
+        events = []
+        x0 = SymbolicDataModel(data_model=Query)
+        slow = await Delay(delay=0.2, events=events, name="slow")(x0)
+        slow_out = await Delay(events=events, name="slow_out")(slow)
+        fast = await Delay(events=events, name="fast")(x0)
+        fast_mid = await Delay(events=events, name="fast_mid")(fast)
+        fast_out = await Delay(events=events, name="fast_out")(fast_mid)
+        fn = function.Function(inputs=x0, outputs=[slow_out, fast_out])
+
+        outputs = await fn(JsonDataModel(data_model=Query(query="test")))
+        self.assertEqual(len(outputs), 2)
+        # The fast branch doesn't wait for the slow node of the same depth
+        self.assertLess(events.index(("end", "fast_out")), events.index(("end", "slow")))
+
+        timings = fn.get_node_timings()
+        self.assertEqual(
+            set(timings.keys()),
+            {"slow", "slow_out", "fast", "fast_mid", "fast_out"},
+        )
+        self.assertEqual(timings["slow"]["calls"], 1)
+        self.assertGreaterEqual(timings["slow"]["total_time"], 0.2)
+        fn.reset_node_timings()
+        self.assertEqual(fn.get_node_timings(), {})
+
+    async def test_max_concurrency(self):
+        class Query(DataModel):
+            query: str
+
+        events = []
+        x0 = SymbolicDataModel(data_model=Query)
+        outputs = [
+            await Delay(delay=0.01, events=events, name=f"branch_{i}")(x0)
+            for i in range(4)
+        ]
+        fn = function.Function(inputs=x0, outputs=outputs, max_concurrency=1)
+
+        _ = await fn(JsonDataModel(data_model=Query(query="test")))
+        # The nodes are executed one at a time
+        for i in range(0, len(events), 2):
+            self.assertEqual(events[i][0], "start")
+            self.assertEqual(events[i + 1], ("end", events[i][1]))
+
+        with self.assertRaisesRegex(ValueError, "max_concurrency"):
+            function.Function(inputs=x0, outputs=outputs, max_concurrency=0)
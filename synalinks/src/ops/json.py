@@ -17,6 +17,17 @@ from synalinks.src.backend import prefix_schema
 from synalinks.src.backend import suffix_json
 from synalinks.src.backend import suffix_schema
 from synalinks.src.ops.operation import Operation
+from synalinks.src.utils.naming import auto_name
+
+
+def _concat(x1, x2, name=None):
+    if not x1:
+        raise ValueError(f"Received x1={x1} and x2={x2}")
+    if not x2:
+        raise ValueError(f"Received x1={x1} and x2={x2}")
+    json = concatenate_json(x1.get_json(), x2.get_json())
+    schema = concatenate_schema(x1.get_schema(), x2.get_schema())
+    return JsonDataModel(json=json, schema=schema, name=name)
 
 
 class Concat(Operation):
@@ -33,13 +44,7 @@ class Concat(Operation):
         )
 
     async def call(self, x1, x2):
-        if not x1:
-            raise ValueError(f"Received x1={x1} and x2={x2}")
-        if not x2:
-            raise ValueError(f"Received x1={x1} and x2={x2}")
-        json = concatenate_json(x1.get_json(), x2.get_json())
-        schema = concatenate_schema(x1.get_schema(), x2.get_schema())
-        return JsonDataModel(json=json, schema=schema, name=self.name)
+        return _concat(x1, x2, name=self.name)
 
     async def compute_output_spec(self, x1, x2):
         schema = concatenate_schema(x1.get_schema(), x2.get_schema())
@@ -94,10 +99,16 @@ async def concat(x1, x2, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x1, x2)
-    return await Concat(
-        name=name,
-        description=description,
-    )(x1, x2)
+    # Eager calls don't need to build an `Operation`
+    return _concat(x1, x2, name=name or auto_name("concat"))
+
+
+def _logical_and(x1, x2, name=None):
+    if x1 and x2:
+        json = concatenate_json(x1.get_json(), x2.get_json())
+        schema = concatenate_schema(x1.get_schema(), x2.get_schema())
+        return JsonDataModel(json=json, schema=schema, name=name)
+    return None
 
 
 class And(Operation):
@@ -114,16 +125,7 @@ class And(Operation):
         )
 
     async def call(self, x1, x2):
-        if x1 and x2:
-            json = concatenate_json(x1.get_json(), x2.get_json())
-            schema = concatenate_schema(x1.get_schema(), x2.get_schema())
-            return JsonDataModel(json=json, schema=schema, name=self.name)
-        elif x1 and not x2:
-            return None
-        elif not x1 and x2:
-            return None
-        else:
-            return None
+        return _logical_and(x1, x2, name=self.name)
 
     async def compute_output_spec(self, x1, x2):
         schema = concatenate_schema(x1.get_schema(), x2.get_schema())
@@ -167,10 +169,20 @@ async def logical_and(x1, x2, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x1, x2)
-    return await And(
-        name=name,
-        description=description,
-    )(x1, x2)
+    return _logical_and(x1, x2, name=name or auto_name("and"))
+
+
+def _logical_or(x1, x2, name=None):
+    if x1 and x2:
+        json = concatenate_json(x1.get_json(), x2.get_json())
+        schema = concatenate_schema(x1.get_schema(), x2.get_schema())
+        return JsonDataModel(json=json, schema=schema, name=name)
+    elif x1 and not x2:
+        return JsonDataModel(json=x1.get_json(), schema=x1.get_schema(), name=name)
+    elif not x1 and x2:
+        return JsonDataModel(json=x2.get_json(), schema=x2.get_schema(), name=name)
+    else:
+        return None
 
 
 class Or(Operation):
@@ -187,20 +199,7 @@ class Or(Operation):
         )
 
     async def call(self, x1, x2):
-        if x1 and x2:
-            json = concatenate_json(x1.get_json(), x2.get_json())
-            schema = concatenate_schema(x1.get_schema(), x2.get_schema())
-            return JsonDataModel(json=json, schema=schema, name=self.name)
-        elif x1 and not x2:
-            return JsonDataModel(
-                json=x1.get_json(), schema=x1.get_schema(), name=self.name
-            )
-        elif not x1 and x2:
-            return JsonDataModel(
-                json=x2.get_json(), schema=x2.get_schema(), name=self.name
-            )
-        else:
-            return None
+        return _logical_or(x1, x2, name=self.name)
 
     async def compute_output_spec(self, x1, x2):
         return SymbolicDataModel(schema=x1.get_schema(), name=self.name)
@@ -243,10 +242,16 @@ async def logical_or(x1, x2, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x1, x2)
-    return await Or(
-        name=name,
-        description=description,
-    )(x1, x2)
+    return _logical_or(x1, x2, name=name or auto_name("or"))
+
+
+def _logical_xor(x1, x2, name=None):
+    if x1 and not x2:
+        return JsonDataModel(json=x1.get_json(), schema=x1.get_schema(), name=name)
+    elif not x1 and x2:
+        return JsonDataModel(json=x2.get_json(), schema=x2.get_schema(), name=name)
+    else:
+        return None
 
 
 class Xor(Operation):
@@ -263,18 +268,7 @@ class Xor(Operation):
         )
 
     async def call(self, x1, x2):
-        if x1 and x2:
-            return None
-        elif x1 and not x2:
-            return JsonDataModel(
-                json=x1.get_json(), schema=x1.get_schema(), name=self.name
-            )
-        elif not x1 and x2:
-            return JsonDataModel(
-                json=x2.get_json(), schema=x2.get_schema(), name=self.name
-            )
-        else:
-            return None
+        return _logical_xor(x1, x2, name=self.name)
 
     async def compute_output_spec(self, x1, x2):
         return SymbolicDataModel(schema=x1.get_schema(), name=self.name)
@@ -316,10 +310,15 @@ async def logical_xor(x1, x2, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x1, x2)
-    return await Xor(
-        name=name,
-        description=description,
-    )(x1, x2)
+    return _logical_xor(x1, x2, name=name or auto_name("xor"))
+
+
+def _factorize(x, name=None):
+    if not x:
+        return None
+    json = factorize_json(x.get_json())
+    schema = factorize_schema(x.get_schema())
+    return JsonDataModel(json=json, schema=schema, name=name)
 
 
 class Factorize(Operation):
@@ -336,11 +335,7 @@ class Factorize(Operation):
         )
 
     async def call(self, x):
-        if not x:
-            return None
-        json = factorize_json(x.get_json())
-        schema = factorize_schema(x.get_schema())
-        return JsonDataModel(json=json, schema=schema, name=self.name)
+        return _factorize(x, name=self.name)
 
     async def compute_output_spec(self, x):
         schema = factorize_schema(x.get_schema())
@@ -373,10 +368,15 @@ async def factorize(x, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await Factorize(
-        name=name,
-        description=description,
-    )(x)
+    return _factorize(x, name=name or auto_name("factorize"))
+
+
+def _out_mask(x, mask=None, recursive=True, name=None):
+    if not x:
+        return None
+    json = out_mask_json(x.get_json(), mask=mask, recursive=recursive)
+    schema = out_mask_schema(x.get_schema(), mask=mask, recursive=recursive)
+    return JsonDataModel(json=json, schema=schema, name=name)
 
 
 class OutMask(Operation):
@@ -397,11 +397,7 @@ class OutMask(Operation):
         self.recursive = recursive
 
     async def call(self, x):
-        if not x:
-            return None
-        json = out_mask_json(x.get_json(), mask=self.mask, recursive=self.recursive)
-        schema = out_mask_schema(x.get_schema(), mask=self.mask, recursive=self.recursive)
-        return JsonDataModel(json=json, schema=schema, name=self.name)
+        return _out_mask(x, mask=self.mask, recursive=self.recursive, name=self.name)
 
     async def compute_output_spec(self, x):
         schema = out_mask_schema(x.get_schema(), mask=self.mask, recursive=self.recursive)
@@ -439,12 +435,20 @@ async def out_mask(x, mask=None, recursive=True, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await OutMask(
+    return _out_mask(
+        x,
         mask=mask,
         recursive=recursive,
-        name=name,
-        description=description,
-    )(x)
+        name=name or auto_name("out_mask"),
+    )
+
+
+def _in_mask(x, mask=None, recursive=True, name=None):
+    if not x:
+        return None
+    json = in_mask_json(x.get_json(), mask=mask, recursive=recursive)
+    schema = in_mask_schema(x.get_schema(), mask=mask, recursive=recursive)
+    return JsonDataModel(json=json, schema=schema, name=name)
 
 
 class InMask(Operation):
@@ -465,11 +469,7 @@ class InMask(Operation):
         self.recursive = recursive
 
     async def call(self, x):
-        if not x:
-            return None
-        json = in_mask_json(x.get_json(), mask=self.mask, recursive=self.recursive)
-        schema = in_mask_schema(x.get_schema(), mask=self.mask, recursive=self.recursive)
-        return JsonDataModel(json=json, schema=schema, name=self.name)
+        return _in_mask(x, mask=self.mask, recursive=self.recursive, name=self.name)
 
     async def compute_output_spec(self, x):
         schema = in_mask_schema(x.get_schema(), mask=self.mask, recursive=self.recursive)
@@ -507,12 +507,20 @@ async def in_mask(x, mask=None, recursive=True, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await InMask(
+    return _in_mask(
+        x,
         mask=mask,
         recursive=recursive,
-        name=name,
-        description=description,
-    )(x)
+        name=name or auto_name("in_mask"),
+    )
+
+
+def _prefix(x, prefix, name=None):
+    if not x:
+        return None
+    json = prefix_json(x.get_json(), prefix)
+    schema = prefix_schema(x.get_schema(), prefix)
+    return JsonDataModel(json=json, schema=schema, name=name)
 
 
 class Prefix(Operation):
@@ -531,11 +539,7 @@ class Prefix(Operation):
         self.prefix = prefix
 
     async def call(self, x):
-        if not x:
-            return None
-        json = prefix_json(x.get_json(), self.prefix)
-        schema = prefix_schema(x.get_schema(), self.prefix)
-        return JsonDataModel(json=json, schema=schema, name=self.name)
+        return _prefix(x, self.prefix, name=self.name)
 
     async def compute_output_spec(self, x):
         schema = prefix_schema(x.get_schema(), self.prefix)
@@ -566,11 +570,15 @@ async def prefix(x, prefix=None, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await Prefix(
-        prefix=prefix,
-        name=name,
-        description=description,
-    )(x)
+    return _prefix(x, prefix, name=name or auto_name("prefix"))
+
+
+def _suffix(x, suffix, name=None):
+    if not x:
+        return None
+    json = suffix_json(x.get_json(), suffix)
+    schema = suffix_schema(x.get_schema(), suffix)
+    return JsonDataModel(json=json, schema=schema, name=name)
 
 
 class Suffix(Operation):
@@ -589,11 +597,7 @@ class Suffix(Operation):
         self.suffix = suffix
 
     async def call(self, x):
-        if not x:
-            return None
-        json = suffix_json(x.get_json(), self.suffix)
-        schema = suffix_schema(x.get_schema(), self.suffix)
-        return JsonDataModel(json=json, schema=schema, name=self.name)
+        return _suffix(x, self.suffix, name=self.name)
 
     async def compute_output_spec(self, x):
         schema = suffix_schema(x.get_schema(), self.suffix)
@@ -624,8 +628,4 @@ async def suffix(x, suffix=None, name=None, description=None):
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await Suffix(
-        suffix=suffix,
-        name=name,
-        description=description,
-    )(x)
+    return _suffix(x, suffix, name=name or auto_name("suffix"))
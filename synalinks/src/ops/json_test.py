@@ -1,9 +1,11 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 from typing import List
+from unittest.mock import patch
 
 from synalinks.src import testing
 from synalinks.src.backend import DataModel
+from synalinks.src.backend import JsonDataModel
 from synalinks.src.backend import SymbolicDataModel
 from synalinks.src.backend import is_schema_equal
 from synalinks.src.backend import standardize_schema
@@ -95,6 +97,22 @@ class ConcatenateTest(testing.TestCase):
         result = await concat(x, y)
         self.assertTrue(is_schema_equal(result.get_schema(), expected.get_schema()))
 
+    async def test_concat_eager_doesnt_build_operation(self):
+        class Test1(DataModel):
+            foo: str
+
+        class Test2(DataModel):
+            bar: str
+
+        with patch("synalinks.src.ops.json.Concat") as mock_concat:
+            result = await concat(Test1(foo="a"), Test2(bar="b"))
+            mock_concat.assert_not_called()
+        self.assertEqual(result.get_json(), {"foo": "a", "bar": "b"})
+        self.assertTrue(result.name.startswith("concat"))
+
+        result = await concat(Test1(foo="a"), Test2(bar="b"), name="my_concat")
+        self.assertEqual(result.name, "my_concat")
+
     async def test_concat_serialization(self):
         class Test1(DataModel):
             foo: str
@@ -160,6 +178,17 @@ class FactorizeTest(testing.TestCase):
         result = await factorize(x)
         self.assertTrue(is_schema_equal(result.get_schema(), expected.get_schema()))
 
+    async def test_factorize_doesnt_modify_inputs(self):
+        class Test(DataModel):
+            answers: List[str]
+            answer: str
+            answer_1: str
+
+        x = JsonDataModel(data_model=Test(answers=["a"], answer="b", answer_1="c"))
+        result = await factorize(x)
+        self.assertEqual(result.get_json(), {"answers": ["a", "b", "c"]})
+        self.assertEqual(x.get_json()["answers"], ["a"])
+
     async def test_factorize_serialization(self):
         class Test(DataModel):
             foos: List[str]
@@ -7,6 +7,45 @@ from synalinks.src.backend import SymbolicDataModel
 from synalinks.src.backend import any_symbolic_data_models
 from synalinks.src.ops.operation import Operation
 from synalinks.src.saving import serialization_lib
+from synalinks.src.utils.naming import auto_name
+
+
+async def _update_knowledge(x, knowledge_base=None, threshold=0.8, name=None):
+    await knowledge_base.update(
+        x,
+        threshold=threshold,
+    )
+    return JsonDataModel(
+        json=x.get_json(),
+        schema=x.get_schema(),
+        name=name,
+    )
+
+
+async def _triplet_search(x, knowledge_base=None, k=10, threshold=0.7, name=None):
+    result = await knowledge_base.triplet_search(
+        x,
+        k=k,
+        threshold=threshold,
+    )
+    return JsonDataModel(
+        json={"result": result},
+        schema=GenericResult.get_schema(),
+        name=name,
+    )
+
+
+async def _similarity_search(x, knowledge_base=None, k=10, threshold=0.7, name=None):
+    result = await knowledge_base.similarity_search(
+        x,
+        k=k,
+        threshold=threshold,
+    )
+    return JsonDataModel(
+        json={"result": result},
+        schema=GenericResult.get_schema(),
+        name=name,
+    )
 
 
 class UpdateKnowledge(Operation):
@@ -26,13 +65,10 @@ class UpdateKnowledge(Operation):
         self.threshold = 0.8
 
     async def call(self, x):
-        await self.knowledge_base.update(
+        return await _update_knowledge(
             x,
+            knowledge_base=self.knowledge_base,
             threshold=self.threshold,
-        )
-        return JsonDataModel(
-            json=x.get_json(),
-            schema=x.get_schema(),
             name=self.name,
         )
 
@@ -102,11 +138,13 @@ async def update_knowledge(
             threshold=threshold,
             description=description,
         ).symbolic_call(x)
-    return await UpdateKnowledge(
+    # Eager calls don't need to build an `Operation`
+    return await _update_knowledge(
+        x,
         knowledge_base=knowledge_base,
-        name=name,
-        description=description,
-    )(x)
+        threshold=threshold,
+        name=name or auto_name("update_knowledge"),
+    )
 
 
 class TripletSearch(Operation):
@@ -128,14 +166,11 @@ class TripletSearch(Operation):
         self.threshold = threshold
 
     async def call(self, x):
-        result = await self.knowledge_base.triplet_search(
+        return await _triplet_search(
             x,
+            knowledge_base=self.knowledge_base,
             k=self.k,
             threshold=self.threshold,
-        )
-        return JsonDataModel(
-            json={"result": result},
-            schema=GenericResult.get_schema(),
             name=self.name,
         )
 
@@ -201,13 +236,14 @@ async def triplet_search(
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await TripletSearch(
+    # Eager calls don't need to build an `Operation`
+    return await _triplet_search(
+        x,
         knowledge_base=knowledge_base,
         k=k,
         threshold=threshold,
-        name=name,
-        description=description,
-    )(x)
+        name=name or auto_name("triplet_search"),
+    )
 
 
 class SimilaritySearch(Operation):
@@ -228,14 +264,11 @@ class SimilaritySearch(Operation):
         self.threshold = threshold
 
     async def call(self, x):
-        result = await self.knowledge_base.similarity_search(
+        return await _similarity_search(
             x,
+            knowledge_base=self.knowledge_base,
             k=self.k,
             threshold=self.threshold,
-        )
-        return JsonDataModel(
-            json={"result": result},
-            schema=GenericResult.get_schema(),
             name=self.name,
         )
 
@@ -309,10 +342,11 @@ async def similarity_search(
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await SimilaritySearch(
+    # Eager calls don't need to build an `Operation`
+    return await _similarity_search(
+        x,
         knowledge_base=knowledge_base,
         k=k,
         threshold=threshold,
-        name=name,
-        description=description,
-    )(x)
+        name=name or auto_name("similarity_search"),
+    )
@@ -8,6 +8,31 @@ from synalinks.src.backend import any_symbolic_data_models
 from synalinks.src.language_models.language_model import StreamingIterator
 from synalinks.src.ops.operation import Operation
 from synalinks.src.saving import serialization_lib
+from synalinks.src.utils.naming import auto_name
+
+
+async def _predict(
+    x,
+    schema=None,
+    language_model=None,
+    streaming=False,
+    name=None,
+    **kwargs,
+):
+    value = await language_model(
+        x,
+        schema=schema,
+        streaming=streaming,
+        **kwargs,
+    )
+    if isinstance(value, StreamingIterator):
+        return value
+    if not value:
+        return None
+    if schema:
+        return JsonDataModel(json=value, schema=schema, name=name)
+    else:
+        return JsonDataModel(json=value, schema=ChatMessage.get_schema(), name=name)
 
 
 class Predict(Operation):
@@ -38,22 +63,14 @@ class Predict(Operation):
         self.lm_kwargs = kwargs
 
     async def call(self, x):
-        value = await self.language_model(
+        return await _predict(
             x,
             schema=self.schema,
+            language_model=self.language_model,
             streaming=self.streaming,
+            name=self.name,
             **self.lm_kwargs,
         )
-        if isinstance(value, StreamingIterator):
-            return value
-        if not value:
-            return None
-        if self.schema:
-            return JsonDataModel(json=value, schema=self.schema, name=self.name)
-        else:
-            return JsonDataModel(
-                json=value, schema=ChatMessage.get_schema(), name=self.name
-            )
 
     async def compute_output_spec(self, x):
         if self.schema:
@@ -123,12 +140,14 @@ async def predict(
             name=name,
             description=description,
         ).symbolic_call(x)
-    return await Predict(
+    # Eager calls don't need to build an `Operation`
+    if not schema and data_model:
+        schema = data_model.get_schema()
+    return await _predict(
+        x,
         schema=schema,
-        data_model=data_model,
         language_model=language_model,
-        streaming=streaming,
-        name=name,
-        description=description,
+        streaming=False if schema else streaming,
+        name=name or auto_name("predict"),
         **kwargs,
-    )(x)
+    )
@@ -15,6 +15,32 @@ from synalinks.src.ops.node import Node
 from synalinks.src.utils import python_utils
 from synalinks.src.utils.naming import auto_name
 
+# The introspection results are cached, as operations are created at each call
+_init_arg_names = {}
+_default_descriptions = {}
+
+# For safety, we only rely on auto-configs for a small set of
+# serializable types.
+_AUTO_CONFIG_SUPPORTED_TYPES = (str, int, float, bool, type(None))
+
+
+def _get_init_arg_names(init):
+    arg_names = _init_arg_names.get(init)
+    if arg_names is None:
+        arg_names = inspect.getfullargspec(init).args
+        _init_arg_names[init] = arg_names
+    return arg_names
+
+
+def _get_default_description(cls):
+    if cls not in _default_descriptions:
+        if cls.__doc__:
+            description = docstring_parser.parse(cls.__doc__).short_description
+        else:
+            description = ""
+        _default_descriptions[cls] = description
+    return _default_descriptions[cls]
+
 
 @synalinks_export("synalinks.Operation")
 class Operation:
@@ -22,12 +48,7 @@ class Operation:
         if name is None:
             name = auto_name(self.__class__.__name__)
         if description is None:
-            if self.__class__.__doc__:
-                description = docstring_parser.parse(
-                    self.__class__.__doc__
-                ).short_description
-            else:
-                description = ""
+            description = _get_default_description(self.__class__)
         if not isinstance(name, str) or "/" in name:
             raise ValueError(
                 "Argument `name` must be a string and "
@@ -87,21 +108,27 @@ class Operation:
         instance = super(Operation, cls).__new__(cls)
 
         # Generate a config to be returned by default by `get_config()`.
-        arg_names = inspect.getfullargspec(cls.__init__).args
-        kwargs.update(dict(zip(arg_names[1 : len(args) + 1], args)))
-
-        # For safety, we only rely on auto-configs for a small set of
-        # serializable types.
-        supported_types = (str, int, float, bool, type(None))
-        try:
-            flat_arg_values = tree.flatten(kwargs)
-            auto_config = True
-            for value in flat_arg_values:
-                if not isinstance(value, supported_types):
-                    auto_config = False
-                    break
-        except TypeError:
-            auto_config = False
+        if args:
+            arg_names = _get_init_arg_names(cls.__init__)
+            kwargs.update(dict(zip(arg_names[1 : len(args) + 1], args)))
+
+        supported_types = _AUTO_CONFIG_SUPPORTED_TYPES
+        # Most arguments are scalars, so the structure is only flattened if needed
+        auto_config = True
+        for value in kwargs.values():
+            if not isinstance(value, supported_types):
+                auto_config = False
+                break
+        if not auto_config:
+            try:
+                flat_arg_values = tree.flatten(kwargs)
+                auto_config = True
+                for value in flat_arg_values:
+                    if not isinstance(value, supported_types):
+                        auto_config = False
+                        break
+            except TypeError:
+                auto_config = False
         try:
             instance._lock = False
             if auto_config:
@@ -14,6 +14,9 @@ from synalinks.src.optimizers.opro import OPROInputs
 from synalinks.src.optimizers.optimizer import Optimizer
 from synalinks.src.programs import Program
 from synalinks.src.saving import serialization_lib
+from synalinks.src.utils.prediction_buffer import clear_predictions
+from synalinks.src.utils.prediction_buffer import get_best_predictions
+from synalinks.src.utils.prediction_buffer import reward_predictions
 
 
 class FewShotOPROOptimizedVariables(DataModel):
@@ -61,6 +64,8 @@ class FewShotOPRO(Optimizer):
         program (Program): The program to use. Optional. If None create one at start.
         name (str): The name of the optimizer.
         description (str): The description of the optimizer.
+        max_concurrency (int): Optional. The maximum number of variables
+            optimized at the same time (Default to None, no limit).
     """
 
     def __init__(
@@ -71,10 +76,12 @@ class FewShotOPRO(Optimizer):
         program=None,
         name=None,
         description=None,
+        max_concurrency=None,
     ):
         super().__init__(
             name=name,
             description=description,
+            max_concurrency=max_concurrency,
             data_model=FewShotOPROOptimizedVariables,
         )
         self.language_model = language_model
@@ -114,16 +121,7 @@ class FewShotOPRO(Optimizer):
     async def optimize(self, trainable_variable, reward=None, training=False):
         """Perform a backprop/optimization on a single variable."""
         # Reward backpropagation
-        predictions = trainable_variable.get("predictions")
-        backpropagated_predictions = []
-        backprop_pred_nb = 0
-        for p in predictions:
-            if p["reward"] is None:
-                p["reward"] = reward
-                backprop_pred_nb += 1
-            backpropagated_predictions.append(p)
-        if backprop_pred_nb > 0:
-            trainable_variable.update({"predictions": backpropagated_predictions})
+        if reward_predictions(trainable_variable, reward, max_predictions=self.k_best):
             # Backpropagate instructions reward
             instructions_candidates = trainable_variable.get("instructions_candidates")
             instructions = trainable_variable.get("instructions")
@@ -132,13 +130,8 @@ class FewShotOPRO(Optimizer):
             trainable_variable.update(
                 {"instructions_candidates": instructions_candidates}
             )
-            # Get the k best predictions (sorted by reward)
-            sorted_predictions = sorted(
-                backpropagated_predictions,
-                key=lambda x: x["reward"] if x["reward"] is not None else float("-inf"),
-                reverse=True,
-            )
-            top_k_predictions = sorted_predictions[: self.k_best]
+            # Get the k best predictions (kept sorted by reward)
+            top_k_predictions = get_best_predictions(trainable_variable, self.k_best)
             if len(top_k_predictions) > self.k:
                 selected_predictions = random.sample(top_k_predictions, self.k)
             else:
@@ -170,7 +163,8 @@ class FewShotOPRO(Optimizer):
 
     async def finalize(self, trainable_variable):
         """Finalize the optimization of a single variable (cleanup/scaling etc.)."""
-        trainable_variable.update({"predictions": [], "instructions_candidates": []})
+        clear_predictions(trainable_variable)
+        trainable_variable.update({"instructions_candidates": []})
 
     def get_config(self):
         config = {
@@ -178,6 +172,7 @@ class FewShotOPRO(Optimizer):
             "k_best": self.k_best,
             "name": self.name,
             "description": self.description,
+            "max_concurrency": self.max_concurrency,
         }
         language_model_config = {
             "language_model": serialization_lib.serialize_synalinks_object(
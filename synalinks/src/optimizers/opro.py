@@ -12,6 +12,8 @@ from synalinks.src.modules.core.input_module import Input
 from synalinks.src.optimizers.optimizer import Optimizer
 from synalinks.src.programs import Program
 from synalinks.src.saving import serialization_lib
+from synalinks.src.utils.prediction_buffer import get_best_predictions
+from synalinks.src.utils.prediction_buffer import reward_predictions
 
 
 class OPROOptimizedVariable(DataModel):
@@ -62,6 +64,8 @@ class OPRO(Optimizer):
             If None create one (non-trained) at start.
         name (str): The name of the optimizer.
         description (str): The description of the optimizer.
+        max_concurrency (int): Optional. The maximum number of variables
+            optimized at the same time (Default to None, no limit).
     """
 
     def __init__(
@@ -71,10 +75,12 @@ class OPRO(Optimizer):
         program=None,
         name=None,
         description=None,
+        max_concurrency=None,
     ):
         super().__init__(
             name=name,
             description=description,
+            max_concurrency=max_concurrency,
             data_model=OPROOptimizedVariable,
         )
         self.language_model = language_model
@@ -113,16 +119,7 @@ class OPRO(Optimizer):
     async def optimize(self, trainable_variable, reward=None, training=False):
         """Perform a backprop/optimization on a single variable."""
         # Backpropagate predictions reward
-        predictions = trainable_variable.get("predictions")
-        backpropagated_predictions = []
-        backprop_pred_nb = 0
-        for p in predictions:
-            if p["reward"] is None:
-                p["reward"] = reward
-                backprop_pred_nb += 1
-            backpropagated_predictions.append(p)
-        if backprop_pred_nb > 0:
-            trainable_variable.update({"predictions": backpropagated_predictions})
+        if reward_predictions(trainable_variable, reward, max_predictions=self.k_best):
             # Backpropagate instructions reward
             instructions_candidates = trainable_variable.get("instructions_candidates")
             instructions = trainable_variable.get("instructions")
@@ -131,13 +128,8 @@ class OPRO(Optimizer):
             trainable_variable.update(
                 {"instructions_candidates": instructions_candidates}
             )
-            # Get the k best predictions (sorted by reward)
-            sorted_predictions = sorted(
-                backpropagated_predictions,
-                key=lambda x: x["reward"] if x["reward"] is not None else float("-inf"),
-                reverse=True,
-            )
-            top_k_predictions = sorted_predictions[: self.k_best]
+            # Get the k best predictions (kept sorted by reward)
+            top_k_predictions = get_best_predictions(trainable_variable, self.k_best)
             # Get the k best instructions candidates (sorted by reward)
             sorted_instructions_candidates = sorted(
                 instructions_candidates,
@@ -167,6 +159,7 @@ class OPRO(Optimizer):
             "k_best": self.k_best,
             "name": self.name,
             "description": self.description,
+            "max_concurrency": self.max_concurrency,
         }
         language_model_config = {
             "language_model": serialization_lib.serialize_synalinks_object(
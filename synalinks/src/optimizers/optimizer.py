@@ -2,6 +2,7 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import warnings
 
 import docstring_parser
@@ -32,6 +33,8 @@ class Optimizer(SynalinksSaveable):
             if no schema is specified, uses the data model to infer it.
         name (str): The name of the optimizer.
         description (str): The description of the optimizer.
+        max_concurrency (int): Optional. The maximum number of variables
+            optimized at the same time (Default to None, no limit).
     """
 
     def __init__(
@@ -40,6 +43,7 @@ class Optimizer(SynalinksSaveable):
         data_model=None,
         name=None,
         description=None,
+        max_concurrency=None,
         **kwargs,
     ):
         self._lock = False
@@ -47,6 +51,13 @@ class Optimizer(SynalinksSaveable):
         if kwargs:
             raise ValueError(f"Argument(s) not recognized: {kwargs}")
 
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "The `max_concurrency` argument should be at least 1, "
+                f"received: {max_concurrency}"
+            )
+        self.max_concurrency = max_concurrency
+
         if name is None:
             name = auto_name(self.__class__.__name__)
         self.name = name
@@ -176,20 +187,39 @@ class Optimizer(SynalinksSaveable):
     async def apply_optimization(self, trainable_variables, reward=None, training=False):
         """Apply the backprop/optimization for each trainable variables
         that match the optimizer schema.
+
+        The variables are independent, so they are optimized concurrently
+        (at most `max_concurrency` at the same time).
         """
         if not self.built:
             run_maybe_nested(self.build(trainable_variables))
         iteration = self._iteration.get("iteration")
         self._iteration.update({"iteration": iteration + 1})
-        for variable in trainable_variables:
-            if contains_schema(variable.get_schema(), self.get_schema()):
-                await self.optimize(variable, reward=reward, training=training)
+        await self._run_concurrently(
+            lambda variable: self.optimize(variable, reward=reward, training=training),
+            trainable_variables,
+        )
 
     async def finalize_variable_values(self, trainable_variables):
         """Finalize the optimization of the variables (cleanup/scaling etc.)."""
-        for variable in trainable_variables:
-            if contains_schema(variable.get_schema(), self.get_schema()):
-                await self.finalize(variable)
+        await self._run_concurrently(self.finalize, trainable_variables)
+
+    async def _run_concurrently(self, fn, trainable_variables):
+        variables = [
+            variable
+            for variable in trainable_variables
+            if contains_schema(variable.get_schema(), self.get_schema())
+        ]
+        if self.max_concurrency is None:
+            await asyncio.gather(*[fn(variable) for variable in variables])
+            return
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(variable):
+            async with semaphore:
+                await fn(variable)
+
+        await asyncio.gather(*[run(variable) for variable in variables])
 
     async def optimize(self, trainable_variable, reward=None, training=False):
         """Perform a backprop/optimization on a single variable.
@@ -214,6 +244,7 @@ class Optimizer(SynalinksSaveable):
             "name": self.name,
             "description": self.description,
             "schema": self.schema,
+            "max_concurrency": self.max_concurrency,
         }
 
     @classmethod
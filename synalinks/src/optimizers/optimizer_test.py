@@ -0,0 +1,65 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+
+from synalinks.src import testing
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.modules import Generator
+from synalinks.src.modules import Input
+from synalinks.src.optimizers import RandomFewShot
+from synalinks.src.programs import Program
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+
+
+class ConcurrencyTracker(RandomFewShot):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.running = 0
+        self.max_running = 0
+        self.optimized = []
+
+    async def optimize(self, trainable_variable, reward=None, training=False):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.optimized.append(trainable_variable.path)
+        self.running -= 1
+
+
+async def program_with_generators(n):
+    language_model = LanguageModel(model="ollama/mistral")
+    inputs = Input(data_model=Query)
+    outputs = [
+        await Generator(
+            language_model=language_model,
+            data_model=AnswerWithRationale,
+        )(inputs)
+        for _ in range(n)
+    ]
+    return Program(inputs=inputs, outputs=outputs)
+
+
+class OptimizerTest(testing.TestCase):
+    async def test_concurrent_optimization(self):
+        program = await program_with_generators(4)
+
+        optimizer = ConcurrencyTracker()
+        await optimizer.apply_optimization(program.trainable_variables, reward=1.0)
+        self.assertEqual(len(optimizer.optimized), 4)
+        self.assertEqual(optimizer.max_running, 4)
+        self.assertEqual(optimizer.iterations.get("iteration"), 1)
+
+        optimizer = ConcurrencyTracker(max_concurrency=2)
+        await optimizer.apply_optimization(program.trainable_variables, reward=1.0)
+        self.assertEqual(len(optimizer.optimized), 4)
+        self.assertEqual(optimizer.max_running, 2)
+
+    def test_max_concurrency(self):
+        optimizer = RandomFewShot(max_concurrency=2)
+        self.assertEqual(optimizer.get_config()["max_concurrency"], 2)
+        optimizer = RandomFewShot.from_config(optimizer.get_config())
+        self.assertEqual(optimizer.max_concurrency, 2)
+
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            RandomFewShot(max_concurrency=0)
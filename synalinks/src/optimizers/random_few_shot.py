@@ -7,6 +7,9 @@ from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import Prediction
 from synalinks.src.optimizers.optimizer import Optimizer
+from synalinks.src.utils.prediction_buffer import clear_predictions
+from synalinks.src.utils.prediction_buffer import get_best_predictions
+from synalinks.src.utils.prediction_buffer import reward_predictions
 
 
 class FewShotOptimizedVariable(DataModel):
@@ -45,6 +48,10 @@ class RandomFewShot(Optimizer):
     Args:
         k (int): The number of examples to select (default 3) among the best predictions.
         k_best (int): The max number of best predictions to select from (default 10).
+        name (str): The name of the optimizer.
+        description (str): The description of the optimizer.
+        max_concurrency (int): Optional. The maximum number of variables
+            optimized at the same time (Default to None, no limit).
     """
 
     def __init__(
@@ -53,10 +60,12 @@ class RandomFewShot(Optimizer):
         k_best=10,
         name=None,
         description=None,
+        max_concurrency=None,
     ):
         super().__init__(
             name=name,
             description=description,
+            max_concurrency=max_concurrency,
             data_model=FewShotOptimizedVariable,
         )
         self.k = k
@@ -68,23 +77,9 @@ class RandomFewShot(Optimizer):
     async def optimize(self, trainable_variable, reward=None, training=False):
         """Perform a backprop/optimization on a single variable."""
         # Reward backpropagation
-        predictions = trainable_variable.get("predictions")
-        backpropagated_predictions = []
-        backprop_pred_nb = 0
-        for p in predictions:
-            if p["reward"] is None:
-                p["reward"] = reward
-                backprop_pred_nb += 1
-            backpropagated_predictions.append(p)
-        if backprop_pred_nb > 0:
-            trainable_variable.update({"predictions": backpropagated_predictions})
-            # Get the k best predictions (sorted by reward)
-            sorted_predictions = sorted(
-                backpropagated_predictions,
-                key=lambda x: x["reward"] if x["reward"] is not None else float("-inf"),
-                reverse=True,
-            )
-            top_k_predictions = sorted_predictions[: self.k_best]
+        if reward_predictions(trainable_variable, reward, max_predictions=self.k_best):
+            # Get the k best predictions (kept sorted by reward)
+            top_k_predictions = get_best_predictions(trainable_variable, self.k_best)
             if len(top_k_predictions) > self.k:
                 selected_predictions = random.sample(top_k_predictions, self.k)
             else:
@@ -93,7 +88,7 @@ class RandomFewShot(Optimizer):
 
     async def finalize(self, trainable_variable):
         """Finalize the optimization of a single variable (cleanup/scaling etc.)."""
-        trainable_variable.update({"predictions": []})
+        clear_predictions(trainable_variable)
 
     def get_config(self):
         return {
@@ -101,4 +96,5 @@ class RandomFewShot(Optimizer):
             "k_best": self.k_best,
             "name": self.name,
             "description": self.description,
+            "max_concurrency": self.max_concurrency,
         }
@@ -55,6 +55,7 @@ class Functional(Function, Program):
                     )
 
         trainable = kwargs.pop("trainable", None)
+        max_concurrency = kwargs.pop("max_concurrency", None)
         flat_inputs = tree.flatten(inputs)
         flat_outputs = tree.flatten(outputs)
         for x in flat_inputs:
@@ -75,7 +76,14 @@ class Functional(Function, Program):
         if not all(is_input_symbolic_data_model(t) for t in flat_inputs):
             inputs, outputs = clone_graph_nodes(inputs, outputs)
 
-        Function.__init__(self, inputs, outputs, name=name, description=description)
+        Function.__init__(
+            self,
+            inputs,
+            outputs,
+            name=name,
+            description=description,
+            max_concurrency=max_concurrency,
+        )
 
         if trainable is not None:
             self.trainable = trainable
@@ -115,7 +123,9 @@ class Functional(Function, Program):
         # Add support for training
         inputs = self._standardize_inputs(inputs)
         outputs = await self._run_through_graph(
-            inputs, operation_fn=lambda op: operation_fn(op, training=training)
+            inputs,
+            operation_fn=lambda op: operation_fn(op, training=training),
+            record_timings=True,
         )
         return unpack_singleton(outputs)
 
@@ -228,6 +238,8 @@ class Functional(Function, Program):
             "name": self.name,
             "trainable": self.trainable,
         }
+        if self.max_concurrency is not None:
+            config["max_concurrency"] = self.max_concurrency
         # Build a map from a module unique name (make_node_key)
         # to the index of the nodes that are saved in the config.
         # Only nodes in network_nodes are saved.
@@ -71,6 +71,12 @@ class Program(Trainer, Module):
     Note: Only dicts, lists, and tuples of input data models are supported. Nested
     inputs are not supported (e.g. lists of list or dicts of dict).
 
+    Each module of a functional program is executed as soon as its inputs are
+    available, so independent branches run concurrently. You can limit the
+    number of modules running at the same time using the `max_concurrency`
+    argument, and inspect the time spent in each module using
+    `program.get_node_timings()`.
+
     ## By subclassing the `Program` class
 
     In that case, you should define your
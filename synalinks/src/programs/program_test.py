@@ -52,6 +52,7 @@ class ProgramTest(testing.TestCase):
                             instructions=[],
                         ).get_json(),
                         "predictions": [],
+                        "predictions_seen": 0,
                         "instructions_candidates": [],
                     }
                 }
@@ -132,6 +133,7 @@ class ProgramTest(testing.TestCase):
                             instructions=[],
                         ).get_json(),
                         "predictions": [],
+                        "predictions_seen": 0,
                         "instructions_candidates": [],
                     }
                 }
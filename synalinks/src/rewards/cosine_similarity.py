@@ -3,6 +3,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 from synalinks.src import ops
+from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common import numpy as np
 from synalinks.src.rewards.reward import Reward
@@ -32,8 +33,6 @@ async def cosine_similarity(y_true, y_pred, embedding_model=None, axis=-1):
             cosine similarity.
         axis (int): (Optional) Defaults to `-1`. The dimension along which the cosine
             similarity is computed.
-        caching (bool): (Optional) Defaults to `False`. Whether to cache the
-            embeddings of `y_true` not to waste computation on ground truth.
 
     Returns:
         (float): The reward value, which tend to 1.0 if the values are similar,
@@ -72,6 +71,9 @@ class CosineSimilarity(RewardFunctionWrapper):
     but scaled to [0.0, 1.0] and adjusted to have a reward that tend
     towards 1.0 if the two objects are similar (and 0.0 otherwise).
 
+    To avoid re-embedding the ground truth at each epoch, give an `EmbeddingCache`
+    to the embedding model (see `synalinks.caches.EmbeddingCache`).
+
     Example:
 
     ```python
@@ -110,6 +112,34 @@ class CosineSimilarity(RewardFunctionWrapper):
             embedding_model=embedding_model,
         )
 
+    async def call_batch(self, y_true, y_pred):
+        """Compute the cosine similarity of a batch using a single embedding request.
+
+        The fields of all the samples are embedded together and the similarities
+        computed on the stacked vectors.
+        """
+        embedding_model = self._fn_kwargs.get("embedding_model")
+        axis = self._fn_kwargs.get("axis", -1)
+        texts = [
+            [str(field) for field in tree.flatten(x.get_json())]
+            for x in list(y_true) + list(y_pred)
+        ]
+        y_true_texts, y_pred_texts = texts[: len(y_true)], texts[len(y_true) :]
+        if axis != -1 or any(
+            len(t) != len(p) or not t for t, p in zip(y_true_texts, y_pred_texts)
+        ):
+            return await super().call_batch(y_true, y_pred)
+        embeddings = await embedding_model(tree.flatten(texts))
+        vectors = np.normalize(np.convert_to_tensor(embeddings["embeddings"]), axis=-1)
+        size = sum(len(t) for t in y_true_texts)
+        similarities = (np.sum(vectors[:size] * vectors[size:], axis=-1) + 1) / 2
+        rewards = []
+        start = 0
+        for t in y_true_texts:
+            rewards.append(similarities[start : start + len(t)])
+            start += len(t)
+        return rewards
+
     def get_config(self):
         config = Reward.get_config()
         from synalinks.src.saving.serialization_lib import serialize_synalinks_object
@@ -43,3 +43,25 @@ class CosineSimilarityTest(testing.TestCase):
         cosine_similarity = CosineSimilarity(embedding_model=embedding_model)
         reward = await cosine_similarity(y_true, y_pred)
         self.assertEqual(reward, 1.0)
+
+    @patch("litellm.aembedding")
+    async def test_compute_batch(self, mock_embedding):
+        embedding_model = EmbeddingModel(model="ollama/all-minilm")
+        vectors = {"Paris": [1.0, 0.0], "Toulouse": [0.0, 1.0]}
+
+        def embed(model=None, input=None, **kwargs):
+            return {"data": [{"embedding": vectors[text]} for text in input]}
+
+        mock_embedding.side_effect = embed
+
+        class Answer(DataModel):
+            answer: str
+
+        y_true = [Answer(answer="Paris"), Answer(answer="Paris")]
+        y_pred = [Answer(answer="Paris"), Answer(answer="Toulouse")]
+
+        cosine_similarity = CosineSimilarity(embedding_model=embedding_model)
+        rewards = await cosine_similarity.compute_batch(y_true, y_pred)
+        self.assertEqual(rewards, [1.0, 0.5])
+        # The whole batch is embedded with a single request
+        self.assertEqual(mock_embedding.call_count, 1)
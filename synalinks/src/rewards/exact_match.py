@@ -63,6 +63,12 @@ class ExactMatch(RewardFunctionWrapper):
             out_mask=out_mask,
         )
 
+    async def call_batch(self, y_true, y_pred):
+        return [
+            1.0 if y_p.get_json() == y_t.get_json() else 0.0
+            for y_t, y_p in zip(y_true, y_pred)
+        ]
+
     def get_config(self):
         return {
             "name": self.name,
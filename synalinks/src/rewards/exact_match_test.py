@@ -49,3 +49,21 @@ class ExactMatchTest(testing.TestCase):
         exact_match = ExactMatch(out_mask=["text"])
         reward = await exact_match(y_true, y_pred)
         self.assertEqual(reward, 1.0)
+
+    async def test_compute_batch(self):
+        class Answer(DataModel):
+            answer: str
+
+        class AnswerWithText(DataModel):
+            text: str
+            answer: str
+
+        y_true = [Answer(answer="Paris"), Answer(answer="Paris"), Answer(answer="Paris")]
+        y_pred = [
+            AnswerWithText(text="The french capital is Paris", answer="Paris"),
+            AnswerWithText(text="The french capital is Toulouse", answer="Toulouse"),
+            None,
+        ]
+        exact_match = ExactMatch(in_mask=["answer"])
+        rewards = await exact_match.compute_batch(y_true, y_pred)
+        self.assertEqual(rewards, [1.0, 0.0, 0.0])
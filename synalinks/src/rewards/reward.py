@@ -2,11 +2,13 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+
 from synalinks.src import ops
 from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
-from synalinks.src.backend.common import numpy as np
 from synalinks.src.backend import is_data_model
+from synalinks.src.backend.common import numpy as np
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
 from synalinks.src.utils.naming import auto_name
 
@@ -24,6 +26,9 @@ class Reward(SynalinksSaveable):
 
     * `call()`: Contains the logic for eval calculation using `y_true`,
         `y_pred`.
+
+    Optionally, subclasses can implement `call_batch()` to score a whole
+    batch of samples at once.
     """
 
     def __init__(
@@ -40,51 +45,7 @@ class Reward(SynalinksSaveable):
 
     async def __call__(self, y_true, y_pred):
         with ops.name_scope(self.name):
-            counter = {"y_pred": 0, "y_true": 0}
-            
-            def convert_y_pred(x):
-                if is_data_model(x):
-                    result = x.to_json_data_model(
-                        name=f"{self.name}_y_pred_{counter['y_pred']}"
-                    )
-                    counter["y_pred"] += 1
-                    return result
-                return x
-            
-            def convert_y_true(x):
-                if is_data_model(x):
-                    result = x.to_json_data_model(
-                        name=f"{self.name}_y_pred_{counter['y_true']}"
-                    )
-                    counter["y_true"] += 1
-                    return result
-                return x
-
-            if y_pred:
-                y_pred = tree.map_structure(
-                    lambda x: convert_y_pred(x), y_pred
-                )
-            if y_true:
-                y_true = tree.map_structure(
-                    lambda x: convert_y_true(x), y_true
-                )
-
-            if self.in_mask and y_pred:
-                y_pred = tree.map_structure(
-                    lambda x: x.in_mask(mask=self.in_mask), y_pred
-                )
-            if self.in_mask and y_true:
-                y_true = tree.map_structure(
-                    lambda x: x.in_mask(mask=self.in_mask), y_true
-                )
-            if self.out_mask and y_pred:
-                y_pred = tree.map_structure(
-                    lambda x: x.out_mask(mask=self.out_mask), y_pred
-                )
-            if self.out_mask and y_true:
-                y_true = tree.map_structure(
-                    lambda x: x.out_mask(mask=self.out_mask), y_true
-                )
+            y_true, y_pred = self._standardize(y_true, y_pred)
             if y_pred:
                 rewards = await self.call(y_true, y_pred)
                 return reduce_values(
@@ -94,9 +55,88 @@ class Reward(SynalinksSaveable):
             else:
                 return 0.0
 
+    async def compute_batch(self, y_true, y_pred):
+        """Compute the rewards of a batch of samples.
+
+        The samples are scored together using `call_batch()`, allowing the rewards
+        to run their computations concurrently or to vectorize them.
+
+        Args:
+            y_true (list): The ground truth data models of the batch.
+            y_pred (list): The predicted data models of the batch.
+
+        Returns:
+            (list): The reward of each sample.
+        """
+        with ops.name_scope(self.name):
+            samples = [self._standardize(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+            indices = [i for i, (_, y_p) in enumerate(samples) if y_p]
+            rewards = [0.0] * len(samples)
+            if indices:
+                values = await self.call_batch(
+                    [samples[i][0] for i in indices],
+                    [samples[i][1] for i in indices],
+                )
+                for i, value in zip(indices, values):
+                    rewards[i] = reduce_values(value, reduction=self.reduction)
+            return rewards
+
+    def _standardize(self, y_true, y_pred):
+        counter = {"y_pred": 0, "y_true": 0}
+
+        def convert_y_pred(x):
+            if is_data_model(x):
+                result = x.to_json_data_model(
+                    name=f"{self.name}_y_pred_{counter['y_pred']}"
+                )
+                counter["y_pred"] += 1
+                return result
+            return x
+
+        def convert_y_true(x):
+            if is_data_model(x):
+                result = x.to_json_data_model(
+                    name=f"{self.name}_y_pred_{counter['y_true']}"
+                )
+                counter["y_true"] += 1
+                return result
+            return x
+
+        if y_pred:
+            y_pred = tree.map_structure(lambda x: convert_y_pred(x), y_pred)
+        if y_true:
+            y_true = tree.map_structure(lambda x: convert_y_true(x), y_true)
+
+        if self.in_mask and y_pred:
+            y_pred = tree.map_structure(lambda x: x.in_mask(mask=self.in_mask), y_pred)
+        if self.in_mask and y_true:
+            y_true = tree.map_structure(lambda x: x.in_mask(mask=self.in_mask), y_true)
+        if self.out_mask and y_pred:
+            y_pred = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_pred)
+        if self.out_mask and y_true:
+            y_true = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_true)
+        return y_true, y_pred
+
     async def call(self, y_true, y_pred):
         raise NotImplementedError
 
+    async def call_batch(self, y_true, y_pred):
+        """Compute the rewards of a batch of samples.
+
+        By default, `call()` runs concurrently for each sample. Subclasses can
+        override this method to score the whole batch at once.
+
+        Args:
+            y_true (list): The ground truth JSON data models.
+            y_pred (list): The predicted JSON data models.
+
+        Returns:
+            (list): The reward of each sample.
+        """
+        return await asyncio.gather(
+            *[self.call(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+        )
+
     def get_config(self):
         return {
             "name": self.name,
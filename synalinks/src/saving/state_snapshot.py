@@ -0,0 +1,217 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.utils import file_utils
+
+SNAPSHOT_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+OBJECTS_DIRNAME = "objects"
+
+
+def _get_variables_collections(program):
+    collections = {
+        "trainable_variables": program.trainable_variables,
+        "non_trainable_variables": program.non_trainable_variables,
+        "metrics_variables": program.metrics_variables,
+    }
+    if getattr(program, "optimizer", None):
+        collections["optimizer_variables"] = program.optimizer.variables
+    return collections
+
+
+def _hash_variables(variables, collection):
+    """Serialize and hash the variables of a collection.
+
+    Returns:
+        (dict): The mapping of the variable paths to `(hash, payload, variable)`.
+    """
+    hashes = {}
+    for variable in variables:
+        if variable.path in hashes:
+            raise ValueError(
+                f"The following variable path is found twice in the {collection} "
+                f"of the program: '{variable.path}'. A snapshot can only be taken "
+                "when all variable paths are unique. Make sure to give unique "
+                "names to your modules (and other objects)."
+            )
+        payload = json.dumps(
+            variable.get_json(), sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        hashes[variable.path] = (digest, payload, variable)
+    return hashes
+
+
+def _get_manifest_objects(manifest):
+    return set(
+        digest for hashes in manifest["variables"].values() for digest in hashes.values()
+    )
+
+
+def _write_atomically(filepath, data):
+    tmp_filepath = f"{filepath}.tmp"
+    with open(tmp_filepath, "wb") as f:
+        f.write(data)
+    os.replace(tmp_filepath, filepath)
+
+
+@synalinks_export("synalinks.saving.StateSnapshot")
+class StateSnapshot:
+    """Incremental and content-hashed snapshots of the variables of a program.
+
+    A snapshot is a directory containing a manifest, that maps the path of
+    each variable to the hash of its JSON, and one object file per distinct
+    variable content. Saving a snapshot only writes the variables that changed
+    since the last save (the others already have their object file), and
+    restoring a snapshot only reads and assigns the variables whose content
+    differs from the current one.
+
+    The variables are serialized when `save()` is called, so the snapshot
+    reflects the state of the program at that time, but with `blocking=False`
+    the files are written by a background thread, so the training loop
+    doesn't wait for the I/O.
+
+    Example:
+
+    ```python
+    snapshot = synalinks.saving.StateSnapshot("checkpoints/snapshot")
+
+    # Save the variables in the background
+    snapshot.save(program, blocking=False)
+
+    # ... later, restore the variables of the program
+    snapshot.restore(program)
+    ```
+
+    Args:
+        directory (str | os.PathLike): The directory of the snapshot.
+    """
+
+    def __init__(self, directory):
+        self.directory = file_utils.path_to_string(directory)
+        self._objects_dir = os.path.join(self.directory, OBJECTS_DIRNAME)
+        self._manifest_path = os.path.join(self.directory, MANIFEST_FILENAME)
+        self._executor = None
+        self._pending = None
+        # The hashes of the objects referenced by the manifest on disk
+        self._objects = set()
+        if file_utils.exists(self._manifest_path):
+            self._objects = _get_manifest_objects(self._read_manifest())
+
+    def save(self, program, blocking=True):
+        """Save the variables of a program.
+
+        Args:
+            program (Program): The program to save.
+            blocking (bool): If `False`, the files are written by a background
+                thread and the method returns as soon as the variables are
+                serialized (Default to True).
+
+        Returns:
+            (int): The number of objects written (the number of distinct
+                variable contents that were not already saved).
+        """
+        # Wait for the previous write, so the manifests are written in order
+        self.wait()
+        manifest = {"version": SNAPSHOT_VERSION, "variables": {}}
+        objects = {}
+        for collection, variables in _get_variables_collections(program).items():
+            hashes = _hash_variables(variables, collection)
+            manifest["variables"][collection] = {
+                path: digest for path, (digest, _, _) in hashes.items()
+            }
+            for digest, payload, _ in hashes.values():
+                if digest not in self._objects:
+                    objects[digest] = payload
+        if blocking:
+            self._write(manifest, objects)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._pending = self._executor.submit(self._write, manifest, objects)
+        return len(objects)
+
+    def _write(self, manifest, objects):
+        if not file_utils.exists(self._objects_dir):
+            file_utils.makedirs(self._objects_dir)
+        for digest, payload in objects.items():
+            _write_atomically(os.path.join(self._objects_dir, f"{digest}.json"), payload)
+        # The manifest is written last, so it only references written objects
+        _write_atomically(
+            self._manifest_path, json.dumps(manifest, indent=2).encode("utf-8")
+        )
+        # Remove the objects that are not referenced anymore
+        referenced = _get_manifest_objects(manifest)
+        for digest in self._objects - referenced:
+            filepath = os.path.join(self._objects_dir, f"{digest}.json")
+            if file_utils.exists(filepath):
+                os.remove(filepath)
+        self._objects = referenced
+
+    def wait(self):
+        """Wait for the pending background write (if any) to complete.
+
+        Errors raised by the background write are raised here.
+        """
+        if self._pending is not None:
+            pending = self._pending
+            self._pending = None
+            pending.result()
+
+    def exists(self):
+        """Returns whether a snapshot was saved in the directory."""
+        self.wait()
+        return file_utils.exists(self._manifest_path)
+
+    def restore(self, program):
+        """Restore the variables of a program from the snapshot.
+
+        Only the variables whose content differs from the snapshot are read
+        and assigned.
+
+        Args:
+            program (Program): The program to restore.
+
+        Returns:
+            (int): The number of variables assigned.
+        """
+        self.wait()
+        if not file_utils.exists(self._manifest_path):
+            raise ValueError(f"No snapshot found in '{self.directory}'.")
+        manifest = self._read_manifest()
+        restored = 0
+        for collection, variables in _get_variables_collections(program).items():
+            saved_hashes = manifest["variables"].get(collection, {})
+            hashes = _hash_variables(variables, collection)
+            for path, (digest, _, variable) in hashes.items():
+                saved_digest = saved_hashes.get(path)
+                if saved_digest is None or saved_digest == digest:
+                    continue
+                with open(
+                    os.path.join(self._objects_dir, f"{saved_digest}.json"), "r"
+                ) as f:
+                    variable.assign(json.loads(f.read()))
+                restored += 1
+        return restored
+
+    def _read_manifest(self):
+        with open(self._manifest_path, "r") as f:
+            manifest = json.loads(f.read())
+        if manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {manifest.get('version')} in "
+                f"'{self.directory}', expected version {SNAPSHOT_VERSION}."
+            )
+        return manifest
+
+    def close(self):
+        """Wait for the pending write and stop the background thread."""
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
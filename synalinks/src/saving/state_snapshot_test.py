@@ -0,0 +1,133 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+from unittest.mock import patch
+
+from synalinks.src import modules
+from synalinks.src import optimizers
+from synalinks.src import programs
+from synalinks.src import rewards
+from synalinks.src import testing
+from synalinks.src.callbacks.program_checkpoint import ProgramCheckpoint
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.saving.state_snapshot import StateSnapshot
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.testing.test_utils import load_test_data
+
+
+async def program_test():
+    language_model = LanguageModel("ollama_chat/deepseek-r1")
+    x0 = modules.Input(data_model=Query)
+    x1 = await modules.Generator(
+        data_model=AnswerWithRationale,
+        language_model=language_model,
+        name="generator",
+    )(x0)
+    x2 = await modules.Generator(
+        data_model=AnswerWithRationale,
+        language_model=language_model,
+        name="other_generator",
+    )(x1)
+    program = programs.Program(
+        inputs=x0,
+        outputs=x2,
+        name="chain_of_thought",
+    )
+    program.compile(
+        optimizer=optimizers.RandomFewShot(),
+        reward=rewards.ExactMatch(in_mask=["answer"]),
+    )
+    return program
+
+
+class StateSnapshotTest(testing.TestCase):
+    async def test_save_and_restore(self):
+        program = await program_test()
+        directory = os.path.join(self.get_temp_dir(), "snapshot")
+        snapshot = StateSnapshot(directory)
+        self.assertFalse(snapshot.exists())
+
+        num_objects = snapshot.save(program)
+        self.assertTrue(snapshot.exists())
+        self.assertGreater(num_objects, 0)
+        # Nothing changed, so nothing is written
+        self.assertEqual(snapshot.save(program), 0)
+
+        variable = program.trainable_variables[0]
+        variable.update({"static_system_prompt": "Be concise."})
+        self.assertEqual(snapshot.save(program, blocking=False), 1)
+        snapshot.wait()
+
+        # Only the modified variables are restored
+        variable.update({"static_system_prompt": None})
+        program.trainable_variables[1].update({"static_system_prompt": "Be brief."})
+        self.assertEqual(StateSnapshot(directory).restore(program), 2)
+        self.assertEqual(variable.get("static_system_prompt"), "Be concise.")
+        self.assertIsNone(program.trainable_variables[1].get("static_system_prompt"))
+        self.assertEqual(StateSnapshot(directory).restore(program), 0)
+
+        # The objects not referenced by the manifest are removed
+        with open(os.path.join(directory, "manifest.json")) as f:
+            manifest = json.load(f)
+        referenced = set(
+            digest
+            for hashes in manifest["variables"].values()
+            for digest in hashes.values()
+        )
+        filenames = os.listdir(os.path.join(directory, "objects"))
+        objects = set(filename[: -len(".json")] for filename in filenames)
+        self.assertEqual(objects, referenced)
+        snapshot.close()
+
+    async def test_restore_without_snapshot(self):
+        program = await program_test()
+        snapshot = StateSnapshot(os.path.join(self.get_temp_dir(), "missing"))
+        with self.assertRaisesRegex(ValueError, "No snapshot found"):
+            snapshot.restore(program)
+
+    @patch("litellm.acompletion")
+    async def test_program_checkpoint_snapshot(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+        directory = os.path.join(self.get_temp_dir(), "checkpoint")
+
+        with self.assertRaisesRegex(ValueError, "must be a directory"):
+            ProgramCheckpoint(
+                filepath=directory + ".json",
+                save_format="snapshot",
+            )
+
+        (x_train, y_train), _ = load_test_data()
+
+        await program.fit(
+            x=x_train,
+            y=y_train,
+            batch_size=1,
+            epochs=2,
+            verbose=0,
+            callbacks=[
+                ProgramCheckpoint(
+                    filepath=directory,
+                    save_format="snapshot",
+                )
+            ],
+        )
+
+        restored_program = await program_test()
+        StateSnapshot(directory).restore(restored_program)
+        for variable, restored_variable in zip(
+            program.trainable_variables, restored_program.trainable_variables
+        ):
+            self.assertEqual(len(restored_variable.get("examples")), 3)
+            self.assertEqual(restored_variable.get("examples"), variable.get("examples"))
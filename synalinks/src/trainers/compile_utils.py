@@ -2,6 +2,7 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 from collections import namedtuple
 
 from synalinks.src import metrics as metrics_module
@@ -24,6 +25,12 @@ class MetricsList(metrics_module.Metric):
         for m in self.metrics:
             await m.update_state(y_true, y_pred)
 
+    async def update_state_batch(self, y_true, y_pred):
+        # The metrics have independent states, so they are updated concurrently
+        await asyncio.gather(
+            *[m.update_state_batch(y_true, y_pred) for m in self.metrics]
+        )
+
     def reset_state(self):
         for m in self.metrics:
             m.reset_state()
@@ -269,6 +276,22 @@ class CompileMetrics(metrics_module.Metric):
             if m is not None:
                 await m.update_state(y_t, y_p)
 
+    async def update_state_batch(self, y_true, y_pred):
+        if len(y_pred) == 0:
+            return
+        if not self.built:
+            self.build(y_true[0], y_pred[0])
+        # Transpose the batch into one list of samples per output
+        y_true = list(zip(*[self._flatten_y(y_t) for y_t in y_true]))
+        y_pred = list(zip(*[self._flatten_y(y_p) for y_p in y_pred]))
+        await asyncio.gather(
+            *[
+                m.update_state_batch(list(y_t), list(y_p))
+                for m, y_t, y_p in zip(self._flat_metrics, y_true, y_pred)
+                if m is not None
+            ]
+        )
+
     def reset_state(self):
         if not self.built:
             return
@@ -570,6 +593,20 @@ class CompileReward(rewards_module.Reward):
         with ops.name_scope(self.name):
             return await self.call(y_true, y_pred)
 
+    async def compute_batch(self, y_true, y_pred):
+        if len(y_pred) == 0:
+            return []
+        with ops.name_scope(self.name):
+            if not any(tree.is_nested(y) for y in list(y_true) + list(y_pred)):
+                # Fast path: single output case, the reward scores the whole batch.
+                if not self.built:
+                    self.build(y_true[0], y_pred[0])
+                _, reward_fn, _, _ = self._flat_rewards[0]
+                return await reward_fn.compute_batch(y_true, y_pred)
+            return await asyncio.gather(
+                *[self.call(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+            )
+
     async def call(self, y_true, y_pred):
         if not tree.is_nested(y_true) and not tree.is_nested(y_pred):
             # Fast path: single output case / no reward-tracking metric.
@@ -1,11 +1,17 @@
 import types
 
+from synalinks.src.datasets.columnar_dataset import ColumnarDataset
+from synalinks.src.datasets.streaming_dataset import StreamingDataset
 from synalinks.src.trainers.data_adapters import array_data_adapter
 from synalinks.src.trainers.data_adapters import data_adapter
 from synalinks.src.trainers.data_adapters.array_data_adapter import ArrayDataAdapter
+from synalinks.src.trainers.data_adapters.columnar_data_adapter import ColumnarDataAdapter
 from synalinks.src.trainers.data_adapters.generator_data_adapter import (
     GeneratorDataAdapter,
 )
+from synalinks.src.trainers.data_adapters.streaming_data_adapter import (
+    StreamingDataAdapter,
+)
 
 
 def get_data_adapter(
@@ -14,12 +20,32 @@ def get_data_adapter(
     batch_size=None,
     steps_per_epoch=None,
     shuffle=False,
+    track_position=False,
 ):
     # Allow passing a custom data adapter.
     if isinstance(x, data_adapter.DataAdapter):
         return x
 
-    if array_data_adapter.can_convert_arrays((x, y)):
+    if isinstance(x, ColumnarDataset):
+        if y is not None:
+            raise_unsupported_arg("y", "the targets", "ColumnarDataset")
+        return ColumnarDataAdapter(
+            x,
+            shuffle=shuffle,
+            batch_size=batch_size,
+            steps=steps_per_epoch,
+        )
+    elif isinstance(x, StreamingDataset):
+        if y is not None:
+            raise_unsupported_arg("y", "the targets", "StreamingDataset")
+        return StreamingDataAdapter(
+            x,
+            shuffle=shuffle,
+            batch_size=batch_size,
+            steps=steps_per_epoch,
+            track_position=track_position,
+        )
+    elif array_data_adapter.can_convert_arrays((x, y)):
         return ArrayDataAdapter(
             x,
             y,
@@ -7,12 +7,17 @@ import math
 import numpy as np
 
 from synalinks.src import tree
+from synalinks.src.datasets.columnar_dataset import ColumnarDataset
 
 ARRAY_TYPES = (np.ndarray, list, tuple)
 
 
 def can_slice_array(x):
-    return x is None or isinstance(x, ARRAY_TYPES) or hasattr(x, "__array__")
+    return (
+        x is None
+        or isinstance(x, (ColumnarDataset, *ARRAY_TYPES))
+        or hasattr(x, "__array__")
+    )
 
 
 def train_validation_split(arrays, validation_split):
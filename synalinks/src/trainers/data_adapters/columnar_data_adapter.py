@@ -0,0 +1,70 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import math
+
+import numpy as np
+
+from synalinks.src.trainers.data_adapters import data_adapter_utils
+from synalinks.src.trainers.data_adapters.data_adapter import DataAdapter
+
+
+class ColumnarDataAdapter(DataAdapter):
+    """Adapter for `ColumnarDataset` objects.
+
+    The examples are shuffled using an index permutation and only the data
+    models of the current batch are materialized.
+    """
+
+    def __init__(
+        self,
+        dataset,
+        batch_size=None,
+        steps=None,
+        shuffle=False,
+    ):
+        num_samples = len(dataset)
+        self._num_samples = num_samples
+        self._dataset = dataset
+
+        # If batch_size is not passed but steps is, calculate from the input
+        # data.  Defaults to `32`.
+        if not batch_size:
+            batch_size = int(math.ceil(num_samples / steps)) if steps else 32
+
+        self._size = int(math.ceil(num_samples / batch_size))
+        self._batch_size = batch_size
+        self._partial_batch_size = num_samples % batch_size
+        self._shuffle = shuffle
+
+    def get_numpy_iterator(self):
+        global_permutation = None
+        if self._shuffle and self._shuffle != "batch":
+            global_permutation = np.random.permutation(self._num_samples)
+
+        for i in range(self._size):
+            start = i * self._batch_size
+            stop = min((i + 1) * self._batch_size, self._num_samples)
+            if self._shuffle == "batch":
+                indices = np.random.permutation(stop - start) + start
+            elif self._shuffle:
+                indices = global_permutation[start:stop]
+            else:
+                indices = slice(start, stop)
+            x, y = self._dataset.get_batch(indices)
+            yield data_adapter_utils.pack_x_y(x, y=y)
+
+    @property
+    def num_batches(self):
+        return self._size
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @property
+    def has_partial_batch(self):
+        return self._partial_batch_size > 0
+
+    @property
+    def partial_batch_size(self):
+        return self._partial_batch_size or None
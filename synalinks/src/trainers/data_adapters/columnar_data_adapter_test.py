@@ -0,0 +1,55 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from absl.testing import parameterized
+
+from synalinks.src import testing
+from synalinks.src.backend import JsonDataModel
+from synalinks.src.datasets.columnar_dataset import ColumnarDataset
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.testing.test_utils import load_test_data
+from synalinks.src.testing.test_utils import named_product
+from synalinks.src.trainers.data_adapters import get_data_adapter
+from synalinks.src.trainers.data_adapters.columnar_data_adapter import ColumnarDataAdapter
+
+
+class TestColumnarDataAdapter(testing.TestCase):
+    @parameterized.named_parameters(
+        named_product(
+            shuffle=[False, "batch", True],
+        )
+    )
+    def test_basic_flow(self, shuffle):
+        x = [Query(query=f"query {i}") for i in range(5)]
+        y = [AnswerWithRationale(rationale="rationale", answer=f"{i}") for i in range(5)]
+
+        adapter = ColumnarDataAdapter(
+            ColumnarDataset(x, y),
+            batch_size=2,
+            shuffle=shuffle,
+        )
+        self.assertEqual(adapter.num_batches, 3)
+        self.assertEqual(adapter.batch_size, 2)
+        self.assertEqual(adapter.has_partial_batch, True)
+        self.assertEqual(adapter.partial_batch_size, 1)
+
+        seen = []
+        for batch in adapter.get_numpy_iterator():
+            self.assertIsInstance(batch, tuple)
+            x_batch, y_batch = batch
+            for inputs, targets in zip(x_batch, y_batch):
+                self.assertIsInstance(inputs, JsonDataModel)
+                self.assertEqual(inputs.get_schema(), Query.get_schema())
+                # The inputs and targets stay aligned when shuffled
+                self.assertEqual(inputs.get("query"), "query " + targets.get("answer"))
+                seen.append(inputs.get("query"))
+        self.assertEqual(sorted(seen), [f"query {i}" for i in range(5)])
+
+    def test_get_data_adapter(self):
+        (x, y), _ = load_test_data()
+        adapter = get_data_adapter(ColumnarDataset(x, y), batch_size=32)
+        self.assertIsInstance(adapter, ColumnarDataAdapter)
+        self.assertEqual(adapter.num_batches, 1)
+
+        with self.assertRaisesRegex(ValueError, "should not be passed"):
+            get_data_adapter(ColumnarDataset(x), y=y)
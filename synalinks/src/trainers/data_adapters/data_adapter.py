@@ -61,6 +61,10 @@ class DataAdapter:
         """
         raise NotImplementedError
 
+    def on_batch_end(self):
+        """A hook called after the trainer consumed a batch of the iterator."""
+        pass
+
     def on_epoch_begin(self):
         """A hook called before each epoch."""
         pass
@@ -0,0 +1,104 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import math
+
+import numpy as np
+
+from synalinks.src.trainers.data_adapters import data_adapter_utils
+from synalinks.src.trainers.data_adapters.data_adapter import DataAdapter
+
+
+class StreamingDataAdapter(DataAdapter):
+    """Adapter for `StreamingDataset` objects.
+
+    Only the records of the current batch are read from the file.
+
+    When `track_position` is True (i.e. in `fit()`), the iteration resumes
+    from the position of the dataset, and the position is only advanced once
+    the trainer consumed the batch (see `on_batch_end()`), so an interrupted
+    epoch is resumed after its last trained batch. The epoch counter is
+    advanced (and the position reset) with the last batch of the epoch.
+    Otherwise (e.g. in `evaluate()` and `predict()`), the iteration always
+    starts from the beginning and the dataset is left untouched.
+    """
+
+    def __init__(
+        self,
+        dataset,
+        batch_size=None,
+        steps=None,
+        shuffle=False,
+        track_position=False,
+    ):
+        num_samples = len(dataset)
+        self._num_samples = num_samples
+        self._dataset = dataset
+
+        # If batch_size is not passed but steps is, calculate from the input
+        # data.  Defaults to `32`.
+        if not batch_size:
+            batch_size = int(math.ceil(num_samples / steps)) if steps else 32
+
+        self._size = int(math.ceil(num_samples / batch_size))
+        self._batch_size = batch_size
+        self._partial_batch_size = num_samples % batch_size
+        self._shuffle = shuffle
+        self._track_position = track_position
+        # The end of the batches yielded but not yet consumed by the trainer
+        self._pending_stops = collections.deque()
+
+    def get_numpy_iterator(self):
+        dataset = self._dataset
+        self._pending_stops.clear()
+        position = dataset.position if self._track_position else 0
+        # The permutation only depends on the seed and epoch of the dataset,
+        # so it is the same when resuming an epoch
+        global_permutation = dataset.get_permutation(self._shuffle)
+        rng = np.random.default_rng([dataset.seed, dataset.epoch])
+
+        for i in range(self._size):
+            start = i * self._batch_size
+            stop = min((i + 1) * self._batch_size, self._num_samples)
+            if self._shuffle == "batch":
+                indices = rng.permutation(stop - start) + start
+            elif global_permutation is not None:
+                indices = global_permutation[start:stop]
+            else:
+                indices = np.arange(start, stop)
+            if stop <= position:
+                continue
+            x, y = dataset.get_batch(indices)
+            if self._track_position:
+                self._pending_stops.append(stop)
+            yield data_adapter_utils.pack_x_y(x, y=y)
+
+    def on_batch_end(self):
+        if not self._pending_stops:
+            return
+        dataset = self._dataset
+        stop = self._pending_stops.popleft()
+        if stop < self._num_samples:
+            dataset.position = stop
+        else:
+            dataset.epoch += 1
+            dataset.position = 0
+
+    @property
+    def num_batches(self):
+        if not self._track_position:
+            return self._size
+        # The batches already consumed when resuming an epoch are skipped
+        return self._size - self._dataset.position // self._batch_size
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @property
+    def has_partial_batch(self):
+        return self._partial_batch_size > 0
+
+    @property
+    def partial_batch_size(self):
+        return self._partial_batch_size or None
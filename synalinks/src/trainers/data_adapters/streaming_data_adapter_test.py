@@ -0,0 +1,115 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+
+from absl.testing import parameterized
+
+from synalinks.src import testing
+from synalinks.src.datasets.streaming_dataset import StreamingDataset
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.testing.test_utils import named_product
+from synalinks.src.trainers.data_adapters import get_data_adapter
+from synalinks.src.trainers.data_adapters.streaming_data_adapter import (
+    StreamingDataAdapter,
+)
+
+
+class TestStreamingDataAdapter(testing.TestCase):
+    def build_dataset(self, n=5):
+        path = os.path.join(self.get_temp_dir(), "data.jsonl")
+        with open(path, "w") as f:
+            for i in range(n):
+                record = {"query": f"query {i}", "rationale": "r", "answer": str(i)}
+                f.write(json.dumps(record) + "\n")
+        return StreamingDataset(
+            path,
+            input_data_model=Query,
+            output_data_model=AnswerWithRationale,
+            seed=0,
+        )
+
+    @parameterized.named_parameters(
+        named_product(
+            shuffle=[False, "batch", True],
+        )
+    )
+    def test_basic_flow(self, shuffle):
+        adapter = StreamingDataAdapter(
+            self.build_dataset(),
+            batch_size=2,
+            shuffle=shuffle,
+        )
+        self.assertEqual(adapter.num_batches, 3)
+        self.assertEqual(adapter.batch_size, 2)
+        self.assertEqual(adapter.has_partial_batch, True)
+        self.assertEqual(adapter.partial_batch_size, 1)
+
+        seen = []
+        for batch in adapter.get_numpy_iterator():
+            self.assertIsInstance(batch, tuple)
+            x_batch, y_batch = batch
+            for inputs, targets in zip(x_batch, y_batch):
+                self.assertIsInstance(inputs, Query)
+                # The inputs and targets stay aligned when shuffled
+                self.assertEqual(inputs.query, "query " + targets.answer)
+                seen.append(inputs.query)
+        self.assertEqual(sorted(seen), [f"query {i}" for i in range(5)])
+
+    def test_resume(self):
+        dataset = self.build_dataset()
+        adapter = StreamingDataAdapter(
+            dataset, batch_size=2, shuffle=True, track_position=True
+        )
+        epoch = [batch[0][0].query for batch in adapter.get_numpy_iterator()]
+
+        dataset.set_state({"epoch": 0, "position": 0})
+        iterator = adapter.get_numpy_iterator()
+        next(iterator)
+        next(iterator)
+        # Only the batches consumed by the trainer advance the position
+        self.assertEqual(dataset.get_state()["position"], 0)
+        adapter.on_batch_end()
+        state = dataset.get_state()
+        self.assertEqual(state["position"], 2)
+
+        resumed = self.build_dataset()
+        resumed.set_state(state)
+        adapter = StreamingDataAdapter(
+            resumed, batch_size=2, shuffle=True, track_position=True
+        )
+        self.assertEqual(adapter.num_batches, 2)
+        resumed_epoch = []
+        for batch in adapter.get_numpy_iterator():
+            resumed_epoch.append(batch[0][0].query)
+            adapter.on_batch_end()
+        self.assertEqual(resumed_epoch, epoch[1:])
+
+        # The next epoch starts from the beginning with a new order
+        self.assertEqual(resumed.get_state()["epoch"], 1)
+        self.assertEqual(resumed.get_state()["position"], 0)
+        self.assertEqual(adapter.num_batches, 3)
+
+    def test_without_position_tracking(self):
+        dataset = self.build_dataset()
+        dataset.set_state({"epoch": 1, "position": 2})
+        adapter = StreamingDataAdapter(dataset, batch_size=2)
+        self.assertEqual(adapter.num_batches, 3)
+
+        seen = []
+        for batch in adapter.get_numpy_iterator():
+            seen.extend(inputs.query for inputs in batch[0])
+            adapter.on_batch_end()
+        self.assertEqual(seen, [f"query {i}" for i in range(5)])
+        self.assertEqual(dataset.get_state()["epoch"], 1)
+        self.assertEqual(dataset.get_state()["position"], 2)
+
+    def test_get_data_adapter(self):
+        dataset = self.build_dataset()
+        adapter = get_data_adapter(dataset, batch_size=32)
+        self.assertIsInstance(adapter, StreamingDataAdapter)
+        self.assertEqual(adapter.num_batches, 1)
+
+        with self.assertRaisesRegex(ValueError, "should not be passed"):
+            get_data_adapter(dataset, y=[])
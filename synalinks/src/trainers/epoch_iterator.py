@@ -17,6 +17,7 @@ class EpochIterator:
         steps_per_epoch=None,
         shuffle=False,
         steps_per_execution=1,
+        track_position=False,
     ):
         self.steps_per_epoch = steps_per_epoch
         self.steps_per_execution = steps_per_execution
@@ -29,6 +30,7 @@ class EpochIterator:
             batch_size=batch_size,
             steps_per_epoch=steps_per_epoch,
             shuffle=shuffle,
+            track_position=track_position,
         )
         self._num_batches = self.data_adapter.num_batches
 
@@ -52,6 +54,11 @@ class EpochIterator:
 
     def _enumerate_iterator(self):
         self.data_adapter.on_epoch_begin()
+        if self._current_iterator is None or self.steps_per_epoch is None:
+            # The number of batches can change between epochs
+            # (e.g. when resuming a streaming dataset)
+            if self.data_adapter.num_batches is not None:
+                self._num_batches = self.data_adapter.num_batches
         steps_per_epoch = self.steps_per_epoch or self._num_batches or -1
 
         if steps_per_epoch > 0:
@@ -93,6 +100,11 @@ class EpochIterator:
             return step, buffer
         raise StopIteration
 
+    def on_step_end(self, data):
+        """Notify the data adapter that the batches of a step were consumed."""
+        for _ in data:
+            self.data_adapter.on_batch_end()
+
     def enumerate_epoch(self):
         for step, data in self:
             yield step, data
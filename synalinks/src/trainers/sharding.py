@@ -0,0 +1,100 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import json
+
+import numpy as np
+
+from synalinks.src.datasets.streaming_dataset import StreamingDataset
+
+
+def get_program_config(program):
+    """Returns the JSON config of a program and its variables.
+
+    The config is the same as the one written by `program.save()`, so the
+    program can be rebuilt in the exact same state in another process.
+
+    Args:
+        program (Program): The program to serialize.
+
+    Returns:
+        (str): The JSON string of the program config.
+    """
+    from synalinks.src.saving import serialization_lib
+
+    program_config = serialization_lib.serialize_synalinks_object(program)
+    program_config.update({"variables": program.get_state_tree()})
+    return json.dumps(program_config)
+
+
+def shard_data(x, y=None, num_shards=1):
+    """Split the data into contiguous shards.
+
+    Args:
+        x (np.ndarray | list | dict | ColumnarDataset): The input data.
+        y (np.ndarray | list | dict): Optional. The target data.
+        num_shards (int): The maximum number of shards (Default to 1).
+
+    Returns:
+        (list): The list of `(x, y)` shards, in the order of the data.
+    """
+    if (
+        isinstance(x, StreamingDataset)
+        or not hasattr(x, "__len__")
+        or not hasattr(x, "__getitem__")
+    ):
+        raise ValueError(
+            "Only array-like data (NumPy arrays, lists, dicts of arrays) or "
+            "`ColumnarDataset`s can be sharded across workers, "
+            f"received: x={type(x)}"
+        )
+
+    def _num_samples(data):
+        if isinstance(data, dict):
+            return len(next(iter(data.values())))
+        return len(data)
+
+    def _slice(data, start, stop):
+        if data is None:
+            return None
+        if isinstance(data, dict):
+            return {key: value[start:stop] for key, value in data.items()}
+        return data[start:stop]
+
+    num_samples = _num_samples(x)
+    num_shards = max(1, min(num_shards, num_samples))
+    bounds = np.linspace(0, num_samples, num_shards + 1).astype(int)
+    return [
+        (_slice(x, start, stop), _slice(y, start, stop))
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+async def _run_shard(program_config, mode, x, y=None, batch_size=None):
+    from synalinks.src.programs.program import program_from_json
+
+    program = program_from_json(program_config)
+    if mode == "predict":
+        return await program.predict(x, batch_size=batch_size, verbose=0)
+    await program.evaluate(x, y=y, batch_size=batch_size, verbose=0)
+    return [[v.get_json() for v in metric.variables] for metric in program.metrics]
+
+
+def run_shard(program_config, mode, x, y=None, batch_size=None):
+    """Rebuild a program and run it on a shard of the data.
+
+    This function is the entry point of the worker processes.
+
+    Args:
+        program_config (str): The JSON config returned by `get_program_config()`.
+        mode (str): Either `"evaluate"` or `"predict"`.
+        x (np.ndarray | list | dict | ColumnarDataset): The input data of the shard.
+        y (np.ndarray | list | dict): Optional. The target data of the shard.
+        batch_size (int): Optional. The batch size used by the worker.
+
+    Returns:
+        (np.ndarray | list): The predictions of the shard when predicting,
+            otherwise the state of each metric of the program (the list of
+            the JSON of its variables).
+    """
+    return asyncio.run(_run_shard(program_config, mode, x, y=y, batch_size=batch_size))
@@ -3,8 +3,12 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import asyncio
+import collections
+import functools
 import inspect
+import multiprocessing
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
@@ -14,11 +18,13 @@ from synalinks.src import metrics as metrics_module
 from synalinks.src import optimizers as optimizers_module
 from synalinks.src.backend.common import numpy
 from synalinks.src.saving import serialization_lib
+from synalinks.src.trainers import sharding
 from synalinks.src.trainers.compile_utils import CompileMetrics
 from synalinks.src.trainers.compile_utils import CompileReward
 from synalinks.src.trainers.data_adapters import array_slicing
 from synalinks.src.trainers.data_adapters import data_adapter_utils
 from synalinks.src.trainers.epoch_iterator import EpochIterator
+from synalinks.src.utils import prediction_buffer
 from synalinks.src.utils import python_utils
 from synalinks.src.utils import tracking
 from synalinks.src.utils.async_utils import run_maybe_nested
@@ -31,6 +37,7 @@ class Trainer:
         self.compiled = False
         self.reward = None
         self.steps_per_execution = 1
+        self.scoring_concurrency = None
         # Can be set by callbacks in on_train_begin
         self._initial_epoch = None
         self._compute_reward_has_training_arg = (
@@ -51,6 +58,7 @@ class Trainer:
         metrics=None,
         run_eagerly=False,
         steps_per_execution=1,
+        scoring_concurrency=None,
     ):
         """Configures the program for training.
 
@@ -101,7 +109,17 @@ class Trainer:
                 `Callback.on_batch_begin` and `Callback.on_batch_end` methods
                 will only be called every `N` batches (i.e. before/after
                 each compiled function execution).
+            scoring_concurrency (int): Optional. The maximum number of samples scored
+                at the same time by the reward and the metrics. The samples of a
+                batch are scored together (see `Reward.call_batch()` and
+                `Metric.update_state_batch()`), this argument splits the batches
+                in smaller chunks (Default to None, no limit).
         """
+        if scoring_concurrency is not None and scoring_concurrency < 1:
+            raise ValueError(
+                "The `scoring_concurrency` argument should be at least 1, "
+                f"received: {scoring_concurrency}"
+            )
         self._clear_previous_trainer_metrics()
         self._optimizer = optimizer
 
@@ -121,6 +139,7 @@ class Trainer:
         self.compiled = True
         self._reward_tracker = metrics_module.Mean(name="reward")
         self.steps_per_execution = steps_per_execution
+        self.scoring_concurrency = scoring_concurrency
 
         self._compile_config = serialization_lib.SerializableDict(
             optimizer=optimizer,
@@ -129,6 +148,7 @@ class Trainer:
             metrics=metrics,
             run_eagerly=run_eagerly,
             steps_per_execution=steps_per_execution,
+            scoring_concurrency=scoring_concurrency,
         )
 
     @property
@@ -226,10 +246,9 @@ class Trainer:
         del training
         rewards = []
         if self._compile_reward is not None:
-            for y_t, y_p in zip(y, y_pred):
-                reward = await self._compile_reward(y_t, y_p)
-                if reward is not None:
-                    rewards.append(reward)
+            for y_t, y_p in self._split_batch(y, y_pred):
+                batch_rewards = await self._compile_reward.compute_batch(y_t, y_p)
+                rewards.extend(reward for reward in batch_rewards if reward is not None)
         for reward in self.rewards:
             rewards.append(numpy.sum(reward))
         if len(rewards) == 1:
@@ -304,10 +323,18 @@ class Trainer:
         """
         del x  # The default implementation does not use `x`.
         if self._compile_metrics is not None:
-            for y_t, y_p in zip(y, y_pred):
-                await self._compile_metrics.update_state(y_t, y_p)
+            for y_t, y_p in self._split_batch(y, y_pred):
+                await self._compile_metrics.update_state_batch(y_t, y_p)
         return self.get_metrics_result()
 
+    def _split_batch(self, y, y_pred):
+        """Split a batch into chunks of at most `scoring_concurrency` samples."""
+        y = list(y)
+        y_pred = list(y_pred)
+        size = self.scoring_concurrency or len(y_pred) or 1
+        for start in range(0, len(y_pred), size):
+            yield y[start : start + size], y_pred[start : start + size]
+
     def get_metrics_result(self):
         """Returns the program's metrics values as a dict.
 
@@ -344,6 +371,7 @@ class Trainer:
         validation_batch_size=None,
         validation_freq=1,
         train_optimizer=False,
+        max_staleness=0,
     ):
         """Trains the program for a fixed number of epochs (dataset iterations).
 
@@ -444,6 +472,13 @@ class Trainer:
                 e.g. `validation_freq=2` runs validation every 2 epochs.
             train_optimizer (bool): Wether or not to train the optimizer
                 if possible (Default to False).
+            max_staleness (int): The number of batches that can run their
+                inference while the optimizer step of a previous batch is in
+                flight, in other words how many optimizer steps the variables
+                used for inference may lag behind. The optimizer steps are still
+                applied one at a time in the order of the batches. If 0, the
+                inference and the optimization of the batches are not overlapped
+                (Default to 0).
 
         Returns:
             (History): A `History` object. Its `History.history` attribute is
@@ -452,6 +487,11 @@ class Trainer:
                 and validation metrics values (if applicable).
         """
         self._assert_compile_called("fit")
+        if max_staleness < 0:
+            raise ValueError(
+                "The `max_staleness` argument should be positive, "
+                f"received: {max_staleness}"
+            )
         # TODO: respect compiled trainable state
         self._eval_epoch_iterator = None
         if validation_split and validation_data is None:
@@ -471,6 +511,7 @@ class Trainer:
             steps_per_epoch=steps_per_epoch,
             shuffle=False,
             steps_per_execution=self.steps_per_execution,
+            track_position=True,
         )
 
         if not all(module.built for module in self._flatten_modules()):
@@ -506,19 +547,28 @@ class Trainer:
             self.reset_metrics()
             callbacks.on_epoch_begin(epoch)
             with epoch_iterator.catch_stop_iteration():
-                for step, iterator in epoch_iterator:
-                    data = iterator[0]
-                    x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
-                    callbacks.on_train_batch_begin(step)
-                    logs = await self.train_on_batch(
-                        x=x_batch,
-                        y=y_batch,
-                        return_dict=True,
+                if max_staleness:
+                    logs = await self._pipelined_train_epoch(
+                        epoch_iterator,
+                        callbacks,
+                        max_staleness=max_staleness,
                         train_optimizer=train_optimizer,
                     )
-                    callbacks.on_train_batch_end(step, logs)
-                    if self.stop_training:
-                        break
+                else:
+                    for step, iterator in epoch_iterator:
+                        data = iterator[0]
+                        x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
+                        callbacks.on_train_batch_begin(step)
+                        logs = await self.train_on_batch(
+                            x=x_batch,
+                            y=y_batch,
+                            return_dict=True,
+                            train_optimizer=train_optimizer,
+                        )
+                        epoch_iterator.on_step_end(iterator)
+                        callbacks.on_train_batch_end(step, logs)
+                        if self.stop_training:
+                            break
 
             # Override with model metrics instead of last step logs if needed.
             epoch_logs = dict(self._get_metrics_result_or_logs(logs))
@@ -574,6 +624,7 @@ class Trainer:
         steps=None,
         callbacks=None,
         return_dict=True,
+        num_workers=None,
         **kwargs,
     ):
         """Returns the reward value & metrics values for the program in test mode.
@@ -613,6 +664,13 @@ class Trainer:
             return_dict (bool): If `True`, reward and metric results are returned as a
                 dict, with each key being the name of the metric.
                 If `False`, they are returned as a list.
+            num_workers (int): Optional. If greater than 1, the data is split into
+                `num_workers` contiguous shards evaluated in parallel by as many
+                worker processes. Each worker rebuilds the program from its config
+                and state tree, and the metric states of the workers are merged
+                back into the program metrics. The data should be array-like
+                (or a `ColumnarDataset`) and the program serializable
+                (Default to None, evaluate in the current process).
 
         Returns:
             (float | list | dict): Scalar test reward
@@ -625,6 +683,7 @@ class Trainer:
         use_cached_eval_dataset = kwargs.pop("_use_cached_eval_dataset", False)
         if kwargs:
             raise ValueError(f"Arguments not recognized: {kwargs}")
+        self._validate_num_workers(num_workers)
         # Create an iterator that yields batches of input/target data.
         if use_cached_eval_dataset:
             epoch_iterator = self._eval_epoch_iterator
@@ -665,19 +724,34 @@ class Trainer:
         callbacks.on_test_begin()
         logs = {}
         self.reset_metrics()
-        for step, iterator in epoch_iterator:
-            callbacks.on_test_batch_begin(step)
-            data = iterator[0]
-            x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
-            logs = await self.test_on_batch(
-                x=x_batch,
-                y=y_batch,
-                return_dict=True,
+        if num_workers and num_workers > 1:
+            metrics_states = await self._run_sharded(
+                "evaluate",
+                x,
+                y=y,
+                batch_size=batch_size,
+                num_workers=num_workers,
             )
-            callbacks.on_test_batch_end(step, logs)
-            if self.stop_evaluating:
+            for _, iterator in epoch_iterator:
+                _, y_batch = data_adapter_utils.unpack_x_y(iterator[0])
+                self._merge_metrics_states(metrics_states, y_batch[0])
                 break
-        logs = self._get_metrics_result_or_logs(logs)
+            epoch_iterator.reset()
+            logs = self.get_metrics_result()
+        else:
+            for step, iterator in epoch_iterator:
+                callbacks.on_test_batch_begin(step)
+                data = iterator[0]
+                x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
+                logs = await self.test_on_batch(
+                    x=x_batch,
+                    y=y_batch,
+                    return_dict=True,
+                )
+                callbacks.on_test_batch_end(step, logs)
+                if self.stop_evaluating:
+                    break
+            logs = self._get_metrics_result_or_logs(logs)
         callbacks.on_test_end(logs)
 
         if return_dict:
@@ -685,7 +759,13 @@ class Trainer:
         return self._flatten_metrics_in_order(logs)
 
     async def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        num_workers=None,
     ):
         """Generates output predictions for the input samples.
 
@@ -725,11 +805,19 @@ class Trainer:
                 repeating dataset, it will run indefinitely.
             callbacks (list): List of `synalinks.callbacks.Callback` instances.
                 List of callbacks to apply during prediction.
+            num_workers (int): Optional. If greater than 1, the data is split into
+                `num_workers` contiguous shards predicted in parallel by as many
+                worker processes. Each worker rebuilds the program from its config
+                and state tree, and the predictions are concatenated in the order
+                of the data. The data should be array-like (or a
+                `ColumnarDataset`) and the program serializable
+                (Default to None, predict in the current process).
 
         Returns:
             (list): `JsonDataModel` array(s) of predictions.
                 If the pipeline failed, a None is added to the predictions.
         """
+        self._validate_num_workers(num_workers)
         # Create an iterator that yields batches of input data.
         epoch_iterator = EpochIterator(
             x=x,
@@ -754,6 +842,17 @@ class Trainer:
         self.stop_predicting = False
         callbacks.on_test_begin()
         outputs = []
+        if num_workers and num_workers > 1:
+            shards_outputs = await self._run_sharded(
+                "predict",
+                x,
+                batch_size=batch_size,
+                num_workers=num_workers,
+            )
+            for shard_outputs in shards_outputs:
+                outputs.extend(shard_outputs)
+            callbacks.on_predict_end()
+            return np.array(outputs, dtype="object")
         for step, iterator in epoch_iterator:
             callbacks.on_predict_batch_begin(step)
             data = iterator[0]
@@ -766,6 +865,76 @@ class Trainer:
         callbacks.on_predict_end()
         return np.array(outputs, dtype="object")
 
+    def _validate_num_workers(self, num_workers):
+        if num_workers is not None and num_workers < 1:
+            raise ValueError(
+                "The `num_workers` argument should be at least 1, "
+                f"received: {num_workers}"
+            )
+
+    async def _run_sharded(self, mode, x, y=None, batch_size=None, num_workers=1):
+        """Run the program on shards of the data in worker processes.
+
+        The workers are spawned (not forked) so they don't inherit the event
+        loop and the open connections of the current process.
+
+        Args:
+            mode (str): Either `"evaluate"` or `"predict"`.
+            x (np.ndarray | list | dict | ColumnarDataset): The input data.
+            y (np.ndarray | list | dict): Optional. The target data.
+            batch_size (int): Optional. The batch size used by the workers.
+            num_workers (int): The number of worker processes.
+
+        Returns:
+            (list): The results of the shards, in the order of the data.
+        """
+        shards = sharding.shard_data(x, y, num_shards=num_workers)
+        program_config = sharding.get_program_config(self)
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return await asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        executor,
+                        functools.partial(
+                            sharding.run_shard,
+                            program_config,
+                            mode,
+                            x_shard,
+                            y=y_shard,
+                            batch_size=batch_size,
+                        ),
+                    )
+                    for x_shard, y_shard in shards
+                ]
+            )
+
+    def _merge_metrics_states(self, metrics_states, y_sample):
+        """Merge the metric states of the shards into the program metrics.
+
+        Args:
+            metrics_states (list): For each shard, the state of each metric.
+            y_sample (DataModel): A target sample, used to build the metrics
+                that are built on the first batch.
+        """
+        # The targets share the structure of the predictions
+        if self._compile_metrics is not None and not self._compile_metrics.built:
+            self._compile_metrics.build(y_sample, y_sample)
+        if self._compile_reward is not None and not self._compile_reward.built:
+            self._compile_reward.build(y_sample, y_sample)
+        metrics = self.metrics
+        for states in metrics_states:
+            if len(states) != len(metrics):
+                raise ValueError(
+                    f"Expected the states of {len(metrics)} metrics from each "
+                    f"shard, received {len(states)}."
+                )
+        for i, metric in enumerate(metrics):
+            metric.merge_state([states[i] for states in metrics_states])
+
     async def train_on_batch(
         self,
         x,
@@ -791,7 +960,22 @@ class Trainer:
                 or a dict of metric and reward values (if `return_dict=True`).
         """
         y_pred = await self.predict_on_batch(x, training=True)
+        return await self._optimize_on_batch(
+            x,
+            y,
+            y_pred,
+            train_optimizer=train_optimizer,
+            return_dict=return_dict,
+        )
 
+    async def _optimize_on_batch(
+        self,
+        x,
+        y,
+        y_pred,
+        train_optimizer=False,
+        return_dict=False,
+    ):
         reward = await self.compute_reward(
             x=x,
             y=y,
@@ -824,6 +1008,76 @@ class Trainer:
             return metrics
         return self._flatten_metrics_in_order(metrics)
 
+    async def _predict_on_batch_staged(self, x):
+        """Returns the training predictions of a batch and their staged predictions.
+
+        The predictions recorded by the modules are staged per sample and
+        returned in the order of the samples, so they can be committed later
+        to the variables in a deterministic order.
+        """
+
+        async def predict(inputs):
+            with prediction_buffer.stage_predictions() as staged_predictions:
+                return await self(inputs, training=True), staged_predictions
+
+        results = await asyncio.gather(*[predict(inputs) for inputs in x])
+        y_pred = [outputs for outputs, _ in results]
+        staged_predictions = [p for _, staged in results for p in staged]
+        return y_pred, staged_predictions
+
+    async def _pipelined_train_epoch(
+        self,
+        epoch_iterator,
+        callbacks,
+        max_staleness=1,
+        train_optimizer=False,
+    ):
+        """Run a training epoch overlapping the inference and the optimization.
+
+        The inference of the next `max_staleness` batches runs while the
+        optimizer step of the current batch is in flight. The optimizer steps
+        are applied one batch at a time in the order of the batches, each one
+        after committing the predictions of its batch to the variables.
+        """
+        logs = {}
+        pending = collections.deque()
+
+        async def optimize_next_batch():
+            step, data, x_batch, y_batch, inference = pending.popleft()
+            y_pred, staged_predictions = await inference
+            prediction_buffer.commit_predictions(staged_predictions)
+            batch_logs = await self._optimize_on_batch(
+                x_batch,
+                y_batch,
+                y_pred,
+                train_optimizer=train_optimizer,
+                return_dict=True,
+            )
+            epoch_iterator.on_step_end(data)
+            callbacks.on_train_batch_end(step, batch_logs)
+            return batch_logs
+
+        try:
+            for step, iterator in epoch_iterator:
+                data = iterator[0]
+                x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
+                callbacks.on_train_batch_begin(step)
+                inference = asyncio.ensure_future(self._predict_on_batch_staged(x_batch))
+                pending.append((step, iterator, x_batch, y_batch, inference))
+                if len(pending) > max_staleness:
+                    logs = await optimize_next_batch()
+                    if self.stop_training:
+                        break
+            while pending and not self.stop_training:
+                logs = await optimize_next_batch()
+        finally:
+            # The predictions of the cancelled batches are never committed
+            inferences = [inference for *_, inference in pending]
+            for inference in inferences:
+                inference.cancel()
+            await asyncio.gather(*inferences, return_exceptions=True)
+        return logs
+
     async def test_on_batch(
         self,
         x,
@@ -1,6 +1,9 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from synalinks.src import metrics
@@ -10,7 +13,10 @@ from synalinks.src import programs
 from synalinks.src import rewards
 from synalinks.src import testing
 from synalinks.src.backend import JsonDataModel
+from synalinks.src.datasets.columnar_dataset import ColumnarDataset
+from synalinks.src.datasets.streaming_dataset import StreamingDataset
 from synalinks.src.language_models import LanguageModel
+from synalinks.src.metrics.f_score_metrics import F1Score
 from synalinks.src.testing.test_utils import AnswerWithRationale
 from synalinks.src.testing.test_utils import Query
 from synalinks.src.testing.test_utils import load_test_data
@@ -112,6 +118,40 @@ class TestTrainer(testing.TestCase):
         self.assertEqual(result_metrics[0], 0.5)
         self.assertEqual(result_metrics[1], 0.5)
 
+    @patch("litellm.acompletion")
+    async def test_test_on_batch_scoring_concurrency(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+            metrics=[
+                metrics.MeanMetricWrapper(rewards.exact_match, in_mask=["answer"]),
+                F1Score(in_mask=["answer"]),
+            ],
+            scoring_concurrency=1,
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        result_metrics = await program.test_on_batch(x_test, y_test, return_dict=True)
+        self.assertEqual(result_metrics["reward"], 0.5)
+        self.assertEqual(result_metrics["mean_metric_wrapper"], 0.5)
+        self.assertIn("f1_score", result_metrics)
+
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            program.compile(reward=rewards.ExactMatch(), scoring_concurrency=0)
+
     @patch("litellm.acompletion")
     async def test_evaluate(self, mock_completion):
         mock_answer = AnswerWithRationale(
@@ -170,3 +210,205 @@ class TestTrainer(testing.TestCase):
         self.assertEqual(len(y_data), 2)
         self.assertIsInstance(y_data[0], JsonDataModel)
         self.assertIsInstance(y_data[1], JsonDataModel)
+
+    @patch("synalinks.src.trainers.trainer.ProcessPoolExecutor")
+    @patch("litellm.acompletion")
+    async def test_evaluate_and_predict_sharded(self, mock_completion, mock_executor):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+        # Run the workers in threads so they share the mocked language model
+        workers = []
+
+        def executor(max_workers=None, mp_context=None):
+            workers.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        mock_executor.side_effect = executor
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+            metrics=[
+                metrics.MeanMetricWrapper(rewards.exact_match, in_mask=["answer"]),
+                F1Score(in_mask=["answer"]),
+            ],
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        expected = await program.evaluate(x=x_test, y=y_test, verbose=0)
+        result = await program.evaluate(x=x_test, y=y_test, verbose=0, num_workers=2)
+        self.assertEqual(workers, [2])
+        self.assertEqual(result["reward"], 0.5)
+        self.assertEqual(result, expected)
+
+        y_data = await program.predict(x=x_train, verbose=0, num_workers=2)
+        self.assertEqual(len(y_data), 2)
+        self.assertEqual(y_data[0].get_json(), mock_answer.get_json())
+        self.assertEqual(y_data[1].get_json(), mock_answer.get_json())
+
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            await program.predict(x=x_train, num_workers=0)
+
+    @patch("litellm.acompletion")
+    async def test_fit_pipelined(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+        events = []
+
+        async def completion(*args, **kwargs):
+            events.append("inference")
+            return {
+                "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+            }
+
+        mock_completion.side_effect = completion
+
+        class SlowOptimizer(optimizers.RandomFewShot):
+            async def optimize(self, trainable_variable, reward=None, training=False):
+                events.append("optimize")
+                await asyncio.sleep(0.01)
+                await super().optimize(
+                    trainable_variable, reward=reward, training=training
+                )
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=SlowOptimizer(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        with self.assertRaisesRegex(ValueError, "should be positive"):
+            await program.fit(x=x_train, y=y_train, max_staleness=-1)
+
+        history = await program.fit(
+            x=x_train,
+            y=y_train,
+            batch_size=1,
+            epochs=2,
+            verbose=0,
+            max_staleness=1,
+        )
+        self.assertEqual(history.history["reward"], [0.5, 0.5])
+        # The inference of the second batch runs before the first optimizer step
+        self.assertEqual(events[:3], ["inference", "inference", "optimize"])
+        self.assertEqual(events.count("optimize"), 4)
+        # All the predictions were committed and rewarded
+        variable = program.trainable_variables[0]
+        self.assertEqual(variable.get("predictions_seen"), 0)
+        for prediction in variable.get("predictions"):
+            self.assertIsNotNone(prediction["reward"])
+
+    @patch("litellm.acompletion")
+    async def test_fit_with_columnar_dataset(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        history = await program.fit(
+            x=ColumnarDataset(x_train, y_train),
+            validation_data=ColumnarDataset(x_test, y_test),
+            epochs=2,
+            verbose=0,
+        )
+        self.assertEqual(len(history.history["reward"]), 2)
+        self.assertEqual(history.history["val_reward"], [0.5, 0.5])
+
+        y_data = await program.predict(x=ColumnarDataset(x_test), verbose=0)
+        self.assertEqual(len(y_data), 2)
+        self.assertIsInstance(y_data[0], JsonDataModel)
+
+    @patch("litellm.acompletion")
+    async def test_fit_with_streaming_dataset(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+        paths = []
+        for name, x, y in [("train", x_train, y_train), ("test", x_test, y_test)]:
+            path = os.path.join(self.get_temp_dir(), f"{name}.jsonl")
+            with open(path, "w") as f:
+                for inputs, targets in zip(x, y):
+                    record = {"inputs": inputs.get_json(), "outputs": targets.get_json()}
+                    f.write(json.dumps(record) + "\n")
+            paths.append(path)
+
+        def dataset(path, targets=True):
+            return StreamingDataset(
+                path,
+                input_data_model=Query,
+                output_data_model=AnswerWithRationale if targets else None,
+                input_key="inputs",
+                output_key="outputs",
+            )
+
+        train_dataset = dataset(paths[0])
+        val_dataset = dataset(paths[1])
+        history = await program.fit(
+            x=train_dataset,
+            validation_data=val_dataset,
+            epochs=2,
+            batch_size=1,
+            verbose=0,
+        )
+        self.assertEqual(len(history.history["reward"]), 2)
+        self.assertEqual(history.history["val_reward"], [0.5, 0.5])
+        self.assertEqual(train_dataset.get_state()["epoch"], 2)
+        self.assertEqual(train_dataset.get_state()["position"], 0)
+        # The evaluation doesn't change the position of the datasets
+        self.assertEqual(val_dataset.get_state()["epoch"], 0)
+        self.assertEqual(val_dataset.get_state()["position"], 0)
+
+        train_dataset.set_state({"epoch": 2, "position": 1})
+        result = await program.evaluate(x=train_dataset, batch_size=1, verbose=0)
+        self.assertEqual(result["reward"], 0.5)
+        self.assertEqual(train_dataset.get_state()["epoch"], 2)
+        self.assertEqual(train_dataset.get_state()["position"], 1)
+
+        y_data = await program.predict(x=dataset(paths[1], targets=False), verbose=0)
+        self.assertEqual(len(y_data), 2)
+        self.assertIsInstance(y_data[0], JsonDataModel)
@@ -5,6 +5,9 @@ from typing import AsyncIterator
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.utils.async_utils import create_task
+from synalinks.src.utils.mcp.session_pool import DEFAULT_HEALTH_CHECK_INTERVAL
+from synalinks.src.utils.mcp.session_pool import DEFAULT_POOL_SIZE
+from synalinks.src.utils.mcp.session_pool import SessionPool
 from synalinks.src.utils.mcp.sessions import ClientSession
 from synalinks.src.utils.mcp.sessions import Connection
 from synalinks.src.utils.mcp.sessions import McpHttpClientFactory
@@ -42,14 +45,31 @@ class MultiServerMCPClient:
     def __init__(
         self,
         connections: dict[str, Connection] | None = None,
+        *,
+        pool_size: int | None = DEFAULT_POOL_SIZE,
+        health_check_interval: float | None = DEFAULT_HEALTH_CHECK_INTERVAL,
+        cache_tools: bool = True,
     ) -> None:
         """Initialize a MultiServerMCPClient with MCP servers connections.
 
+        By default, the tools reuse long-lived sessions (up to `pool_size`
+        sessions per server), that are health-checked and reconnected on
+        failure, and the list of tools of each server is cached. The cache is
+        invalidated when a server notifies that its tools changed, or with
+        `invalidate_tools()`. Use `close()` to close the sessions.
+
         Args:
             connections: A dictionary mapping server names to connection configurations.
                 If None, no initial connections are established.
+            pool_size: The maximum number of sessions per server, None to start
+                a new session on each tool call (Default to 1)
+            health_check_interval: The idle duration in seconds after which a
+                pooled session is pinged before being reused, None to disable
+                the health checks (Default to 30)
+            cache_tools: Whether to cache the list of tools of each server
+                (Default to True)
 
-        Example: basic usage (starting a new session on each tool call)
+        Example: basic usage (reusing a session per server across the tool calls)
 
         ```python
         import synalinks
@@ -71,6 +91,8 @@ class MultiServerMCPClient:
             }
         )
         all_tools = await client.get_tools()
+        # ... when done with the tools
+        await client.close()
         ```
 
         Example: explicitly starting a session
@@ -91,7 +113,57 @@ class MultiServerMCPClient:
                 "MCP server names in the connections mapping must be unique."
             )
 
+        if pool_size is not None and pool_size < 1:
+            raise ValueError(
+                f"The `pool_size` argument should be at least 1, received: {pool_size}"
+            )
+
         self.connections: dict[str, Connection] = connections
+        self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
+        self.cache_tools = cache_tools
+        self._session_pools: dict[str, SessionPool] = {}
+        self._tools_cache: dict[tuple[str, bool], list[Tool]] = {}
+
+    def _check_server_name(self, server_name: str) -> None:
+        if server_name not in self.connections:
+            raise ValueError(
+                f"Couldn't find a server with name '{server_name}', "
+                f"expected one of '{list(self.connections.keys())}'"
+            )
+
+    def _get_session_pool(self, server_name: str) -> SessionPool | None:
+        if self.pool_size is None:
+            return None
+        if server_name not in self._session_pools:
+            self._session_pools[server_name] = SessionPool(
+                self.connections[server_name],
+                pool_size=self.pool_size,
+                health_check_interval=self.health_check_interval,
+                on_tools_changed=lambda: self.invalidate_tools(server_name),
+            )
+        return self._session_pools[server_name]
+
+    def invalidate_tools(self, server_name: str | None = None) -> None:
+        """Invalidate the cached list of tools.
+
+        Args:
+            server_name: Optional name of the server to invalidate the tools of.
+                If None, the tools of all servers are invalidated (default).
+        """
+        if server_name is None:
+            self._tools_cache.clear()
+            return
+        for key in list(self._tools_cache):
+            if key[0] == server_name:
+                del self._tools_cache[key]
+
+    async def close(self) -> None:
+        """Close the pooled sessions of all servers."""
+        session_pools = list(self._session_pools.values())
+        self._session_pools = {}
+        for session_pool in session_pools:
+            await session_pool.close()
 
     @asynccontextmanager
     async def session(
@@ -110,13 +182,16 @@ class MultiServerMCPClient:
             ValueError: If the server name is not found in the connections
 
         Yields:
-            An initialized ClientSession
+            An initialized ClientSession (borrowed from the pool of the
+            server if the sessions are pooled and `auto_initialize` is True)
         """
-        if server_name not in self.connections:
-            raise ValueError(
-                f"Couldn't find a server with name '{server_name}', "
-                f"expected one of '{list(self.connections.keys())}'"
-            )
+        self._check_server_name(server_name)
+
+        session_pool = self._get_session_pool(server_name)
+        if session_pool is not None and auto_initialize:
+            async with session_pool.session() as session:
+                yield session
+            return
 
         async with create_session(self.connections[server_name]) as session:
             if auto_initialize:
@@ -130,31 +205,40 @@ class MultiServerMCPClient:
             server_name: Optional name of the server to get tools from.
                 If None, all tools from all servers will be returned (default).
 
-        NOTE: a new session will be created for each tool call
+        NOTE: if the sessions are not pooled, a new session will be created
+        for each tool call
 
         Returns:
             A list of Synalinks tools
         """
         if server_name is not None:
-            if server_name not in self.connections:
-                raise ValueError(
-                    f"Couldn't find a server with name '{server_name}', "
-                    f"expected one of '{list(self.connections.keys())}'"
-                )
-            return await load_mcp_tools(None, connection=self.connections[server_name])
+            self._check_server_name(server_name)
+            return await self._load_tools(server_name, namespaced=False)
 
         all_tools: list[Tool] = []
         load_mcp_tool_tasks = []
-        for namespace, connection in self.connections.items():
-            load_mcp_tool_task = create_task(
-                load_mcp_tools(None, connection=connection, namespace=namespace)
-            )
+        for namespace in self.connections:
+            load_mcp_tool_task = create_task(self._load_tools(namespace, namespaced=True))
             load_mcp_tool_tasks.append(load_mcp_tool_task)
         tools_list = await asyncio.gather(*load_mcp_tool_tasks)
         for tools in tools_list:
             all_tools.extend(tools)
         return all_tools
 
+    async def _load_tools(self, server_name: str, namespaced: bool) -> list[Tool]:
+        key = (server_name, namespaced)
+        if self.cache_tools and key in self._tools_cache:
+            return list(self._tools_cache[key])
+        tools = await load_mcp_tools(
+            None,
+            connection=self.connections[server_name],
+            namespace=server_name if namespaced else None,
+            session_pool=self._get_session_pool(server_name),
+        )
+        if self.cache_tools:
+            self._tools_cache[key] = tools
+        return list(tools)
+
     async def __aenter__(self) -> "MultiServerMCPClient":
         raise NotImplementedError(ASYNC_CONTEXT_MANAGER_ERROR)
 
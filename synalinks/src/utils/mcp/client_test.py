@@ -1,8 +1,11 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
 import platform
 import unittest
+from unittest.mock import patch
 
+import anyio
 import httpx
 from mcp.server import FastMCP
 from mcp.types import ToolAnnotations
@@ -204,3 +207,94 @@ class MCPClientIntegrationTest(testing.TestCase):
         )
         result = await namespaced_time_tool()
         self.assertEqual(result["response"], "5:20:00 PM EST")
+
+    async def test_pooled_sessions_are_reused(self):
+        """Test that the tool calls reuse the pooled session of the server."""
+        client = MultiServerMCPClient({"math": self.math_connection})
+
+        tools = await client.get_tools(server_name="math")
+        add_tool = next(tool for tool in tools if tool.name == "add_numbers")
+        results = await asyncio.gather(*[add_tool(a=i, b=1) for i in range(5)])
+        self.assertEqual([r["response"] for r in results], ["1", "2", "3", "4", "5"])
+
+        session_pool = client._session_pools["math"]
+        self.assertEqual(len(session_pool._sessions), 1)
+        pooled = session_pool._sessions[0]
+        self.assertEqual(pooled.in_flight, 0)
+
+        async with client.session("math") as session:
+            self.assertIs(session, pooled.session)
+
+        # A closed session is replaced by a new one
+        await pooled.close()
+        result = await add_tool(a=2, b=2)
+        self.assertEqual(result["response"], "4")
+        self.assertEqual(len(session_pool._sessions), 1)
+        self.assertIsNot(session_pool._sessions[0], pooled)
+
+        await client.close()
+        self.assertEqual(client._session_pools, {})
+
+    async def test_pooled_call_tool_retries(self):
+        """Test that only the calls that were never sent are retried."""
+        client = MultiServerMCPClient({"math": self.math_connection})
+        session_pool = client._get_session_pool("math")
+
+        async with session_pool.session() as session:
+            pass
+        with patch.object(
+            session, "call_tool", side_effect=anyio.ClosedResourceError()
+        ) as mock_call_tool:
+            result = await session_pool.call_tool("add_numbers", {"a": 1, "b": 2})
+        self.assertEqual(mock_call_tool.call_count, 1)
+        self.assertEqual(result.content[0].text, "3")
+        self.assertEqual(len(session_pool._sessions), 1)
+        self.assertIsNot(session_pool._sessions[0].session, session)
+
+        session = session_pool._sessions[0].session
+        with patch.object(
+            session, "call_tool", side_effect=RuntimeError("Connection lost")
+        ) as mock_call_tool:
+            with self.assertRaisesRegex(RuntimeError, "Connection lost"):
+                await session_pool.call_tool("add_numbers", {"a": 1, "b": 2})
+        self.assertEqual(mock_call_tool.call_count, 1)
+        self.assertIs(session_pool._sessions[0].session, session)
+        await client.close()
+
+    async def test_tools_are_cached(self):
+        """Test that the list of tools is cached until invalidated."""
+        client = MultiServerMCPClient(
+            {"math": self.math_connection, "time": self.time_connection}
+        )
+
+        tools = await client.get_tools(server_name="math")
+        cached_tools = await client.get_tools(server_name="math")
+        self.assertEqual(len(cached_tools), 2)
+        self.assertTrue(all(a is b for a, b in zip(tools, cached_tools)))
+
+        all_tools = await client.get_tools()
+        self.assertEqual(len(all_tools), 3)
+
+        client.invalidate_tools("math")
+        self.assertIn(("time", True), client._tools_cache)
+        self.assertNotIn(("math", False), client._tools_cache)
+        new_tools = await client.get_tools(server_name="math")
+        self.assertIsNot(new_tools[0], tools[0])
+        await client.close()
+
+    async def test_without_session_pool(self):
+        """Test that a new session is created on each call without pool."""
+        client = MultiServerMCPClient(
+            {"math": self.math_connection},
+            pool_size=None,
+            cache_tools=False,
+        )
+        tools = await client.get_tools(server_name="math")
+        add_tool = next(tool for tool in tools if tool.name == "add_numbers")
+        result = await add_tool(a=1, b=2)
+        self.assertEqual(result["response"], "3")
+        self.assertEqual(client._session_pools, {})
+        self.assertEqual(client._tools_cache, {})
+
+        with self.assertRaisesRegex(ValueError, "pool_size"):
+            MultiServerMCPClient({"math": self.math_connection}, pool_size=0)
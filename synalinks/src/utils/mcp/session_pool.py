@@ -0,0 +1,239 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from typing import Any
+from typing import AsyncIterator
+
+import anyio
+from mcp import ClientSession
+from mcp.types import CallToolResult
+from mcp.types import ServerNotification
+from mcp.types import ToolListChangedNotification
+
+from synalinks.src.utils.async_utils import create_task
+from synalinks.src.utils.mcp.sessions import Connection
+from synalinks.src.utils.mcp.sessions import create_session
+
+DEFAULT_POOL_SIZE = 1
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+DEFAULT_HEALTH_CHECK_TIMEOUT = 5.0
+
+
+class _PooledSession:
+    """A long-lived session, kept open by a background task.
+
+    The session context is entered and exited by the same task (as required
+    by the MCP transports), while the session itself can be used by any task
+    of the event loop.
+    """
+
+    def __init__(self) -> None:
+        self.session: ClientSession | None = None
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def open(self, connection: Connection) -> None:
+        ready = asyncio.get_running_loop().create_future()
+
+        async def _run() -> None:
+            try:
+                async with create_session(connection) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await self._closing.wait()
+            except BaseException as e:
+                if not ready.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        ready.cancel()
+                    else:
+                        ready.set_exception(e)
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+
+        self._task = create_task(_run())
+        self.session = await ready
+
+    def is_alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def check_health(self, interval: float | None) -> bool:
+        """Ping the server if the session was idle for more than `interval`."""
+        if not self.is_alive():
+            return False
+        if interval is None or time.monotonic() - self.last_used < interval:
+            return True
+        try:
+            await asyncio.wait_for(
+                self.session.send_ping(), timeout=DEFAULT_HEALTH_CHECK_TIMEOUT
+            )
+        except Exception:
+            return False
+        self.last_used = time.monotonic()
+        return True
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            with contextlib.suppress(BaseException):
+                await self._task
+            self._task = None
+
+
+class SessionPool:
+    """A pool of long-lived sessions to an MCP server.
+
+    The sessions are opened on demand, up to `pool_size` sessions, and reused
+    across the calls. As the MCP requests are multiplexed, a session can serve
+    several concurrent calls: a new session is only opened when all the
+    sessions of the pool are busy. The sessions idle for more than
+    `health_check_interval` seconds are pinged before being reused, and the
+    broken sessions are replaced by new ones.
+
+    The sessions are bound to the event loop that opened them. When used from
+    another event loop, the pool starts over with new sessions.
+
+    Args:
+        connection: Connection config to use to connect to the server
+        pool_size: The maximum number of sessions (Default to 1)
+        health_check_interval: The idle duration in seconds after which a
+            session is pinged before being reused, None to disable the health
+            checks (Default to 30)
+        on_tools_changed: Optional callback called when the server notifies
+            that its list of tools changed
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        health_check_interval: float | None = DEFAULT_HEALTH_CHECK_INTERVAL,
+        on_tools_changed: Callable[[], None] | None = None,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(
+                f"The `pool_size` argument should be at least 1, received: {pool_size}"
+            )
+        self.connection = connection
+        self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
+        self.on_tools_changed = on_tools_changed
+        self._sessions: list[_PooledSession] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+
+    def _get_connection(self) -> Connection:
+        if self.on_tools_changed is None:
+            return self.connection
+        session_kwargs = dict(self.connection.get("session_kwargs") or {})
+        message_handler = session_kwargs.get("message_handler")
+
+        async def _message_handler(message: Any) -> None:
+            if isinstance(message, ServerNotification) and isinstance(
+                message.root, ToolListChangedNotification
+            ):
+                self.on_tools_changed()
+            if message_handler is not None:
+                await message_handler(message)
+
+        session_kwargs["message_handler"] = _message_handler
+        return {**self.connection, "session_kwargs": session_kwargs}
+
+    def _check_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The sessions of another event loop can't be used (nor closed)
+            self._sessions = []
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+    async def _acquire(self) -> _PooledSession:
+        self._check_loop()
+        async with self._lock:
+            self._sessions = [s for s in self._sessions if s.is_alive()]
+            if len(self._sessions) < self.pool_size and not any(
+                s.in_flight == 0 for s in self._sessions
+            ):
+                pooled = await self._open()
+            else:
+                pooled = min(self._sessions, key=lambda s: s.in_flight)
+                if not await pooled.check_health(self.health_check_interval):
+                    await self._discard(pooled)
+                    pooled = await self._open()
+            pooled.in_flight += 1
+            return pooled
+
+    def _release(self, pooled: _PooledSession) -> None:
+        pooled.in_flight -= 1
+        pooled.last_used = time.monotonic()
+
+    async def _open(self) -> _PooledSession:
+        pooled = _PooledSession()
+        await pooled.open(self._get_connection())
+        self._sessions.append(pooled)
+        return pooled
+
+    async def _discard(self, pooled: _PooledSession) -> None:
+        if pooled in self._sessions:
+            self._sessions.remove(pooled)
+        await pooled.close()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """Borrow an initialized session from the pool.
+
+        The session is returned to the pool (not closed) on exit.
+
+        Yields:
+            An initialized ClientSession
+        """
+        pooled = await self._acquire()
+        try:
+            yield pooled.session
+        finally:
+            self._release(pooled)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> CallToolResult:
+        """Call a tool using a pooled session.
+
+        If the request can't be sent because the session is already closed
+        or broken, the session is replaced and the call is retried once with
+        a new one. As the request never reached the server, the tool is not
+        run twice. Any other error (including the errors returned by the
+        server, or a connection lost while the tool runs) is raised as is,
+        without retrying, as the tool might have already run.
+
+        Note: The `Tool` wrapping a MCP tool still retries the failed calls
+        (e.g. on a timeout of the server), so the pooled tools with side
+        effects should be idempotent.
+
+        Args:
+            name: The name of the tool
+            arguments: The arguments of the tool
+
+        Returns:
+            The result of the tool call
+        """
+        for attempt in range(2):
+            pooled = await self._acquire()
+            try:
+                return await pooled.session.call_tool(name, arguments)
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                await self._discard(pooled)
+                if attempt > 0:
+                    raise
+            finally:
+                self._release(pooled)
+
+    async def close(self) -> None:
+        """Close all the sessions of the pool."""
+        if self._loop is not asyncio.get_running_loop():
+            self._sessions = []
+            return
+        sessions, self._sessions = self._sessions, []
+        for pooled in sessions:
+            await pooled.close()
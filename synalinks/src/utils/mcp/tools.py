@@ -9,6 +9,7 @@ from mcp.types import ImageContent
 from mcp.types import TextContent
 from mcp.types import Tool as MCPTool
 
+from synalinks.src.utils.mcp.session_pool import SessionPool
 from synalinks.src.utils.mcp.sessions import Connection
 from synalinks.src.utils.mcp.sessions import create_session
 from synalinks.src.utils.tool_utils import Tool
@@ -104,6 +105,7 @@ def _create_async_function_from_mcp_tool(
     session: ClientSession | None,
     connection: Connection | None = None,
     namespace: str | None = None,
+    session_pool: SessionPool | None = None,
 ) -> typing.Coroutine:
     """Create a dynamic async function from an MCP tool
     that can be wrapped by Synalinks tool.
@@ -156,7 +158,12 @@ def _create_async_function_from_mcp_tool(
     async def dynamic_function(**kwargs):
         filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
 
-        if session is None:
+        if session is None and session_pool is not None:
+            # will reuse a session of the pool
+            call_tool_result = await session_pool.call_tool(
+                mcp_tool.name, filtered_kwargs
+            )
+        elif session is None:
             # will create a session one on the fly
             async with create_session(connection) as tool_session:
                 await tool_session.initialize()
@@ -199,6 +206,7 @@ def convert_mcp_tool_to_synalinks_tool(
     *,
     connection: Connection | None = None,
     namespace: str | None = None,
+    session_pool: SessionPool | None = None,
 ) -> Tool:
     """Convert an MCP tool to a Synalinks tool.
 
@@ -210,15 +218,19 @@ def convert_mcp_tool_to_synalinks_tool(
         connection: Optional connection config to use to create a new session
                     if a `session` is not provided
         namespace: Optional namespace to use for the tool name, if provided
+        session_pool: Optional pool of sessions to use to call the tool
+                      if a `session` is not provided
 
     Returns:
         A Synalinks tool that wraps the MCP tool functionality
     """
-    if session is None and connection is None:
-        raise ValueError("Either a session or a connection config must be provided")
+    if session is None and connection is None and session_pool is None:
+        raise ValueError(
+            "Either a session, a connection config or a session pool must be provided"
+        )
 
     function = _create_async_function_from_mcp_tool(
-        tool, session, connection, namespace=namespace
+        tool, session, connection, namespace=namespace, session_pool=session_pool
     )
     return Tool(function)
 
@@ -228,16 +240,30 @@ async def load_mcp_tools(
     *,
     connection: Connection | None = None,
     namespace: str | None = None,
+    session_pool: SessionPool | None = None,
 ) -> list[Tool]:
     """Load all available MCP tools and convert them to Synalinks tools.
 
+    Args:
+        session: MCP client session
+        connection: Optional connection config to use to create a new session
+                    if a `session` is not provided
+        namespace: Optional namespace to use for the tool names, if provided
+        session_pool: Optional pool of sessions to use to list and call the tools
+                      if a `session` is not provided
+
     Returns:
         A list of Synalinks tools with correct signature, annotations and schemas
     """
-    if session is None and connection is None:
-        raise ValueError("Either a session or a connection config must be provided")
+    if session is None and connection is None and session_pool is None:
+        raise ValueError(
+            "Either a session, a connection config or a session pool must be provided"
+        )
 
-    if session is None:
+    if session is None and session_pool is not None:
+        async with session_pool.session() as tool_session:
+            tools = await _list_all_tools(tool_session)
+    elif session is None:
         # will create a session one on the fly
         async with create_session(connection) as tool_session:
             await tool_session.initialize()
@@ -247,7 +273,11 @@ async def load_mcp_tools(
 
     converted_tools = [
         convert_mcp_tool_to_synalinks_tool(
-            session, tool, connection=connection, namespace=namespace
+            session,
+            tool,
+            connection=connection,
+            namespace=namespace,
+            session_pool=session_pool,
         )
         for tool in tools
     ]
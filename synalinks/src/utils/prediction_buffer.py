@@ -0,0 +1,157 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import contextlib
+import contextvars
+import heapq
+import random
+
+# The predictions recorded in the current context, when they are staged
+_staged_predictions = contextvars.ContextVar("staged_predictions", default=None)
+
+
+def _reward_key(prediction):
+    reward = prediction.get("reward")
+    return reward if reward is not None else float("-inf")
+
+
+def add_prediction(variable, prediction, max_predictions=None):
+    """Add an unrewarded prediction to the predictions buffer of a variable.
+
+    The unrewarded predictions (the ones made since the last optimization step)
+    are kept in a bounded reservoir: once `max_predictions` of them are buffered,
+    each new prediction replaces a random one with a probability that keeps the
+    buffer an uniform sample of all the predictions seen (reservoir sampling).
+
+    If the variable has a `predictions_seen` field, it is used to count the
+    predictions seen since the last optimization step.
+
+    Inside a `stage_predictions()` context, the prediction is recorded instead
+    and only added when the staged predictions are committed.
+
+    Args:
+        variable (Variable): The variable holding the `predictions` list.
+        prediction (dict): The JSON of the prediction to add.
+        max_predictions (int): Optional. The max number of unrewarded
+            predictions to keep (Default to None, unbounded).
+    """
+    staged_predictions = _staged_predictions.get()
+    if staged_predictions is not None:
+        staged_predictions.append((variable, prediction, max_predictions))
+        return
+    predictions = variable.get("predictions")
+    seen = variable.get("predictions_seen")
+    if seen is None:
+        pending = [i for i, p in enumerate(predictions) if p.get("reward") is None]
+        seen = len(pending)
+    elif max_predictions:
+        pending = range(
+            len(predictions) - min(seen, max_predictions, len(predictions)),
+            len(predictions),
+        )
+    else:
+        pending = ()
+    if not max_predictions or len(pending) < max_predictions:
+        predictions.append(prediction)
+    else:
+        index = random.randint(0, seen)
+        if index < max_predictions:
+            predictions[pending[index]] = prediction
+    if variable.get("predictions_seen") is not None:
+        variable.update({"predictions_seen": seen + 1})
+
+
+def reward_predictions(variable, reward, max_predictions=None):
+    """Assign a reward to the unrewarded predictions of a variable.
+
+    The predictions are then kept sorted by decreasing reward, so the
+    best predictions can be read in O(k) with `get_best_predictions()`.
+    If `max_predictions` is provided, only the best ones are kept.
+
+    Args:
+        variable (Variable): The variable holding the `predictions` list.
+        reward (float): The reward to assign.
+        max_predictions (int): Optional. The max number of rewarded
+            predictions to keep (Default to None, keep all of them).
+
+    Returns:
+        (int): The number of predictions that were rewarded.
+    """
+    predictions = variable.get("predictions")
+    rewarded = 0
+    for prediction in predictions:
+        if prediction.get("reward") is None:
+            prediction["reward"] = reward
+            rewarded += 1
+    if rewarded > 0:
+        if max_predictions:
+            predictions = heapq.nlargest(max_predictions, predictions, key=_reward_key)
+        else:
+            predictions = sorted(predictions, key=_reward_key, reverse=True)
+        variable.update({"predictions": predictions})
+        if variable.get("predictions_seen") is not None:
+            variable.update({"predictions_seen": 0})
+    return rewarded
+
+
+def get_best_predictions(variable, k):
+    """Returns the k best rewarded predictions of a variable.
+
+    Args:
+        variable (Variable): The variable holding the `predictions` list
+            (sorted by `reward_predictions()`).
+        k (int): The number of predictions to return.
+
+    Returns:
+        (list): The k best predictions.
+    """
+    return variable.get("predictions")[:k]
+
+
+def clear_predictions(variable):
+    """Empty the predictions buffer of a variable.
+
+    Args:
+        variable (Variable): The variable holding the `predictions` list.
+    """
+    variable.update({"predictions": []})
+    if variable.get("predictions_seen") is not None:
+        variable.update({"predictions_seen": 0})
+
+
+@contextlib.contextmanager
+def stage_predictions():
+    """Stage the predictions added in the current context.
+
+    The predictions added with `add_prediction()` inside this context (and in
+    the tasks it creates) are kept aside, allowing to run the inference of a
+    batch while the variables are still being optimized with the rewards of
+    a previous batch. Use `commit_predictions()` to add them to the variables.
+
+    Example:
+
+    ```python
+    with stage_predictions() as staged_predictions:
+        y_pred = await program(x, training=True)
+    # ...
+    commit_predictions(staged_predictions)
+    ```
+
+    Yields:
+        (list): The staged predictions.
+    """
+    staged_predictions = []
+    token = _staged_predictions.set(staged_predictions)
+    try:
+        yield staged_predictions
+    finally:
+        _staged_predictions.reset(token)
+
+
+def commit_predictions(staged_predictions):
+    """Add staged predictions to their variables, in the order they were made.
+
+    Args:
+        staged_predictions (list): The predictions staged by `stage_predictions()`.
+    """
+    for variable, prediction, max_predictions in staged_predictions:
+        add_prediction(variable, prediction, max_predictions=max_predictions)
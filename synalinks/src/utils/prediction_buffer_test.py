@@ -0,0 +1,99 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+from typing import List
+
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.backend import Prediction
+from synalinks.src.backend import Variable
+from synalinks.src.utils.prediction_buffer import add_prediction
+from synalinks.src.utils.prediction_buffer import clear_predictions
+from synalinks.src.utils.prediction_buffer import commit_predictions
+from synalinks.src.utils.prediction_buffer import get_best_predictions
+from synalinks.src.utils.prediction_buffer import reward_predictions
+from synalinks.src.utils.prediction_buffer import stage_predictions
+
+
+class PredictionsBuffer(DataModel):
+    predictions: List[Prediction] = []
+    predictions_seen: int = 0
+
+
+def make_prediction(i):
+    return Prediction(inputs={"i": i}, outputs={"i": i}).get_json()
+
+
+class PredictionBufferTest(testing.TestCase):
+    def test_bounded_unrewarded_predictions(self):
+        variable = Variable(
+            initializer=PredictionsBuffer().get_json(),
+            data_model=PredictionsBuffer,
+        )
+        for i in range(100):
+            add_prediction(variable, make_prediction(i), max_predictions=10)
+        self.assertEqual(len(variable.get("predictions")), 10)
+        self.assertEqual(variable.get("predictions_seen"), 100)
+
+        self.assertEqual(reward_predictions(variable, 0.5, max_predictions=5), 10)
+        self.assertEqual(len(variable.get("predictions")), 5)
+        self.assertEqual(variable.get("predictions_seen"), 0)
+        # Nothing left to reward
+        self.assertEqual(reward_predictions(variable, 0.5), 0)
+
+        clear_predictions(variable)
+        self.assertEqual(variable.get("predictions"), [])
+
+    def test_best_predictions_kept_sorted(self):
+        variable = Variable(
+            initializer=PredictionsBuffer().get_json(),
+            data_model=PredictionsBuffer,
+        )
+        for step, reward in enumerate([0.2, 0.9, 0.1, 0.5]):
+            for i in range(3):
+                add_prediction(variable, make_prediction(step * 3 + i))
+            reward_predictions(variable, reward, max_predictions=4)
+            # The rewarded predictions are not counted in the reservoir
+            add_prediction(variable, make_prediction(-1), max_predictions=1)
+            reward_predictions(variable, 0.0, max_predictions=4)
+
+        best = get_best_predictions(variable, 4)
+        self.assertEqual([p["reward"] for p in best], [0.9, 0.9, 0.9, 0.5])
+        self.assertEqual(len(variable.get("predictions")), 4)
+
+    def test_variable_without_counter(self):
+        class Predictions(DataModel):
+            predictions: List[Prediction] = []
+
+        variable = Variable(
+            initializer=Predictions().get_json(),
+            data_model=Predictions,
+        )
+        for i in range(20):
+            add_prediction(variable, make_prediction(i), max_predictions=5)
+        self.assertEqual(len(variable.get("predictions")), 5)
+        self.assertIsNone(variable.get("predictions_seen"))
+
+    async def test_stage_predictions(self):
+        variable = Variable(
+            initializer=PredictionsBuffer().get_json(),
+            data_model=PredictionsBuffer,
+        )
+
+        async def predict(i):
+            add_prediction(variable, make_prediction(i))
+
+        with stage_predictions() as staged_predictions:
+            # The tasks created in the context stage their predictions too
+            await asyncio.gather(predict(0), predict(1))
+        self.assertEqual(len(staged_predictions), 2)
+        self.assertEqual(variable.get("predictions"), [])
+
+        add_prediction(variable, make_prediction(2))
+        self.assertEqual(len(variable.get("predictions")), 1)
+
+        commit_predictions(staged_predictions)
+        self.assertEqual(
+            [p["inputs"]["i"] for p in variable.get("predictions")], [2, 0, 1]
+        )
+        self.assertEqual(variable.get("predictions_seen"), 3)
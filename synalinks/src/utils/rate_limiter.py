@@ -0,0 +1,413 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import collections
+import contextlib
+import json
+import random
+import time
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.backend.common.global_state import get_global_attribute
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+RETRYABLE_ERROR_NAMES = {
+    "RateLimitError",
+    "Timeout",
+    "APIConnectionError",
+    "ServiceUnavailableError",
+    "InternalServerError",
+}
+
+
+def is_rate_limit_error(exception):
+    """Returns whether the exception is a provider rate limit error (HTTP 429).
+
+    Args:
+        exception (Exception): The exception to check.
+
+    Returns:
+        (bool): True if the exception is a rate limit error.
+    """
+    if getattr(exception, "status_code", None) == 429:
+        return True
+    return type(exception).__name__ == "RateLimitError"
+
+
+def is_retryable_error(exception):
+    """Returns whether the exception is a transient error worth retrying.
+
+    Args:
+        exception (Exception): The exception to check.
+
+    Returns:
+        (bool): True if the exception is a transient error.
+    """
+    if isinstance(exception, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    if getattr(exception, "status_code", None) in RETRYABLE_STATUS_CODES:
+        return True
+    return type(exception).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def estimate_tokens(obj):
+    """Roughly estimates the number of tokens of a JSON-like object.
+
+    Uses the common heuristic of 4 characters per token, which is enough
+    to throttle the requests without loading a tokenizer.
+
+    Args:
+        obj (any): The JSON-like object (e.g. the messages or texts).
+
+    Returns:
+        (int): The estimated number of tokens.
+    """
+    if isinstance(obj, str):
+        return len(obj) // 4 + 1
+    return len(json.dumps(obj, default=str)) // 4 + 1
+
+
+def _wake_up(future):
+    if not future.done():
+        future.set_result(None)
+
+
+@synalinks_export(["synalinks.utils.RateLimiter", "synalinks.RateLimiter"])
+class RateLimiter:
+    """Limit the concurrency and the throughput of the calls to a provider.
+
+    A rate limiter is meant to be shared between the language models and the
+    embedding models that hit the same provider. It combines:
+
+    - A maximum number of requests in flight.
+    - A token bucket limiting the number of requests and tokens per minute.
+    - An exponential backoff with jitter used by the models between retries.
+    - An adaptive control of the concurrency: each rate limit error (HTTP 429)
+        halves the number of allowed requests in flight, which is then
+        increased again by one after each window of successful requests.
+
+    This way the throughput stays close to the provider's ceiling instead of
+    collapsing into retry storms when running large batches.
+
+    Example:
+
+    ```python
+    import synalinks
+
+    rate_limiter = synalinks.RateLimiter(
+        max_concurrency=32,
+        requests_per_minute=500,
+        tokens_per_minute=200_000,
+    )
+
+    language_model = synalinks.LanguageModel(
+        model="openai/gpt-4o-mini",
+        rate_limiter=rate_limiter,
+    )
+
+    embedding_model = synalinks.EmbeddingModel(
+        model="openai/text-embedding-3-small",
+        rate_limiter=rate_limiter,
+    )
+    ```
+
+    You can also register a rate limiter for every model of a provider
+    (or for every model if no provider is given) using
+    `synalinks.utils.set_rate_limiter()`.
+
+    Args:
+        max_concurrency (int): Optional. The maximum number of requests in flight
+            (Default to None, unbounded).
+        requests_per_minute (int): Optional. The maximum number of requests
+            per minute (Default to None, unbounded).
+        tokens_per_minute (int): Optional. The maximum number of (estimated) tokens
+            per minute (Default to None, unbounded).
+        adaptive (bool): Optional. Whether to shrink the concurrency when
+            rate limit errors are encountered (Default to True).
+        min_concurrency (int): Optional. The minimum number of requests in flight
+            when shrinking the concurrency (Default to 1).
+        backoff_base (float): Optional. The base delay in seconds of the
+            exponential backoff (Default to 1.0).
+        backoff_max (float): Optional. The maximum delay in seconds of the
+            exponential backoff (Default to 60.0).
+        jitter (bool): Optional. Whether to randomize the backoff delays
+            (Default to True).
+    """
+
+    def __init__(
+        self,
+        max_concurrency=None,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        adaptive=True,
+        min_concurrency=1,
+        backoff_base=1.0,
+        backoff_max=60.0,
+        jitter=True,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "The `max_concurrency` argument should be at least 1, "
+                f"received: {max_concurrency}"
+            )
+        if min_concurrency < 1:
+            raise ValueError(
+                "The `min_concurrency` argument should be at least 1, "
+                f"received: {min_concurrency}"
+            )
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.adaptive = adaptive
+        self.min_concurrency = min_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+
+        self.concurrency = max_concurrency
+        self.in_flight = 0
+        self.rate_limited = 0
+        self._successes = 0
+        self._waiters = collections.deque()
+        self._request_allowance = (
+            float(requests_per_minute) if requests_per_minute else None
+        )
+        self._token_allowance = float(tokens_per_minute) if tokens_per_minute else None
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._request_allowance = min(
+                float(self.requests_per_minute),
+                self._request_allowance + elapsed * self.requests_per_minute / 60.0,
+            )
+        if self.tokens_per_minute:
+            self._token_allowance = min(
+                float(self.tokens_per_minute),
+                self._token_allowance + elapsed * self.tokens_per_minute / 60.0,
+            )
+
+    def _budget_delay(self, tokens):
+        self._refill()
+        delay = 0.0
+        if self.requests_per_minute and self._request_allowance < 1.0:
+            delay = max(
+                delay,
+                (1.0 - self._request_allowance) * 60.0 / self.requests_per_minute,
+            )
+        if self.tokens_per_minute and tokens:
+            needed = min(tokens, self.tokens_per_minute)
+            if self._token_allowance < needed:
+                delay = max(
+                    delay,
+                    (needed - self._token_allowance) * 60.0 / self.tokens_per_minute,
+                )
+        return delay
+
+    def _has_free_slot(self):
+        return self.concurrency is None or self.in_flight < self.concurrency
+
+    def _wake_waiters(self):
+        available = (
+            len(self._waiters)
+            if self.concurrency is None
+            else self.concurrency - self.in_flight
+        )
+        while self._waiters and available > 0:
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            try:
+                future.get_loop().call_soon_threadsafe(_wake_up, future)
+            except RuntimeError:
+                # The loop of the waiter is closed.
+                continue
+            available -= 1
+
+    async def acquire(self, tokens=0):
+        """Wait for a free slot and for enough budget to send a request.
+
+        Args:
+            tokens (int): Optional. The estimated number of tokens of the request.
+        """
+        while not self._has_free_slot():
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+                raise
+        self.in_flight += 1
+        try:
+            delay = self._budget_delay(tokens)
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = self._budget_delay(tokens)
+            if self.requests_per_minute:
+                self._request_allowance -= 1.0
+            if self.tokens_per_minute and tokens:
+                self._token_allowance -= min(tokens, self.tokens_per_minute)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        """Release the slot acquired with `acquire()`."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake_waiters()
+
+    def on_success(self):
+        """Notify a successful request, slowly increasing the concurrency."""
+        if not self.adaptive or self.concurrency is None:
+            return
+        if self.max_concurrency is not None and self.concurrency >= self.max_concurrency:
+            return
+        self._successes += 1
+        if self._successes >= self.concurrency:
+            self._successes = 0
+            self.concurrency += 1
+            self._wake_waiters()
+
+    def on_rate_limited(self):
+        """Notify a rate limit error, halving the concurrency."""
+        self.rate_limited += 1
+        if not self.adaptive:
+            return
+        current = self.concurrency
+        if current is None:
+            current = max(self.in_flight, self.min_concurrency)
+        self.concurrency = max(self.min_concurrency, current // 2)
+        self._successes = 0
+
+    @contextlib.asynccontextmanager
+    async def limit(self, tokens=0):
+        """Async context manager wrapping a request to the provider.
+
+        Acquires a slot, then releases it and updates the adaptive
+        concurrency depending on whether the request succeeded or was
+        rate limited.
+
+        Args:
+            tokens (int): Optional. The estimated number of tokens of the request.
+        """
+        await self.acquire(tokens=tokens)
+        try:
+            yield self
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.on_rate_limited()
+            raise
+        else:
+            self.on_success()
+        finally:
+            self.release()
+
+    def backoff_delay(self, attempt):
+        """Returns the delay to wait before retrying.
+
+        Args:
+            attempt (int): The index of the failed attempt (starting from 0).
+
+        Returns:
+            (float): The delay in seconds.
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        if self.jitter:
+            delay = random.uniform(0.0, delay)
+        return delay
+
+    async def backoff(self, attempt):
+        """Sleep for the backoff delay of the given attempt.
+
+        Args:
+            attempt (int): The index of the failed attempt (starting from 0).
+        """
+        await asyncio.sleep(self.backoff_delay(attempt))
+
+    def get_config(self):
+        return {
+            "max_concurrency": self.max_concurrency,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "adaptive": self.adaptive,
+            "min_concurrency": self.min_concurrency,
+            "backoff_base": self.backoff_base,
+            "backoff_max": self.backoff_max,
+            "jitter": self.jitter,
+        }
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_waiters"] = collections.deque()
+        return state
+
+    def __repr__(self):
+        return (
+            f"<RateLimiter concurrency={self.concurrency} "
+            f"in_flight={self.in_flight} rate_limited={self.rate_limited}>"
+        )
+
+
+@synalinks_export("synalinks.utils.set_rate_limiter")
+def set_rate_limiter(rate_limiter, provider=None):
+    """Register a rate limiter shared by the language and embedding models.
+
+    Example:
+
+    ```python
+    import synalinks
+
+    # Limit all the OpenAI calls
+    synalinks.utils.set_rate_limiter(
+        synalinks.RateLimiter(max_concurrency=32, requests_per_minute=500),
+        provider="openai",
+    )
+    # Limit all the other calls
+    synalinks.utils.set_rate_limiter(
+        synalinks.RateLimiter(max_concurrency=64),
+    )
+    ```
+
+    The rate limiter given to a model using its `rate_limiter` argument takes
+    precedence over the registered ones.
+
+    Args:
+        rate_limiter (RateLimiter): The rate limiter to register or `None`
+            to remove it.
+        provider (str): Optional. The provider (e.g. `"openai"`, `"ollama"`)
+            to register the rate limiter for. If `None`, the rate limiter
+            is used for every provider without a specific rate limiter.
+    """
+    rate_limiters = get_global_attribute("rate_limiters", {}, set_to_default=True)
+    if rate_limiter is None:
+        rate_limiters.pop(provider, None)
+    else:
+        rate_limiters[provider] = rate_limiter
+
+
+@synalinks_export("synalinks.utils.get_rate_limiter")
+def get_rate_limiter(provider=None):
+    """Returns the rate limiter registered for the given provider.
+
+    Args:
+        provider (str): Optional. The provider (e.g. `"openai"`, `"ollama"`).
+
+    Returns:
+        (RateLimiter): The rate limiter of the provider if any, otherwise
+            the global rate limiter if any, otherwise `None`.
+    """
+    rate_limiters = get_global_attribute("rate_limiters", {})
+    rate_limiter = rate_limiters.get(provider, None)
+    if rate_limiter is None:
+        rate_limiter = rate_limiters.get(None, None)
+    return rate_limiter
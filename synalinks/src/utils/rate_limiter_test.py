@@ -0,0 +1,129 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+from unittest.mock import patch
+
+import litellm
+
+from synalinks.src import testing
+from synalinks.src.backend import ChatMessage
+from synalinks.src.backend import ChatMessages
+from synalinks.src.backend import ChatRole
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.utils.rate_limiter import RateLimiter
+from synalinks.src.utils.rate_limiter import get_rate_limiter
+from synalinks.src.utils.rate_limiter import is_rate_limit_error
+from synalinks.src.utils.rate_limiter import is_retryable_error
+from synalinks.src.utils.rate_limiter import set_rate_limiter
+
+
+def rate_limit_error():
+    return litellm.RateLimitError(
+        message="Too many requests",
+        llm_provider="ollama",
+        model="mistral",
+    )
+
+
+class RateLimiterTest(testing.TestCase):
+    async def test_max_concurrency(self):
+        rate_limiter = RateLimiter(max_concurrency=2)
+        peak = {"in_flight": 0, "max": 0}
+
+        async def request():
+            async with rate_limiter.limit():
+                peak["in_flight"] += 1
+                peak["max"] = max(peak["max"], peak["in_flight"])
+                await asyncio.sleep(0.01)
+                peak["in_flight"] -= 1
+
+        await asyncio.gather(*[request() for _ in range(10)])
+        self.assertEqual(peak["max"], 2)
+        self.assertEqual(rate_limiter.in_flight, 0)
+
+    async def test_adaptive_concurrency(self):
+        rate_limiter = RateLimiter(max_concurrency=8)
+        with self.assertRaises(litellm.RateLimitError):
+            async with rate_limiter.limit():
+                raise rate_limit_error()
+        self.assertEqual(rate_limiter.concurrency, 4)
+        self.assertEqual(rate_limiter.rate_limited, 1)
+        for _ in range(4):
+            async with rate_limiter.limit():
+                pass
+        self.assertEqual(rate_limiter.concurrency, 5)
+
+    async def test_adaptive_concurrency_min(self):
+        rate_limiter = RateLimiter(max_concurrency=2, min_concurrency=1)
+        for _ in range(3):
+            rate_limiter.on_rate_limited()
+        self.assertEqual(rate_limiter.concurrency, 1)
+
+    async def test_requests_per_minute(self):
+        rate_limiter = RateLimiter(requests_per_minute=60)
+        for _ in range(60):
+            await rate_limiter.acquire()
+            rate_limiter.release()
+        self.assertAlmostEqual(rate_limiter._budget_delay(0), 1.0, places=1)
+        rate_limiter._last_refill -= 1.0
+        self.assertEqual(rate_limiter._budget_delay(0), 0.0)
+
+    async def test_tokens_per_minute(self):
+        rate_limiter = RateLimiter(tokens_per_minute=600)
+        await rate_limiter.acquire(tokens=600)
+        rate_limiter.release()
+        self.assertAlmostEqual(rate_limiter._budget_delay(100), 10.0, places=1)
+
+    def test_backoff_delay(self):
+        rate_limiter = RateLimiter(backoff_base=1.0, backoff_max=5.0, jitter=False)
+        self.assertEqual(rate_limiter.backoff_delay(0), 1.0)
+        self.assertEqual(rate_limiter.backoff_delay(2), 4.0)
+        self.assertEqual(rate_limiter.backoff_delay(10), 5.0)
+        rate_limiter = RateLimiter(backoff_base=1.0, backoff_max=5.0)
+        for attempt in range(10):
+            self.assertLessEqual(rate_limiter.backoff_delay(attempt), 5.0)
+
+    def test_error_classification(self):
+        self.assertTrue(is_rate_limit_error(rate_limit_error()))
+        self.assertTrue(is_retryable_error(rate_limit_error()))
+        self.assertFalse(is_rate_limit_error(ValueError()))
+        self.assertFalse(is_retryable_error(ValueError()))
+
+    def test_registered_rate_limiters(self):
+        global_rate_limiter = RateLimiter()
+        openai_rate_limiter = RateLimiter()
+        set_rate_limiter(global_rate_limiter)
+        set_rate_limiter(openai_rate_limiter, provider="openai")
+        self.assertIs(get_rate_limiter("openai"), openai_rate_limiter)
+        self.assertIs(get_rate_limiter("ollama"), global_rate_limiter)
+        language_model = LanguageModel(model="ollama/mistral")
+        self.assertIs(language_model._get_rate_limiter(), global_rate_limiter)
+        set_rate_limiter(None)
+        self.assertIsNone(get_rate_limiter("ollama"))
+
+    def test_rate_limiter_from_config(self):
+        rate_limiter = RateLimiter(max_concurrency=4, requests_per_minute=100)
+        config = rate_limiter.get_config()
+        rate_limiter = RateLimiter.from_config(config)
+        self.assertEqual(rate_limiter.max_concurrency, 4)
+        self.assertEqual(rate_limiter.requests_per_minute, 100)
+
+    @patch("asyncio.sleep")
+    @patch("litellm.acompletion")
+    async def test_language_model_backoff(self, mock_completion, mock_sleep):
+        rate_limiter = RateLimiter(max_concurrency=4, jitter=False)
+        language_model = LanguageModel(
+            model="ollama/mistral",
+            rate_limiter=rate_limiter,
+        )
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="Hello")]
+        )
+        mock_completion.side_effect = [
+            rate_limit_error(),
+            {"choices": [{"message": {"content": "Hello, how can I help you?"}}]},
+        ]
+        result = await language_model(messages)
+        self.assertEqual(result.get("content"), "Hello, how can I help you?")
+        mock_sleep.assert_called_once_with(1.0)
+        self.assertEqual(rate_limiter.concurrency, 2)
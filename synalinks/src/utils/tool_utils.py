@@ -23,16 +23,71 @@
 # Original authors: Lucas Lofaro
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import contextlib
+import functools
 import inspect
 import logging
+import multiprocessing
+import threading
 import typing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 import docstring_parser
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry
+from tenacity import retry_if_exception_type
+from tenacity import retry_if_not_exception_type
+from tenacity import stop_after_attempt
+from tenacity import wait_exponential
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.saving import serialization_lib
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
+from synalinks.src.utils.rate_limiter import RateLimiter
+
+TOOL_EXECUTION_MODES = ("inline", "thread", "process")
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_tool_executor(execution):
+    """Returns the executor shared by the tools of an execution mode.
+
+    The executors are created on their first use. The process pool uses the
+    `spawn` start method, so it is safe to use from a running event loop.
+
+    Args:
+        execution (str): Either `"thread"` or `"process"`.
+
+    Returns:
+        (concurrent.futures.Executor): The executor.
+    """
+    with _executors_lock:
+        executor = _executors.get(execution)
+        if executor is None or getattr(executor, "_broken", False):
+            if execution == "thread":
+                executor = ThreadPoolExecutor(thread_name_prefix="synalinks_tool")
+            elif execution == "process":
+                executor = ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                raise ValueError(
+                    f"No executor for the execution mode '{execution}', "
+                    "expected 'thread' or 'process'."
+                )
+            _executors[execution] = executor
+        return executor
+
+
+def _run_function(func, args, kwargs):
+    # Entry point of the tools running in a thread or a process
+    if inspect.iscoroutinefunction(func):
+        return asyncio.run(func(*args, **kwargs))
+    return func(*args, **kwargs)
+
 
 JsonSchema = typing.Union[
     typing.Dict[str, typing.Any],
@@ -136,10 +191,88 @@ def get_param_schema(
     ]
 )
 class Tool(SynalinksSaveable):
-    def __init__(self, func: typing.Callable):
+    """A tool wrapping a Python function.
+
+    The tool schema is inferred from the type hints and the docstring of the
+    function.
+
+    By default, the function is awaited on the event loop (`"inline"`
+    execution), so it must be asynchronous and never block. The functions
+    doing synchronous CPU work or blocking I/O (like the ones using a sync
+    SDK) should use the `"thread"` or `"process"` execution, so they run
+    in a shared pool off the event loop and don't stall the other requests.
+    With these modes, the function can be synchronous or asynchronous (an
+    asynchronous function is run in its own event loop). With `"process"`,
+    the function and its arguments and results must be picklable (e.g.
+    defined at the top level of a module).
+
+    Example:
+
+    ```python
+    import synalinks
+
+    def calculate(expression: str):
+        \"""Calculate the result of a mathematical expression.
+
+        Args:
+            expression (str): The mathematical expression to calculate.
+        \"""
+        return {"result": eval(expression, {"__builtins__": None}, {})}
+
+    tool = synalinks.Tool(
+        calculate,
+        execution="process",
+        timeout=5,
+        max_concurrency=4,
+    )
+    ```
+
+    Args:
+        func (Callable): The function to wrap.
+        execution (str): Optional. Where the function is run, one of
+            `"inline"`, `"thread"` or `"process"` (Default to `"inline"`).
+        timeout (float): Optional. The maximum duration in seconds of a call,
+            a `TimeoutError` is raised when exceeded and the call is not retried
+            (Default to None, no timeout). Note that a thread (or process)
+            can't be interrupted: the caller stops waiting, but the function
+            runs until its completion.
+        max_concurrency (int): Optional. The maximum number of concurrent calls
+            of the tool, the other calls wait for a free slot
+            (Default to None, no limit).
+    """
+
+    def __init__(
+        self,
+        func: typing.Callable,
+        execution="inline",
+        timeout=None,
+        max_concurrency=None,
+    ):
         self._func = func
-        if not inspect.iscoroutinefunction(self._func):
-            raise TypeError(f"{self.name} is not an asynchronous function")
+        if execution not in TOOL_EXECUTION_MODES:
+            raise ValueError(
+                f"The `execution` argument should be one of {TOOL_EXECUTION_MODES}, "
+                f"received: {execution}"
+            )
+        if execution == "inline" and not inspect.iscoroutinefunction(self._func):
+            raise TypeError(
+                f"{self.name} is not an asynchronous function, "
+                "use `execution='thread'` or `execution='process'` "
+                "to run a synchronous function"
+            )
+        if timeout is not None and timeout <= 0:
+            raise ValueError(
+                f"The `timeout` argument should be positive, received: {timeout}"
+            )
+        self.execution = execution
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._rate_limiter = None
+        if max_concurrency is not None:
+            self._rate_limiter = RateLimiter(
+                max_concurrency=max_concurrency,
+                adaptive=False,
+            )
 
         doc = inspect.getdoc(func)
         if not doc:
@@ -162,11 +295,47 @@ class Tool(SynalinksSaveable):
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((Exception,)),
-        reraise=True
+        retry=(
+            retry_if_exception_type((Exception,))
+            & retry_if_not_exception_type(TimeoutError)
+        ),
+        reraise=True,
     )
     async def __call__(self, *args, **kwargs):
-        return await self._func(*args, **kwargs)
+        return await self.run(*args, **kwargs)
+
+    async def run(self, *args, **kwargs):
+        """Call the function once (without retry).
+
+        The function is run according to the execution mode, the timeout
+        and the concurrency limit of the tool.
+
+        Returns:
+            (Any): The result of the function.
+        """
+        if self._rate_limiter is not None:
+            limit = self._rate_limiter.limit()
+        else:
+            limit = contextlib.nullcontext()
+        async with limit:
+            try:
+                return await asyncio.wait_for(
+                    self._execute(args, kwargs),
+                    timeout=self.timeout,
+                )
+            except asyncio.TimeoutError as e:
+                raise TimeoutError(
+                    f"The tool ({self.name}) timed out after {self.timeout} seconds"
+                ) from e
+
+    async def _execute(self, args, kwargs):
+        if self.execution == "inline":
+            return await self._func(*args, **kwargs)
+        # If cancelled (e.g. on timeout) before starting, the call is dropped
+        return await asyncio.get_running_loop().run_in_executor(
+            get_tool_executor(self.execution),
+            functools.partial(_run_function, self._func, args, kwargs),
+        )
 
     def _parse_arguments(self):
         for param_name, param in self._signature.parameters.items():
@@ -200,10 +369,15 @@ class Tool(SynalinksSaveable):
         return schema
 
     def get_config(self):
+        config = {
+            "execution": self.execution,
+            "timeout": self.timeout,
+            "max_concurrency": self.max_concurrency,
+        }
         func_config = {"func": serialization_lib.serialize_synalinks_object(self._func)}
-        return {**func_config}
+        return {**func_config, **config}
 
     @classmethod
     def from_config(cls, config):
         func = serialization_lib.deserialize_synalinks_object(config.pop("func"))
-        return cls(func)
+        return cls(func, **config)
@@ -1,5 +1,8 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import time
+
 from synalinks.src import saving
 from synalinks.src import testing
 from synalinks.src.utils.tool_utils import Tool
@@ -33,6 +36,17 @@ async def calculate(expression: str):
         }
 
 
+@saving.object_registration.register_synalinks_serializable()
+def blocking_sleep(duration: float):
+    """Sleep without yielding to the event loop.
+
+    Args:
+        duration (float): The duration of the sleep in seconds.
+    """
+    time.sleep(duration)
+    return {"slept": duration}
+
+
 class ToolUtilsTest(testing.TestCase):
     def test_basic_tool(self):
         _ = Tool(calculate)
@@ -46,3 +60,65 @@ class ToolUtilsTest(testing.TestCase):
         result = tool_call.get("result")
 
         self.assertTrue(result == 4)
+
+    def test_tool_execution_validation(self):
+        with self.assertRaisesRegex(TypeError, "not an asynchronous function"):
+            Tool(blocking_sleep)
+        with self.assertRaisesRegex(ValueError, "execution"):
+            Tool(calculate, execution="subprocess")
+        with self.assertRaisesRegex(ValueError, "timeout"):
+            Tool(calculate, timeout=0)
+
+    async def test_thread_execution_doesnt_block_event_loop(self):
+        tool = Tool(blocking_sleep, execution="thread")
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        result, _ = await asyncio.gather(tool(duration=0.2), tick())
+        self.assertEqual(result, {"slept": 0.2})
+        # The event loop kept running while the tool was sleeping
+        self.assertEqual(ticks, 5)
+
+        # An asynchronous function runs in its own event loop
+        tool = Tool(calculate, execution="thread")
+        self.assertEqual((await tool("2+2")).get("result"), 4)
+
+    async def test_tool_timeout(self):
+        tool = Tool(blocking_sleep, execution="thread", timeout=0.05)
+        start = time.monotonic()
+        with self.assertRaisesRegex(TimeoutError, "blocking_sleep"):
+            await tool(duration=0.5)
+        # A timed out call is not retried
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    async def test_tool_max_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def wait(duration: float):
+            """Wait for some time.
+
+            Args:
+                duration (float): The duration in seconds.
+            """
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(duration)
+            in_flight -= 1
+
+        tool = Tool(wait, max_concurrency=2)
+        await asyncio.gather(*[tool(duration=0.01) for _ in range(6)])
+        self.assertEqual(max_in_flight, 2)
+
+    def test_tool_with_execution_serialization(self):
+        tool = Tool(blocking_sleep, execution="process", timeout=5, max_concurrency=2)
+        new_tool = Tool.from_config(tool.get_config())
+        self.assertEqual(new_tool.execution, "process")
+        self.assertEqual(new_tool.timeout, 5)
+        self.assertEqual(new_tool.max_concurrency, 2)